@@ -20,10 +20,17 @@
 """
 Algorithm that parsers and converts a bytes object of csv data to Arrow record batch
 format. Calls a tool that executes the pyarrow csv reader.
+The schema unified over the sampled blocks is locked in the tool and
+registered as a Table in the output dataset.
 """
+import uuid
+
 from artemis.core.algo import AlgoBase
 from artemis.decorators import timethis
 from artemis.utils.utils import range_positive
+from artemis.io.protobuf.artemis_pb2 import JOB_SAMPLE
+from artemis.io.protobuf.cronus_pb2 import TableObjectInfo
+from artemis.io.protobuf.table_pb2 import Table
 
 
 class CsvParserAlgo(AlgoBase):
@@ -42,36 +49,88 @@ class CsvParserAlgo(AlgoBase):
         self.__logger.info("Book")
         bins = [x for x in range_positive(0.0, 100.0, 2.0)]
         self.gate.hbook.book(self.name, "time.pyarrowparse", bins, "ms", timer=True)
+        self.gate.hbook.book(self.name, "nbatches", range(100), "n")
 
     def rebook(self):
-        pass
+        schema = self.get_tool("csvtool").schema
+        if schema is None:
+            self.__logger.warning("No sampled schema to lock")
+            return
+        self.__logger.info("Locked schema %s", schema)
+        try:
+            self._register_schema(schema)
+        except Exception:
+            self.__logger.error("Cannot register locked schema")
+            raise
+
+    @property
+    def required_columns(self):
+        # Parser reads the raw block
+        return []
+
+    def push_columns(self, columns):
+        self.get_tool("csvtool").include_columns(columns)
+
+    def _register_schema(self, schema):
+        """
+        Register the locked schema as a Table
+        Partition is keyed by the algorithm name
+        """
+        ds_id = self.gate.meta.dataset_id
+        job_id = self.gate.meta.job_id
+        if self.name not in self.gate.store.list_partitions(ds_id):
+            self.gate.store.new_partition(ds_id, self.name)
+
+        raw_schema = schema.serialize().to_pybytes()
+        table = Table()
+        table.uuid = str(uuid.uuid4())
+        table.name = f"{ds_id}.job_{job_id}.part_{self.name}.{table.uuid}.table.pb"
+        table.info.partition = self.name
+
+        tinfo = TableObjectInfo()
+        for f in schema:
+            field = table.info.schema.info.fields.add()
+            field.name = f.name
+            field.info.type = str(f.type)
+            tinfo.fields.append(field.name)
+
+        table.info.schema.info.aux.raw_header_size_bytes = len(raw_schema)
+        table.info.schema.info.aux.raw_header = raw_schema
+
+        self.gate.store.register_content(
+            table, tinfo, dataset_id=ds_id, partition_key=self.name, job_id=job_id
+        )
 
     @timethis
     def pyarrow_parsing(self, block):
+        tool = self.get_tool("csvtool")
         try:
-            batch = self.get_tool("csvtool").execute(block)
+            if self.gate.meta.state == JOB_SAMPLE:
+                batches = tool.sample(block)
+            else:
+                batches = tool.execute(block)
         except Exception:
             raise
-        return batch
+        return batches
 
     def execute(self, element):
 
         raw_ = element.get_data()
 
         try:
-            tbatch, time_ = self.pyarrow_parsing(raw_)
+            tbatches, time_ = self.pyarrow_parsing(raw_)
         except Exception:
             self.__logger.error("PyArrow parsing fails")
             raise
         self.gate.hbook.fill(self.name, "time.pyarrowparse", time_)
+        self.gate.hbook.fill(self.name, "nbatches", len(tbatches))
 
-        self.__logger.debug("Arrow schema: %s: ", tbatch.schema)
-
-        #  TODO
-        #  Arrow schema validation per batch
+        if tbatches:
+            self.__logger.debug("Arrow schema: %s: ", tbatches[-1].schema)
 
+        # Element carries the list of batches parsed from the block
         # Does this overwrite the existing data for this element?
-        element.add_data(tbatch)
+        element.add_data(tbatches)
         self.__logger.debug("Element Data type %s", type(element.get_data()))
 
     def finalize(self):
@@ -0,0 +1,149 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Data quality checks of input record batches with a set of rules.
+Calls a tool that evaluates the rules compiled to pyarrow compute kernels.
+
+The rows passing and failing each rule are counted in the histogram
+rule.<rule name> of the algorithm, failed (bin 0) and passed (bin 1).
+Batches are passed through unchanged. With side_output, the batches are
+replaced by the rows failing a rule, such that the node of the algorithm,
+a leaf branching from the checked node in the menu, is an output partition
+of the failures: the input file, the row index in the file and a column
+per rule flagging the failed rules. Null rate rules only count nulls.
+"""
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from artemis.core.algo import AlgoBase
+from artemis.decorators import iterable, timethis
+from artemis.utils.utils import range_positive
+
+
+@iterable
+class DQRuleAlgoOptions:
+    side_output = False  # Replace the batches with the rows failing a rule
+
+
+class DQRuleAlgo(AlgoBase):
+    def __init__(self, name, **kwargs):
+        options = dict(DQRuleAlgoOptions())
+        options.update(kwargs)
+        super().__init__(name, **options)
+        self.__logger.info("%s: __init__ DQRuleAlgo" % self.name)
+        self._file = None
+        self._offset = 0
+        self._null_rates = {}
+
+    def initialize(self):
+        self.__logger.info("%s: Initialized DQRuleAlgo" % self.name)
+        self._null_rates = {
+            rule.name: rule.null_rate.max_rate
+            for rule in self.get_tool("dqruletool").rules
+            if rule.WhichOneof("check") == "null_rate"
+        }
+
+    def book(self):
+        self.__logger.info("Book")
+        bins = [x for x in range_positive(0.0, 100.0, 2.0)]
+        self.gate.hbook.book(self.name, "time.dqrules", bins, "ms", timer=True)
+        for rule in self.get_tool("dqruletool").rules:
+            self.gate.hbook.book(
+                self.name, "rule." + rule.name, [0, 1, 2], "failed, passed"
+            )
+
+    def rebook(self):
+        # Row indices restart with the files of the job after sampling
+        self._file = None
+        self._offset = 0
+
+    @property
+    def required_columns(self):
+        return self.get_tool("dqruletool").columns
+
+    @timethis
+    def check_rows(self, record_batch):
+        return self.get_tool("dqruletool").execute(record_batch)
+
+    def _check(self, batch):
+        masks, time_ = self.check_rows(batch)
+        self.gate.hbook.fill(self.name, "time.dqrules", time_)
+        for name, mask in masks.items():
+            npassed = pc.sum(mask).as_py() or 0
+            counts = self.gate.hbook[self.name + ".rule." + name]
+            counts.fill(0, weight=len(mask) - npassed)
+            counts.fill(1, weight=npassed)
+
+        if self.gate.current_file != self._file:
+            self._file = self.gate.current_file
+            self._offset = 0
+        offset = self._offset
+        self._offset += batch.num_rows
+
+        if not self.properties.side_output:
+            return batch
+        return self._failures(masks, offset)
+
+    def _failures(self, masks, offset):
+        """
+        Batch of the rows failing any rule but a null rate
+        """
+        names = [name for name in masks if name not in self._null_rates]
+        failed = [pc.invert(masks[name]) for name in names]
+        if failed:
+            any_failed = failed[0]
+            for mask in failed[1:]:
+                any_failed = pc.or_(any_failed, mask)
+            indices = pc.indices_nonzero(any_failed)
+        else:
+            indices = pa.array([], pa.uint64())
+        files = pa.array([str(self._file)]).take(
+            pa.array(np.zeros(len(indices), dtype="int64"))
+        )
+        rows = pc.add(indices.cast(pa.int64()), pa.scalar(offset, pa.int64()))
+        arrays = [files, rows] + [mask.take(indices) for mask in failed]
+        return pa.RecordBatch.from_arrays(arrays, ["file", "row"] + names)
+
+    def execute(self, element):
+        raw_ = element.get_data()
+        # Element may carry a list of batches parsed from a single block
+        if isinstance(raw_, list):
+            element.add_data([self._check(batch) for batch in raw_])
+        else:
+            element.add_data(self._check(raw_))
+
+    def finalize(self):
+        for name, _ in self.gate.hbook.items():
+            if not name.startswith(self.name + ".rule."):
+                continue
+            rule = name[len(self.name + ".rule.") :]
+            nfailed, npassed = self.gate.hbook[name].frequencies
+            self.__logger.info("Rule %s failed %i passed %i", rule, nfailed, npassed)
+            total = nfailed + npassed
+            if rule in self._null_rates and total > 0:
+                if nfailed / total > self._null_rates[rule]:
+                    self.__logger.warning(
+                        "Rule %s null rate %f above %f",
+                        rule,
+                        nfailed / total,
+                        self._null_rates[rule],
+                    )
+        self.__logger.info("Completed DQRuleAlgo")
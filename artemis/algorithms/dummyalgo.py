@@ -75,6 +75,9 @@ class DummyAlgo1(AlgoBase):
         # Access histograms books via the gate service
         self.gate.hbook.book(self.name, "testh1", range(10))
 
+    def rebook(self):
+        pass
+
     def execute(self, element):
         """
         Execute operations on data that is associated with a node in the process graph.
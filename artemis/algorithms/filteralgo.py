@@ -45,14 +45,35 @@ class FilterAlgo(AlgoBase):
     def rebook(self):
         pass
 
+    @property
+    def required_columns(self):
+        options = self.get_tool("filtercoltool").options
+        if options["columns"] is None or options["invert"]:
+            return None
+        return list(options["columns"])
+
+    @property
+    def projects_columns(self):
+        return self.required_columns is not None
+
     @timethis
     def filter_columns(self, record_batch):
         return self.get_tool("filtercoltool").execute(record_batch)
 
     def execute(self, element):
-        fbatch, time_ = self.filter_columns(element.get_data())
-        self.gate.hbook.fill(self.name, "time.filtercol", time_)
-        element.add_data(fbatch)
+        raw_ = element.get_data()
+        # Element may carry a list of batches parsed from a single block
+        if isinstance(raw_, list):
+            fbatches = []
+            for batch in raw_:
+                fbatch, time_ = self.filter_columns(batch)
+                self.gate.hbook.fill(self.name, "time.filtercol", time_)
+                fbatches.append(fbatch)
+            element.add_data(fbatches)
+        else:
+            fbatch, time_ = self.filter_columns(raw_)
+            self.gate.hbook.fill(self.name, "time.filtercol", time_)
+            element.add_data(fbatch)
 
     def finalize(self):
         self.__logger.info("Completed FilterAlgo")
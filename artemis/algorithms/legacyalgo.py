@@ -49,6 +49,15 @@ class LegacyDataAlgo(AlgoBase):
     def rebook(self):
         pass
 
+    @property
+    def required_columns(self):
+        # Parser reads the raw block
+        return []
+
+    def push_columns(self, columns):
+        self.get_tool("legacytool").include_columns(columns)
+        self.get_tool("fwftool").include_columns(columns)
+
     @timethis
     def pyarrow_parsing(self, block):
         try:
@@ -18,16 +18,25 @@
 # limitations under the License.
 
 """
-Profiles record batch columns with TDigest
+Profiles record batch columns with TDigest and mergeable column sketches
 """
 
 from artemis.externals.tdigest.tdigest import TDigest
 from artemis.core.algo import AlgoBase
+from artemis.decorators import iterable
+
+
+@iterable
+class ProfilerAlgoOptions:
+    sketch_precision = 12  # HyperLogLog of 2**precision registers, 0 disables sketches
+    sketch_capacity = 64  # Most frequent values counted per string column
 
 
 class ProfilerAlgo(AlgoBase):
     def __init__(self, name, **kwargs):
-        super().__init__(name, **kwargs)
+        options = dict(ProfilerAlgoOptions())
+        options.update(kwargs)
+        super().__init__(name, **options)
         self.__logger.info("%s: __init__ ProfilerAlgo" % self.name)
         self.reader = None
         self.jobops = None
@@ -41,6 +50,9 @@ class ProfilerAlgo(AlgoBase):
     def book(self):
         pass
 
+    def rebook(self):
+        pass
+
     def create_tdigests(self, record_batch):
         tool_digests = {}
         try:
@@ -54,6 +66,15 @@ class ProfilerAlgo(AlgoBase):
 
         raw_ = record_batch.get_data()
 
+        # Element may carry a list of batches parsed from a single block
+        if isinstance(raw_, list):
+            for batch in raw_:
+                self._profile(batch)
+        else:
+            self._profile(raw_)
+
+    def _profile(self, raw_):
+
         # Code for understanding the record batch
         # that this algorithim has recived
         # We can break up the record batch into a
@@ -97,6 +118,17 @@ class ProfilerAlgo(AlgoBase):
             self.__logger.error("TDigest creation fails")
             raise
 
+        # Sketches of all columns, summed in the sketch book
+        if self.properties.sketch_precision > 0:
+            for name, column in zip(raw_.schema.names, raw_.columns):
+                self.gate.sbook.fill(
+                    self.name,
+                    name,
+                    column,
+                    self.properties.sketch_precision,
+                    self.properties.sketch_capacity,
+                )
+
         # Redundant, it is the same object as the input!
         # element.add_data(raw_)
 
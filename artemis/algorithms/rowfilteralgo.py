@@ -0,0 +1,81 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Vectorized row selection of input record batches with a boolean expression.
+Calls a tool that evaluates the expression with pyarrow compute kernels.
+"""
+
+from artemis.core.algo import AlgoBase
+from artemis.decorators import timethis
+from artemis.utils.utils import range_positive
+
+
+class RowFilterAlgo(AlgoBase):
+    def __init__(self, name, **kwargs):
+        super().__init__(name, **kwargs)
+        self.__logger.info("%s: __init__ RowFilterAlgo" % self.name)
+        self._npassed = 0
+        self._ndropped = 0
+
+    def initialize(self):
+        self.__logger.info("%s: Initialized RowFilterAlgo" % self.name)
+
+    def book(self):
+        self.__logger.info("Book")
+        bins = [x for x in range_positive(0.0, 100.0, 2.0)]
+        self.gate.hbook.book(self.name, "time.rowfilter", bins, "ms", timer=True)
+        # Counts of rows dropped (bin 0) and passed (bin 1)
+        self.gate.hbook.book(self.name, "rows", [0, 1, 2], "dropped, passed")
+
+    def rebook(self):
+        # Histograms are reset after sampling
+        self._npassed = 0
+        self._ndropped = 0
+
+    @property
+    def required_columns(self):
+        return self.get_tool("rowfiltertool").columns
+
+    @timethis
+    def filter_rows(self, record_batch):
+        return self.get_tool("rowfiltertool").execute(record_batch)
+
+    def _filter(self, batch):
+        fbatch, time_ = self.filter_rows(batch)
+        self.gate.hbook.fill(self.name, "time.rowfilter", time_)
+        npassed = fbatch.num_rows
+        ndropped = batch.num_rows - npassed
+        rows = self.gate.hbook[self.name + ".rows"]
+        rows.fill(0, weight=ndropped)
+        rows.fill(1, weight=npassed)
+        self._npassed += npassed
+        self._ndropped += ndropped
+        return fbatch
+
+    def execute(self, element):
+        raw_ = element.get_data()
+        # Element may carry a list of batches parsed from a single block
+        if isinstance(raw_, list):
+            element.add_data([self._filter(batch) for batch in raw_])
+        else:
+            element.add_data(self._filter(raw_))
+
+    def finalize(self):
+        self.__logger.info("Rows passed %i dropped %i", self._npassed, self._ndropped)
+        self.__logger.info("Completed RowFilterAlgo")
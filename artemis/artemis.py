@@ -22,6 +22,7 @@ Artemis Core Application
 """
 
 # Python libraries
+import contextlib
 import traceback
 
 # Externals
@@ -34,16 +35,22 @@ from artemis.logger import Logger
 
 # Core
 from artemis.core.properties import Properties
+from artemis.core.context import current_context
 from artemis.core.gate import ArtemisGateSvc
 from artemis.core.gate import MetaMixin, IOMetaMixin
 from artemis.core.steering import Steering
 from artemis.core.algo import AlgoBase
+from artemis.core.tool import ToolBase
 
 # IO
 from artemis.io.collector import Collector
 
 # Protobuf
 import artemis.io.protobuf.artemis_pb2 as artemis_pb2
+from artemis.io.protobuf.cronus_pb2 import JobCheckpoint
+from artemis.io.protobuf.histogram_pb2 import HistogramCollection
+from artemis.io.protobuf.tdigest_pb2 import TDigest_store
+from artemis.io.protobuf.sketch_pb2 import Sketch_store
 
 # Utils
 from artemis.utils.utils import bytes_to_mb, range_positive
@@ -118,6 +125,11 @@ class Artemis(MetaMixin, IOMetaMixin):
     ----------------
         loglevel : str
             Optional level for logging `INFO`, `DEBUG`, `VERBOSE`
+        context : JobContext
+            Optional job context owning the framework services,
+            entered by the job and closed when control returns
+        store : BaseObjectStore
+            Optional opened store of the job, loaded from jobinfo otherwise
 
     Returns
     -------
@@ -128,12 +140,14 @@ class Artemis(MetaMixin, IOMetaMixin):
 
     def __init__(self, jobinfo, **kwargs):
         self.properties = Properties()
-        self.gate = ArtemisGateSvc()
-        self.gate.configure(jobinfo)
-        self.job_state = artemis_pb2.JOB_STARTING
-        # Logging
-        logobj = self.register_log()
-        Logger.configure(self, path=logobj.address, loglevel=kwargs["loglevel"])
+        self.context = kwargs.get("context", None)
+        with self._job_context():
+            self.gate = ArtemisGateSvc()
+            self.gate.configure(jobinfo, store=kwargs.get("store", None))
+            self.job_state = artemis_pb2.JOB_STARTING
+            # Logging
+            logobj = self.register_log()
+            Logger.configure(self, path=logobj.address, loglevel=kwargs["loglevel"])
         #######################################################################
 
         # Define the internal objects for Artemis
@@ -141,6 +155,11 @@ class Artemis(MetaMixin, IOMetaMixin):
         self.datahandler = None  # Manages input data
         self.filehandler = None  # Manages datum processing
         self.collector = None  # Manages Arrow malloc and serialization
+        self.checkpoint = None  # Checkpoint of a previous attempt of the job
+        self._completed = []  # Keys of the completed datums
+        self._skip = set()  # Keys of the datums completed before a restart
+        self._offsets = {}  # Outputs registered in the dataset before the job
+        self._stopped = False  # Graceful stop requested
 
     def control(self):
         """
@@ -158,6 +177,23 @@ class Artemis(MetaMixin, IOMetaMixin):
             The return code :: False -- exception encountered
             sends error to :class:`artemis.Artemis.abort`
         """
+        if self.context is None:
+            return self._control()
+        with self.context:
+            try:
+                return self._control()
+            finally:
+                self.context.close()
+
+    def _job_context(self):
+        """
+        Job context passed to the job, if any
+        """
+        if self.context is None:
+            return contextlib.nullcontext()
+        return self.context
+
+    def _control(self):
         self.job_state = artemis_pb2.JOB_RUNNING
         self.launch()
 
@@ -200,6 +236,52 @@ class Artemis(MetaMixin, IOMetaMixin):
             self.abort(e)
             return False
 
+        # A job restarted after a failure resumes from its checkpoint,
+        # the schemas and timer binnings are known and sampling is skipped
+        try:
+            self.load_checkpoint()
+        except Exception as e:
+            self.logger.error("Caught error in load_checkpoint")
+            self.__logger.error("Reason: %s" % e)
+            self.abort(e)
+            return False
+
+        if self.checkpoint is not None:
+            self.job_state = artemis_pb2.JOB_REBOOK
+            try:
+                self.resume()
+            except Exception as e:
+                self.logger.error("Caught error in resume")
+                self.__logger.error("Reason: %s" % e)
+                self.abort(e)
+                return False
+        elif self._sample() is False:
+            return False
+
+        self.job_state = artemis_pb2.JOB_EXECUTE
+        try:
+            r, time_ = self.execute()
+            self.gate.hbook.fill("artemis", "time.execute", time_)
+        except Exception as e:
+            self.logger.error("Unexcepted error caught in run")
+            self.__logger.error("Reason: %s" % e)
+            self.abort(e)
+            return False
+
+        self.job_state = artemis_pb2.JOB_FINALIZE
+        try:
+            self.finalize()
+        except Exception as e:
+            self.logger.error("Unexcepted error caught in finalize")
+            self.__logger.error("Reason: %s" % e)
+            self.abort(e)
+            return False
+
+    def _sample(self):
+        """
+        Sample datums to set the output schemas and the timer binnings
+        returns False if the job aborts
+        """
         # In order to set the output buffer schema
         # we need to get a schema first
         # In order to set the timing histograms, we need to profile
@@ -246,24 +328,6 @@ class Artemis(MetaMixin, IOMetaMixin):
         self.__logger.info(
             "artemis: sampleing complete malloc %i", pa.total_allocated_bytes()
         )
-        self.job_state = artemis_pb2.JOB_EXECUTE
-        try:
-            r, time_ = self.execute()
-            self.gate.hbook.fill("artemis", "time.execute", time_)
-        except Exception as e:
-            self.logger.error("Unexcepted error caught in run")
-            self.__logger.error("Reason: %s" % e)
-            self.abort(e)
-            return False
-
-        self.job_state = artemis_pb2.JOB_FINALIZE
-        try:
-            self.finalize()
-        except Exception as e:
-            self.logger.error("Unexcepted error caught in finalize")
-            self.__logger.error("Reason: %s" % e)
-            self.abort(e)
-            return False
 
     def launch(self):
         """
@@ -392,6 +456,13 @@ class Artemis(MetaMixin, IOMetaMixin):
         self.__logger.info("Rebook")
 
         self.gate.hbook.rebook()  # Resets all histograms!
+        self.gate.sbook.rebook()  # Drops the sampled data from the sketches
+
+        try:
+            self.steer.rebook()
+        except Exception:
+            self.__logger.error("Cannot rebook Steering")
+            raise
 
         self.__logger.info(
             "artemis: allocated before reset %i", pa.total_allocated_bytes()
@@ -431,7 +502,19 @@ class Artemis(MetaMixin, IOMetaMixin):
             self.__logger.error("Unknown job state for execute")
             raise ValueError
 
-        for datum in iter_datum:
+        for idatum, datum in enumerate(iter_datum):
+            if self._stopped and self.job_state == artemis_pb2.JOB_EXECUTE:
+                self.__logger.info("Job stopped after %i datums", len(self._completed))
+                break
+            # Idle stream, close the outputs older than their max age
+            if datum is None:
+                self.collector.roll()
+                continue
+            # Input files are keyed by uuid, generated datums by index
+            key = datum if isinstance(datum, str) else str(idatum)
+            if key in self._skip:
+                self.__logger.info("Skip completed datum %s", key)
+                continue
             if isinstance(datum, bytes):
                 datum = pa.py_buffer(datum)
 
@@ -463,7 +546,12 @@ class Artemis(MetaMixin, IOMetaMixin):
                 raise ValueError
 
             for batch in iter_batches:
-                self.gate.hbook.fill("artemis", "blocksize", bytes_to_mb(batch.size))
+                # Raw blocks are buffers, ipc files yield record batches
+                if isinstance(batch, pa.RecordBatch):
+                    size_ = pa.get_record_batch_size(batch)
+                else:
+                    size_ = batch.size
+                self.gate.hbook.fill("artemis", "blocksize", bytes_to_mb(size_))
                 steer_exec = timethis(self.steer.execute)
                 try:
                     r, time_ = steer_exec(batch)
@@ -474,7 +562,8 @@ class Artemis(MetaMixin, IOMetaMixin):
                     "artemis: execute complete malloc %i", pa.total_allocated_bytes()
                 )
                 self.gate.hbook.fill("artemis", "time.steer", time_)
-                self.processed_bytes = batch.size
+                self.processed_bytes = size_
+                self._heartbeat()
 
                 if self.job_state == artemis_pb2.JOB_EXECUTE:
                     try:
@@ -485,9 +574,154 @@ class Artemis(MetaMixin, IOMetaMixin):
 
             # Update datum input count
             self.processed_ndatums = 1
+            self._heartbeat()
+            if self.job_state == artemis_pb2.JOB_EXECUTE:
+                self._completed.append(key)
+                self.save_checkpoint()
+                self.collector.roll()
 
             self.__logger.info("Processed %i" % self.gate.meta.summary.processed_bytes)
 
+    def stop(self):
+        """
+        Request a graceful stop of the job, e.g. of a stream on SIGTERM.
+        The current datum completes and the job finalizes its outputs.
+
+            signal.signal(signal.SIGTERM, lambda *args: bow.stop())
+        """
+        self._stopped = True
+        if self.datahandler is not None:
+            self.datahandler.stop()
+
+    def _heartbeat(self):
+        """
+        Report the progress of the job to the heartbeat of its context, if any
+        """
+        if self.job_state != artemis_pb2.JOB_EXECUTE:
+            return
+        context = current_context()
+        if context is not None and context.heartbeat is not None:
+            context.heartbeat(self.gate.meta.summary)
+
+    def load_checkpoint(self):
+        """
+        Retrieve the checkpoint of a previous attempt of the job,
+        if checkpoints are configured.
+        Records the outputs registered in the dataset before the job.
+        """
+        dataset = self.gate.store[self.output_id].dataset
+        self._offsets = {"files": len(dataset.files), "tables": len(dataset.tables)}
+        if self.gate.config.checkpoint_ndatums > 0:
+            self.checkpoint = self.gate.store.load_checkpoint(
+                self.output_id, self.job_id
+            )
+
+    def save_checkpoint(self):
+        """
+        Every checkpoint_ndatums completed datums spill the outputs to files
+        and persist the checkpoint of the job: completed datums,
+        output files and tables, histograms, tdigests,
+        output schemas and the state of the tools.
+        A stream also advances the watermark of the output dataset.
+        """
+        ndatums = self.gate.config.checkpoint_ndatums
+        if ndatums == 0 or len(self._completed) % ndatums != 0:
+            return
+
+        try:
+            schemas = self.collector.checkpoint()
+        except Exception:
+            self.__logger.error("Cannot spill outputs for checkpoint")
+            raise
+
+        checkpoint = JobCheckpoint()
+        checkpoint.job_id = self.job_id
+        checkpoint.datums.extend(self._completed)
+        dataset = self.gate.store[self.output_id].dataset
+        checkpoint.partitions.extend(dataset.partitions)
+        checkpoint.files.extend(dataset.files[self._offsets["files"] :])
+        checkpoint.tables.extend(dataset.tables[self._offsets["tables"] :])
+        checkpoint.hists = self.gate.hbook._to_message().SerializeToString()
+        for name, stats in self.gate.hbook.stats().items():
+            checkpoint.stats[name].sum = stats["sum"]
+            checkpoint.stats[name].sum2 = stats["sum2"]
+        checkpoint.tdigests = self.gate.tbook._to_message().SerializeToString()
+        checkpoint.sketches = self.gate.sbook._to_message().SerializeToString()
+        for name, schema in schemas.items():
+            checkpoint.schemas[name] = schema.serialize().to_pybytes()
+        for name, tool in self.gate.tools.items():
+            if isinstance(tool, ToolBase):
+                state = tool.checkpoint()
+                if state:
+                    checkpoint.states[name] = state
+        checkpoint.processed_bytes = self.gate.meta.summary.processed_bytes
+        checkpoint.processed_ndatums = self.gate.meta.summary.processed_ndatums
+        try:
+            self.gate.store.save_checkpoint(self.output_id, self.job_id, checkpoint)
+        except Exception:
+            self.__logger.error("Cannot save checkpoint")
+            raise
+        self.__logger.info("Checkpoint after %i datums", len(self._completed))
+
+        # A stream consumes its inputs at each checkpoint, the next checkpoint
+        # only records the datums and outputs since this one
+        if getattr(self.datahandler, "streaming", False):
+            inputs = [key for key in self._completed if key in self.gate.store]
+            self.gate.store.update_watermark(self.output_id, inputs)
+            self.gate.store.save_store()
+            self._completed = []
+            self._offsets = {
+                "files": len(dataset.files),
+                "tables": len(dataset.tables),
+            }
+
+    def resume(self):
+        """
+        Resume the job from the checkpoint of a previous attempt.
+        Replaces sampling and rebook, the outputs, histograms, tdigests, sketches,
+        output schemas and the state of the tools are restored.
+        The completed datums are skipped.
+        """
+        checkpoint = self.checkpoint
+        self.__logger.info(
+            "Resume job %s after %i datums", self.job_id, len(checkpoint.datums)
+        )
+        self.gate.store.restore_checkpoint(self.output_id, checkpoint)
+
+        hists = HistogramCollection()
+        hists.ParseFromString(checkpoint.hists)
+        stats = {
+            name: {"sum": x.sum, "sum2": x.sum2} for name, x in checkpoint.stats.items()
+        }
+        self.gate.hbook.restore(hists, stats)
+        tdigests = TDigest_store()
+        tdigests.ParseFromString(checkpoint.tdigests)
+        self.gate.tbook.restore(tdigests)
+        sketches = Sketch_store()
+        sketches.ParseFromString(checkpoint.sketches)
+        self.gate.sbook.restore(sketches)
+
+        for name, state in checkpoint.states.items():
+            try:
+                self.get_tool(name).resume(state)
+            except Exception:
+                self.__logger.error("Cannot resume tool %s", name)
+                raise
+
+        schemas = {}
+        for name, buf in checkpoint.schemas.items():
+            schemas[name] = pa.ipc.read_schema(pa.py_buffer(buf))
+        try:
+            self.collector.initialize(schemas)
+        except Exception:
+            self.__logger.error("Cannot initialize collector")
+            raise
+
+        self.gate.meta.summary.processed_bytes = checkpoint.processed_bytes
+        self.gate.meta.summary.processed_ndatums = checkpoint.processed_ndatums
+        self._completed = list(checkpoint.datums)
+        self._skip = set(checkpoint.datums)
+
     def finalize(self):
         """finalize Artemis sub-job.
 
@@ -529,6 +763,14 @@ class Artemis(MetaMixin, IOMetaMixin):
         except Exception:
             raise
 
+        # Outputs of the job are complete, a restart processes all datums
+        if self.gate.config.checkpoint_ndatums > 0:
+            self.gate.store.remove_checkpoint(self.output_id, self.job_id)
+
+        # Input files are consumed, incremental jobs skip them
+        inputs = [key for key in self._completed if key in self.gate.store]
+        self.gate.store.update_watermark(self.output_id, inputs)
+
         self.__logger.info("Job Complete with state %s", self.job_state)
 
     def abort(self, *args, **kwargs):
@@ -554,11 +796,15 @@ class Artemis(MetaMixin, IOMetaMixin):
         self.__logger.error("Artemis has been triggered to Abort")
         self.__logger.error("Reason %s" % args[0])
 
-        try:
-            self.collector.finalize()
-        except Exception:
-            self.__logger.error("Collector fails to finalize buffer")
-            raise
+        # Outputs after the last checkpoint are processed again on restart
+        if self.gate.config.checkpoint_ndatums > 0:
+            self.__logger.info("Discard outputs after the last checkpoint")
+        else:
+            try:
+                self.collector.finalize()
+            except Exception:
+                self.__logger.error("Collector fails to finalize buffer")
+                raise
 
         self.gate.meta.finished.GetCurrentTime()
         try:
@@ -38,6 +38,8 @@ class CsvGenOptions:
     linesep = "\r\n"
     delimiter = ","
     blocksize = 2 ** 16
+    parser_blocksize = None  # Chunk size of threaded csv parser, None for 1 chunk
+    dictionary_encode = False  # Dictionary encode low-cardinality string columns
 
 
 @Logger.logged
@@ -66,8 +68,12 @@ class CsvGenConfig(Configurable):
         self._config_tdigest()
 
         # Ensure block_size for arrow parser greater than
-        # file chunk size
-        csvtool = CsvTool("csvtool", block_size=(2 * self.blocksize))
+        # file chunk size, unless parsing a block in multiple chunks
+        csvtool = CsvTool(
+            "csvtool",
+            block_size=(self.parser_blocksize or 2 * self.blocksize),
+            dictionary_encode=self.dictionary_encode,
+        )
         self._tools.append(csvtool.to_msg())
         self._config_sampler()
         self._config_writer()
@@ -98,8 +104,12 @@ class CsvIOConfig(Configurable):
         self._config_tdigest()
 
         # Ensure block_size for arrow parser greater than
-        # file chunk size
-        csvtool = CsvTool("csvtool", block_size=(self.blocksize * 2))
+        # file chunk size, unless parsing a block in multiple chunks
+        csvtool = CsvTool(
+            "csvtool",
+            block_size=(self.parser_blocksize or 2 * self.blocksize),
+            dictionary_encode=self.dictionary_encode,
+        )
         self._tools.append(csvtool.to_msg())
         self._config_sampler()
         self._config_writer()
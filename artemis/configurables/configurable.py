@@ -57,9 +57,12 @@ class GlobalConfigOptions:
     # Defaults
     max_malloc = 2147483648  # Maximum memory allowed in Arrow memory pool
     max_buffer_size = 2147483648  # Maximum size serialized ipc message
+    max_file_age = 0  # Seconds before an output file is closed, 0 disables
+    zone_maps = False  # Record column statistics of the output files
     write_csv = True  # Output csv files
     sample_ndatums = 1  # Preprocess job to sample files from dataset
     sample_nchunks = 10  # Preprocess job to sample chunks from a file
+    checkpoint_ndatums = 0  # Datums between checkpoints of a job, 0 disables
     loglevel = "INFO"
     # Set by the config classes
     generator_type = None
@@ -89,6 +92,7 @@ class Configurable:
             self._msg.name = f"{self._msg.uuid}.config.pb"
 
         self._msg.max_malloc_size_bytes = self.max_malloc
+        self._msg.checkpoint_ndatums = self.checkpoint_ndatums
         self._tools = []
 
         if hasattr(self._msg, "config_id"):
@@ -154,6 +158,8 @@ class Configurable:
         tool = BufferOutputWriter(
             "bufferwriter",
             BUFFER_MAX_SIZE=self.max_buffer_size,
+            max_file_age=self.max_file_age,
+            zone_maps=self.zone_maps,
             write_csv=self.write_csv,
             path=self.output_repo,
         )
@@ -21,12 +21,12 @@
 Algorithms
 """
 from collections import OrderedDict
-import importlib
 from pprint import pformat
 
 from artemis.logger import Logger
 from artemis.core.abcalgo import AbcAlgoBase
 from artemis.core.properties import Properties
+from artemis.core.registry import resolve
 from artemis.core.gate import ArtemisGateSvc
 from artemis.io.protobuf.configuration_pb2 import Module as Algo_pb
 
@@ -84,6 +84,27 @@ class AlgoBase(MetaMixin, metaclass=AbcAlgoBase):
         """
         return self.__name
 
+    @property
+    def required_columns(self):
+        """
+        Columns read by the algorithm, used for projection pushdown
+        None if the algorithm may read any column of its input
+        """
+        return None
+
+    @property
+    def projects_columns(self):
+        """
+        True if the algorithm only passes its required columns downstream
+        """
+        return False
+
+    def push_columns(self, columns):
+        """
+        Restrict the columns produced by the algorithm, e.g. a parser
+        """
+        pass
+
     @staticmethod
     def load(logger, **kwargs):
         """
@@ -91,20 +112,15 @@ class AlgoBase(MetaMixin, metaclass=AbcAlgoBase):
         """
         logger.info("Loading Algo %s" % kwargs["name"])
         try:
-            module = importlib.import_module(kwargs["module"])
+            class_ = resolve(kwargs["class"], kwargs.get("module"))
         except ImportError:
-            logger.error("Unable to load module %s" % kwargs["module"])
-            raise
-        except Exception as e:
-            logger.error("Unknow error loading module: %s" % e)
+            logger.error("Unable to load module %s" % kwargs.get("module"))
             raise
-        try:
-            class_ = getattr(module, kwargs["class"])
         except AttributeError:
             logger.error("%s: missing attribute %s" % (kwargs["name"], kwargs["class"]))
             raise
         except Exception as e:
-            logger.error("Reason: %s" % e)
+            logger.error("Unknow error loading module: %s" % e)
             raise
 
         logger.debug(pformat(kwargs["properties"]))
@@ -156,20 +172,15 @@ class AlgoBase(MetaMixin, metaclass=AbcAlgoBase):
     def from_msg(logger, msg):
         logger.info("Loading Algo from msg %s", msg.name)
         try:
-            module = importlib.import_module(msg.module)
+            class_ = resolve(msg.klass, msg.module)
         except ImportError:
-            logger.error("Unable to load module %s", msg.module)
+            logger.error("Unable to load module %s", msg.module or msg.klass)
             raise
-        except Exception as e:
-            logger.error("Unknow error loading module: %s" % e)
-            raise
-        try:
-            class_ = getattr(module, msg.klass)
         except AttributeError:
             logger.error("%s: missing attribute %s" % (msg.name, msg.klass))
             raise
         except Exception as e:
-            logger.error("Reason: %s" % e)
+            logger.error("Unknow error loading module: %s" % e)
             raise
 
         properties = Properties.from_msg(msg.properties)
@@ -268,20 +279,15 @@ class IOAlgoBase(MetaMixin, IOMetaMixin, metaclass=AbcAlgoBase):
         """
         logger.info("Loading Algo %s" % kwargs["name"])
         try:
-            module = importlib.import_module(kwargs["module"])
+            class_ = resolve(kwargs["class"], kwargs.get("module"))
         except ImportError:
-            logger.error("Unable to load module %s" % kwargs["module"])
-            raise
-        except Exception as e:
-            logger.error("Unknow error loading module: %s" % e)
+            logger.error("Unable to load module %s" % kwargs.get("module"))
             raise
-        try:
-            class_ = getattr(module, kwargs["class"])
         except AttributeError:
             logger.error("%s: missing attribute %s" % (kwargs["name"], kwargs["class"]))
             raise
         except Exception as e:
-            logger.error("Reason: %s" % e)
+            logger.error("Unknow error loading module: %s" % e)
             raise
 
         logger.debug(pformat(kwargs["properties"]))
@@ -333,20 +339,15 @@ class IOAlgoBase(MetaMixin, IOMetaMixin, metaclass=AbcAlgoBase):
     def from_msg(logger, msg):
         logger.info("Loading Algo from msg %s", msg.name)
         try:
-            module = importlib.import_module(msg.module)
+            class_ = resolve(msg.klass, msg.module)
         except ImportError:
-            logger.error("Unable to load module %s", msg.module)
+            logger.error("Unable to load module %s", msg.module or msg.klass)
             raise
-        except Exception as e:
-            logger.error("Unknow error loading module: %s" % e)
-            raise
-        try:
-            class_ = getattr(module, msg.klass)
         except AttributeError:
             logger.error("%s: missing attribute %s" % (msg.name, msg.klass))
             raise
         except Exception as e:
-            logger.error("Reason: %s" % e)
+            logger.error("Unknow error loading module: %s" % e)
             raise
 
         properties = Properties.from_msg(msg.properties)
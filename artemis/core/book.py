@@ -25,7 +25,7 @@
 
 """
 Book classes that work as dictionaries. Concrete classes to store, access and manage
-histograms, tdigests and tool objects.
+histograms, tdigests, column sketches and tool objects.
 """
 
 import collections
@@ -43,8 +43,10 @@ from artemis.logger import Logger
 from artemis.utils.utils import autobinning
 from artemis.core.tool import ToolBase
 
-from artemis.externals.tdigest.tdigest import TDigest
+from artemis.externals.tdigest.tdigest import TDigest, Centroid
 from artemis.io.protobuf.tdigest_pb2 import TDigest_store, TDigest_instance
+from artemis.core.sketch import ColumnSketch
+from artemis.io.protobuf.sketch_pb2 import Sketch_store
 
 
 class BaseBook(collections.MutableMapping):
@@ -363,6 +365,27 @@ class ArtemisBook(BaseBook):
     def _to_message(self):
         return physt_write_many(self._content)
 
+    def stats(self):
+        """
+        Sum and sum of squares of the entries of each histogram,
+        which are not kept in the messages
+        """
+        return {n: dict(x._stats) for n, x in self if x._stats}
+
+    def restore(self, msg, stats=None):
+        """
+        Replace the histograms with the histograms of a message,
+        e.g. of a checkpoint, which are already rebooked
+        """
+        if stats is None:
+            stats = {}
+        for n, x in self._from_message(msg):
+            if n in stats:
+                x._stats = dict(stats[n])
+            self._set(n, x)
+        self._timers.clear()
+        self._rebooked = True
+
     def load(self, fname):
         msg = HistogramCollection()
         try:
@@ -512,23 +535,12 @@ class TDigestBook(BaseBook):
                 "Error: tried to decode a " "non protobuf object into a TDigest"
             )
 
-        digest_dict = {}
-
-        digest_dict["K"] = protobuf.K
-        digest_dict["delta"] = protobuf.delta
-
-        centroid_list = []
-
+        # The centroids of a serialized digest are inserted as is,
+        # rather than re-inserted as values with update_from_dict
+        digest = TDigest(protobuf.delta, protobuf.K)
         for centroid in protobuf.centroids:
-            current_centroid = {}
-            current_centroid["c"] = centroid.c
-            current_centroid["m"] = centroid.m
-            centroid_list.append(current_centroid)
-
-        digest_dict["centroids"] = centroid_list
-
-        digest = TDigest()
-        digest.update_from_dict(digest_dict)
+            digest._add_centroid(Centroid(centroid.m, centroid.c))
+            digest.n += centroid.c
         return digest
 
     def _from_message(self, msg):
@@ -544,6 +556,14 @@ class TDigestBook(BaseBook):
             store.digest_map[n].CopyFrom(self._digest_to_protobuf(x, n))
         return store
 
+    def restore(self, msg):
+        """
+        Replace the tdigests with the tdigests of a message, e.g. of a checkpoint
+        """
+        for n, x in self._from_message(msg):
+            self._set(n, x)
+        self._rebooked = True
+
     @classmethod
     def load(cls, fname):
         msg = TDigest_store()
@@ -572,6 +592,81 @@ class TDigestBook(BaseBook):
             raise
 
 
+@Logger.logged
+class SketchBook(BaseBook):
+    """
+    Book of mergeable column sketches
+
+    Sketches are booked on the first fill of a column,
+    with the precision and capacity of the booking algorithm.
+    """
+
+    def __init__(self, sketches={}):
+        super().__init__(sketches)
+        self._rebooked = False
+
+    def __setitem__(self, name, value):
+        """
+        book[key] = value
+        """
+
+        if not isinstance(name, str):
+            raise TypeError
+        if not isinstance(value, ColumnSketch):
+            raise TypeError
+
+        self._set(name, value)
+
+    def book(self, algname, name, precision=12, capacity=64):
+        name_ = ".".join([algname, name])
+        self.__logger.info("Booking %s", name_)
+        if self._get(name_) is not None:
+            self.__logger.error("Sketch already exists %s", name_)
+        else:
+            self[name_] = ColumnSketch(precision, capacity)
+
+    def rebook(self, excludes=[]):
+        """
+        Force reset of all sketches
+        """
+
+        self._rebooked = True
+        for n, x in self:
+            if n in excludes:
+                continue
+            self._set(n, ColumnSketch(x.precision, x.capacity))
+
+    def fill(self, algname, name, data, precision=12, capacity=64):
+        """
+        Update the sketch of a column with an Arrow array
+        """
+        name_ = ".".join([algname, name])
+        if self._get(name_) is None:
+            self.book(algname, name, precision, capacity)
+        self[name_].update(data)
+
+    def _from_message(self, msg):
+
+        content = collections.OrderedDict(
+            (n, ColumnSketch.from_protobuf(v)) for n, v in msg.sketch_map.items()
+        )
+        return self.__class__.load_from_dicts(content)
+
+    def _to_message(self):
+        store = Sketch_store()
+        for n, x in self:
+            store.sketch_map[n].CopyFrom(x.to_protobuf(n))
+        return store
+
+    def restore(self, msg):
+        """
+        Replace the sketches with the sketches of a message, e.g. of a checkpoint
+        """
+        for n, x in self._from_message(msg):
+            self._set(n, x)
+        self._rebooked = True
+
+
 @Logger.logged
 class ToolStore(BaseBook):
     # TODO
@@ -0,0 +1,173 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Job context, owns the framework services of one Artemis job
+
+The Singleton services (ArtemisGateSvc, ArrowSets) are resolved
+in the job context of the caller, held in a context variable.
+Outside of any job context the process-wide instances are used,
+as before. Jobs in separate contexts run concurrently in one
+interpreter, e.g. one thread per job
+
+    context = JobContext("job")
+    with context:
+        Artemis(jobinfo, loglevel="INFO").control()
+    hbook = context.hbook
+    context.close()
+
+or pass the context to the job, which enters it in control
+
+    Artemis(jobinfo, loglevel="INFO", context=JobContext("job")).control()
+
+Threads started within a job do not inherit the context,
+use context.run(func) or contextvars.copy_context().
+"""
+import contextvars
+import logging
+
+_current = contextvars.ContextVar("artemis_job_context", default=None)
+
+
+def current_context():
+    """
+    Job context of the caller, None outside of any job context
+    """
+    return _current.get()
+
+
+class JobContext:
+    """
+    Services of one Artemis job
+
+    Attributes
+    ----------
+        name : str
+            Name of the job
+        services : dict
+            Singleton class to instance within the context
+        handlers : list
+            Log handlers of the job, removed on close
+        heartbeat : callable
+            Optional, called with the JobInfo summary as the job progresses
+    """
+
+    def __init__(self, name=""):
+        self.name = name
+        self.services = {}
+        self.handlers = []
+        self.heartbeat = None
+        self._tokens = []
+
+    def __repr__(self):
+        return f"JobContext({self.name!r})"
+
+    def __enter__(self):
+        self._tokens.append(_current.set(self))
+        return self
+
+    def __exit__(self, *exc):
+        _current.reset(self._tokens.pop())
+        return False
+
+    def run(self, func, *args, **kwargs):
+        """
+        Call func within the context
+        """
+        with self:
+            return func(*args, **kwargs)
+
+    @property
+    def gate(self):
+        from artemis.core.gate import ArtemisGateSvc
+
+        with self:
+            return ArtemisGateSvc()
+
+    @property
+    def arrowsets(self):
+        from artemis.core.datastore import ArrowSets
+
+        with self:
+            return ArrowSets()
+
+    @property
+    def meta(self):
+        return self.gate.meta
+
+    @property
+    def hbook(self):
+        return self.gate.hbook
+
+    @property
+    def tbook(self):
+        return self.gate.tbook
+
+    @property
+    def sbook(self):
+        return self.gate.sbook
+
+    @property
+    def tools(self):
+        return self.gate.tools
+
+    @property
+    def store(self):
+        return self.gate.store
+
+    @property
+    def tree(self):
+        return self.gate.tree
+
+    def add_handler(self, handler, logger=None):
+        """
+        Add a log handler which only accepts records of this context
+
+        Parameters
+        ----------
+        handler : logging.Handler
+        logger : logging.Logger, default root logger
+        """
+        logger = logger or logging.getLogger()
+        handler.addFilter(ContextFilter(self))
+        logger.addHandler(handler)
+        self.handlers.append((logger, handler))
+
+    def close(self):
+        """
+        Remove and close the log handlers of the job
+        The services are retained for inspection of the job
+        """
+        while self.handlers:
+            logger, handler = self.handlers.pop()
+            logger.removeHandler(handler)
+            handler.close()
+
+
+class ContextFilter(logging.Filter):
+    """
+    Accepts the records logged within a job context
+    """
+
+    def __init__(self, context):
+        super().__init__()
+        self.context = context
+
+    def filter(self, record):
+        return current_context() is self.context
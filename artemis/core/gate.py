@@ -23,11 +23,12 @@ histograms, timers, and stores
 from artemis.logger import Logger
 from artemis.core.singleton import Singleton
 from artemis.core.tree import Tree
-from artemis.core.book import ArtemisBook, TDigestBook
+from artemis.core.book import ArtemisBook, TDigestBook, SketchBook
 from artemis.meta.cronus import BaseObjectStore
 from artemis.io.protobuf.cronus_pb2 import (
     HistsObjectInfo,
     TDigestObjectInfo,
+    SketchObjectInfo,
     JobObjectInfo,
 )
 from artemis.io.protobuf.artemis_pb2 import JobInfo as JobInfo_pb
@@ -54,6 +55,8 @@ class ArtemisGateSvc(metaclass=Singleton):
         OrderedDict of all histograms in framework
     tbook : TDigestBook
         OrderedDict of all tdigests in framework
+    sbook : SketchBook
+        OrderedDict of all column sketches in framework
     menu : Menu
         Business process graph
     config : Configuration
@@ -71,6 +74,7 @@ class ArtemisGateSvc(metaclass=Singleton):
         self.meta = JobInfo_pb()
         self.hbook = ArtemisBook()
         self.tbook = TDigestBook()
+        self.sbook = SketchBook()
         self.menu = Menu()
         self.config = Configuration()
         self.tools = ToolStore()
@@ -78,9 +82,11 @@ class ArtemisGateSvc(metaclass=Singleton):
         self.tree = None
         self._current_file_id = None
 
-    def configure(self, jobinfo):
+    def configure(self, jobinfo, store=None):
         """Configure the gate with jobinfo passed to Artemis.
 
+        An opened store, e.g. kept warm by a worker between jobs,
+        is used instead of loading the store of the job.
         """
         try:
             self.meta.CopyFrom(jobinfo)
@@ -93,16 +99,19 @@ class ArtemisGateSvc(metaclass=Singleton):
         self.meta.summary.processed_bytes = 0
         self.meta.summary.processed_ndatums = 0
 
-        try:
-            self.store = BaseObjectStore(
-                self.meta.store_path, self.meta.store_name, self.meta.store_id
-            )
-        except FileNotFoundError:
-            self.__logger.error("Store path does not exist")
-            raise
-        except Exception:
-            self.__logger.error("Unknown store error")
-            raise
+        if store is not None:
+            self.store = store
+        else:
+            try:
+                self.store = BaseObjectStore(
+                    self.meta.store_path, self.meta.store_name, self.meta.store_id
+                )
+            except FileNotFoundError:
+                self.__logger.error("Store path does not exist")
+                raise
+            except Exception:
+                self.__logger.error("Unknown store error")
+                raise
 
         try:
             self.store.get(self.meta.menu_id, self.menu)
@@ -210,6 +219,21 @@ class ArtemisGateSvc(metaclass=Singleton):
             self.__logger.error("Unable to register tdigest")
             raise
 
+        if len(self.sbook) > 0:
+            sinfo = SketchObjectInfo()
+            sinfo.keys.extend(self.sbook.keys())
+            smsg = self.sbook._to_message()
+            try:
+                self.store.register_content(
+                    smsg,
+                    sinfo,
+                    dataset_id=self.meta.dataset_id,
+                    job_id=self.meta.job_id,
+                )
+            except Exception:
+                self.__logger.error("Unable to register sketches")
+                raise
+
         try:
             self._finalize_jobstate()
         except Exception:
@@ -0,0 +1,201 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Plugin registry of algorithms, tools and generators
+
+A configuration references a class by module and class name,
+the module is imported only when the configuration is loaded.
+A class referenced by name only is looked up in
+    the plugins registered at runtime with register
+    the builtin plugins of Artemis
+    the entry points of installed packages in the group artemis.plugins
+
+e.g. a package provides plugins in its setup.py
+
+    entry_points={"artemis.plugins": ["MyAlgo = mypackage.myalgo:MyAlgo"]}
+
+lazy_import defers the import of a heavy dependency
+to the first access of one of its attributes.
+"""
+import importlib
+import importlib.util
+import sys
+import types
+
+ENTRY_POINT_GROUP = "artemis.plugins"
+
+# Class name to module of the plugins distributed with Artemis
+BUILTINS = {
+    # Algorithms
+    "CsvParserAlgo": "artemis.algorithms.csvparseralgo",
+    "DQRuleAlgo": "artemis.algorithms.dqrulealgo",
+    "DummyAlgo1": "artemis.algorithms.dummyalgo",
+    "FilterAlgo": "artemis.algorithms.filteralgo",
+    "LegacyDataAlgo": "artemis.algorithms.legacyalgo",
+    "ProfilerAlgo": "artemis.algorithms.profileralgo",
+    "RowFilterAlgo": "artemis.algorithms.rowfilteralgo",
+    # Tools
+    "BufferOutputWriter": "artemis.io.writer",
+    "CsvTool": "artemis.tools.csvtool",
+    "DQRuleTool": "artemis.tools.dqruletool",
+    "FileHandlerTool": "artemis.io.filehandler",
+    "FilterColTool": "artemis.tools.filtercoltool",
+    "FwfTool": "artemis.tools.fwftool",
+    "MfTool": "artemis.tools.mftool",
+    "PartitionedOutputWriter": "artemis.io.writer",
+    "RowFilterTool": "artemis.tools.rowfiltertool",
+    "TDigestTool": "artemis.tools.tdigesttool",
+    "XlsTool": "artemis.tools.xlstool",
+    # Generators
+    "FileGenerator": "artemis.generators.filegen",
+    "GenCsvLikeArrow": "artemis.generators.csvgen",
+    "GenMF": "artemis.generators.legacygen",
+    "SimuTableGen": "artemis.generators.simutablegen",
+    "StreamGenerator": "artemis.generators.streamgen",
+}
+
+_registered = {}  # Plugins registered at runtime
+_entry_points = None  # Entry points of installed packages, loaded once
+_classes = {}  # Resolved classes by (module, class name)
+
+
+def register(klass, module):
+    """
+    Register the module of a plugin class
+
+    Parameters
+    ----------
+    klass : class name
+    module : importable module path
+    """
+    _registered[klass] = module
+
+
+def plugins():
+    """
+    Class name to module of all known plugins
+    """
+    table = dict(BUILTINS)
+    table.update(_load_entry_points())
+    table.update(_registered)
+    return table
+
+
+def _load_entry_points():
+    global _entry_points
+    if _entry_points is None:
+        try:
+            from importlib import metadata
+        except ImportError:
+            try:
+                import importlib_metadata as metadata
+            except ImportError:
+                metadata = None
+        _entry_points = {}
+        if metadata is not None:
+            entries = metadata.entry_points()
+            if hasattr(entries, "select"):
+                entries = entries.select(group=ENTRY_POINT_GROUP)
+            else:
+                entries = entries.get(ENTRY_POINT_GROUP, [])
+            for entry in entries:
+                module, _, attr = entry.value.partition(":")
+                _entry_points[attr or entry.name] = module.strip()
+    return _entry_points
+
+
+def module_of(klass):
+    """
+    Module of a plugin class referenced by name only
+    """
+    if klass in _registered:
+        return _registered[klass]
+    if klass in BUILTINS:
+        return BUILTINS[klass]
+    try:
+        return _load_entry_points()[klass]
+    except KeyError:
+        raise ImportError(f"No module registered for plugin {klass}")
+
+
+def resolve(klass, module=None):
+    """
+    Import a plugin class, the module is imported on first use
+
+    Parameters
+    ----------
+    klass : class name
+    module : module path, looked up in the plugins if empty
+
+    Returns
+    -------
+    class
+
+    Raises
+    ------
+    ImportError if the module cannot be imported
+    AttributeError if the module has no class klass
+    """
+    if not module:
+        module = module_of(klass)
+    key = (module, klass)
+    if key not in _classes:
+        _classes[key] = getattr(importlib.import_module(module), klass)
+    return _classes[key]
+
+
+class _MissingModule(types.ModuleType):
+    """
+    Placeholder of a module which is not installed
+    """
+
+    def __getattr__(self, attr):
+        raise ImportError(f"Module {self.__name__} is required, not installed")
+
+
+def lazy_import(name):
+    """
+    Module imported on first access of an attribute
+
+    Modules already imported are returned as is.
+    A module which is not installed raises ImportError on first access.
+
+    Parameters
+    ----------
+    name : module path
+
+    Returns
+    -------
+    module
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        spec = None
+    if spec is None:
+        return _MissingModule(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -21,22 +21,35 @@
 Singleton class to allow
 creation of singleton objects, where appropriate.
 Think of Singleton types as data sinks
+
+Instances are held in the current job context, if any,
+see artemis.core.context, otherwise in the process
 """
+from artemis.core.context import current_context
 
 
 class Singleton(type):
     _instances = {}
 
+    @staticmethod
+    def _registry():
+        context = current_context()
+        if context is None:
+            return Singleton._instances
+        return context.services
+
     def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
-        return cls._instances[cls]
+        instances = Singleton._registry()
+        if cls not in instances:
+            instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
+        return instances[cls]
 
     def reset(cls):
-        if cls in cls._instances:
-            del cls._instances[cls]
+        instances = Singleton._registry()
+        if cls in instances:
+            del instances[cls]
         else:
             print("Key: " + str(cls) + " is not present.")
 
     def exists(cls):
-        return cls in cls._instances
+        return cls in Singleton._registry()
@@ -0,0 +1,385 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Mergeable sketches profiling the columns of record batches
+
+A ColumnSketch holds the count of values and nulls, the min and max,
+a HyperLogLog estimate of the number of distinct values and, for string
+columns, the space-saving counters of the most frequent values.
+Sketches are updated with Arrow arrays and summed with +, the sum of
+the sketches of batches, files or sub-jobs is the sketch of the dataset
+within the error bounds of the sketch, in bounded memory.
+
+A BloomFilter tests the membership of keys in a set of hashed keys,
+without false negatives.
+"""
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from artemis.core.registry import lazy_import
+from artemis.io.protobuf.sketch_pb2 import Sketch_instance
+
+pandas = lazy_import("pandas")
+
+
+def hash_array(array):
+    """
+    64-bit hashes of the values of an Arrow array without nulls
+
+    Dictionary arrays hash the dictionary once, values hash the same
+    whether the column is dictionary encoded or not.
+    """
+    if pa.types.is_dictionary(array.type):
+        hashes = hash_array(array.dictionary)
+        return hashes[array.indices.to_numpy(zero_copy_only=False)]
+    values = array.to_numpy(zero_copy_only=False)
+    return pandas.util.hash_array(values, categorize=False)
+
+
+def _bit_length(values):
+    """
+    Number of significant bits of unsigned 64-bit integers
+    """
+    length = np.zeros(len(values), dtype=np.uint8)
+    values = values.copy()
+    for shift in (32, 16, 8, 4, 2, 1):
+        mask = values >= np.uint64(1 << shift)
+        length[mask] += shift
+        values[mask] >>= np.uint64(shift)
+    length[values > 0] += 1
+    return length
+
+
+class HyperLogLog:
+    """
+    HyperLogLog estimate of the number of distinct values
+
+    2 ** precision registers of one byte, the relative standard error
+    is about 1.04 / sqrt(2 ** precision).
+    """
+
+    def __init__(self, precision=12):
+        if not 4 <= precision <= 18:
+            raise ValueError(f"HyperLogLog precision {precision} not in [4, 18]")
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def update(self, hashes):
+        """
+        Update the registers with the hashes of a batch of values
+        """
+        if len(hashes) == 0:
+            return
+        width = 64 - self.precision
+        index = hashes >> np.uint64(width)
+        rank = width + 1 - _bit_length(hashes & np.uint64((1 << width) - 1))
+        # Max rank of each register in the batch, aggregated in Arrow
+        table = pa.table({"index": index, "rank": rank})
+        ranks = table.group_by("index").aggregate([("rank", "max")])
+        index = ranks.column("index").to_numpy()
+        rank = ranks.column("rank_max").to_numpy()
+        self.registers[index] = np.maximum(self.registers[index], rank)
+
+    def estimate(self):
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.exp2(-self.registers.astype("float")))
+        zeros = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * m and zeros > 0:
+            # Linear counting for small cardinalities
+            estimate = m * np.log(m / zeros)
+        return estimate
+
+    def __add__(self, other):
+        if self.precision != other.precision:
+            raise ValueError("Cannot merge HyperLogLog of different precision")
+        out = HyperLogLog(self.precision)
+        out.registers = np.maximum(self.registers, other.registers)
+        return out
+
+
+class SpaceSaving:
+    """
+    Space-saving counters of the most frequent values
+
+    At most capacity values are counted, count - error <= frequency <= count
+    for counted values, values not counted have a frequency at most bound.
+    """
+
+    def __init__(self, capacity=64):
+        if capacity < 1:
+            raise ValueError(f"SpaceSaving capacity {capacity} less than 1")
+        self.capacity = capacity
+        self.bound = 0
+        self.counts = {}
+        self.errors = {}
+
+    def update(self, array):
+        """
+        Count the values of an Arrow array without nulls
+        """
+        counts = pc.value_counts(array)
+        batch = SpaceSaving(self.capacity)
+        batch.counts = dict(
+            zip(
+                counts.field("values").to_pylist(),
+                counts.field("counts").to_numpy().tolist(),
+            )
+        )
+        batch.errors = dict.fromkeys(batch.counts, 0)
+        batch._truncate()
+        merged = self + batch
+        self.bound = merged.bound
+        self.counts = merged.counts
+        self.errors = merged.errors
+
+    def _truncate(self):
+        if len(self.counts) <= self.capacity:
+            return
+        ranked = sorted(self.counts, key=self.counts.get, reverse=True)
+        dropped = ranked[self.capacity]
+        self.bound = max(self.bound, self.counts[dropped])
+        for value in ranked[self.capacity :]:
+            del self.counts[value]
+            del self.errors[value]
+
+    def top(self, k=None):
+        """
+        List of (value, count, error) of the k most frequent values
+        """
+        ranked = sorted(self.counts, key=self.counts.get, reverse=True)[:k]
+        return [(v, self.counts[v], self.errors[v]) for v in ranked]
+
+    def __add__(self, other):
+        out = SpaceSaving(max(self.capacity, other.capacity))
+        out.bound = self.bound + other.bound
+        for value in {**self.counts, **other.counts}:
+            out.counts[value] = self.counts.get(value, self.bound) + other.counts.get(
+                value, other.bound
+            )
+            out.errors[value] = self.errors.get(value, self.bound) + other.errors.get(
+                value, other.bound
+            )
+        out._truncate()
+        return out
+
+
+class BloomFilter:
+    """
+    Bloom filter of 64-bit hashes
+
+    The k positions of a hash are derived from its two 32-bit halves,
+    the false positive rate of n keys is about (1 - exp(-k n / m)) ** k
+    for m bits.
+    """
+
+    def __init__(self, num_bits, num_hashes):
+        if num_bits < 1 or num_hashes < 1:
+            raise ValueError(f"Bloom filter of {num_bits} bits, {num_hashes} hashes")
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.bits = np.zeros((num_bits + 7) // 8, dtype=np.uint8)
+
+    @classmethod
+    def optimal(cls, num_keys, fpp=0.01):
+        """
+        Smallest filter of num_keys keys with a false positive rate fpp
+        """
+        num_bits = max(64, int(np.ceil(-num_keys * np.log(fpp) / np.log(2) ** 2)))
+        num_hashes = max(1, int(round(num_bits / max(num_keys, 1) * np.log(2))))
+        return cls(num_bits, num_hashes)
+
+    def _positions(self, hashes):
+        h1 = hashes & np.uint64(0xFFFFFFFF)
+        h2 = (hashes >> np.uint64(32)) | np.uint64(1)
+        for i in range(self.num_hashes):
+            yield (h1 + np.uint64(i) * h2) % np.uint64(self.num_bits)
+
+    def update(self, hashes):
+        """
+        Add the hashes of a batch of keys
+        """
+        bits = np.unpackbits(self.bits)
+        for positions in self._positions(hashes):
+            bits[positions] = 1
+        self.bits = np.packbits(bits)
+
+    def contains(self, hashes):
+        """
+        Boolean mask of the hashes which could have been added
+        """
+        mask = np.ones(len(hashes), dtype=bool)
+        for positions in self._positions(hashes):
+            byte = self.bits[positions >> np.uint64(3)]
+            mask &= (byte >> (7 - (positions & np.uint64(7))).astype(np.uint8)) & 1 > 0
+        return mask
+
+
+class ColumnSketch:
+    """
+    Profile of a column: count, null count, min, max,
+    distinct values and most frequent values of strings,
+    not counted with a capacity of 0
+    """
+
+    def __init__(self, precision=12, capacity=64):
+        self.precision = precision
+        self.capacity = capacity
+        self.count = 0
+        self.null_count = 0
+        self.min = None
+        self.max = None
+        self.hll = HyperLogLog(precision)
+        self.topk = None
+
+    def update(self, data):
+        """
+        Update the sketch with an Arrow array or chunked array
+        """
+        if isinstance(data, pa.ChunkedArray):
+            for chunk in data.chunks:
+                self.update(chunk)
+            return
+        self.count += len(data)
+        self.null_count += data.null_count
+        if data.null_count > 0:
+            data = pc.drop_null(data)
+        if len(data) == 0:
+            return
+        self._update_range(data)
+        self.hll.update(hash_array(data))
+        if _is_string(data.type) and self.capacity > 0:
+            if self.topk is None:
+                self.topk = SpaceSaving(self.capacity)
+            self.topk.update(data)
+
+    def _update_range(self, data):
+        if pa.types.is_dictionary(data.type):
+            data = data.dictionary.take(pc.unique(data.indices))
+        type_ = data.type
+        if not (
+            pa.types.is_integer(type_)
+            or pa.types.is_floating(type_)
+            or pa.types.is_boolean(type_)
+            or _is_string(type_)
+        ):
+            return
+        minmax = pc.min_max(data)
+        lo, hi = minmax["min"].as_py(), minmax["max"].as_py()
+        if lo is None:
+            return
+        self.min = lo if self.min is None else min(self.min, lo)
+        self.max = hi if self.max is None else max(self.max, hi)
+
+    def distinct(self):
+        """
+        Estimated number of distinct values
+        """
+        return self.hll.estimate()
+
+    def top(self, k=None):
+        """
+        List of (value, count, error) of the most frequent values
+        """
+        if self.topk is None:
+            return []
+        return self.topk.top(k)
+
+    def __add__(self, other):
+        out = ColumnSketch(self.precision, max(self.capacity, other.capacity))
+        out.count = self.count + other.count
+        out.null_count = self.null_count + other.null_count
+        bounds = [x for x in (self.min, other.min) if x is not None]
+        out.min = min(bounds) if bounds else None
+        bounds = [x for x in (self.max, other.max) if x is not None]
+        out.max = max(bounds) if bounds else None
+        out.hll = self.hll + other.hll
+        if self.topk is None or other.topk is None:
+            out.topk = self.topk or other.topk
+        else:
+            out.topk = self.topk + other.topk
+        return out
+
+    def to_protobuf(self, name):
+        """
+        Sketch_instance message of the sketch
+        """
+        msg = Sketch_instance()
+        msg.name = name
+        msg.count = self.count
+        msg.null_count = self.null_count
+        _value_to_protobuf(self.min, msg.min)
+        _value_to_protobuf(self.max, msg.max)
+        msg.hll.precision = self.hll.precision
+        msg.hll.registers = self.hll.registers.tobytes()
+        msg.topk.capacity = self.capacity
+        if self.topk is not None:
+            msg.topk.bound = self.topk.bound
+            for value, count, error in self.topk.top():
+                counter = msg.topk.counters.add()
+                counter.value = value
+                counter.count = count
+                counter.error = error
+        return msg
+
+    @classmethod
+    def from_protobuf(cls, msg):
+        if not isinstance(msg, Sketch_instance):
+            raise TypeError(
+                "Error: tried to decode a non protobuf object into a sketch"
+            )
+        sketch = cls(msg.hll.precision, msg.topk.capacity)
+        sketch.count = msg.count
+        sketch.null_count = msg.null_count
+        sketch.min = _value_from_protobuf(msg.min)
+        sketch.max = _value_from_protobuf(msg.max)
+        sketch.hll.registers = np.frombuffer(msg.hll.registers, dtype=np.uint8).copy()
+        if len(msg.topk.counters) > 0:
+            sketch.topk = SpaceSaving(msg.topk.capacity)
+            sketch.topk.bound = msg.topk.bound
+            for counter in msg.topk.counters:
+                sketch.topk.counts[counter.value] = counter.count
+                sketch.topk.errors[counter.value] = counter.error
+        return sketch
+
+
+def _is_string(type_):
+    if pa.types.is_dictionary(type_):
+        type_ = type_.value_type
+    return pa.types.is_string(type_) or pa.types.is_large_string(type_)
+
+
+def _value_to_protobuf(value, msg):
+    if value is None:
+        return
+    if isinstance(value, str):
+        msg.string_value = value
+    elif isinstance(value, (bool, int)):
+        msg.int_value = value
+    else:
+        msg.double_value = value
+
+
+def _value_from_protobuf(msg):
+    field = msg.WhichOneof("value")
+    if field is None:
+        return None
+    return getattr(msg, field)
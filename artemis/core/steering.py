@@ -76,6 +76,7 @@ class Steering(AlgoBase):
         """
         self.__logger.info("Initialize Steering")
         self.from_msg()
+        self.push_columns(self.leaf_columns())
 
     def from_msg(self):
         """
@@ -142,6 +143,69 @@ class Steering(AlgoBase):
         self.__logger.info("Tree nodes are as follows: %s" % str(self.gate.tree.nodes))
         self.__logger.info("%s: Initialized Steering" % self.name)
 
+    def _paths(self, key):
+        """
+        Node keys of all paths from the initial node to the node key
+        """
+        parents = self.gate.tree.nodes[key].parents
+        if not parents:
+            return [[key]]
+        return [path + [key] for parent in parents for path in self._paths(parent)]
+
+    def _path_columns(self, path):
+        """
+        Columns required along a path
+        None if all columns are required
+        """
+        columns = []
+        for key in path:
+            for algo in self._menu[key]:
+                if isinstance(algo, str):
+                    continue
+                required = algo.required_columns
+                if required is None:
+                    return None
+                columns.extend(c for c in required if c not in columns)
+                if algo.projects_columns:
+                    # Downstream algorithms only receive the projected columns
+                    return columns
+        # No projection, leaf outputs all columns
+        return None
+
+    def leaf_columns(self):
+        """
+        Columns required to produce the output of all leaves
+        gathered from the algorithm declarations
+
+        Returns
+        -------
+        list of column names, None if any leaf requires all columns
+        """
+        columns = []
+        for leaf in self.gate.tree.leaves:
+            for path in self._paths(leaf):
+                required = self._path_columns(path)
+                if required is None:
+                    self.__logger.info("Leaf %s requires all columns", leaf)
+                    return None
+                columns.extend(c for c in required if c not in columns)
+        return columns
+
+    def push_columns(self, columns):
+        """
+        Push the required columns into the algorithms, e.g. parsers,
+        such that unused columns are never parsed
+        """
+        if columns is None:
+            self.__logger.info("No projection pushdown")
+            return
+        self.__logger.info("Projection pushdown %s", columns)
+        for key in self._menu:
+            for algo in self._menu[key]:
+                if isinstance(algo, str):
+                    continue
+                algo.push_columns(columns)
+
     def lock(self):
         """
         Overides the base class lock.
@@ -26,11 +26,11 @@ Tools can be registered in a ToolSvc, and lookup via name
 through the Algo via a property with name of tool
 
 """
-import importlib
 from pprint import pformat
 
 from artemis.logger import Logger
 from artemis.core.properties import Properties
+from artemis.core.registry import resolve
 from artemis.io.protobuf.configuration_pb2 import Module as Tool_pb
 
 from artemis.core.abcalgo import AbcAlgoBase
@@ -77,20 +77,15 @@ class ToolBase(metaclass=AbcAlgoBase):
     def from_msg(logger, msg):
         logger.info("Loading Tool from msg %s", msg.name)
         try:
-            module = importlib.import_module(msg.module)
+            class_ = resolve(msg.klass, msg.module)
         except ImportError:
-            logger.error("Unable to load module %s", msg.module)
+            logger.error("Unable to load module %s", msg.module or msg.klass)
             raise
-        except Exception as e:
-            logger.error("Unknow error loading module: %s" % e)
-            raise
-        try:
-            class_ = getattr(module, msg.klass)
         except AttributeError:
             logger.error("%s: missing attribute %s" % (msg.name, msg.klass))
             raise
         except Exception as e:
-            logger.error("Reason: %s" % e)
+            logger.error("Unknow error loading module: %s" % e)
             raise
 
         properties = Properties.from_msg(msg.properties)
@@ -131,3 +126,17 @@ class ToolBase(metaclass=AbcAlgoBase):
         Ideally, most tools accept an Arrow Array or batch
         """
         pass
+
+    def checkpoint(self):
+        """
+        State of the tool to persist in a job checkpoint,
+        e.g. a schema locked when sampling. Empty if stateless
+        """
+        return b""
+
+    def resume(self, state):
+        """
+        Restore the state of checkpoint when a job resumes,
+        replaces the sampling of the tool
+        """
+        pass
@@ -0,0 +1,175 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Parallel tree reduction of the books registered by the sub-jobs of a dataset
+
+Each sub-job registers its histograms, tdigests and sketches in the
+dataset. The serialized books are merged in a tree, each level merges
+groups of fanin books in parallel on a process pool, such that N books
+are summed in log(N) levels rather than N serial additions.
+The sum is registered as a single object of each kind in the dataset,
+under the job key of the merged books.
+
+    hbook, tbook, sbook = reduce_books(store, dataset_id, nworkers=4)
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+from artemis.core.book import ArtemisBook, TDigestBook, SketchBook
+from artemis.io.protobuf.cronus_pb2 import (
+    HistsObjectInfo,
+    TDigestObjectInfo,
+    SketchObjectInfo,
+)
+from artemis.io.protobuf.histogram_pb2 import HistogramCollection
+from artemis.io.protobuf.tdigest_pb2 import TDigest_store
+from artemis.io.protobuf.sketch_pb2 import Sketch_store
+
+# Book class, message class and object info class of each kind of book
+BOOKS = {
+    "hists": (ArtemisBook, HistogramCollection, HistsObjectInfo),
+    "tdigests": (TDigestBook, TDigest_store, TDigestObjectInfo),
+    "sketches": (SketchBook, Sketch_store, SketchObjectInfo),
+}
+
+
+def _load(kind, buf):
+    book, message, _ = BOOKS[kind]
+    msg = message()
+    msg.ParseFromString(buf)
+    return book()._from_message(msg)
+
+
+def _merge(kind, bufs):
+    """
+    Serialized sum of serialized books, run in the pool
+    """
+    book = _load(kind, bufs[0])
+    for buf in bufs[1:]:
+        book += _load(kind, buf)
+    return book._to_message().SerializeToString()
+
+
+def tree_reduce(kind, bufs, executor=None, fanin=2):
+    """
+    Sum of serialized books by a tree of merges
+
+    Parameters
+    ----------
+    kind : hists, tdigests or sketches
+    bufs : serialized books
+    executor : pool merging the groups of a level in parallel,
+        the groups are merged in process if None
+    fanin : number of books merged by a node of the tree
+
+    Returns
+    -------
+    Serialized sum of the books
+    """
+    if fanin < 2:
+        raise ValueError(f"Tree reduction fanin {fanin} less than 2")
+    bufs = list(bufs)
+    if not bufs:
+        return BOOKS[kind][0]()._to_message().SerializeToString()
+    while len(bufs) > 1:
+        groups = [bufs[i : i + fanin] for i in range(0, len(bufs), fanin)]
+        if executor is None:
+            bufs = [_merge(kind, group) for group in groups]
+        else:
+            bufs = list(executor.map(_merge, [kind] * len(groups), groups))
+    return bufs[0]
+
+
+def merge_books(
+    store,
+    dataset_id,
+    hists,
+    tdigests,
+    sketches=(),
+    job_id="merged",
+    nworkers=1,
+    fanin=2,
+):
+    """
+    Register the sum of histograms, tdigests and sketches of sub-jobs in the dataset
+
+    Parameters
+    ----------
+    store : BaseObjectStore
+    dataset_id : uuid of the dataset
+    hists : uuids of the histogram collections
+    tdigests : uuids of the tdigest collections
+    sketches : uuids of the sketch collections, registered only if not empty
+    job_id : job key of the merged objects
+    nworkers : number of processes of the reduction, merged in process if 1
+    fanin : number of books merged by a node of the tree
+
+    Returns
+    -------
+    ArtemisBook, TDigestBook, SketchBook
+    """
+    executor = ProcessPoolExecutor(nworkers) if nworkers > 1 else None
+    books = []
+    try:
+        for kind, ids in (
+            ("hists", hists),
+            ("tdigests", tdigests),
+            ("sketches", sketches),
+        ):
+            bufs = [bytes(store.get(id_)) for id_ in ids]
+            book = _load(kind, tree_reduce(kind, bufs, executor, fanin))
+            books.append(book)
+            if kind == "sketches" and not ids:
+                continue
+            info = BOOKS[kind][2]()
+            info.keys.extend(book.keys())
+            store.register_content(
+                book._to_message(), info, dataset_id=dataset_id, job_id=job_id
+            )
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return tuple(books)
+
+
+def reduce_books(store, dataset_id, job_id="merged", nworkers=1, fanin=2):
+    """
+    Register the sum of the books of all the jobs of a dataset
+
+    Books registered under job_id, e.g. by a previous reduction,
+    are not summed again.
+
+    Returns
+    -------
+    ArtemisBook, TDigestBook, SketchBook
+    """
+
+    def ids(objs):
+        return [obj.uuid for obj in objs if f".job_{job_id}." not in obj.name]
+
+    return merge_books(
+        store,
+        dataset_id,
+        ids(store.list_histograms(dataset_id)),
+        ids(store.list_tdigests(dataset_id)),
+        ids(store.list_sketches(dataset_id)),
+        job_id=job_id,
+        nworkers=nworkers,
+        fanin=fanin,
+    )
@@ -0,0 +1,421 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Scheduler of a dataset job over the input files of a parentset
+
+The input files of the parentset are listed from the store
+and packed by size into work units of balanced bytes.
+Each work unit is a sub-job reading only its files, run on
+a pool of warm workers. Units outnumber the workers and
+are queued largest first, idle workers take the next unit,
+such that uneven files do not leave workers idle.
+The outputs of the sub-jobs are merged into the dataset,
+with the histograms, tdigests and sketches summed over all sub-jobs
+in a parallel tree reduction.
+
+Sub-jobs report their processed bytes in heartbeats. Once the
+queue is drained, a sub-job processing slower than the median
+rate of the completed sub-jobs by straggler_factor is a straggler,
+its work unit is speculatively run again on an idle worker.
+The first attempt to finish is committed to the dataset,
+the other attempt is cancelled and its outputs removed.
+
+With an incremental FileGenerator, files in the watermark of the
+output dataset are not scheduled, a run over a dataset processes
+only the files added to the parentset since its last run.
+
+    scheduler = DatasetScheduler(store, menu_id, config_id, nworkers=8)
+    dataset_id = scheduler.run(parentset_id)
+"""
+import heapq
+import os
+import statistics
+import time
+import urllib.parse
+import uuid
+from concurrent.futures import FIRST_COMPLETED, wait
+
+from artemis.logger import Logger
+from artemis.decorators import iterable
+from artemis.distributed.reduction import merge_books
+from artemis.distributed.workerpool import WorkerPool, discard
+from artemis.errors import JobCancelledError
+from artemis.io.protobuf.artemis_pb2 import JobInfo as JobInfo_pb
+from artemis.io.protobuf.configuration_pb2 import Configuration
+from artemis.io.protobuf.cronus_pb2 import ConfigObjectInfo, DatasetObjectInfo
+
+
+@iterable
+class SchedulerOptions:
+    name = "scheduler"  # Name of the sub-jobs
+    nworkers = 1  # Number of worker processes
+    units_per_worker = 4  # Work units queued per worker
+    loglevel = "INFO"  # Log level of the sub-jobs
+    preload = []  # Modules imported on startup of the workers
+    speculate = True  # Run the work unit of a straggler again on an idle worker
+    straggler_factor = 2.0  # Slowdown to the median rate of a straggler
+    min_elapsed = 5.0  # Seconds before a sub-job can be a straggler
+    heartbeat_interval = 0.5  # Seconds between heartbeats of the sub-jobs
+
+
+def pack(sizes, nunits):
+    """
+    Pack items into units of balanced total size,
+    assigning the largest remaining item to the smallest unit
+
+    Parameters
+    ----------
+    sizes : list of item sizes
+    nunits : maximum number of units
+
+    Returns
+    -------
+    list of lists of item indices, largest unit first
+    """
+    nunits = max(1, min(nunits, len(sizes)))
+    units = [(0, i, []) for i in range(nunits)]
+    for idx in sorted(range(len(sizes)), key=lambda i: sizes[i], reverse=True):
+        total, i, items = heapq.heappop(units)
+        items.append(idx)
+        heapq.heappush(units, (total + sizes[idx], i, items))
+    units = [unit for unit in units if unit[2]]
+    return [items for _, _, items in sorted(units, reverse=True)]
+
+
+class StragglerDetector:
+    """
+    Tracks the rate of sub-jobs from their heartbeats
+
+    A running sub-job is a straggler if its rate is below the median rate
+    of the completed sub-jobs divided by factor
+
+    Parameters
+    ----------
+    factor : slowdown to the median rate of a straggler
+    min_elapsed : seconds before a sub-job can be a straggler
+    """
+
+    def __init__(self, factor=2.0, min_elapsed=5.0):
+        self.factor = factor
+        self.min_elapsed = min_elapsed
+        self.started = {}  # Start time of the running sub-jobs
+        self.processed = {}  # Processed bytes of the running sub-jobs
+        self.rates = []  # Bytes per second of the completed sub-jobs
+
+    def beat(self, key, nbytes, ndatums, time_):
+        self.started.setdefault(key, time_)
+        self.processed[key] = nbytes
+
+    def complete(self, key, nbytes, time_):
+        start = self.started.pop(key, None)
+        self.processed.pop(key, None)
+        if start is not None and time_ > start:
+            self.rates.append(nbytes / (time_ - start))
+
+    def discard(self, key):
+        self.started.pop(key, None)
+        self.processed.pop(key, None)
+
+    def stragglers(self, now):
+        """
+        Keys of the running stragglers, slowest first
+        """
+        if not self.rates:
+            return []
+        threshold = statistics.median(self.rates) / self.factor
+        rates = []
+        for key, start in self.started.items():
+            elapsed = now - start
+            if elapsed < self.min_elapsed:
+                continue
+            rate = self.processed[key] / elapsed
+            if rate < threshold:
+                rates.append((rate, key))
+        return [key for _, key in sorted(rates)]
+
+
+@Logger.logged
+class DatasetScheduler:
+    """
+    Runs a dataset job as sub-jobs over balanced work units of input files
+
+    Parameters
+    ----------
+    store : BaseObjectStore
+        Store of the parentset, menu, configuration and output dataset
+    menu_id : str
+        uuid of the menu
+    config_id : str
+        uuid of the configuration, with a FileGenerator input
+
+    Other Parameters
+    ----------------
+    name : str
+        Name of the sub-jobs
+    nworkers : int
+        Number of worker processes
+    units_per_worker : int
+        Work units per worker, more units balance uneven files
+    loglevel : str
+        Log level of the sub-jobs
+    preload : list
+        Modules imported on startup of the workers
+    speculate : bool
+        Run the work unit of a straggler again on an idle worker
+    straggler_factor : float
+        Slowdown to the median rate of a straggler
+    min_elapsed : float
+        Seconds before a sub-job can be a straggler
+    heartbeat_interval : float
+        Seconds between heartbeats of the sub-jobs
+    """
+
+    def __init__(self, store, menu_id, config_id, **kwargs):
+        options = dict(SchedulerOptions())
+        options.update(kwargs)
+
+        self.store = store
+        self.menu_id = menu_id
+        self.config_id = config_id
+        self.name = options["name"]
+        self.nworkers = options["nworkers"]
+        self.nunits = options["nworkers"] * options["units_per_worker"]
+        self.loglevel = options["loglevel"]
+        self.preload = options["preload"]
+        self.speculate = options["speculate"]
+        self.straggler_factor = options["straggler_factor"]
+        self.min_elapsed = options["min_elapsed"]
+        self.heartbeat_interval = options["heartbeat_interval"]
+
+        self.config = Configuration()
+        self.store.get(config_id, self.config)
+        self.glob = ""
+        self.incremental = False
+        for p in self.config.input.generator.config.properties.property:
+            if p.name == "glob":
+                self.glob = p.value
+            elif p.name == "incremental":
+                self.incremental = p.value == "True"
+
+    def size_of(self, id_):
+        """
+        Size of a file from its metadata, on-disk size if not recorded
+        """
+        obj = self.store[id_]
+        if obj.file.size_bytes > 0:
+            return obj.file.size_bytes
+        location = urllib.parse.unquote(urllib.parse.urlparse(obj.address).path)
+        try:
+            return os.path.getsize(location)
+        except OSError:
+            return 0
+
+    def list_inputs(self, parentset_id, dataset_id=None):
+        """
+        Input files of the parentset and their size in bytes,
+        if incremental without the files consumed by the dataset
+
+        Returns
+        -------
+        list of uuids, list of sizes
+        """
+        ids = [
+            obj.uuid
+            for obj in self.store.list(prefix=parentset_id, suffix=self.glob)
+            if self.store[obj.uuid].WhichOneof("info") == "file"
+        ]
+        if self.incremental and dataset_id is not None:
+            watermark = set(self.store.list_watermark(dataset_id))
+            ids = [id_ for id_ in ids if id_ not in watermark]
+        return ids, [self.size_of(id_) for id_ in ids]
+
+    def _unit_config(self, file_ids):
+        """
+        Register the configuration of a work unit, reading only file_ids
+        """
+        config = Configuration()
+        config.CopyFrom(self.config)
+        config.uuid = str(uuid.uuid4())
+        config.name = f"{config.uuid}.config.pb"
+        properties = config.input.generator.config.properties
+        for p in properties.property:
+            if p.name == "file_ids":
+                properties.property.remove(p)
+                break
+        p = properties.property.add()
+        p.name = "file_ids"
+        p.type = "list"
+        p.value = str(file_ids)
+        configinfo = ConfigObjectInfo()
+        configinfo.created.GetCurrentTime()
+        return self.store.register_content(config, configinfo).uuid
+
+    def _jobinfo(self, dataset_id, parentset_id, config_id):
+        job = JobInfo_pb()
+        job.name = self.name
+        job.store_path = self.store.root
+        job.store_id = self.store.store_uuid
+        job.store_name = self.store.store_name
+        job.menu_id = self.menu_id
+        job.config_id = config_id
+        job.dataset_id = dataset_id
+        job.parentset_id = parentset_id
+        job.job_id = str(self.store.new_job(dataset_id))
+        return job
+
+    def run(self, parentset_id, dataset_id=None):
+        """
+        Process all input files of the parentset,
+        if incremental the files not consumed by the dataset
+
+        Parameters
+        ----------
+        parentset_id : uuid of the input dataset
+        dataset_id : uuid of the output dataset, registered if None
+
+        Returns
+        -------
+        uuid of the output dataset
+        """
+        if dataset_id is None:
+            dataset_id = self.store.register_dataset(self.menu_id, self.config_id).uuid
+
+        ids, sizes = self.list_inputs(parentset_id, dataset_id)
+        if not ids and self.incremental:
+            self.__logger.info("No new input files in %s", parentset_id)
+            return dataset_id
+        if not ids:
+            self.__logger.error("No input files in %s", parentset_id)
+            raise ValueError
+        units = pack(sizes, self.nunits)
+        self.__logger.info(
+            "Scheduling %i files, %i bytes in %i units",
+            len(ids),
+            sum(sizes),
+            len(units),
+        )
+
+        jobs = []
+        for unit in units:
+            config_id = self._unit_config([ids[i] for i in unit])
+            jobs.append(self._jobinfo(dataset_id, parentset_id, config_id))
+        # Workers load the persisted store
+        self.store.save_store()
+
+        with WorkerPool(
+            nworkers=self.nworkers,
+            loglevel=self.loglevel,
+            preload=self.preload,
+            heartbeat_interval=self.heartbeat_interval if self.speculate else None,
+        ) as pool:
+            updates = self._execute(
+                pool, jobs, [sum(sizes[i] for i in u) for u in units]
+            )
+        self.merge(dataset_id, updates)
+        self.store.save_store()
+        return dataset_id
+
+    def _execute(self, pool, jobs, unit_bytes):
+        """
+        Run the sub-jobs, speculatively run stragglers again
+
+        Returns
+        -------
+        Updates of the committed attempt of each work unit
+        """
+        detector = StragglerDetector(self.straggler_factor, self.min_elapsed)
+        committed = {}
+        running = {}
+        for iunit, job in enumerate(jobs):
+            running[pool.submit(job, key=(iunit, 0))] = (iunit, 0)
+        backups = set()
+
+        while running:
+            done, _ = wait(
+                running, timeout=self.heartbeat_interval, return_when=FIRST_COMPLETED
+            )
+            for beat in pool.heartbeats():
+                detector.beat(*beat)
+            now = time.time()
+
+            for future in done:
+                key = running.pop(future)
+                iunit = key[0]
+                error = future.exception()
+                if error is None and iunit not in committed:
+                    committed[iunit] = future.result()
+                    detector.complete(key, unit_bytes[iunit], now)
+                    for other in running.values():
+                        if other[0] == iunit:
+                            self.__logger.info("Cancel attempt %s", other)
+                            pool.cancel(other)
+                    continue
+                detector.discard(key)
+                if error is None:
+                    # Duplicate of a committed attempt
+                    self.__logger.info("Discard attempt %s", key)
+                    update = DatasetObjectInfo()
+                    update.ParseFromString(future.result())
+                    discard(update)
+                elif isinstance(error, JobCancelledError):
+                    self.__logger.info("Attempt %s cancelled", key)
+                elif iunit in committed or iunit in [k[0] for k in running.values()]:
+                    self.__logger.warning("Attempt %s failed: %s", key, error)
+                else:
+                    self.__logger.error("Work unit %i failed", iunit)
+                    raise error
+
+            if self.speculate:
+                for key in detector.stragglers(now):
+                    iunit = key[0]
+                    if len(running) >= self.nworkers:
+                        break
+                    if iunit in committed or iunit in backups:
+                        continue
+                    self.__logger.warning("Straggler %s, run unit %i again", key, iunit)
+                    backups.add(iunit)
+                    job = JobInfo_pb()
+                    job.CopyFrom(jobs[iunit])
+                    job.job_id = str(self.store.new_job(job.dataset_id))
+                    running[pool.submit(job, key=(iunit, 1))] = (iunit, 1)
+
+        return [committed[iunit] for iunit in sorted(committed)]
+
+    def merge(self, dataset_id, updates):
+        """
+        Merge the updates of the sub-jobs in the dataset
+        """
+        hists = []
+        tdigests = []
+        sketches = []
+        for buf in updates:
+            update = DatasetObjectInfo()
+            update.ParseFromString(buf)
+            for key in update.partitions:
+                if key not in self.store.list_partitions(dataset_id):
+                    self.store.new_partition(dataset_id, key)
+            hists.extend(obj.uuid for obj in update.hists)
+            tdigests.extend(obj.uuid for obj in update.tdigests)
+            sketches.extend(obj.uuid for obj in update.sketches)
+            self.store.update_dataset(dataset_id, buf)
+        merge_books(
+            self.store, dataset_id, hists, tdigests, sketches, nworkers=self.nworkers
+        )
+        self.__logger.info("Merged %i sub-jobs in %s", len(updates), dataset_id)
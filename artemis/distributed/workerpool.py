@@ -0,0 +1,331 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Pool of warm worker processes executing Artemis sub-jobs
+
+Workers are persistent processes, the framework is imported once
+and the metastore is kept open between sub-jobs, reloaded only
+when the persisted metastore changes. Each sub-job runs in its
+own JobContext and returns the objects it registered in its
+output dataset, serialized as a DatasetObjectInfo to be merged
+with update_dataset
+
+    with WorkerPool(nworkers=4) as pool:
+        futures = [pool.submit(job) for job in jobs]
+        for future in futures:
+            store.update_dataset(dataset_id, future.result())
+
+The store must be saved before submitting jobs.
+
+With a heartbeat interval, sub-jobs submitted with a key report
+their processed bytes and datums to the heartbeats of the pool,
+and a sub-job cancelled with its key stops at its next heartbeat.
+"""
+import importlib
+import multiprocessing
+import os
+import queue
+import time
+import urllib.parse
+from concurrent.futures import ProcessPoolExecutor
+
+from artemis.artemis import Artemis
+from artemis.logger import Logger
+from artemis.decorators import iterable
+from artemis.core.context import JobContext
+from artemis.errors import JobCancelledError
+from artemis.meta.cronus import BaseObjectStore
+from artemis.io.protobuf.artemis_pb2 import JobInfo as JobInfo_pb
+from artemis.io.protobuf.cronus_pb2 import DatasetObjectInfo
+
+# Dataset fields extended by a sub-job
+DATASET_FIELDS = ("jobs", "hists", "tdigests", "sketches", "files", "logs", "tables")
+
+# State of the worker process
+_worker = {"loglevel": "INFO", "stores": {}}
+
+
+@iterable
+class WorkerPoolOptions:
+    nworkers = 1  # Number of worker processes
+    loglevel = "INFO"  # Log level of the sub-jobs
+    preload = []  # Modules imported on startup of the workers
+    heartbeat_interval = None  # Seconds between heartbeats, None disables
+
+
+def _initialize_worker(loglevel, preload):
+    """
+    Import the plugins of the jobs once per worker
+    """
+    _worker["loglevel"] = loglevel
+    for module in preload:
+        importlib.import_module(module)
+
+
+def _open_store(jobinfo):
+    """
+    Metastore of the job, loaded again only if the persisted store changed
+    """
+    key = (jobinfo.store_path, jobinfo.store_name, jobinfo.store_id)
+    stat = os.stat(os.path.join(jobinfo.store_path, jobinfo.store_name))
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _worker["stores"].get(key)
+    if cached is None or cached[0] != version:
+        store = BaseObjectStore(*key[:2], store_uuid=jobinfo.store_id)
+        _worker["stores"][key] = (version, store)
+    return _worker["stores"][key][1]
+
+
+def _checkpoint(store, dataset_id):
+    """
+    Length of the dataset fields and of the store objects before a sub-job
+    """
+    dataset = store[dataset_id].dataset
+    lengths = {field: len(getattr(dataset, field)) for field in DATASET_FIELDS}
+    lengths["partitions"] = len(dataset.partitions)
+    lengths["watermark"] = len(dataset.watermark)
+    lengths["objects"] = len(store.store_info.objects)
+    return lengths
+
+
+def _update(store, dataset_id, lengths):
+    """
+    Update of the dataset with the objects registered by a sub-job
+    """
+    dataset = store[dataset_id].dataset
+    update = DatasetObjectInfo()
+    update.partitions.extend(dataset.partitions)
+    for field in DATASET_FIELDS:
+        getattr(update, field).extend(getattr(dataset, field)[lengths[field] :])
+    update.watermark.extend(dataset.watermark[lengths["watermark"] :])
+    return update
+
+
+def _restore(store, dataset_id, lengths):
+    """
+    Remove the objects registered by a sub-job from the kept store
+    """
+    dataset = store[dataset_id].dataset
+    for field in DATASET_FIELDS:
+        objs = getattr(dataset, field)
+        for obj in objs[lengths[field] :]:
+            if obj.uuid in store:
+                del store[obj.uuid]
+        del objs[lengths[field] :]
+    del dataset.partitions[lengths["partitions"] :]
+    del dataset.watermark[lengths["watermark"] :]
+    objs = store.store_info.objects
+    for obj in objs[lengths["objects"] :]:
+        if obj.uuid in store:
+            del store[obj.uuid]
+    del objs[lengths["objects"] :]
+
+
+def discard(update):
+    """
+    Remove the content of the objects of a dataset update from the store
+
+    Parameters
+    ----------
+    update : DatasetObjectInfo
+    """
+    for field in DATASET_FIELDS:
+        for obj in getattr(update, field):
+            location = urllib.parse.unquote(urllib.parse.urlparse(obj.address).path)
+            try:
+                os.remove(location)
+            except OSError:
+                pass
+
+
+class Heartbeat:
+    """
+    Reports the progress of a sub-job, at most once per interval
+
+    Parameters
+    ----------
+    key : key of the sub-job
+    heartbeats : queue of (key, processed bytes, processed datums, time)
+    cancelled : keys of the cancelled sub-jobs
+    interval : seconds between heartbeats
+    """
+
+    def __init__(self, key, heartbeats, cancelled, interval):
+        self.key = key
+        self.heartbeats = heartbeats
+        self.cancelled = cancelled
+        self.interval = interval
+        self._last = 0
+
+    def send(self, nbytes, ndatums):
+        self._last = time.monotonic()
+        self.heartbeats.put((self.key, nbytes, ndatums, time.time()))
+        if self.key in self.cancelled:
+            raise JobCancelledError(f"Sub-job {self.key} cancelled")
+
+    def __call__(self, summary):
+        if time.monotonic() - self._last >= self.interval:
+            self.send(summary.processed_bytes, summary.processed_ndatums)
+
+
+def run_subjob(msg, heartbeat=None):
+    """
+    Execute a sub-job in a worker
+
+    Parameters
+    ----------
+    msg : serialized JobInfo
+    heartbeat : Heartbeat of the sub-job, optional
+
+    Returns
+    -------
+    Serialized DatasetObjectInfo with the objects registered by the sub-job
+
+    Raises
+    ------
+    RuntimeError if the sub-job fails
+    JobCancelledError if the sub-job is cancelled, its outputs are removed
+    """
+    jobinfo = JobInfo_pb()
+    jobinfo.ParseFromString(msg)
+    if heartbeat is not None:
+        heartbeat.send(0, 0)
+
+    store = _open_store(jobinfo)
+    lengths = _checkpoint(store, jobinfo.dataset_id)
+    context = JobContext(f"{jobinfo.name}.job_{jobinfo.job_id}")
+    context.heartbeat = heartbeat
+    try:
+        bow = Artemis(
+            jobinfo, loglevel=_worker["loglevel"], context=context, store=store
+        )
+        status = bow.control()
+        if heartbeat is not None and heartbeat.key in heartbeat.cancelled:
+            discard(_update(store, jobinfo.dataset_id, lengths))
+            raise JobCancelledError(f"Sub-job {heartbeat.key} cancelled")
+        if status is False:
+            raise RuntimeError(f"Sub-job {jobinfo.job_id} failed")
+        return _update(store, jobinfo.dataset_id, lengths).SerializeToString()
+    finally:
+        context.close()
+        _restore(store, jobinfo.dataset_id, lengths)
+
+
+@Logger.logged
+class WorkerPool:
+    """
+    Executes Artemis sub-jobs on a pool of persistent processes
+
+    Parameters
+    ----------
+    nworkers : int
+        Number of worker processes
+    loglevel : str
+        Log level of the sub-jobs
+    preload : list
+        Modules imported on startup of the workers, e.g. the modules
+        of the algorithms and tools of the configuration
+    heartbeat_interval : float
+        Seconds between heartbeats of the sub-jobs, None disables heartbeats
+    """
+
+    def __init__(self, **kwargs):
+        options = dict(WorkerPoolOptions())
+        options.update(kwargs)
+
+        self.nworkers = options["nworkers"]
+        self.heartbeat_interval = options["heartbeat_interval"]
+        self._manager = None
+        if self.heartbeat_interval is not None:
+            self._manager = multiprocessing.Manager()
+            self._heartbeats = self._manager.Queue()
+            self._cancelled = self._manager.dict()
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.nworkers,
+            initializer=_initialize_worker,
+            initargs=(options["loglevel"], list(options["preload"])),
+        )
+        self.__logger.info("Started %i workers", self.nworkers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+        return False
+
+    def submit(self, jobinfo, key=None):
+        """
+        Queue a sub-job
+
+        Parameters
+        ----------
+        jobinfo : JobInfo_pb
+        key : key of the sub-job in heartbeats and cancel, optional
+
+        Returns
+        -------
+        Future of the serialized update of the output dataset
+        """
+        self.__logger.debug("Submit job %s", jobinfo.job_id)
+        heartbeat = None
+        if key is not None and self._manager is not None:
+            heartbeat = Heartbeat(
+                key, self._heartbeats, self._cancelled, self.heartbeat_interval
+            )
+        return self._pool.submit(run_subjob, jobinfo.SerializeToString(), heartbeat)
+
+    def heartbeats(self):
+        """
+        Heartbeats received since the last call
+
+        Returns
+        -------
+        list of (key, processed bytes, processed datums, time)
+        """
+        beats = []
+        while self._manager is not None:
+            try:
+                beats.append(self._heartbeats.get_nowait())
+            except queue.Empty:
+                break
+        return beats
+
+    def cancel(self, key):
+        """
+        Cancel a sub-job submitted with key, stops at its next heartbeat
+        """
+        if self._manager is None:
+            raise ValueError("Cancel requires heartbeats")
+        self._cancelled[key] = True
+
+    def map(self, jobinfos):
+        """
+        Execute sub-jobs, results in order of the jobs
+        """
+        msgs = [jobinfo.SerializeToString() for jobinfo in jobinfos]
+        return self._pool.map(run_subjob, msgs)
+
+    def shutdown(self, wait=True):
+        self._pool.shutdown(wait=wait)
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
+        self.__logger.info("Stopped workers")
@@ -21,6 +21,12 @@ class MissingDataError(ValueError):
     """
 
 
+class JobCancelledError(RuntimeError):
+    """
+    Raised in a sub-job cancelled by its scheduler
+    """
+
+
 class ParserWarning(Warning):
     """
     """
@@ -20,13 +20,15 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 """One-dimensional histograms."""
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, Optional, Tuple
 
 import numpy as np
 from . import bin_utils
 from .histogram_base import HistogramBase
 from .binnings import BinningBase
-import pandas
+
+if TYPE_CHECKING:
+    import pandas
 
 # TODO: Fix I/O with binning
 
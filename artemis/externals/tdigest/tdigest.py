@@ -25,8 +25,8 @@
 
 from __future__ import print_function
 
+import heapq
 from random import choice
-from itertools import chain
 from artemis.externals.accumulation_tree.accumulation_tree import AccumulationTree
 from artemis.externals.pyudorandom import pyudorandom
 
@@ -38,6 +38,10 @@ def _centroid_count(centroid):
     return centroid.count
 
 
+def _centroid_mean(centroid):
+    return centroid.mean
+
+
 class Centroid(object):
     def __init__(self, mean, count):
         self.mean = float(mean)
@@ -64,13 +68,39 @@ class TDigest(object):
         self.K = K
 
     def __add__(self, other_digest):
-        data = list(chain(self.C.values(), other_digest.C.values()))
-        new_digest = TDigest(self.delta, self.K)
+        return self.merge(other_digest)
 
-        if len(data) > 0:
-            for c in pyudorandom.items(data):
-                new_digest.update(c.mean, c.count)
+    def merge(self, *digests):
+        """
+        Sum of the t-digest with other t-digests.
 
+        The sorted centroids of the digests are merged in a single pass,
+        adjacent centroids are combined while the combined count is within
+        the size bound at their quantile. Unlike re-inserting the centroids
+        one by one, the cost is linear in the number of centroids.
+
+        """
+        digests = (self,) + digests
+        new_digest = TDigest(self.delta, self.K)
+        n = sum(d.n for d in digests)
+        if n == 0:
+            return new_digest
+
+        merged = []
+        cumulative = 0.0
+        for c in heapq.merge(*(d.C.values() for d in digests), key=_centroid_mean):
+            if merged:
+                last = merged[-1]
+                q = (cumulative + (last.count + c.count) / 2.0) / n
+                if last.count + c.count <= 4 * n * self.delta * q * (1 - q):
+                    last.update(c.mean, c.count)
+                    continue
+                cumulative += last.count
+            merged.append(Centroid(c.mean, c.count))
+
+        new_digest.n = n
+        for c in merged:
+            new_digest._add_centroid(c)
         return new_digest
 
     def __len__(self):
@@ -42,7 +42,6 @@ import itertools
 import codecs
 import decimal
 import unicodedata
-import importlib
 
 from functools import partial
 from pprint import pformat
@@ -55,6 +54,7 @@ import pyarrow as pa
 from artemis.logger import Logger
 from artemis.core.algo import AbcAlgoBase
 from artemis.core.properties import Properties
+from artemis.core.registry import resolve
 from artemis.core.gate import ArtemisGateSvc
 from artemis.io.protobuf.configuration_pb2 import Module as Algo_pb
 from artemis.errors import AbstractMethodError
@@ -168,6 +168,8 @@ class GeneratorBase(metaclass=AbcAlgoBase):
     Common base class for generators
     """
 
+    streaming = False  # Generates the datums of an unbounded stream
+
     def __init__(self, name, **kwargs):
         """
         Access the Base logger directly through
@@ -234,20 +236,15 @@ class GeneratorBase(metaclass=AbcAlgoBase):
     def from_msg(logger, msg):
         logger.info("Loading Algo from msg %s", msg.name)
         try:
-            module = importlib.import_module(msg.module)
+            class_ = resolve(msg.klass, msg.module)
         except ImportError:
-            logger.error("Unable to load module %s", msg.module)
-            raise
-        except Exception as e:
-            logger.error("Unknow error loading module: %s" % e)
+            logger.error("Unable to load module %s", msg.module or msg.klass)
             raise
-        try:
-            class_ = getattr(module, msg.klass)
         except AttributeError:
             logger.error("%s: missing attribute %s" % (msg.name, msg.klass))
             raise
         except Exception as e:
-            logger.error("Reason: %s" % e)
+            logger.error("Unknow error loading module: %s" % e)
             raise
 
         properties = Properties.from_msg(msg.properties)
@@ -285,6 +282,23 @@ class GeneratorBase(metaclass=AbcAlgoBase):
     def sampler(self):
         raise AbstractMethodError(self)
 
+    def stop(self):
+        """
+        End the generation of datums, e.g. of a stream
+        """
+        pass
+
+    def generate_datum(self):
+        """
+        Generate the content of a single datum, without registering it
+        Used for generating data in worker processes
+
+        Returns
+        -------
+        pa.Buffer
+        """
+        raise AbstractMethodError(self)
+
 
 class BuiltinsGenerator(object):
     def __init__(self, seed=None):
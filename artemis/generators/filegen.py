@@ -19,6 +19,10 @@
 
 """
 Class for generating lists of input files from OS
+
+In incremental mode, only the files not in the watermark of the
+output dataset are generated, i.e. files added to the parentset
+since the last successful job of the dataset.
 """
 from artemis.decorators import iterable
 from artemis.generators.common import GeneratorBase
@@ -27,6 +31,8 @@ from artemis.generators.common import GeneratorBase
 @iterable
 class FileGenOptions:
     nsamples = 1
+    file_ids = []  # uuids of the input files, all files of the parentset if empty
+    incremental = False  # Skip the files consumed by jobs of the output dataset
     # seed = 42
 
 
@@ -47,6 +53,8 @@ class FileGenerator(GeneratorBase):
         self._glob = self.properties.glob
         # self._seed = self.properties.seed
         self._nsamples = self.properties.nsamples
+        self._file_ids = self.properties.file_ids
+        self._incremental = self.properties.incremental
         self._batch_iter = None
         # self._batch_iter = pathlib.Path(self._path).glob(self._glob)
         # self.__logger.info("Path %s", self._path)
@@ -54,22 +62,27 @@ class FileGenerator(GeneratorBase):
         # self.__logger.info("Seed %s", self._seed)
         self.__logger.info("Samples %s", self._nsamples)
 
+    def _list_ids(self):
+        if self._file_ids:
+            ids = list(self._file_ids)
+        else:
+            ids = []
+            for obj in self.gate.store.list(
+                prefix=self.gate.meta.parentset_id, suffix=self._glob
+            ):
+                ids.append(obj.uuid)
+        if self._incremental:
+            watermark = set(self.gate.store.list_watermark(self.gate.meta.dataset_id))
+            ids = [id_ for id_ in ids if id_ not in watermark]
+            self.__logger.info("%i new files since the watermark", len(ids))
+        return ids
+
     def initialize(self):
-        ids = []
-        for obj in self.gate.store.list(
-            prefix=self.gate.meta.parentset_id, suffix=self._glob
-        ):
-            ids.append(obj.uuid)
-        self._batch_iter = iter(ids)
+        self._batch_iter = iter(self._list_ids())
 
     def reset(self):
         # self._batch_iter = pathlib.Path(self._path).glob(self._glob)
-        ids = []
-        for obj in self.gate.store.list(
-            prefix=self.gate.meta.parentset_id, suffix=self._glob
-        ):
-            ids.append(obj.uuid)
-        self._batch_iter = iter(ids)
+        self._batch_iter = iter(self._list_ids())
 
     def sampler(self):
         lst = list(self._batch_iter)
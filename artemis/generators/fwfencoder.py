@@ -0,0 +1,144 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Vectorized encoding of columns to fixed width fields
+
+Each column is encoded to a byte matrix of shape (records, field length)
+of latin-1 characters. The matrices of all fields are interleaved
+into records and encoded to the output codec in one pass.
+
+Signed integers are zoned decimals, the sign and the last digit
+are combined in an overpunch character, e.g. 123 -> 12C, -120 -> 12}
+"""
+import codecs
+
+import numpy as np
+
+SPACE = ord(" ")
+ZERO = ord("0")
+
+# Translation of latin-1 bytes to EBCDIC
+CP500 = np.frombuffer(bytes(range(256)).decode("latin-1").encode("cp500"), np.uint8)
+
+
+def overpunch_table(chars):
+    """
+    Lookup table of the overpunch character of each digit
+
+    Parameters
+    ----------
+    chars : dict of digit to overpunch character, e.g. {"0": "{", "1": "A", ...}
+
+    Returns
+    -------
+    np.ndarray of 10 character codes
+    """
+    return np.array([ord(chars[str(digit)]) for digit in range(10)], np.uint8)
+
+
+def encode_int(values, length, pos_char=None, neg_char=None):
+    """
+    Zero padded digits of integers, overpunched with the sign if given tables
+    Values wider than the field keep the low-order digits
+
+    Parameters
+    ----------
+    values : array-like of integers
+    length : field length
+    pos_char : overpunch table of positive values
+    neg_char : overpunch table of negative values
+
+    Returns
+    -------
+    np.ndarray (records, length) of uint8
+    """
+    values = np.asarray(values, dtype=np.int64)
+    remainder = np.abs(values)
+    matrix = np.empty((len(values), length), np.uint8)
+    for position in range(length - 1, -1, -1):
+        remainder, digit = np.divmod(remainder, 10)
+        matrix[:, position] = digit
+    if pos_char is not None:
+        last = matrix[:, -1]
+        matrix[:, -1] = np.where(values < 0, neg_char[last], pos_char[last])
+        matrix[:, :-1] += ZERO
+    else:
+        matrix += ZERO
+    return matrix
+
+
+def encode_str(values, length):
+    """
+    Left justified strings padded with spaces
+    Characters outside latin-1 are replaced
+
+    Parameters
+    ----------
+    values : array-like of str
+    length : field length
+
+    Returns
+    -------
+    np.ndarray (records, length) of uint8
+    """
+    values = np.char.encode(np.asarray(values, dtype=str), "latin-1", "replace")
+    # Fixed width truncates, shorter values are padded with null bytes
+    matrix = values.astype(f"S{length}").view(np.uint8).reshape(len(values), length)
+    matrix = matrix.copy()
+    matrix[matrix == 0] = SPACE
+    return matrix
+
+
+def random_str(random_state, source, nrecords, length):
+    """
+    Random strings of characters in source
+
+    Returns
+    -------
+    np.ndarray (records, length) of uint8
+    """
+    chars = np.frombuffer(source.encode("latin-1"), np.uint8)
+    return chars[random_state.randint(0, len(chars), (nrecords, length))]
+
+
+def encode_records(matrices, codec="cp500", header="", footer=""):
+    """
+    Interleave the fields into records, encoded to codec
+
+    Parameters
+    ----------
+    matrices : list of field byte matrices
+    codec : output encoding
+    header : prepended to the records
+    footer : appended to the records
+
+    Returns
+    -------
+    bytes
+    """
+    if matrices:
+        records = np.hstack(matrices)
+    else:
+        records = np.empty((0, 0), np.uint8)
+    if codecs.lookup(codec).name == "cp500":
+        data = CP500[records].tobytes()
+    else:
+        data = records.tobytes().decode("latin-1").encode(codec)
+    return header.encode(codec) + data + footer.encode(codec)
@@ -26,6 +26,12 @@ import pyarrow as pa
 
 from artemis.decorators import iterable
 from artemis.generators.common import GeneratorBase
+from artemis.generators.fwfencoder import (
+    encode_int,
+    encode_records,
+    overpunch_table,
+    random_str,
+)
 from artemis.io.protobuf.cronus_pb2 import FileObjectInfo
 
 
@@ -100,6 +106,11 @@ class GenMF(GeneratorBase):
         # Specific characters used for encoding signed integers.
         self.pos_char = self.properties.pos_char
         self.neg_char = self.properties.neg_char
+        self._pos_table = overpunch_table(self.pos_char)
+        self._neg_table = overpunch_table(self.neg_char)
+
+        # Data are fixed width fields
+        self.file_type = 2
 
         # Meta data
         self.header = self.properties.header
@@ -110,41 +121,26 @@ class GenMF(GeneratorBase):
     def gen_column(self, dataset, size):
         """
         Creates a column of data. The number of records is size.
-        """
-        rand_col = []
 
+        Returns
+        -------
+        np.ndarray (size, length) of the field characters
+        """
         #  Create data of specific unit types.
         if dataset["utype"] == "int":
-            # Creates a column of "size" records of integers.
-            for i in range(size):
-                dpoint = self.random_state.randint(
-                    dataset["min_val"], dataset["max_val"]
-                )
-                if dpoint < 0:
-                    # Convert negative integers.
-                    dpoint = str(dpoint)
-                    dpoint = dpoint.replace("-", "")
-                    dpoint = dpoint.replace(dpoint[-1], self.neg_char[dpoint[-1:]])
-                else:
-                    # Convert positive integers.
-                    dpoint = str(dpoint)
-                    dpoint = dpoint.replace(dpoint[-1], self.pos_char[dpoint[-1:]])
-                # Print to be converted to logger if appropriate.
-                self.__logger.debug("Data pointi: " + dpoint)
-                dpoint = ("0" * (dataset["length"] - len(dpoint))) + dpoint
-                self.__logger.debug("Data pointiw: " + dpoint)
-                rand_col.append(dpoint)
+            # Signed integers, overpunched zoned decimal
+            values = self.random_state.randint(
+                dataset["min_val"], dataset["max_val"], size
+            )
+            return encode_int(
+                values, dataset["length"], self._pos_table, self._neg_table
+            )
         elif dataset["utype"] == "uint":
-            # Creates a column of "size" records of unsigned ints.
-            for i in range(size):
-                dpoint = self.random_state.randint(
-                    dataset["min_val"], dataset["max_val"]
-                )
-                dpoint = str(dpoint)
-                self.__logger.debug("Data pointu: " + dpoint)
-                dpoint = ("0" * (dataset["length"] - len(dpoint))) + dpoint
-                self.__logger.debug("Data pointuw: " + dpoint)
-                rand_col.append(dpoint)
+            # Unsigned integers, zero padded
+            values = self.random_state.randint(
+                dataset["min_val"], dataset["max_val"], size
+            )
+            return encode_int(values, dataset["length"])
         else:
             # Creates a column of "size" records of strings.
             # Characters allowed in the string.
@@ -154,16 +150,7 @@ class GenMF(GeneratorBase):
                 + string.digits
                 + string.punctuation
             )
-            source = list(source)
-            for i in range(size):
-                dpoint = "".join(self.random_state.choice(source, dataset["length"]))
-                self.__logger.debug("Data pointc: " + dpoint)
-                dpoint = dpoint + (" " * (dataset["length"] - len(dpoint)))
-                self.__logger.debug("Data pointcw: " + dpoint)
-                rand_col.append(dpoint)
-
-        self.__logger.debug(rand_col)
-        return rand_col
+            return random_str(self.random_state, source, size, dataset["length"])
 
     def pad_header(self):
         len_pad = self.header_offset - len(self.header)
@@ -179,35 +166,21 @@ class GenMF(GeneratorBase):
         """
         Generates a chunk of data as per configured instance.
         """
-
-        header = self.pad_header()
-        footer = self.pad_footer()
-
-        chunk = header
-        cols = []
-
         # Creates a column of data for each field.
-        for dataset in self.ds_schema:
-            cols.append(self.gen_column(dataset, self.num_rows))
-
-        i = 0
+        cols = [self.gen_column(dataset, self.num_rows) for dataset in self.ds_schema]
 
-        # Goes through the columns to create records.
-        while i < self.num_rows:
-            for column in cols:
-                chunk = chunk + column[i]
-            i = i + 1
-
-        chunk = chunk + footer
-
-        self.__logger.debug("Chunk: %s", chunk)
         # Encode data chunk in cp500.
         # Might want to make this configurable.
-        chunk = chunk.encode(encoding="cp500")
-        self.__logger.debug("Chunk ebcdic: %s", chunk)
+        chunk = encode_records(
+            cols, "cp500", header=self.pad_header(), footer=self.pad_footer()
+        )
+        self.__logger.debug("Chunk size %i", len(chunk))
 
         return chunk
 
+    def generate_datum(self):
+        return pa.py_buffer(self.gen_chunk())
+
     def generate(self):
         while self._nbatches > 0:
             self.__logger.info("%s: Generating datum " % (self.__class__.__name__))
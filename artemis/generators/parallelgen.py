@@ -0,0 +1,195 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Driver for generating a dataset of synthetic data on a pool of processes
+
+The dataset is split into chunks, each generated with a seed
+derived from a common seed, such that the output does not depend
+on the number of workers.
+Chunks are written in the Cronus store by the workers
+and registered in bulk under the parent dataset,
+to be consumed by a FileGenerator.
+"""
+import os
+import shutil
+import tempfile
+import urllib.parse
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import numpy as np
+import pyarrow as pa
+
+from artemis.logger import Logger
+from artemis.decorators import iterable
+from artemis.core.properties import Properties
+from artemis.core.registry import resolve
+from artemis.meta.cronus import BaseObjectStore
+from artemis.io.protobuf.configuration_pb2 import Module as Algo_pb
+from artemis.io.protobuf.cronus_pb2 import FileObjectInfo
+
+
+@iterable
+class ParallelGenOptions:
+    nchunks = 1  # Number of files to generate
+    nworkers = 1  # Number of worker processes, 1 generates in process
+    seed = 42  # Seed from which the seed of each chunk is derived
+
+
+def generate_chunk(msg, seed, offset, store, path):
+    """
+    Generate a single datum and write to path
+
+    Parameters
+    ----------
+    msg : serialized generator configuration
+    seed : seed of the datum
+    offset : index of the first record of the datum in the dataset
+    store : tuple of root, name and uuid of the Cronus store
+    path : location of the datum
+
+    Returns
+    -------
+    Size of the datum in bytes
+    """
+    config = Algo_pb()
+    config.ParseFromString(msg)
+    class_ = resolve(config.klass, config.module)
+    properties = Properties.from_msg(config.properties)
+    properties["seed"] = seed
+    properties["record_offset"] = offset
+    generator = class_(config.name, **properties)
+
+    # Generators may retrieve their model from the store
+    # The gate is shared when generating in process
+    root, name, store_uuid = store
+    current = generator.gate.store
+    generator.gate.store = BaseObjectStore(root, name, store_uuid=store_uuid)
+    try:
+        generator.initialize()
+        data = generator.generate_datum()
+    finally:
+        generator.gate.store = current
+
+    with pa.OSFile(path, "wb") as f:
+        f.write(data)
+    return data.size
+
+
+@Logger.logged
+class ParallelGenerator:
+    """
+    Generates chunks of data with a configured generator
+    on a pool of processes
+    """
+
+    def __init__(self, generator, **kwargs):
+        options = dict(ParallelGenOptions())
+        options.update(kwargs)
+
+        self.generator = generator
+        self.nchunks = options["nchunks"]
+        self.nworkers = options["nworkers"]
+        self.seed = options["seed"]
+
+        self.__logger.info("%s: __init__ ParallelGenerator", generator.name)
+        self.__logger.info("Options %s", options)
+
+    @staticmethod
+    def chunk_seeds(seed, nchunks):
+        """
+        Independent seed of each chunk derived from a common seed
+        """
+        sequence = np.random.SeedSequence(seed)
+        return [int(child.generate_state(1)[0]) for child in sequence.spawn(nchunks)]
+
+    def run(self, store, dataset_id, job_id, partition_key=None):
+        """
+        Generate all chunks and register the files in the dataset
+
+        Parameters
+        ----------
+        store : BaseObjectStore
+        dataset_id : uuid of the parent dataset
+        job_id : job index
+        partition_key : defaults to the generator name
+
+        Returns
+        -------
+        list of MetaObject of the registered files, in chunk order
+        """
+        if partition_key is None:
+            partition_key = self.generator.name
+        if partition_key not in store.list_partitions(dataset_id):
+            store.new_partition(dataset_id, partition_key)
+        # Workers load the persisted store
+        store.save_store()
+
+        msg = self.generator.to_msg().SerializeToString()
+        seeds = self.chunk_seeds(self.seed, self.nchunks)
+        # Records of each chunk follow the records of the previous chunks
+        num_rows = getattr(self.generator, "num_rows", 0)
+        offsets = [ichunk * num_rows for ichunk in range(self.nchunks)]
+        store_args = (store.root, store.store_name, store.store_uuid)
+
+        staging = tempfile.mkdtemp(prefix=".staging.", dir=store.root)
+        paths = [os.path.join(staging, f"chunk_{i}") for i in range(self.nchunks)]
+        args = (repeat(msg), seeds, offsets, repeat(store_args), paths)
+        try:
+            if self.nworkers > 1:
+                with ProcessPoolExecutor(max_workers=self.nworkers) as pool:
+                    sizes = list(pool.map(generate_chunk, *args))
+            else:
+                sizes = list(map(generate_chunk, *args))
+            objs = self._register(
+                store, dataset_id, job_id, partition_key, paths, sizes
+            )
+        except Exception:
+            self.__logger.error("Failed generating chunks")
+            raise
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+        store.save_store()
+        self.__logger.info("Registered %i files", len(objs))
+        return objs
+
+    def _register(self, store, dataset_id, job_id, partition_key, paths, sizes):
+        """
+        Register all chunks and move the files to the store location
+        """
+        objs = []
+        for ichunk, (path, size) in enumerate(zip(paths, sizes)):
+            fileinfo = FileObjectInfo()
+            fileinfo.type = self.generator.file_type
+            fileinfo.partition = partition_key
+            fileinfo.size_bytes = size
+            with pa.memory_map(path) as content:
+                obj = store.register_content(
+                    content,
+                    fileinfo,
+                    dataset_id=dataset_id,
+                    partition_key=partition_key,
+                    job_id=f"{job_id}_chunk_{ichunk}",
+                )
+            location = urllib.parse.unquote(urllib.parse.urlparse(obj.address).path)
+            os.replace(path, location)
+            objs.append(obj)
+        return objs
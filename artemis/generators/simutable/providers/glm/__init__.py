@@ -53,28 +53,21 @@ class Provider(BaseProvider):
         y = np.dot(np.asarray(X), beta) + self.generator.random.gauss(0.0, sigma)
         return y
 
-    def glm(self, params_or_msg):
+    def _parameters(self, params_or_msg):
         """
-        expect a dictionary
+        Variable generators, coefficients and width of the model
+        from a dictionary or a list of parameter messages
         """
-        beta = None
-        sigma = None
-        ndof = None
-        X = None
         fields = []
-        fakers = []
         beta = []
+        sigma = None
         if isinstance(params_or_msg, dict):
             generators = params_or_msg["Variables"]
-            # fields = []
             for item in generators:
                 fields.append(item["Generator"])
 
             beta = params_or_msg["Parameters"][:-1]
             sigma = params_or_msg["Parameters"][-1]
-            ndof = len(params_or_msg["Parameters"])
-            X = np.ones(ndof)
-            # fakers = []
         else:
             for parameter in params_or_msg:
                 if parameter.HasField("variable"):
@@ -83,8 +76,16 @@ class Provider(BaseProvider):
                     beta.append(round(parameter.value, 4))
                 if parameter.name == "sigma":
                     sigma = round(parameter.value, 4)
-            ndof = len(beta) + 1
-            X = np.ones(ndof)
+        return fields, beta, sigma
+
+    def glm(self, params_or_msg):
+        """
+        expect a dictionary
+        """
+        fields, beta, sigma = self._parameters(params_or_msg)
+        ndof = len(beta) + 1
+        X = np.ones(ndof)
+        fakers = []
 
         for counter, f in enumerate(fields):
             fake = None
@@ -98,3 +99,26 @@ class Provider(BaseProvider):
         fakers.append(self.sample(X[:-1], beta, sigma))
 
         return fakers
+
+    def glm_batch(self, params_or_msg, n, rng):
+        """
+        Batch of n values of each variable and the predictor
+        Variables are drawn with their batch generator if available,
+        otherwise one value at a time
+        """
+        fields, beta, sigma = self._parameters(params_or_msg)
+        X = np.ones((n, len(beta)))
+        fakers = []
+
+        for counter, f in enumerate(fields):
+            try:
+                fake = self.generator.get_formatter(f + "_batch")
+                X[:, counter] = fake(n, rng)
+            except AttributeError:
+                fake = self.generator.get_formatter(f)
+                X[:, counter] = [fake() for _ in range(n)]
+            fakers.append(X[:, counter].copy())
+
+        fakers.append(X.dot(np.asarray(beta)) + rng.normal(0.0, sigma, n))
+
+        return fakers
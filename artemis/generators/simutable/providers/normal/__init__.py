@@ -10,6 +10,7 @@ faker provider for creating a normal distribution
 
 import unittest
 
+import numpy as np
 from faker import Faker
 from faker.providers import BaseProvider
 
@@ -21,6 +22,15 @@ class Provider(BaseProvider):
 
         return self.generator.random.normalvariate(mu, sigma)
 
+    def normal_batch(self, n, rng):
+        """
+        Batch of n values drawn with a numpy random Generator
+        """
+        mu = 0
+        sigma = 1
+
+        return rng.normal(mu, sigma, n)
+
 
 class TestCase(unittest.TestCase):
     def test(self):
@@ -29,6 +39,7 @@ class TestCase(unittest.TestCase):
         provider = Provider(fake)
         fake.add_provider(provider)
         print(fake.normal())
+        print(fake.normal_batch(10, np.random.default_rng(1)))
 
 
 if __name__ == "__main__":
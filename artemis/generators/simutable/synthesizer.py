@@ -22,6 +22,7 @@ Generates the data using faker
 import logging
 
 from pprint import pformat
+import numpy as np
 from faker import Faker
 from artemis.externals.physt.histogram1d import Histogram1D
 
@@ -57,6 +58,8 @@ class Synthesizer(object):
         self.__logger.debug("DEBUG Message")
 
         self.fake = Faker(local)
+        # Random generator for providers with a batch API
+        self.rng = np.random.default_rng()
         self.__reccntr = idx
         self.add_providers()
         self.schema = []
@@ -73,6 +76,8 @@ class Synthesizer(object):
 
         # Cache the generator functions once
         self.generator_fcns = {}
+        # Batch generator functions, None if the provider has no batch API
+        self.batch_fcns = {}
 
         self.set_generators_from_proto(model)
 
@@ -155,6 +160,7 @@ class Synthesizer(object):
 
     def set_seed(self, seed):
         self.fake.seed(seed)
+        self.rng = np.random.default_rng(seed)
 
     def add_providers(self):
         """
@@ -209,10 +215,28 @@ class Synthesizer(object):
                     )
 
             self.generator_fcns[field.name] = (fake, parms)
+            self.batch_fcns[field.name] = self.get_batch_formatter(field)
             self.__logger.debug(parms)
             self.__logger.debug(fake)
             self.__logger.debug(self.generator_fcns[field.name])
 
+    def get_batch_formatter(self, field):
+        """
+        Batch generator function of a field
+        Providers declare a batch API as a method <name>_batch
+        returning numpy arrays of length n
+        """
+        if field.name == "record_id":
+            return self.record_id_batch
+        try:
+            return self.fake.get_formatter(field.info.aux.generator.name + "_batch")
+        except AttributeError:
+            return None
+
+    def record_id_batch(self, n, rng):
+        start = self.record_count
+        return np.array(["rec-" + str(i) + "-id" for i in range(start, start + n)])
+
     def generate_duplicate_pdf(self):
         """
         Create a map of duplicates and probabilities
@@ -342,6 +366,49 @@ class Synthesizer(object):
         self.__logger.debug("Complete Event ID %d" % self.record_count)
         return darr
 
+    def generate_columns(self, n):
+        """
+        Generate n records as a list of columns
+
+        Fields with a batch generator are generated as numpy arrays,
+        other fields fall back to generating one value per record.
+        Duplicate records are generated record by record.
+        """
+        if self.duplicate is True:
+            rows = [self.generate() for _ in range(n)]
+            return [list(column) for column in zip(*rows)]
+
+        columns = []
+        for i, name in enumerate(self.schema):
+            if self.is_dependent[i] is True:
+                continue
+            fake, parms = self.generator_fcns[name]
+            batch = self.batch_fcns[name]
+            if batch is not None:
+                if parms is None:
+                    values = batch(n, self.rng)
+                else:
+                    values = batch(parms, n, self.rng)
+                # Providers of several fields return a list of arrays
+                if not isinstance(values, list):
+                    values = [values]
+            else:
+                if parms is None:
+                    rows = [fake() for _ in range(n)]
+                else:
+                    rows = [fake(parms) for _ in range(n)]
+                if rows and isinstance(rows[0], list):
+                    values = [list(column) for column in zip(*rows)]
+                else:
+                    values = [rows]
+            columns.extend(values)
+
+        self.record_count += n
+        self.stats["Original"] += n
+        self.stats["Total"] += n
+        self.__logger.debug("Generated %d records", n)
+        return columns
+
     def plots(self):
         self.__logger.info("=============================================")
         self.__logger.info("Synthesizer job summary")
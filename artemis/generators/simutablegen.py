@@ -22,11 +22,18 @@ Generator algo for SimuTable
 
 """
 import io
+import numpy as np
 import pyarrow as pa
 
 from artemis.logger import Logger
 from artemis.decorators import iterable
 from artemis.generators.common import GeneratorBase
+from artemis.generators.fwfencoder import (
+    encode_int,
+    encode_records,
+    encode_str,
+    overpunch_table,
+)
 from artemis.io.protobuf.cronus_pb2 import FileObjectInfo
 from artemis.io.protobuf.table_pb2 import Table
 from artemis.generators.simutable.synthesizer import Synthesizer
@@ -40,6 +47,8 @@ class SimuTableGenOptions:
     file_type = 1
     codec = "utf8"
     linesep = "\r\n"
+    columnar = False  # Generate columns with the provider batch API
+    record_offset = 0  # Index of the first record, e.g. of a chunk of a dataset
 
 
 @Logger.logged
@@ -61,11 +70,13 @@ class SimuTableGen(GeneratorBase):
         self.nsamples = self.properties.nsamples
         self.file_type = self.properties.file_type
         self.codec = self.properties.codec
+        self.columnar = self.properties.columnar
 
         self.synthesizer = None
         self.num_cols = None
         self.write_batch = None
         self.header = None
+        self.pa_schema = None
 
         # FWF
         self.pos_char = {
@@ -92,6 +103,8 @@ class SimuTableGen(GeneratorBase):
             "8": "Q",
             "9": "R",
         }
+        self._pos_table = overpunch_table(self.pos_char)
+        self._neg_table = overpunch_table(self.neg_char)
         # header = ''
         self.header_offset = 0
         self.footer = ""
@@ -120,12 +133,13 @@ class SimuTableGen(GeneratorBase):
             names.append(field.name)
         self.header = names
 
+        idx = self.properties.record_offset
         if hasattr(self.properties, "seed"):
             self.synthesizer = Synthesizer(
-                self.table, "en_CA", idx=0, seed=self.properties.seed
+                self.table, "en_CA", idx=idx, seed=self.properties.seed
             )
         else:
-            self.synthesizer = Synthesizer(self.table, "en_CA", idx=0)
+            self.synthesizer = Synthesizer(self.table, "en_CA", idx=idx)
 
         if self.file_type == 1:
             self.write_batch = self.write_batch_csv
@@ -138,6 +152,9 @@ class SimuTableGen(GeneratorBase):
         """
         Allow for concurrent generate during write
         """
+        if self.columnar:
+            yield from zip(*self.columns())
+            return
         for _ in range(self.num_rows):
             try:
                 yield tuple(self.synthesizer.generate())
@@ -147,6 +164,24 @@ class SimuTableGen(GeneratorBase):
             except Exception:
                 self.__logger.error("Unknown error in chunk")
 
+    def columns(self):
+        """
+        Generate a batch of records as a list of columns
+        """
+        if self.columnar:
+            return self.synthesizer.generate_columns(self.num_rows)
+        return [list(column) for column in zip(*self.chunk())]
+
+    def generate_datum(self):
+        data = self.write_batch()
+        if isinstance(data, pa.RecordBatch):
+            sink = pa.BufferOutputStream()
+            writer = pa.RecordBatchFileWriter(sink, data.schema)
+            writer.write_batch(data)
+            writer.close()
+            data = sink.getvalue()
+        return data
+
     def sampler(self):
         while self.nsamples > 0:
             self.__logger.info("%s: Generating datum " % (self.__class__.__name__))
@@ -168,56 +203,34 @@ class SimuTableGen(GeneratorBase):
             self.nsamples -= 1
             self.__logger.debug("Batch %i", self.nsamples)
 
-    def fwf_encode_row(self, row):
-        record = ""
-        #  Create data of specific unit types.
-        fields = list(self.table.info.schema.fields)
-        for i, dpoint in enumerate(row):
-            # encode
-            # pad to field width
-            # append to record
-            field_schema = fields[i]
-
-            dpoint = str(dpoint)
-            # signed integers require encoding
-            # all other fields expected to be string-like
-            if field_schema["utype"] == "int":
-                if dpoint < 0:
-                    # Convert negative integers.
-                    dpoint = dpoint.replace("-", "")
-                    dpoint = dpoint.replace(dpoint[-1], self.neg_char[dpoint[-1:]])
-                else:
-                    # Convert positive integers.
-                    dpoint = dpoint.replace(dpoint[-1], self.pos_char[dpoint[-1:]])
-
-            # ensure generated field is within schema length
-            dpoint = dpoint[: field_schema["length"]]
-
-            # pad up to required length
-            if field_schema["utype"] == "int" or field_schema["utype"] == "uint":
-                dpoint = ("0" * (field_schema["length"] - len(dpoint))) + dpoint
+    def fwf_encode_columns(self, columns):
+        """
+        Encode columns to fixed width fields
+        Integer columns are overpunched zoned decimals,
+        all other fields are left justified strings
+        """
+        fields = self.table.info.schema.info.fields
+        if len(columns) != len(fields):
+            raise ValueError
+        matrices = []
+        for field, column in zip(fields, columns):
+            values = np.asarray(column)
+            if values.dtype.kind in "iu":
+                matrix = encode_int(
+                    values, field.info.length, self._pos_table, self._neg_table
+                )
             else:
-                dpoint = dpoint + (" " * (field_schema["length"] - len(dpoint)))
-
-            # append field to record
-            record += dpoint
-
-        return record
+                matrix = encode_str(values, field.info.length)
+            matrices.append(matrix)
+        return encode_records(matrices, self.codec)
 
     def write_batch_fwf(self):
         """
         Generate a batch of records
-        convert rows to fixed width fields
-        encode to ascii format in bytes
+        convert columns to fixed width fields
+        encode to codec in bytes
         """
-        fwf = io.StringIO()
-        for row in list(self.chunk()):
-            if len(row) != len(self.header):
-                raise ValueError
-            fwf.write(self.fwf_encode_row(row))
-
-        fwf = fwf.getvalue().encode(self.codec)
-        return pa.py_buffer(fwf)
+        return pa.py_buffer(self.fwf_encode_columns(self.columns()))
 
     def write_batch_csv(self):
         """
@@ -241,13 +254,19 @@ class SimuTableGen(GeneratorBase):
         convert to pyarrow arrays
         convert to RecordBatch
         """
-        data = list(self.chunk())
-        data = zip(*data)
         arrays = []
-        for i, column in enumerate(data):
-            arrays.append(pa.array(column, self.pa_schema[i].type))
+        for i, column in enumerate(self.columns()):
+            if self.pa_schema is None:
+                arrays.append(pa.array(column))
+            else:
+                arrays.append(pa.array(column, self.pa_schema[i].type))
 
-        batch = pa.RecordBatch.from_arrays(arrays, names=self.pa_schema.names)
+        if self.pa_schema is None:
+            # Schema fixed by the types of the first batch
+            batch = pa.RecordBatch.from_arrays(arrays, names=self.header)
+            self.pa_schema = batch.schema
+        else:
+            batch = pa.RecordBatch.from_arrays(arrays, schema=self.pa_schema)
         return batch
 
     def write_csv(self):
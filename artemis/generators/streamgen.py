@@ -0,0 +1,197 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Generator of a stream of input files arriving during a job
+
+The files of the parentset are polled in the store, new files
+are generated as they arrive. With a landing directory, files
+written in the directory are registered in the parentset once
+they are no longer modified. Files in the watermark of the
+output dataset are skipped, a restarted stream resumes with
+the files which arrived since the last successful job.
+
+A poll without new files generates None, such that the job can
+close the outputs open for longer than their max age while idle.
+The stream ends when stopped, or after idle_timeout seconds
+without new files.
+"""
+import collections
+import threading
+import time
+from pathlib import Path
+
+from artemis.decorators import iterable
+from artemis.generators.common import GeneratorBase
+from artemis.io.protobuf.cronus_pb2 import FileObjectInfo
+
+
+@iterable
+class StreamGenOptions:
+    glob = ""  # Suffix of the input files
+    path = ""  # Landing directory, only the parentset in the store is polled if empty
+    partition = "generator"  # Partition of the parentset of the landed files
+    nsamples = 1
+    poll_interval = 1.0  # Seconds between polls for new files
+    settle_time = 1.0  # Seconds since the last modification of a landed file
+    idle_timeout = 0  # Seconds without new files before the stream ends, 0 disables
+
+
+class StreamGenerator(GeneratorBase):
+    """
+    Generates the uuids of the input files as they arrive
+    """
+
+    streaming = True
+
+    def __init__(self, name, **kwargs):
+
+        options = dict(StreamGenOptions())
+        options.update(kwargs)
+
+        super().__init__(name, **options)
+
+        self._glob = self.properties.glob
+        self._path = self.properties.path
+        self._partition = self.properties.partition
+        self._nsamples = self.properties.nsamples
+        self._poll_interval = self.properties.poll_interval
+        self._settle_time = self.properties.settle_time
+        self._idle_timeout = self.properties.idle_timeout
+
+        self._landed = {}  # Landed paths registered in the store
+        self._seen = set()  # Generated file uuids
+        self._queue = collections.deque()  # Arrived files not yet generated
+        self._last_arrival = None
+        self._stop = threading.Event()
+        self.__logger.info("Glob %s", self._glob)
+        self.__logger.info("Landing directory %s", self._path)
+
+    def _register_landed(self):
+        """
+        Register the files of the landing directory no longer modified
+        """
+        store = self.gate.store
+        parentset_id = self.gate.meta.parentset_id
+        now = time.time()
+        registered = None
+        for path in sorted(Path(self._path).iterdir()):
+            if not path.name.endswith(self._glob) or str(path) in self._landed:
+                continue
+            try:
+                if now - path.stat().st_mtime < self._settle_time:
+                    continue
+            except OSError:
+                continue
+            # Files registered before a restart are not registered again
+            if registered is None:
+                registered = {}
+                for obj in store[parentset_id].dataset.files:
+                    registered.setdefault(obj.address, obj.uuid)
+                    registered.setdefault(obj.uuid.split("_")[0], obj.uuid)
+            id_ = registered.get(path.resolve().as_uri())
+            if id_ is None:
+                id_ = registered.get(store.file_hash(path))
+            if id_ is not None:
+                self.__logger.info("Landed file %s already registered", path)
+                self._landed[str(path)] = id_
+                continue
+            if self._partition not in store.list_partitions(parentset_id):
+                store.new_partition(parentset_id, self._partition)
+            fileinfo = FileObjectInfo()
+            fileinfo.partition = self._partition
+            obj = store.register_content(
+                str(path),
+                fileinfo,
+                dataset_id=parentset_id,
+                partition_key=self._partition,
+            )
+            self.__logger.info("Landed file %s as %s", path, obj.uuid)
+            self._landed[str(path)] = obj.uuid
+            registered[obj.address] = obj.uuid
+            registered[obj.uuid.split("_")[0]] = obj.uuid
+
+    def poll(self):
+        """
+        Queue the files arrived since the last poll
+
+        Returns
+        -------
+        Number of arrived files
+        """
+        if self._path:
+            self._register_landed()
+        watermark = set(self.gate.store.list_watermark(self.gate.meta.dataset_id))
+        queued = set(self._queue)
+        narrived = 0
+        for obj in self.gate.store.list(
+            prefix=self.gate.meta.parentset_id, suffix=self._glob
+        ):
+            if obj.uuid in self._seen or obj.uuid in queued or obj.uuid in watermark:
+                continue
+            self._queue.append(obj.uuid)
+            narrived += 1
+        if narrived > 0:
+            self._last_arrival = time.monotonic()
+        return narrived
+
+    def _idle(self):
+        if self._idle_timeout <= 0:
+            return False
+        return time.monotonic() - self._last_arrival >= self._idle_timeout
+
+    def stop(self):
+        """
+        End the stream, the files already generated complete
+        """
+        self.__logger.info("Stop stream")
+        self._stop.set()
+
+    def initialize(self):
+        self.reset()
+
+    def reset(self):
+        self._seen = set()
+        self._queue.clear()
+        self._last_arrival = time.monotonic()
+
+    def sampler(self):
+        while not self._queue and not self._stop.is_set():
+            if self.poll() == 0:
+                if self._idle():
+                    break
+                self._stop.wait(self._poll_interval)
+        lst = list(self._queue)
+        self.__logger.info("File list %s", lst)
+        if not lst:
+            self.__logger.error("No input files arrived to sample")
+            return
+        rndidx = iter(self.random_state.choice(len(lst), self._nsamples))
+        for idx in rndidx:
+            yield lst[idx]
+
+    def __next__(self):
+        if self._stop.is_set() or self._idle():
+            raise StopIteration
+        if not self._queue and self.poll() == 0:
+            self._stop.wait(self._poll_interval)
+            return None
+        id_ = self._queue.popleft()
+        self._seen.add(id_)
+        return id_
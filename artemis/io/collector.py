@@ -51,7 +51,16 @@ class Collector(IOAlgoBase):
 
         self.max_malloc = self.properties.max_malloc
 
-    def initialize(self):
+    def initialize(self, schemas=None):
+        """
+        Add a writer for each leaf of the tree with record batches
+
+        Parameters
+        ----------
+        schemas : dict, optional
+            Schema of each leaf, e.g. of a checkpoint,
+            retrieved from the sampled payload of the leaves otherwise
+        """
         self.__logger.info("initialize")
         # Configure the output data streams
         # Each stream associated with leaf in Tree
@@ -75,16 +84,25 @@ class Collector(IOAlgoBase):
             self.__logger.info("Leave node %s", leaf)
             node = self.gate.tree.get_node_by_key(leaf)
             key = node.key
-            try:
-                _last = node.payload[-1].get_data()
-            except IndexError:
-                self.__logger.error("Cannot retrieve payload! %s", key)
-                raise
+            if schemas is not None:
+                _schema = schemas.get(key, None)
+            else:
+                try:
+                    _last = node.payload[-1].get_data()
+                    # Element may carry a list of batches
+                    if isinstance(_last, list):
+                        _last = _last[-1]
+                except IndexError:
+                    self.__logger.error("Cannot retrieve payload! %s", key)
+                    raise
+                _schema = None
+                if isinstance(_last, pa.lib.RecordBatch):
+                    _schema = _last.schema
 
             # TODO
             # Properly configure the properties in the job config
             # This is a workaround which overwrites any set properties
-            if isinstance(_last, pa.lib.RecordBatch):
+            if _schema is not None:
                 self.__logger.info("Writer config")
                 self.__logger.info(_wrtcfg)
                 try:
@@ -94,9 +112,12 @@ class Collector(IOAlgoBase):
                     raise
                 self.__logger.info("Add Tool %s", _wrtcfg.name)
                 self.gate.tools.add(self.__logger, _wrtcfg)
-                self.gate.tools.get(_wrtcfg.name)._schema = _last.schema
+                self.gate.tools.get(_wrtcfg.name)._schema = _schema
                 self.gate.tools.get(_wrtcfg.name).initialize()
-                self.gate.store.new_partition(self.gate.meta.dataset_id, key)
+                if key not in self.gate.store.list_partitions(
+                    self.gate.meta.dataset_id
+                ):
+                    self.gate.store.new_partition(self.gate.meta.dataset_id, key)
 
         # Batches serialized, clear the tree
         try:
@@ -160,6 +181,9 @@ class Collector(IOAlgoBase):
             _last = None
             try:
                 _last = els[-1].get_data()
+                # Element may carry a list of batches
+                if isinstance(_last, list):
+                    _last = _last[-1]
             except IndexError:
                 self.__logger.error("%s payload empty", leaf)
                 raise
@@ -169,7 +193,7 @@ class Collector(IOAlgoBase):
             if isinstance(_last, pa.lib.RecordBatch):
                 self.__logger.debug("RecordBatch")
                 self.__logger.debug("Allocated %i", pa.total_allocated_bytes())
-                _schema_batch = els[-1].get_data().schema
+                _schema_batch = _last.schema
 
                 if self.gate.tools.get(_name)._schema != _schema_batch:
                     self.__logger.error("Schema mismatch")
@@ -255,6 +279,70 @@ class Collector(IOAlgoBase):
                 writer.total_files,
             )
 
+    def checkpoint(self):
+        """
+        Spill the collected data of the processed datums to files,
+        such that all outputs of the datums are persisted
+
+        Returns
+        -------
+        dict of the schema of the writer of each leaf
+        """
+        _store = ArrowSets()
+        if _store.is_empty() is False:
+            try:
+                result_, time_ = self._collect()
+            except Exception:
+                self.__logger.error("Problem collecting")
+                raise
+
+        schemas = {}
+        for leaf in self.gate.tree.leaves:
+            node = self.gate.tree.get_node_by_key(leaf)
+            try:
+                writer = self.gate.tools.get("writer_" + node.key)
+            except KeyError:
+                continue
+            if writer._nbatches > 0:
+                try:
+                    writer._new_writer()
+                except Exception:
+                    self.__logger.error("Spill buffer stream fails %s", writer.name)
+                    raise
+            schemas[node.key] = writer._schema
+        return schemas
+
+    def roll(self):
+        """
+        Close the output files older than the max file age of their writer,
+        with the data collected since the last datum
+        """
+        writers = []
+        for leaf in self.gate.tree.leaves:
+            node = self.gate.tree.get_node_by_key(leaf)
+            try:
+                writers.append(self.gate.tools.get("writer_" + node.key))
+            except KeyError:
+                continue
+        if not any(writer.max_file_age > 0 for writer in writers):
+            return
+
+        _store = ArrowSets()
+        if _store.is_empty() is False:
+            try:
+                result_, time_ = self._collect()
+            except Exception:
+                self.__logger.error("Problem collecting")
+                raise
+        for writer in writers:
+            if writer.expired():
+                self.__logger.info("Roll file of %s", writer.name)
+                try:
+                    writer._new_writer()
+                except Exception:
+                    self.__logger.error("Roll buffer stream fails %s", writer.name)
+                    raise
+
     def _flush_buffer(self):
         _wnames = []
         for leaf in Tree().leaves:
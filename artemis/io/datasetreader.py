@@ -0,0 +1,230 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Lazy reader of the output files of an Artemis dataset
+
+The Arrow files of a dataset are listed in Cronus, the files of the
+selected partitions, jobs and buckets are scanned with pyarrow.dataset without
+walking the store. Files are memory mapped, the scan is multi-threaded
+and only the projected columns are read. Batches are iterated without
+materializing the table, e.g.
+
+    reader = DatasetReader(store, dataset_id, partitions=["seqY"], columns=["a"])
+    for batch in reader:
+        ...
+
+A filter is either a pyarrow.dataset expression, pushed down to the scan,
+or a RowFilterTool expression. The files whose zone maps cannot match a
+RowFilterTool expression are pruned before the scan, and the rows of the
+scanned batches are selected with the tool.
+"""
+import urllib.parse
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.fs as fs
+
+from artemis.logger import Logger
+from artemis.meta.zonemap import ZoneMapFilter
+from artemis.tools.rowfiltertool import RowFilterTool
+
+
+@Logger.logged
+class DatasetReader:
+    """
+    Reader of the Arrow files of a dataset
+
+    Parameters
+    ----------
+    store : BaseObjectStore
+    dataset_id : uuid of the dataset
+    partitions : partition keys to read, all partitions if None
+    jobs : job indices to read, all jobs if None
+    buckets : buckets of a partitioned output to read, all buckets if None
+    columns : columns to project, all columns if None
+    filter : pyarrow.dataset.Expression or RowFilterTool expression
+    batch_size : max number of rows of a scanned batch
+    use_threads : scan the files in parallel
+    """
+
+    def __init__(
+        self,
+        store,
+        dataset_id,
+        partitions=None,
+        jobs=None,
+        buckets=None,
+        columns=None,
+        filter=None,
+        batch_size=2 ** 17,
+        use_threads=True,
+    ):
+        self.store = store
+        self.dataset_id = dataset_id
+        self.partitions = None if partitions is None else set(partitions)
+        self.jobs = None if jobs is None else {str(job) for job in jobs}
+        self.buckets = None if buckets is None else set(buckets)
+        self.columns = columns
+        self.batch_size = batch_size
+        self.use_threads = use_threads
+        self._expression = None  # Expression pushed down to the scan
+        self._zonemap = None  # Zone map predicate of the files
+        self._rowfilter = None  # Tool selecting the rows of the batches
+        if isinstance(filter, str):
+            self._zonemap = ZoneMapFilter(filter)
+            self._rowfilter = RowFilterTool("datasetfilter", expression=filter)
+            self._rowfilter.initialize()
+        else:
+            self._expression = filter
+        self._batches = None
+
+    def files(self):
+        """
+        Output files of the dataset selected for the scan
+
+        Returns
+        -------
+        list of file uuids
+        """
+        selected = []
+        for obj in self.store[self.dataset_id].dataset.files:
+            info = obj.file
+            if info.type != 5:
+                # Only Arrow files, csv copies of the outputs are skipped
+                continue
+            if self.partitions is not None and info.partition not in self.partitions:
+                continue
+            if self.jobs is not None and self._job(obj.name) not in self.jobs:
+                continue
+            if self.buckets is not None and info.bucket not in self.buckets:
+                continue
+            if self._zonemap is not None and info.HasField("zonemap"):
+                if not self._zonemap(info.zonemap):
+                    continue
+            selected.append(obj.uuid)
+        self.__logger.debug("Selected %i files", len(selected))
+        return selected
+
+    @staticmethod
+    def _job(name):
+        """
+        Job index of a file named dataset.job_<index>.part_<key>.uuid.arrow
+        """
+        return name.split(".")[1][len("job_") :]
+
+    def _path(self, id_):
+        url_data = urllib.parse.urlparse(self.store[id_].address)
+        return urllib.parse.unquote(url_data.path)
+
+    def dataset(self):
+        """
+        pyarrow.dataset.Dataset of the memory mapped files,
+        the schemas of the files of several partitions are unified,
+        an empty selection has the schema of a file of its partitions
+        """
+        ids = self.files()
+        paths = [self._path(id_) for id_ in ids]
+        filesystem = fs.LocalFileSystem(use_mmap=True)
+        if not ids:
+            return ds.dataset(
+                [], schema=self._schema(), format="ipc", filesystem=filesystem
+            )
+        dataset = ds.dataset(paths, format="ipc", filesystem=filesystem)
+        partitions = {self.store[id_].file.partition for id_ in ids}
+        if len(partitions) > 1:
+            schema = pa.unify_schemas(
+                [fragment.physical_schema for fragment in dataset.get_fragments()]
+            )
+            dataset = ds.dataset(
+                paths, schema=schema, format="ipc", filesystem=filesystem
+            )
+        return dataset
+
+    def _schema(self):
+        """
+        Schema of the first Arrow file of the selected partitions
+        """
+        for obj in self.store[self.dataset_id].dataset.files:
+            if obj.file.type != 5:
+                continue
+            if self.partitions is None or obj.file.partition in self.partitions:
+                return pa.ipc.open_file(pa.memory_map(self._path(obj.uuid))).schema
+        return pa.schema([])
+
+    def scanner(self):
+        """
+        Lazy scanner of the selected files
+        """
+        columns = self.columns
+        if columns is not None and self._rowfilter is not None:
+            # Columns of the row filter are read and dropped after the filter
+            columns = list(columns) + [
+                name for name in self._rowfilter.columns if name not in columns
+            ]
+        return ds.Scanner.from_dataset(
+            self.dataset(),
+            columns=columns,
+            filter=self._expression,
+            batch_size=self.batch_size,
+            use_threads=self.use_threads,
+        )
+
+    def to_batches(self):
+        """
+        Generator of the record batches of the scan
+        """
+        for batch in self.scanner().to_batches():
+            if self._rowfilter is not None:
+                batch = self._rowfilter.execute(batch)
+                if self.columns is not None:
+                    batch = pa.RecordBatch.from_arrays(
+                        [batch.column(name) for name in self.columns], self.columns
+                    )
+            if batch.num_rows > 0:
+                yield batch
+
+    def to_table(self):
+        """
+        Table of the scan, materialized in memory
+        """
+        if self._rowfilter is None:
+            return self.scanner().to_table()
+        scanner = self.scanner()
+        schema = scanner.projected_schema
+        if self.columns is not None:
+            schema = pa.schema([schema.field(name) for name in self.columns])
+        return pa.Table.from_batches(list(self.to_batches()), schema)
+
+    def count_rows(self):
+        if self._rowfilter is None:
+            return self.scanner().count_rows()
+        return sum(batch.num_rows for batch in self.to_batches())
+
+    def __iter__(self):
+        self._batches = self.to_batches()
+        return self
+
+    def __next__(self):
+        if self._batches is None:
+            self._batches = self.to_batches()
+        return next(self._batches)
+
+    def close(self):
+        self._batches = None
@@ -31,15 +31,17 @@ import pathlib
 import six
 import uuid
 import pyarrow as pa
-from sas7bdat import SAS7BDAT
 
 from artemis.decorators import iterable
 from artemis.core.algo import IOAlgoBase
+from artemis.core.registry import lazy_import
 from artemis.generators.common import BuiltinsGenerator
 from artemis.io.readers import ReaderFactory
 from artemis.io.protobuf.table_pb2 import Table
 from artemis.io.protobuf.cronus_pb2 import TableObjectInfo
 
+sas7bdat = lazy_import("sas7bdat")
+
 
 @iterable
 class FileHandlerOptions:
@@ -249,7 +251,7 @@ class FileHandlerTool(IOAlgoBase):
         stream.seek(self.header_offset)
 
     def prepare_sas(self, stream):
-        reader = SAS7BDAT(
+        reader = sas7bdat.SAS7BDAT(
             self.__module__,
             log_level=self.__logger.getEffectiveLevel(),
             extra_time_format_strings=None,
@@ -0,0 +1,200 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Key index of the output files of a dataset
+
+The writer hashes the values of a key column as the batches are written,
+and writes an index of each output file: the 64-bit hashes of the keys,
+sorted, with the batch and row of each key. The index is an Arrow file
+registered in Cronus in the partition of the output file, and referenced
+in the FileObjectInfo of the output file.
+
+A lookup memory maps the indices, finds the hash of the key with a binary
+search and reads only the batches holding the key, e.g.
+
+    rows = lookup(store, dataset_id, "record_id", 123456789)
+"""
+import urllib.parse
+
+import numpy as np
+import pyarrow as pa
+
+from artemis.core.sketch import hash_array
+from artemis.meta.zonemap import ZoneMapFilter
+
+INDEX_SCHEMA = pa.schema(
+    [("hash", pa.uint64()), ("batch", pa.int32()), ("row", pa.int64())]
+)
+
+
+class KeyIndexBuilder:
+    """
+    Index of the keys of the batches written to a file
+    """
+
+    def __init__(self, key):
+        self.key = key
+        self.reset()
+
+    def reset(self):
+        self._hashes = []
+        self._batches = []
+        self._rows = []
+
+    @property
+    def num_keys(self):
+        return sum(len(hashes) for hashes in self._hashes)
+
+    def update(self, batch, ibatch):
+        """
+        Hash the non-null keys of a batch
+
+        Parameters
+        ----------
+        batch : pa.RecordBatch
+        ibatch : index of the batch in the file
+        """
+        column = batch.column(batch.schema.get_field_index(self.key))
+        rows = np.arange(len(column))
+        if column.null_count > 0:
+            rows = rows[column.is_valid().to_numpy(zero_copy_only=False)]
+            column = column.filter(column.is_valid())
+        self._hashes.append(hash_array(column))
+        self._batches.append(np.full(len(rows), ibatch, dtype=np.int32))
+        self._rows.append(rows)
+
+    def to_buffer(self):
+        """
+        Arrow file of the index sorted by hash
+
+        Returns
+        -------
+        pa.Buffer
+        """
+        hashes = np.concatenate(self._hashes or [np.array([], np.uint64)])
+        order = np.argsort(hashes, kind="stable")
+        batches = np.concatenate(self._batches or [np.array([], np.int32)])
+        rows = np.concatenate(self._rows or [np.array([], np.int64)])
+        index = pa.RecordBatch.from_arrays(
+            [pa.array(hashes[order]), pa.array(batches[order]), pa.array(rows[order])],
+            schema=INDEX_SCHEMA.with_metadata({"key": self.key}),
+        )
+        sink = pa.BufferOutputStream()
+        writer = pa.RecordBatchFileWriter(sink, index.schema)
+        writer.write_batch(index)
+        writer.close()
+        return sink.getvalue()
+
+
+def _path(store, id_):
+    url_data = urllib.parse.urlparse(store[id_].address)
+    return urllib.parse.unquote(url_data.path)
+
+
+def _key_hash(value, type_):
+    """
+    Hash of a key, as hashed in a column of the type
+    """
+    if pa.types.is_dictionary(type_):
+        type_ = type_.value_type
+    return hash_array(pa.array([value], type=type_))[0]
+
+
+def search(store, index_id, value, type_):
+    """
+    Batches and rows of the keys with the hash of a value in an index
+
+    Returns
+    -------
+    list of (batch index, row)
+    """
+    reader = pa.ipc.open_file(pa.memory_map(_path(store, index_id)))
+    if reader.num_record_batches == 0:
+        return []
+    index = reader.get_batch(0)
+    hashes = index.column(0).to_numpy()
+    hash_ = _key_hash(value, type_)
+    lo = np.searchsorted(hashes, hash_, side="left")
+    hi = np.searchsorted(hashes, hash_, side="right")
+    batches = index.column(1).to_numpy()[lo:hi]
+    rows = index.column(2).to_numpy()[lo:hi]
+    return list(zip(batches.tolist(), rows.tolist()))
+
+
+def lookup(store, dataset_id, key, value, partition=None, columns=None):
+    """
+    Records of a dataset with a key value
+
+    Only the files whose zone map could hold the value are searched,
+    and only the batches holding the value are read.
+
+    Parameters
+    ----------
+    store : BaseObjectStore
+    dataset_id : uuid of the dataset
+    key : indexed column
+    value : value of the key
+    partition : only the files of a partition if set
+    columns : columns of the records, all columns if None
+
+    Returns
+    -------
+    pa.Table of the records, None if no file is indexed by the key
+    """
+    predicate = ZoneMapFilter(f"col({key!r}) == {value!r}")
+    indexed = None
+    records = []
+    for obj in store[dataset_id].dataset.files:
+        info = obj.file
+        if info.type != 5 or info.index.key != key:
+            continue
+        if partition is not None and info.partition != partition:
+            continue
+        indexed = indexed or obj.uuid
+        if info.HasField("zonemap") and not predicate(info.zonemap):
+            continue
+        reader = pa.ipc.open_file(pa.memory_map(_path(store, obj.uuid)))
+        type_ = reader.schema.field(key).type
+        matches = {}
+        for ibatch, row in search(store, info.index.uuid, value, type_):
+            matches.setdefault(ibatch, []).append(row)
+        for ibatch, rows in sorted(matches.items()):
+            batch = reader.get_batch(ibatch).take(pa.array(rows))
+            # Distinct keys with the same hash are dropped
+            column = batch.column(batch.schema.get_field_index(key))
+            if pa.types.is_dictionary(column.type):
+                column = column.cast(column.type.value_type)
+            batch = batch.filter(
+                pa.array([v == value for v in column.to_pylist()], pa.bool_())
+            )
+            if columns is not None:
+                batch = pa.RecordBatch.from_arrays(
+                    [batch.column(batch.schema.get_field_index(c)) for c in columns],
+                    columns,
+                )
+            records.append(pa.Table.from_batches([batch]))
+    if indexed is None:
+        return None
+    if not records:
+        schema = pa.ipc.open_file(pa.memory_map(_path(store, indexed))).schema
+        if columns is not None:
+            schema = pa.schema([schema.field(c) for c in columns])
+        return schema.empty_table()
+    return pa.concat_tables(records, promote=True)
@@ -1,7 +1,7 @@
 """Google's protocol buffer I/O support."""
 import warnings
 from packaging.version import Version
-from pkg_resources import parse_version
+from packaging.version import parse as parse_version
 
 import numpy as np
 from typing import Union
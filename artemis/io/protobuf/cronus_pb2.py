@@ -16,12 +16,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import sys
-_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
-from google.protobuf.internal import enum_type_wrapper
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
 from google.protobuf import descriptor as _descriptor
-from google.protobuf import message as _message
-from google.protobuf import reflection as _reflection
+from google.protobuf import descriptor_pool as _descriptor_pool
 from google.protobuf import symbol_database as _symbol_database
 # @@protoc_insertion_point(imports)
 
@@ -31,2414 +29,125 @@ _sym_db = _symbol_database.Default()
 from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
 
 
-DESCRIPTOR = _descriptor.FileDescriptor(
-  name='cronus.proto',
-  package='',
-  syntax='proto3',
-  serialized_options=None,
-  serialized_pb=_b('\n\x0c\x63ronus.proto\x1a\x1fgoogle/protobuf/timestamp.proto\"o\n\x0b\x43ronusStore\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04uuid\x18\x02 \x01(\t\x12\x13\n\x0bparent_uuid\x18\x03 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x04 \x01(\t\x12\x1e\n\x04info\x18\x05 \x01(\x0b\x32\x10.CronusStoreInfo\"\x8a\x01\n\x0f\x43ronusStoreInfo\x12+\n\x07\x63reated\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12 \n\x03\x61ux\x18\x03 \x01(\x0b\x32\x13.CronusStoreAuxInfo\x12(\n\x0c\x63hild_stores\x18\x04 \x03(\x0b\x32\x12.CronusObjectStore\")\n\x12\x43ronusStoreAuxInfo\x12\x13\n\x0b\x64\x65scription\x18\x01 \x01(\t\"{\n\x11\x43ronusObjectStore\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04uuid\x18\x02 \x01(\t\x12\x13\n\x0bparent_uuid\x18\x03 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x04 \x01(\t\x12$\n\x04info\x18\x05 \x01(\x0b\x32\x16.CronusObjectStoreInfo\"\x8c\x01\n\x15\x43ronusObjectStoreInfo\x12+\n\x07\x63reated\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12&\n\x03\x61ux\x18\x03 \x01(\x0b\x32\x19.CronusObjectStoreAuxInfo\x12\x1e\n\x07objects\x18\x05 \x03(\x0b\x32\r.CronusObject\"/\n\x18\x43ronusObjectStoreAuxInfo\x12\x13\n\x0b\x64\x65scription\x18\x01 \x01(\t\"\x92\x03\n\x0c\x43ronusObject\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04uuid\x18\x02 \x01(\t\x12\x13\n\x0bparent_uuid\x18\x03 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\r \x01(\t\x12\x1f\n\x04menu\x18\x04 \x01(\x0b\x32\x0f.MenuObjectInfoH\x00\x12#\n\x06\x63onfig\x18\x05 \x01(\x0b\x32\x11.ConfigObjectInfoH\x00\x12%\n\x07\x64\x61taset\x18\x06 \x01(\x0b\x32\x12.DatasetObjectInfoH\x00\x12!\n\x05hists\x18\x07 \x01(\x0b\x32\x10.HistsObjectInfoH\x00\x12\x1d\n\x03job\x18\x08 \x01(\x0b\x32\x0e.JobObjectInfoH\x00\x12\x1d\n\x03log\x18\t \x01(\x0b\x32\x0e.LogObjectInfoH\x00\x12\x1f\n\x04\x66ile\x18\x0b \x01(\x0b\x32\x0f.FileObjectInfoH\x00\x12!\n\x05table\x18\x0c \x01(\x0b\x32\x10.TableObjectInfoH\x00\x12&\n\x08tdigests\x18\x0e \x01(\x0b\x32\x12.TDigestObjectInfoH\x00\x42\x06\n\x04info\"\xd0\x02\n\x0f\x41rtemisArtifact\x12\x1d\n\ttransform\x18\x01 \x01(\x0b\x32\n.Transform\x12\"\n\x0binput_files\x18\x02 \x03(\x0b\x32\r.CronusObject\x12\x19\n\x11\x64\x61taset_parent_id\x18\x03 \x01(\t\x12\x18\n\x10\x64\x61taset_child_id\x18\x04 \x01(\t\x12\x15\n\rjob_parent_id\x18\x05 \x01(\t\x12\x10\n\x08\x63hild_id\x18\x06 \x01(\t\x12!\n\npartitions\x18\x07 \x03(\x0b\x32\r.CronusObject\x12\x1c\n\x05hists\x18\x08 \x01(\x0b\x32\r.CronusObject\x12\x1e\n\x07jobinfo\x18\t \x01(\x0b\x32\r.CronusObject\x12\x1a\n\x03log\x18\n \x01(\x0b\x32\r.CronusObject\x12\x1f\n\x08tdigests\x18\x0b \x01(\x0b\x32\r.CronusObject\"^\n\x0eMenuObjectInfo\x12\x1f\n\x03\x61ux\x18\x01 \x01(\x0b\x32\x12.MenuObjectAuxInfo\x12+\n\x07\x63reated\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"(\n\x11MenuObjectAuxInfo\x12\x13\n\x0b\x64\x65scription\x18\x01 \x01(\t\"b\n\x10\x43onfigObjectInfo\x12!\n\x03\x61ux\x18\x01 \x01(\x0b\x32\x14.ConfigObjectAuxInfo\x12+\n\x07\x63reated\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"*\n\x13\x43onfigObjectAuxInfo\x12\x13\n\x0b\x64\x65scription\x18\x01 \x01(\t\"A\n\x0fHistsObjectInfo\x12 \n\x03\x61ux\x18\x02 \x01(\x0b\x32\x13.HistsObjectAuxInfo\x12\x0c\n\x04keys\x18\x01 \x03(\t\"\x83\x01\n\x12HistsObjectAuxInfo\x12\x13\n\x0b\x64\x65scription\x18\x01 \x01(\t\x12+\n\x04meta\x18\x02 \x03(\x0b\x32\x1d.HistsObjectAuxInfo.MetaEntry\x1a+\n\tMetaEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"E\n\x11TDigestObjectInfo\x12\"\n\x03\x61ux\x18\x02 \x01(\x0b\x32\x15.TDigestObjectAuxInfo\x12\x0c\n\x04keys\x18\x01 \x03(\t\"\x87\x01\n\x14TDigestObjectAuxInfo\x12\x13\n\x0b\x64\x65scription\x18\x01 \x01(\t\x12-\n\x04meta\x18\x02 \x03(\x0b\x32\x1f.TDigestObjectAuxInfo.MetaEntry\x1a+\n\tMetaEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"/\n\rJobObjectInfo\x12\x1e\n\x03\x61ux\x18\x01 \x01(\x0b\x32\x11.JobObjectAuxInfo\"\'\n\x10JobObjectAuxInfo\x12\x13\n\x0b\x64\x65scription\x18\x01 \x01(\t\"/\n\rLogObjectInfo\x12\x1e\n\x03\x61ux\x18\x01 \x01(\x0b\x32\x11.LogObjectAuxInfo\"\'\n\x10LogObjectAuxInfo\x12\x13\n\x0b\x64\x65scription\x18\x01 \x01(\t\"\x8c\x03\n\x11\x44\x61tasetObjectInfo\x12\"\n\x03\x61ux\x18\x01 \x01(\x0b\x32\x15.DatasetObjectAuxInfo\x12\x1d\n\ttransform\x18\x04 \x01(\x0b\x32\n.Transform\x12\x12\n\npartitions\x18\x02 \x03(\t\x12\x0f\n\x07job_idx\x18\r \x01(\x05\x12\x1b\n\x04jobs\x18\x05 \x03(\x0b\x32\r.CronusObject\x12\x1c\n\x05hists\x18\x06 \x03(\x0b\x32\r.CronusObject\x12\x1b\n\x04logs\x18\x07 \x03(\x0b\x32\r.CronusObject\x12\x18\n\x10storage_location\x18\x08 \x01(\t\x12\x1e\n\x07parents\x18\t \x03(\x0b\x32\r.CronusObject\x12\x1f\n\x08\x63hildren\x18\n \x03(\x0b\x32\r.CronusObject\x12\x1c\n\x05\x66iles\x18\x0b \x03(\x0b\x32\r.CronusObject\x12\x1d\n\x06tables\x18\x0c \x03(\x0b\x32\r.CronusObject\x12\x1f\n\x08tdigests\x18\x0e \x03(\x0b\x32\r.CronusObject\"Z\n\x14\x44\x61tasetObjectAuxInfo\x12\"\n\x0c\x64\x61ta_holding\x18\x01 \x01(\x0b\x32\x0c.DataHolding\x12\x1e\n\ndata_asset\x18\x02 \x01(\x0b\x32\n.DataAsset\"\x8d\x04\n\x0b\x44\x61taHolding\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x17\n\x0fprogram_element\x18\x03 \x01(\t\x12\"\n\x1asensitive_statistical_info\x18\x04 \x01(\x08\x12 \n\x18has_personal_identifiers\x18\x05 \x01(\x08\x12\x1b\n\x13has_data_dictionary\x18\x06 \x01(\x08\x12\x19\n\x11has_record_layout\x18\x07 \x01(\x08\x12*\n\"has_other_supporting_documentation\x18\x08 \x01(\x08\x12\x14\n\x0c\x64\x61taset_size\x18\t \x01(\x05\x12+\n\x11\x64\x61taset_size_type\x18\n \x01(\x0e\x32\x10.DatasetSizeType\x12\x17\n\x0f\x65xpected_medium\x18\x0b \x03(\t\x12/\n\x13\x64\x61ta_holding_detail\x18\x0c \x01(\x0b\x32\x12.DataHoldingDetail\x12\x30\n\x13provision_agreement\x18\r \x01(\x0b\x32\x13.ProvisionAgreement\x12\r\n\x05usage\x18\x0e \x03(\t\x12\x12\n\npermission\x18\x0f \x01(\t\x12\x10\n\x08provider\x18\x10 \x01(\t\x12$\n\rprovider_type\x18\x11 \x01(\x0e\x32\r.ProviderType\"\xa5\x03\n\tDataAsset\x12\x13\n\x0b\x64\x65scription\x18\x01 \x01(\t\x12\x18\n\x10reference_period\x18\x02 \x01(\t\x12\x18\n\x10granularity_type\x18\x03 \x01(\t\x12\r\n\x05state\x18\x05 \x01(\t\x12\x30\n\x0clast_updated\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x31\n\rcreation_time\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x1b\n\x13\x64\x61ta_asset_category\x18\x08 \x01(\t\x12&\n\x0e\x64\x61ta_retention\x18\t \x01(\x0b\x32\x0e.DataRetention\x12\x13\n\x0btable_count\x18\n \x01(\x05\x12\x12\n\nfile_count\x18\x0b \x01(\x05\x12\x17\n\x0fpartition_count\x18\x0c \x01(\x05\x12\x11\n\tjob_count\x18\r \x01(\x05\x12\x13\n\x0bhists_count\x18\x0e \x01(\x05\x12\x14\n\x0cparent_count\x18\x0f \x01(\x05\x12\x16\n\x0e\x63hildren_count\x18\x14 \x01(\x05\"}\n\rDataRetention\x12\x13\n\x0b\x64\x65scription\x18\x01 \x01(\t\x12\x0e\n\x06period\x18\x02 \x01(\t\x12\x1e\n\x16retention_trigger_date\x18\x03 \x01(\t\x12\x19\n\x11retention_trigger\x18\x04 \x01(\t\x12\x0c\n\x04type\x18\x05 \x01(\t\"\x8e\x01\n\x11\x44\x61taHoldingDetail\x12\x1a\n\x12receptionFrequency\x18\x04 \x01(\t\x12\x19\n\x11\x61\x63quisition_stage\x18\x01 \x01(\t\x12\x18\n\x10\x61\x63quisition_cost\x18\x02 \x01(\x02\x12(\n quality_evaluation_done_on_input\x18\x03 \x01(\x08\"\x92\x01\n\x12ProvisionAgreement\x12\x0f\n\x07\x63hannel\x18\x01 \x01(\t\x12\x1b\n\x13statcan_act_section\x18\x02 \x03(\t\x12\x16\n\x0e\x63hannel_detail\x18\x03 \x01(\t\x12\x17\n\x0f\x64\x61ta_usage_type\x18\x04 \x01(\t\x12\x1d\n\x15\x64\x61ta_acquisition_type\x18\x05 \x01(\t\"!\n\x0fTableObjectInfo\x12\x0e\n\x06\x66ields\x18\x01 \x03(\t\"G\n\tTransform\x12\x1b\n\x04menu\x18\x01 \x01(\x0b\x32\r.CronusObject\x12\x1d\n\x06\x63onfig\x18\x02 \x01(\x0b\x32\r.CronusObject\"\x9c\x01\n\x0e\x46ileObjectInfo\x12\x1f\n\x03\x61ux\x18\x01 \x01(\x0b\x32\x12.FileObjectAuxInfo\x12\x17\n\x04type\x18\x02 \x01(\x0e\x32\t.FileType\x12\x12\n\nsize_bytes\x18\x03 \x01(\x03\x12\x11\n\tsize_unit\x18\x06 \x01(\t\x12\x16\n\x06\x62locks\x18\x04 \x03(\x0b\x32\x06.Block\x12\x11\n\tpartition\x18\x05 \x01(\t\"d\n\x11\x46ileObjectAuxInfo\x12\x13\n\x0b\x64\x65scription\x18\x01 \x01(\t\x12\x13\n\x0bnum_columns\x18\x02 \x01(\x05\x12\x10\n\x08num_rows\x18\x03 \x01(\x05\x12\x13\n\x0bnum_batches\x18\x04 \x01(\x05\"0\n\x05\x42lock\x12\r\n\x05index\x18\x01 \x01(\x05\x12\x18\n\x04info\x18\x02 \x01(\x0b\x32\n.BlockInfo\"?\n\tBlockInfo\x12\x12\n\nsize_bytes\x18\x01 \x01(\x03\x12\x0e\n\x06offset\x18\x02 \x01(\x03\x12\x0e\n\x06length\x18\x03 \x01(\x03\"1\n\x0c\x44ummyMessage\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t*K\n\x0f\x44\x61tasetSizeType\x12\x08\n\x04\x42YTE\x10\x00\x12\x06\n\x02KB\x10\x01\x12\x06\n\x02MB\x10\x02\x12\x06\n\x02GB\x10\x03\x12\x06\n\x02TB\x10\x04\x12\x06\n\x02PB\x10\x05\x12\x06\n\x02\x45\x42\x10\x06*K\n\x0cProviderType\x12\x15\n\x11\x45XTERNAL_PROVIDER\x10\x00\x12\x15\n\x11INTERNAL_PROVIDER\x10\x01\x12\r\n\tCUSTODIAN\x10\x02*h\n\x08\x46ileType\x12\x08\n\x04NONE\x10\x00\x12\x07\n\x03\x43SV\x10\x01\x12\x07\n\x03\x46WF\x10\x02\x12\x08\n\x04JSON\x10\x03\x12\x0b\n\x07PARQUET\x10\x04\x12\t\n\x05\x41RROW\x10\x05\x12\x10\n\x0c\x41RROW_STREAM\x10\x06\x12\x0c\n\x08SAS7BDAT\x10\x07\x62\x06proto3')
-  ,
-  dependencies=[google_dot_protobuf_dot_timestamp__pb2.DESCRIPTOR,])
-
-_DATASETSIZETYPE = _descriptor.EnumDescriptor(
-  name='DatasetSizeType',
-  full_name='DatasetSizeType',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='BYTE', index=0, number=0,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='KB', index=1, number=1,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='MB', index=2, number=2,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='GB', index=3, number=3,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='TB', index=4, number=4,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='PB', index=5, number=5,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='EB', index=6, number=6,
-      serialized_options=None,
-      type=None),
-  ],
-  containing_type=None,
-  serialized_options=None,
-  serialized_start=4678,
-  serialized_end=4753,
-)
-_sym_db.RegisterEnumDescriptor(_DATASETSIZETYPE)
-
-DatasetSizeType = enum_type_wrapper.EnumTypeWrapper(_DATASETSIZETYPE)
-_PROVIDERTYPE = _descriptor.EnumDescriptor(
-  name='ProviderType',
-  full_name='ProviderType',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='EXTERNAL_PROVIDER', index=0, number=0,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='INTERNAL_PROVIDER', index=1, number=1,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='CUSTODIAN', index=2, number=2,
-      serialized_options=None,
-      type=None),
-  ],
-  containing_type=None,
-  serialized_options=None,
-  serialized_start=4755,
-  serialized_end=4830,
-)
-_sym_db.RegisterEnumDescriptor(_PROVIDERTYPE)
-
-ProviderType = enum_type_wrapper.EnumTypeWrapper(_PROVIDERTYPE)
-_FILETYPE = _descriptor.EnumDescriptor(
-  name='FileType',
-  full_name='FileType',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='NONE', index=0, number=0,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='CSV', index=1, number=1,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='FWF', index=2, number=2,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='JSON', index=3, number=3,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='PARQUET', index=4, number=4,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='ARROW', index=5, number=5,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='ARROW_STREAM', index=6, number=6,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='SAS7BDAT', index=7, number=7,
-      serialized_options=None,
-      type=None),
-  ],
-  containing_type=None,
-  serialized_options=None,
-  serialized_start=4832,
-  serialized_end=4936,
-)
-_sym_db.RegisterEnumDescriptor(_FILETYPE)
-
-FileType = enum_type_wrapper.EnumTypeWrapper(_FILETYPE)
-BYTE = 0
-KB = 1
-MB = 2
-GB = 3
-TB = 4
-PB = 5
-EB = 6
-EXTERNAL_PROVIDER = 0
-INTERNAL_PROVIDER = 1
-CUSTODIAN = 2
-NONE = 0
-CSV = 1
-FWF = 2
-JSON = 3
-PARQUET = 4
-ARROW = 5
-ARROW_STREAM = 6
-SAS7BDAT = 7
-
-
-
-_CRONUSSTORE = _descriptor.Descriptor(
-  name='CronusStore',
-  full_name='CronusStore',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='name', full_name='CronusStore.name', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='uuid', full_name='CronusStore.uuid', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='parent_uuid', full_name='CronusStore.parent_uuid', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='address', full_name='CronusStore.address', index=3,
-      number=4, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='info', full_name='CronusStore.info', index=4,
-      number=5, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=49,
-  serialized_end=160,
-)
-
-
-_CRONUSSTOREINFO = _descriptor.Descriptor(
-  name='CronusStoreInfo',
-  full_name='CronusStoreInfo',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='created', full_name='CronusStoreInfo.created', index=0,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='aux', full_name='CronusStoreInfo.aux', index=1,
-      number=3, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='child_stores', full_name='CronusStoreInfo.child_stores', index=2,
-      number=4, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=163,
-  serialized_end=301,
-)
-
-
-_CRONUSSTOREAUXINFO = _descriptor.Descriptor(
-  name='CronusStoreAuxInfo',
-  full_name='CronusStoreAuxInfo',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='description', full_name='CronusStoreAuxInfo.description', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=303,
-  serialized_end=344,
-)
-
-
-_CRONUSOBJECTSTORE = _descriptor.Descriptor(
-  name='CronusObjectStore',
-  full_name='CronusObjectStore',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='name', full_name='CronusObjectStore.name', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='uuid', full_name='CronusObjectStore.uuid', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='parent_uuid', full_name='CronusObjectStore.parent_uuid', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='address', full_name='CronusObjectStore.address', index=3,
-      number=4, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='info', full_name='CronusObjectStore.info', index=4,
-      number=5, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=346,
-  serialized_end=469,
-)
-
-
-_CRONUSOBJECTSTOREINFO = _descriptor.Descriptor(
-  name='CronusObjectStoreInfo',
-  full_name='CronusObjectStoreInfo',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='created', full_name='CronusObjectStoreInfo.created', index=0,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='aux', full_name='CronusObjectStoreInfo.aux', index=1,
-      number=3, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='objects', full_name='CronusObjectStoreInfo.objects', index=2,
-      number=5, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=472,
-  serialized_end=612,
-)
-
-
-_CRONUSOBJECTSTOREAUXINFO = _descriptor.Descriptor(
-  name='CronusObjectStoreAuxInfo',
-  full_name='CronusObjectStoreAuxInfo',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='description', full_name='CronusObjectStoreAuxInfo.description', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=614,
-  serialized_end=661,
-)
-
-
-_CRONUSOBJECT = _descriptor.Descriptor(
-  name='CronusObject',
-  full_name='CronusObject',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='name', full_name='CronusObject.name', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='uuid', full_name='CronusObject.uuid', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='parent_uuid', full_name='CronusObject.parent_uuid', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='address', full_name='CronusObject.address', index=3,
-      number=13, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='menu', full_name='CronusObject.menu', index=4,
-      number=4, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='config', full_name='CronusObject.config', index=5,
-      number=5, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='dataset', full_name='CronusObject.dataset', index=6,
-      number=6, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='hists', full_name='CronusObject.hists', index=7,
-      number=7, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='job', full_name='CronusObject.job', index=8,
-      number=8, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='log', full_name='CronusObject.log', index=9,
-      number=9, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='file', full_name='CronusObject.file', index=10,
-      number=11, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='table', full_name='CronusObject.table', index=11,
-      number=12, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='tdigests', full_name='CronusObject.tdigests', index=12,
-      number=14, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-    _descriptor.OneofDescriptor(
-      name='info', full_name='CronusObject.info',
-      index=0, containing_type=None, fields=[]),
-  ],
-  serialized_start=664,
-  serialized_end=1066,
-)
-
-
-_ARTEMISARTIFACT = _descriptor.Descriptor(
-  name='ArtemisArtifact',
-  full_name='ArtemisArtifact',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='transform', full_name='ArtemisArtifact.transform', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='input_files', full_name='ArtemisArtifact.input_files', index=1,
-      number=2, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='dataset_parent_id', full_name='ArtemisArtifact.dataset_parent_id', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='dataset_child_id', full_name='ArtemisArtifact.dataset_child_id', index=3,
-      number=4, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='job_parent_id', full_name='ArtemisArtifact.job_parent_id', index=4,
-      number=5, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='child_id', full_name='ArtemisArtifact.child_id', index=5,
-      number=6, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='partitions', full_name='ArtemisArtifact.partitions', index=6,
-      number=7, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='hists', full_name='ArtemisArtifact.hists', index=7,
-      number=8, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='jobinfo', full_name='ArtemisArtifact.jobinfo', index=8,
-      number=9, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='log', full_name='ArtemisArtifact.log', index=9,
-      number=10, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='tdigests', full_name='ArtemisArtifact.tdigests', index=10,
-      number=11, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1069,
-  serialized_end=1405,
-)
-
-
-_MENUOBJECTINFO = _descriptor.Descriptor(
-  name='MenuObjectInfo',
-  full_name='MenuObjectInfo',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='aux', full_name='MenuObjectInfo.aux', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='created', full_name='MenuObjectInfo.created', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1407,
-  serialized_end=1501,
-)
-
-
-_MENUOBJECTAUXINFO = _descriptor.Descriptor(
-  name='MenuObjectAuxInfo',
-  full_name='MenuObjectAuxInfo',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='description', full_name='MenuObjectAuxInfo.description', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1503,
-  serialized_end=1543,
-)
-
-
-_CONFIGOBJECTINFO = _descriptor.Descriptor(
-  name='ConfigObjectInfo',
-  full_name='ConfigObjectInfo',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='aux', full_name='ConfigObjectInfo.aux', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='created', full_name='ConfigObjectInfo.created', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1545,
-  serialized_end=1643,
-)
-
-
-_CONFIGOBJECTAUXINFO = _descriptor.Descriptor(
-  name='ConfigObjectAuxInfo',
-  full_name='ConfigObjectAuxInfo',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='description', full_name='ConfigObjectAuxInfo.description', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1645,
-  serialized_end=1687,
-)
-
-
-_HISTSOBJECTINFO = _descriptor.Descriptor(
-  name='HistsObjectInfo',
-  full_name='HistsObjectInfo',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='aux', full_name='HistsObjectInfo.aux', index=0,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='keys', full_name='HistsObjectInfo.keys', index=1,
-      number=1, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1689,
-  serialized_end=1754,
-)
-
-
-_HISTSOBJECTAUXINFO_METAENTRY = _descriptor.Descriptor(
-  name='MetaEntry',
-  full_name='HistsObjectAuxInfo.MetaEntry',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='key', full_name='HistsObjectAuxInfo.MetaEntry.key', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='value', full_name='HistsObjectAuxInfo.MetaEntry.value', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=_b('8\001'),
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1845,
-  serialized_end=1888,
-)
-
-_HISTSOBJECTAUXINFO = _descriptor.Descriptor(
-  name='HistsObjectAuxInfo',
-  full_name='HistsObjectAuxInfo',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='description', full_name='HistsObjectAuxInfo.description', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='meta', full_name='HistsObjectAuxInfo.meta', index=1,
-      number=2, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[_HISTSOBJECTAUXINFO_METAENTRY, ],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1757,
-  serialized_end=1888,
-)
-
-
-_TDIGESTOBJECTINFO = _descriptor.Descriptor(
-  name='TDigestObjectInfo',
-  full_name='TDigestObjectInfo',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='aux', full_name='TDigestObjectInfo.aux', index=0,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='keys', full_name='TDigestObjectInfo.keys', index=1,
-      number=1, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1890,
-  serialized_end=1959,
-)
-
-
-_TDIGESTOBJECTAUXINFO_METAENTRY = _descriptor.Descriptor(
-  name='MetaEntry',
-  full_name='TDigestObjectAuxInfo.MetaEntry',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='key', full_name='TDigestObjectAuxInfo.MetaEntry.key', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='value', full_name='TDigestObjectAuxInfo.MetaEntry.value', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=_b('8\001'),
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1845,
-  serialized_end=1888,
-)
-
-_TDIGESTOBJECTAUXINFO = _descriptor.Descriptor(
-  name='TDigestObjectAuxInfo',
-  full_name='TDigestObjectAuxInfo',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='description', full_name='TDigestObjectAuxInfo.description', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='meta', full_name='TDigestObjectAuxInfo.meta', index=1,
-      number=2, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[_TDIGESTOBJECTAUXINFO_METAENTRY, ],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1962,
-  serialized_end=2097,
-)
-
-
-_JOBOBJECTINFO = _descriptor.Descriptor(
-  name='JobObjectInfo',
-  full_name='JobObjectInfo',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='aux', full_name='JobObjectInfo.aux', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2099,
-  serialized_end=2146,
-)
-
-
-_JOBOBJECTAUXINFO = _descriptor.Descriptor(
-  name='JobObjectAuxInfo',
-  full_name='JobObjectAuxInfo',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='description', full_name='JobObjectAuxInfo.description', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2148,
-  serialized_end=2187,
-)
-
-
-_LOGOBJECTINFO = _descriptor.Descriptor(
-  name='LogObjectInfo',
-  full_name='LogObjectInfo',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='aux', full_name='LogObjectInfo.aux', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2189,
-  serialized_end=2236,
-)
-
-
-_LOGOBJECTAUXINFO = _descriptor.Descriptor(
-  name='LogObjectAuxInfo',
-  full_name='LogObjectAuxInfo',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='description', full_name='LogObjectAuxInfo.description', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2238,
-  serialized_end=2277,
-)
-
-
-_DATASETOBJECTINFO = _descriptor.Descriptor(
-  name='DatasetObjectInfo',
-  full_name='DatasetObjectInfo',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='aux', full_name='DatasetObjectInfo.aux', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='transform', full_name='DatasetObjectInfo.transform', index=1,
-      number=4, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='partitions', full_name='DatasetObjectInfo.partitions', index=2,
-      number=2, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='job_idx', full_name='DatasetObjectInfo.job_idx', index=3,
-      number=13, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='jobs', full_name='DatasetObjectInfo.jobs', index=4,
-      number=5, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='hists', full_name='DatasetObjectInfo.hists', index=5,
-      number=6, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='logs', full_name='DatasetObjectInfo.logs', index=6,
-      number=7, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='storage_location', full_name='DatasetObjectInfo.storage_location', index=7,
-      number=8, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='parents', full_name='DatasetObjectInfo.parents', index=8,
-      number=9, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='children', full_name='DatasetObjectInfo.children', index=9,
-      number=10, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='files', full_name='DatasetObjectInfo.files', index=10,
-      number=11, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='tables', full_name='DatasetObjectInfo.tables', index=11,
-      number=12, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='tdigests', full_name='DatasetObjectInfo.tdigests', index=12,
-      number=14, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2280,
-  serialized_end=2676,
-)
-
-
-_DATASETOBJECTAUXINFO = _descriptor.Descriptor(
-  name='DatasetObjectAuxInfo',
-  full_name='DatasetObjectAuxInfo',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='data_holding', full_name='DatasetObjectAuxInfo.data_holding', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='data_asset', full_name='DatasetObjectAuxInfo.data_asset', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2678,
-  serialized_end=2768,
-)
-
-
-_DATAHOLDING = _descriptor.Descriptor(
-  name='DataHolding',
-  full_name='DataHolding',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='name', full_name='DataHolding.name', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='description', full_name='DataHolding.description', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='program_element', full_name='DataHolding.program_element', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='sensitive_statistical_info', full_name='DataHolding.sensitive_statistical_info', index=3,
-      number=4, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='has_personal_identifiers', full_name='DataHolding.has_personal_identifiers', index=4,
-      number=5, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='has_data_dictionary', full_name='DataHolding.has_data_dictionary', index=5,
-      number=6, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='has_record_layout', full_name='DataHolding.has_record_layout', index=6,
-      number=7, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='has_other_supporting_documentation', full_name='DataHolding.has_other_supporting_documentation', index=7,
-      number=8, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='dataset_size', full_name='DataHolding.dataset_size', index=8,
-      number=9, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='dataset_size_type', full_name='DataHolding.dataset_size_type', index=9,
-      number=10, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='expected_medium', full_name='DataHolding.expected_medium', index=10,
-      number=11, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='data_holding_detail', full_name='DataHolding.data_holding_detail', index=11,
-      number=12, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='provision_agreement', full_name='DataHolding.provision_agreement', index=12,
-      number=13, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='usage', full_name='DataHolding.usage', index=13,
-      number=14, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='permission', full_name='DataHolding.permission', index=14,
-      number=15, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='provider', full_name='DataHolding.provider', index=15,
-      number=16, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='provider_type', full_name='DataHolding.provider_type', index=16,
-      number=17, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2771,
-  serialized_end=3296,
-)
-
-
-_DATAASSET = _descriptor.Descriptor(
-  name='DataAsset',
-  full_name='DataAsset',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='description', full_name='DataAsset.description', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='reference_period', full_name='DataAsset.reference_period', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='granularity_type', full_name='DataAsset.granularity_type', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='state', full_name='DataAsset.state', index=3,
-      number=5, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='last_updated', full_name='DataAsset.last_updated', index=4,
-      number=6, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='creation_time', full_name='DataAsset.creation_time', index=5,
-      number=7, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='data_asset_category', full_name='DataAsset.data_asset_category', index=6,
-      number=8, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='data_retention', full_name='DataAsset.data_retention', index=7,
-      number=9, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='table_count', full_name='DataAsset.table_count', index=8,
-      number=10, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='file_count', full_name='DataAsset.file_count', index=9,
-      number=11, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='partition_count', full_name='DataAsset.partition_count', index=10,
-      number=12, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='job_count', full_name='DataAsset.job_count', index=11,
-      number=13, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='hists_count', full_name='DataAsset.hists_count', index=12,
-      number=14, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='parent_count', full_name='DataAsset.parent_count', index=13,
-      number=15, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='children_count', full_name='DataAsset.children_count', index=14,
-      number=20, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=3299,
-  serialized_end=3720,
-)
-
-
-_DATARETENTION = _descriptor.Descriptor(
-  name='DataRetention',
-  full_name='DataRetention',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='description', full_name='DataRetention.description', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='period', full_name='DataRetention.period', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='retention_trigger_date', full_name='DataRetention.retention_trigger_date', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='retention_trigger', full_name='DataRetention.retention_trigger', index=3,
-      number=4, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='type', full_name='DataRetention.type', index=4,
-      number=5, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=3722,
-  serialized_end=3847,
-)
-
-
-_DATAHOLDINGDETAIL = _descriptor.Descriptor(
-  name='DataHoldingDetail',
-  full_name='DataHoldingDetail',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='receptionFrequency', full_name='DataHoldingDetail.receptionFrequency', index=0,
-      number=4, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='acquisition_stage', full_name='DataHoldingDetail.acquisition_stage', index=1,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='acquisition_cost', full_name='DataHoldingDetail.acquisition_cost', index=2,
-      number=2, type=2, cpp_type=6, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='quality_evaluation_done_on_input', full_name='DataHoldingDetail.quality_evaluation_done_on_input', index=3,
-      number=3, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=3850,
-  serialized_end=3992,
-)
-
-
-_PROVISIONAGREEMENT = _descriptor.Descriptor(
-  name='ProvisionAgreement',
-  full_name='ProvisionAgreement',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='channel', full_name='ProvisionAgreement.channel', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='statcan_act_section', full_name='ProvisionAgreement.statcan_act_section', index=1,
-      number=2, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='channel_detail', full_name='ProvisionAgreement.channel_detail', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='data_usage_type', full_name='ProvisionAgreement.data_usage_type', index=3,
-      number=4, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='data_acquisition_type', full_name='ProvisionAgreement.data_acquisition_type', index=4,
-      number=5, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=3995,
-  serialized_end=4141,
-)
-
-
-_TABLEOBJECTINFO = _descriptor.Descriptor(
-  name='TableObjectInfo',
-  full_name='TableObjectInfo',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='fields', full_name='TableObjectInfo.fields', index=0,
-      number=1, type=9, cpp_type=9, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=4143,
-  serialized_end=4176,
-)
-
-
-_TRANSFORM = _descriptor.Descriptor(
-  name='Transform',
-  full_name='Transform',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='menu', full_name='Transform.menu', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='config', full_name='Transform.config', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=4178,
-  serialized_end=4249,
-)
-
-
-_FILEOBJECTINFO = _descriptor.Descriptor(
-  name='FileObjectInfo',
-  full_name='FileObjectInfo',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='aux', full_name='FileObjectInfo.aux', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='type', full_name='FileObjectInfo.type', index=1,
-      number=2, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='size_bytes', full_name='FileObjectInfo.size_bytes', index=2,
-      number=3, type=3, cpp_type=2, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='size_unit', full_name='FileObjectInfo.size_unit', index=3,
-      number=6, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='blocks', full_name='FileObjectInfo.blocks', index=4,
-      number=4, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='partition', full_name='FileObjectInfo.partition', index=5,
-      number=5, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=4252,
-  serialized_end=4408,
-)
-
-
-_FILEOBJECTAUXINFO = _descriptor.Descriptor(
-  name='FileObjectAuxInfo',
-  full_name='FileObjectAuxInfo',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='description', full_name='FileObjectAuxInfo.description', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='num_columns', full_name='FileObjectAuxInfo.num_columns', index=1,
-      number=2, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='num_rows', full_name='FileObjectAuxInfo.num_rows', index=2,
-      number=3, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='num_batches', full_name='FileObjectAuxInfo.num_batches', index=3,
-      number=4, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=4410,
-  serialized_end=4510,
-)
-
-
-_BLOCK = _descriptor.Descriptor(
-  name='Block',
-  full_name='Block',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='index', full_name='Block.index', index=0,
-      number=1, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='info', full_name='Block.info', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=4512,
-  serialized_end=4560,
-)
-
-
-_BLOCKINFO = _descriptor.Descriptor(
-  name='BlockInfo',
-  full_name='BlockInfo',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='size_bytes', full_name='BlockInfo.size_bytes', index=0,
-      number=1, type=3, cpp_type=2, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='offset', full_name='BlockInfo.offset', index=1,
-      number=2, type=3, cpp_type=2, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='length', full_name='BlockInfo.length', index=2,
-      number=3, type=3, cpp_type=2, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=4562,
-  serialized_end=4625,
-)
-
-
-_DUMMYMESSAGE = _descriptor.Descriptor(
-  name='DummyMessage',
-  full_name='DummyMessage',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='name', full_name='DummyMessage.name', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='description', full_name='DummyMessage.description', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=4627,
-  serialized_end=4676,
-)
-
-_CRONUSSTORE.fields_by_name['info'].message_type = _CRONUSSTOREINFO
-_CRONUSSTOREINFO.fields_by_name['created'].message_type = google_dot_protobuf_dot_timestamp__pb2._TIMESTAMP
-_CRONUSSTOREINFO.fields_by_name['aux'].message_type = _CRONUSSTOREAUXINFO
-_CRONUSSTOREINFO.fields_by_name['child_stores'].message_type = _CRONUSOBJECTSTORE
-_CRONUSOBJECTSTORE.fields_by_name['info'].message_type = _CRONUSOBJECTSTOREINFO
-_CRONUSOBJECTSTOREINFO.fields_by_name['created'].message_type = google_dot_protobuf_dot_timestamp__pb2._TIMESTAMP
-_CRONUSOBJECTSTOREINFO.fields_by_name['aux'].message_type = _CRONUSOBJECTSTOREAUXINFO
-_CRONUSOBJECTSTOREINFO.fields_by_name['objects'].message_type = _CRONUSOBJECT
-_CRONUSOBJECT.fields_by_name['menu'].message_type = _MENUOBJECTINFO
-_CRONUSOBJECT.fields_by_name['config'].message_type = _CONFIGOBJECTINFO
-_CRONUSOBJECT.fields_by_name['dataset'].message_type = _DATASETOBJECTINFO
-_CRONUSOBJECT.fields_by_name['hists'].message_type = _HISTSOBJECTINFO
-_CRONUSOBJECT.fields_by_name['job'].message_type = _JOBOBJECTINFO
-_CRONUSOBJECT.fields_by_name['log'].message_type = _LOGOBJECTINFO
-_CRONUSOBJECT.fields_by_name['file'].message_type = _FILEOBJECTINFO
-_CRONUSOBJECT.fields_by_name['table'].message_type = _TABLEOBJECTINFO
-_CRONUSOBJECT.fields_by_name['tdigests'].message_type = _TDIGESTOBJECTINFO
-_CRONUSOBJECT.oneofs_by_name['info'].fields.append(
-  _CRONUSOBJECT.fields_by_name['menu'])
-_CRONUSOBJECT.fields_by_name['menu'].containing_oneof = _CRONUSOBJECT.oneofs_by_name['info']
-_CRONUSOBJECT.oneofs_by_name['info'].fields.append(
-  _CRONUSOBJECT.fields_by_name['config'])
-_CRONUSOBJECT.fields_by_name['config'].containing_oneof = _CRONUSOBJECT.oneofs_by_name['info']
-_CRONUSOBJECT.oneofs_by_name['info'].fields.append(
-  _CRONUSOBJECT.fields_by_name['dataset'])
-_CRONUSOBJECT.fields_by_name['dataset'].containing_oneof = _CRONUSOBJECT.oneofs_by_name['info']
-_CRONUSOBJECT.oneofs_by_name['info'].fields.append(
-  _CRONUSOBJECT.fields_by_name['hists'])
-_CRONUSOBJECT.fields_by_name['hists'].containing_oneof = _CRONUSOBJECT.oneofs_by_name['info']
-_CRONUSOBJECT.oneofs_by_name['info'].fields.append(
-  _CRONUSOBJECT.fields_by_name['job'])
-_CRONUSOBJECT.fields_by_name['job'].containing_oneof = _CRONUSOBJECT.oneofs_by_name['info']
-_CRONUSOBJECT.oneofs_by_name['info'].fields.append(
-  _CRONUSOBJECT.fields_by_name['log'])
-_CRONUSOBJECT.fields_by_name['log'].containing_oneof = _CRONUSOBJECT.oneofs_by_name['info']
-_CRONUSOBJECT.oneofs_by_name['info'].fields.append(
-  _CRONUSOBJECT.fields_by_name['file'])
-_CRONUSOBJECT.fields_by_name['file'].containing_oneof = _CRONUSOBJECT.oneofs_by_name['info']
-_CRONUSOBJECT.oneofs_by_name['info'].fields.append(
-  _CRONUSOBJECT.fields_by_name['table'])
-_CRONUSOBJECT.fields_by_name['table'].containing_oneof = _CRONUSOBJECT.oneofs_by_name['info']
-_CRONUSOBJECT.oneofs_by_name['info'].fields.append(
-  _CRONUSOBJECT.fields_by_name['tdigests'])
-_CRONUSOBJECT.fields_by_name['tdigests'].containing_oneof = _CRONUSOBJECT.oneofs_by_name['info']
-_ARTEMISARTIFACT.fields_by_name['transform'].message_type = _TRANSFORM
-_ARTEMISARTIFACT.fields_by_name['input_files'].message_type = _CRONUSOBJECT
-_ARTEMISARTIFACT.fields_by_name['partitions'].message_type = _CRONUSOBJECT
-_ARTEMISARTIFACT.fields_by_name['hists'].message_type = _CRONUSOBJECT
-_ARTEMISARTIFACT.fields_by_name['jobinfo'].message_type = _CRONUSOBJECT
-_ARTEMISARTIFACT.fields_by_name['log'].message_type = _CRONUSOBJECT
-_ARTEMISARTIFACT.fields_by_name['tdigests'].message_type = _CRONUSOBJECT
-_MENUOBJECTINFO.fields_by_name['aux'].message_type = _MENUOBJECTAUXINFO
-_MENUOBJECTINFO.fields_by_name['created'].message_type = google_dot_protobuf_dot_timestamp__pb2._TIMESTAMP
-_CONFIGOBJECTINFO.fields_by_name['aux'].message_type = _CONFIGOBJECTAUXINFO
-_CONFIGOBJECTINFO.fields_by_name['created'].message_type = google_dot_protobuf_dot_timestamp__pb2._TIMESTAMP
-_HISTSOBJECTINFO.fields_by_name['aux'].message_type = _HISTSOBJECTAUXINFO
-_HISTSOBJECTAUXINFO_METAENTRY.containing_type = _HISTSOBJECTAUXINFO
-_HISTSOBJECTAUXINFO.fields_by_name['meta'].message_type = _HISTSOBJECTAUXINFO_METAENTRY
-_TDIGESTOBJECTINFO.fields_by_name['aux'].message_type = _TDIGESTOBJECTAUXINFO
-_TDIGESTOBJECTAUXINFO_METAENTRY.containing_type = _TDIGESTOBJECTAUXINFO
-_TDIGESTOBJECTAUXINFO.fields_by_name['meta'].message_type = _TDIGESTOBJECTAUXINFO_METAENTRY
-_JOBOBJECTINFO.fields_by_name['aux'].message_type = _JOBOBJECTAUXINFO
-_LOGOBJECTINFO.fields_by_name['aux'].message_type = _LOGOBJECTAUXINFO
-_DATASETOBJECTINFO.fields_by_name['aux'].message_type = _DATASETOBJECTAUXINFO
-_DATASETOBJECTINFO.fields_by_name['transform'].message_type = _TRANSFORM
-_DATASETOBJECTINFO.fields_by_name['jobs'].message_type = _CRONUSOBJECT
-_DATASETOBJECTINFO.fields_by_name['hists'].message_type = _CRONUSOBJECT
-_DATASETOBJECTINFO.fields_by_name['logs'].message_type = _CRONUSOBJECT
-_DATASETOBJECTINFO.fields_by_name['parents'].message_type = _CRONUSOBJECT
-_DATASETOBJECTINFO.fields_by_name['children'].message_type = _CRONUSOBJECT
-_DATASETOBJECTINFO.fields_by_name['files'].message_type = _CRONUSOBJECT
-_DATASETOBJECTINFO.fields_by_name['tables'].message_type = _CRONUSOBJECT
-_DATASETOBJECTINFO.fields_by_name['tdigests'].message_type = _CRONUSOBJECT
-_DATASETOBJECTAUXINFO.fields_by_name['data_holding'].message_type = _DATAHOLDING
-_DATASETOBJECTAUXINFO.fields_by_name['data_asset'].message_type = _DATAASSET
-_DATAHOLDING.fields_by_name['dataset_size_type'].enum_type = _DATASETSIZETYPE
-_DATAHOLDING.fields_by_name['data_holding_detail'].message_type = _DATAHOLDINGDETAIL
-_DATAHOLDING.fields_by_name['provision_agreement'].message_type = _PROVISIONAGREEMENT
-_DATAHOLDING.fields_by_name['provider_type'].enum_type = _PROVIDERTYPE
-_DATAASSET.fields_by_name['last_updated'].message_type = google_dot_protobuf_dot_timestamp__pb2._TIMESTAMP
-_DATAASSET.fields_by_name['creation_time'].message_type = google_dot_protobuf_dot_timestamp__pb2._TIMESTAMP
-_DATAASSET.fields_by_name['data_retention'].message_type = _DATARETENTION
-_TRANSFORM.fields_by_name['menu'].message_type = _CRONUSOBJECT
-_TRANSFORM.fields_by_name['config'].message_type = _CRONUSOBJECT
-_FILEOBJECTINFO.fields_by_name['aux'].message_type = _FILEOBJECTAUXINFO
-_FILEOBJECTINFO.fields_by_name['type'].enum_type = _FILETYPE
-_FILEOBJECTINFO.fields_by_name['blocks'].message_type = _BLOCK
-_BLOCK.fields_by_name['info'].message_type = _BLOCKINFO
-DESCRIPTOR.message_types_by_name['CronusStore'] = _CRONUSSTORE
-DESCRIPTOR.message_types_by_name['CronusStoreInfo'] = _CRONUSSTOREINFO
-DESCRIPTOR.message_types_by_name['CronusStoreAuxInfo'] = _CRONUSSTOREAUXINFO
-DESCRIPTOR.message_types_by_name['CronusObjectStore'] = _CRONUSOBJECTSTORE
-DESCRIPTOR.message_types_by_name['CronusObjectStoreInfo'] = _CRONUSOBJECTSTOREINFO
-DESCRIPTOR.message_types_by_name['CronusObjectStoreAuxInfo'] = _CRONUSOBJECTSTOREAUXINFO
-DESCRIPTOR.message_types_by_name['CronusObject'] = _CRONUSOBJECT
-DESCRIPTOR.message_types_by_name['ArtemisArtifact'] = _ARTEMISARTIFACT
-DESCRIPTOR.message_types_by_name['MenuObjectInfo'] = _MENUOBJECTINFO
-DESCRIPTOR.message_types_by_name['MenuObjectAuxInfo'] = _MENUOBJECTAUXINFO
-DESCRIPTOR.message_types_by_name['ConfigObjectInfo'] = _CONFIGOBJECTINFO
-DESCRIPTOR.message_types_by_name['ConfigObjectAuxInfo'] = _CONFIGOBJECTAUXINFO
-DESCRIPTOR.message_types_by_name['HistsObjectInfo'] = _HISTSOBJECTINFO
-DESCRIPTOR.message_types_by_name['HistsObjectAuxInfo'] = _HISTSOBJECTAUXINFO
-DESCRIPTOR.message_types_by_name['TDigestObjectInfo'] = _TDIGESTOBJECTINFO
-DESCRIPTOR.message_types_by_name['TDigestObjectAuxInfo'] = _TDIGESTOBJECTAUXINFO
-DESCRIPTOR.message_types_by_name['JobObjectInfo'] = _JOBOBJECTINFO
-DESCRIPTOR.message_types_by_name['JobObjectAuxInfo'] = _JOBOBJECTAUXINFO
-DESCRIPTOR.message_types_by_name['LogObjectInfo'] = _LOGOBJECTINFO
-DESCRIPTOR.message_types_by_name['LogObjectAuxInfo'] = _LOGOBJECTAUXINFO
-DESCRIPTOR.message_types_by_name['DatasetObjectInfo'] = _DATASETOBJECTINFO
-DESCRIPTOR.message_types_by_name['DatasetObjectAuxInfo'] = _DATASETOBJECTAUXINFO
-DESCRIPTOR.message_types_by_name['DataHolding'] = _DATAHOLDING
-DESCRIPTOR.message_types_by_name['DataAsset'] = _DATAASSET
-DESCRIPTOR.message_types_by_name['DataRetention'] = _DATARETENTION
-DESCRIPTOR.message_types_by_name['DataHoldingDetail'] = _DATAHOLDINGDETAIL
-DESCRIPTOR.message_types_by_name['ProvisionAgreement'] = _PROVISIONAGREEMENT
-DESCRIPTOR.message_types_by_name['TableObjectInfo'] = _TABLEOBJECTINFO
-DESCRIPTOR.message_types_by_name['Transform'] = _TRANSFORM
-DESCRIPTOR.message_types_by_name['FileObjectInfo'] = _FILEOBJECTINFO
-DESCRIPTOR.message_types_by_name['FileObjectAuxInfo'] = _FILEOBJECTAUXINFO
-DESCRIPTOR.message_types_by_name['Block'] = _BLOCK
-DESCRIPTOR.message_types_by_name['BlockInfo'] = _BLOCKINFO
-DESCRIPTOR.message_types_by_name['DummyMessage'] = _DUMMYMESSAGE
-DESCRIPTOR.enum_types_by_name['DatasetSizeType'] = _DATASETSIZETYPE
-DESCRIPTOR.enum_types_by_name['ProviderType'] = _PROVIDERTYPE
-DESCRIPTOR.enum_types_by_name['FileType'] = _FILETYPE
-_sym_db.RegisterFileDescriptor(DESCRIPTOR)
-
-CronusStore = _reflection.GeneratedProtocolMessageType('CronusStore', (_message.Message,), {
-  'DESCRIPTOR' : _CRONUSSTORE,
-  '__module__' : 'cronus_pb2'
-  # @@protoc_insertion_point(class_scope:CronusStore)
-  })
-_sym_db.RegisterMessage(CronusStore)
-
-CronusStoreInfo = _reflection.GeneratedProtocolMessageType('CronusStoreInfo', (_message.Message,), {
-  'DESCRIPTOR' : _CRONUSSTOREINFO,
-  '__module__' : 'cronus_pb2'
-  # @@protoc_insertion_point(class_scope:CronusStoreInfo)
-  })
-_sym_db.RegisterMessage(CronusStoreInfo)
-
-CronusStoreAuxInfo = _reflection.GeneratedProtocolMessageType('CronusStoreAuxInfo', (_message.Message,), {
-  'DESCRIPTOR' : _CRONUSSTOREAUXINFO,
-  '__module__' : 'cronus_pb2'
-  # @@protoc_insertion_point(class_scope:CronusStoreAuxInfo)
-  })
-_sym_db.RegisterMessage(CronusStoreAuxInfo)
-
-CronusObjectStore = _reflection.GeneratedProtocolMessageType('CronusObjectStore', (_message.Message,), {
-  'DESCRIPTOR' : _CRONUSOBJECTSTORE,
-  '__module__' : 'cronus_pb2'
-  # @@protoc_insertion_point(class_scope:CronusObjectStore)
-  })
-_sym_db.RegisterMessage(CronusObjectStore)
-
-CronusObjectStoreInfo = _reflection.GeneratedProtocolMessageType('CronusObjectStoreInfo', (_message.Message,), {
-  'DESCRIPTOR' : _CRONUSOBJECTSTOREINFO,
-  '__module__' : 'cronus_pb2'
-  # @@protoc_insertion_point(class_scope:CronusObjectStoreInfo)
-  })
-_sym_db.RegisterMessage(CronusObjectStoreInfo)
-
-CronusObjectStoreAuxInfo = _reflection.GeneratedProtocolMessageType('CronusObjectStoreAuxInfo', (_message.Message,), {
-  'DESCRIPTOR' : _CRONUSOBJECTSTOREAUXINFO,
-  '__module__' : 'cronus_pb2'
-  # @@protoc_insertion_point(class_scope:CronusObjectStoreAuxInfo)
-  })
-_sym_db.RegisterMessage(CronusObjectStoreAuxInfo)
-
-CronusObject = _reflection.GeneratedProtocolMessageType('CronusObject', (_message.Message,), {
-  'DESCRIPTOR' : _CRONUSOBJECT,
-  '__module__' : 'cronus_pb2'
-  # @@protoc_insertion_point(class_scope:CronusObject)
-  })
-_sym_db.RegisterMessage(CronusObject)
-
-ArtemisArtifact = _reflection.GeneratedProtocolMessageType('ArtemisArtifact', (_message.Message,), {
-  'DESCRIPTOR' : _ARTEMISARTIFACT,
-  '__module__' : 'cronus_pb2'
-  # @@protoc_insertion_point(class_scope:ArtemisArtifact)
-  })
-_sym_db.RegisterMessage(ArtemisArtifact)
-
-MenuObjectInfo = _reflection.GeneratedProtocolMessageType('MenuObjectInfo', (_message.Message,), {
-  'DESCRIPTOR' : _MENUOBJECTINFO,
-  '__module__' : 'cronus_pb2'
-  # @@protoc_insertion_point(class_scope:MenuObjectInfo)
-  })
-_sym_db.RegisterMessage(MenuObjectInfo)
-
-MenuObjectAuxInfo = _reflection.GeneratedProtocolMessageType('MenuObjectAuxInfo', (_message.Message,), {
-  'DESCRIPTOR' : _MENUOBJECTAUXINFO,
-  '__module__' : 'cronus_pb2'
-  # @@protoc_insertion_point(class_scope:MenuObjectAuxInfo)
-  })
-_sym_db.RegisterMessage(MenuObjectAuxInfo)
-
-ConfigObjectInfo = _reflection.GeneratedProtocolMessageType('ConfigObjectInfo', (_message.Message,), {
-  'DESCRIPTOR' : _CONFIGOBJECTINFO,
-  '__module__' : 'cronus_pb2'
-  # @@protoc_insertion_point(class_scope:ConfigObjectInfo)
-  })
-_sym_db.RegisterMessage(ConfigObjectInfo)
-
-ConfigObjectAuxInfo = _reflection.GeneratedProtocolMessageType('ConfigObjectAuxInfo', (_message.Message,), {
-  'DESCRIPTOR' : _CONFIGOBJECTAUXINFO,
-  '__module__' : 'cronus_pb2'
-  # @@protoc_insertion_point(class_scope:ConfigObjectAuxInfo)
-  })
-_sym_db.RegisterMessage(ConfigObjectAuxInfo)
-
-HistsObjectInfo = _reflection.GeneratedProtocolMessageType('HistsObjectInfo', (_message.Message,), {
-  'DESCRIPTOR' : _HISTSOBJECTINFO,
-  '__module__' : 'cronus_pb2'
-  # @@protoc_insertion_point(class_scope:HistsObjectInfo)
-  })
-_sym_db.RegisterMessage(HistsObjectInfo)
-
-HistsObjectAuxInfo = _reflection.GeneratedProtocolMessageType('HistsObjectAuxInfo', (_message.Message,), {
-
-  'MetaEntry' : _reflection.GeneratedProtocolMessageType('MetaEntry', (_message.Message,), {
-    'DESCRIPTOR' : _HISTSOBJECTAUXINFO_METAENTRY,
-    '__module__' : 'cronus_pb2'
-    # @@protoc_insertion_point(class_scope:HistsObjectAuxInfo.MetaEntry)
-    })
-  ,
-  'DESCRIPTOR' : _HISTSOBJECTAUXINFO,
-  '__module__' : 'cronus_pb2'
-  # @@protoc_insertion_point(class_scope:HistsObjectAuxInfo)
-  })
-_sym_db.RegisterMessage(HistsObjectAuxInfo)
-_sym_db.RegisterMessage(HistsObjectAuxInfo.MetaEntry)
-
-TDigestObjectInfo = _reflection.GeneratedProtocolMessageType('TDigestObjectInfo', (_message.Message,), {
-  'DESCRIPTOR' : _TDIGESTOBJECTINFO,
-  '__module__' : 'cronus_pb2'
-  # @@protoc_insertion_point(class_scope:TDigestObjectInfo)
-  })
-_sym_db.RegisterMessage(TDigestObjectInfo)
-
-TDigestObjectAuxInfo = _reflection.GeneratedProtocolMessageType('TDigestObjectAuxInfo', (_message.Message,), {
-
-  'MetaEntry' : _reflection.GeneratedProtocolMessageType('MetaEntry', (_message.Message,), {
-    'DESCRIPTOR' : _TDIGESTOBJECTAUXINFO_METAENTRY,
-    '__module__' : 'cronus_pb2'
-    # @@protoc_insertion_point(class_scope:TDigestObjectAuxInfo.MetaEntry)
-    })
-  ,
-  'DESCRIPTOR' : _TDIGESTOBJECTAUXINFO,
-  '__module__' : 'cronus_pb2'
-  # @@protoc_insertion_point(class_scope:TDigestObjectAuxInfo)
-  })
-_sym_db.RegisterMessage(TDigestObjectAuxInfo)
-_sym_db.RegisterMessage(TDigestObjectAuxInfo.MetaEntry)
-
-JobObjectInfo = _reflection.GeneratedProtocolMessageType('JobObjectInfo', (_message.Message,), {
-  'DESCRIPTOR' : _JOBOBJECTINFO,
-  '__module__' : 'cronus_pb2'
-  # @@protoc_insertion_point(class_scope:JobObjectInfo)
-  })
-_sym_db.RegisterMessage(JobObjectInfo)
-
-JobObjectAuxInfo = _reflection.GeneratedProtocolMessageType('JobObjectAuxInfo', (_message.Message,), {
-  'DESCRIPTOR' : _JOBOBJECTAUXINFO,
-  '__module__' : 'cronus_pb2'
-  # @@protoc_insertion_point(class_scope:JobObjectAuxInfo)
-  })
-_sym_db.RegisterMessage(JobObjectAuxInfo)
-
-LogObjectInfo = _reflection.GeneratedProtocolMessageType('LogObjectInfo', (_message.Message,), {
-  'DESCRIPTOR' : _LOGOBJECTINFO,
-  '__module__' : 'cronus_pb2'
-  # @@protoc_insertion_point(class_scope:LogObjectInfo)
-  })
-_sym_db.RegisterMessage(LogObjectInfo)
-
-LogObjectAuxInfo = _reflection.GeneratedProtocolMessageType('LogObjectAuxInfo', (_message.Message,), {
-  'DESCRIPTOR' : _LOGOBJECTAUXINFO,
-  '__module__' : 'cronus_pb2'
-  # @@protoc_insertion_point(class_scope:LogObjectAuxInfo)
-  })
-_sym_db.RegisterMessage(LogObjectAuxInfo)
-
-DatasetObjectInfo = _reflection.GeneratedProtocolMessageType('DatasetObjectInfo', (_message.Message,), {
-  'DESCRIPTOR' : _DATASETOBJECTINFO,
-  '__module__' : 'cronus_pb2'
-  # @@protoc_insertion_point(class_scope:DatasetObjectInfo)
-  })
-_sym_db.RegisterMessage(DatasetObjectInfo)
-
-DatasetObjectAuxInfo = _reflection.GeneratedProtocolMessageType('DatasetObjectAuxInfo', (_message.Message,), {
-  'DESCRIPTOR' : _DATASETOBJECTAUXINFO,
-  '__module__' : 'cronus_pb2'
-  # @@protoc_insertion_point(class_scope:DatasetObjectAuxInfo)
-  })
-_sym_db.RegisterMessage(DatasetObjectAuxInfo)
-
-DataHolding = _reflection.GeneratedProtocolMessageType('DataHolding', (_message.Message,), {
-  'DESCRIPTOR' : _DATAHOLDING,
-  '__module__' : 'cronus_pb2'
-  # @@protoc_insertion_point(class_scope:DataHolding)
-  })
-_sym_db.RegisterMessage(DataHolding)
-
-DataAsset = _reflection.GeneratedProtocolMessageType('DataAsset', (_message.Message,), {
-  'DESCRIPTOR' : _DATAASSET,
-  '__module__' : 'cronus_pb2'
-  # @@protoc_insertion_point(class_scope:DataAsset)
-  })
-_sym_db.RegisterMessage(DataAsset)
-
-DataRetention = _reflection.GeneratedProtocolMessageType('DataRetention', (_message.Message,), {
-  'DESCRIPTOR' : _DATARETENTION,
-  '__module__' : 'cronus_pb2'
-  # @@protoc_insertion_point(class_scope:DataRetention)
-  })
-_sym_db.RegisterMessage(DataRetention)
-
-DataHoldingDetail = _reflection.GeneratedProtocolMessageType('DataHoldingDetail', (_message.Message,), {
-  'DESCRIPTOR' : _DATAHOLDINGDETAIL,
-  '__module__' : 'cronus_pb2'
-  # @@protoc_insertion_point(class_scope:DataHoldingDetail)
-  })
-_sym_db.RegisterMessage(DataHoldingDetail)
-
-ProvisionAgreement = _reflection.GeneratedProtocolMessageType('ProvisionAgreement', (_message.Message,), {
-  'DESCRIPTOR' : _PROVISIONAGREEMENT,
-  '__module__' : 'cronus_pb2'
-  # @@protoc_insertion_point(class_scope:ProvisionAgreement)
-  })
-_sym_db.RegisterMessage(ProvisionAgreement)
-
-TableObjectInfo = _reflection.GeneratedProtocolMessageType('TableObjectInfo', (_message.Message,), {
-  'DESCRIPTOR' : _TABLEOBJECTINFO,
-  '__module__' : 'cronus_pb2'
-  # @@protoc_insertion_point(class_scope:TableObjectInfo)
-  })
-_sym_db.RegisterMessage(TableObjectInfo)
-
-Transform = _reflection.GeneratedProtocolMessageType('Transform', (_message.Message,), {
-  'DESCRIPTOR' : _TRANSFORM,
-  '__module__' : 'cronus_pb2'
-  # @@protoc_insertion_point(class_scope:Transform)
-  })
-_sym_db.RegisterMessage(Transform)
-
-FileObjectInfo = _reflection.GeneratedProtocolMessageType('FileObjectInfo', (_message.Message,), {
-  'DESCRIPTOR' : _FILEOBJECTINFO,
-  '__module__' : 'cronus_pb2'
-  # @@protoc_insertion_point(class_scope:FileObjectInfo)
-  })
-_sym_db.RegisterMessage(FileObjectInfo)
-
-FileObjectAuxInfo = _reflection.GeneratedProtocolMessageType('FileObjectAuxInfo', (_message.Message,), {
-  'DESCRIPTOR' : _FILEOBJECTAUXINFO,
-  '__module__' : 'cronus_pb2'
-  # @@protoc_insertion_point(class_scope:FileObjectAuxInfo)
-  })
-_sym_db.RegisterMessage(FileObjectAuxInfo)
-
-Block = _reflection.GeneratedProtocolMessageType('Block', (_message.Message,), {
-  'DESCRIPTOR' : _BLOCK,
-  '__module__' : 'cronus_pb2'
-  # @@protoc_insertion_point(class_scope:Block)
-  })
-_sym_db.RegisterMessage(Block)
-
-BlockInfo = _reflection.GeneratedProtocolMessageType('BlockInfo', (_message.Message,), {
-  'DESCRIPTOR' : _BLOCKINFO,
-  '__module__' : 'cronus_pb2'
-  # @@protoc_insertion_point(class_scope:BlockInfo)
-  })
-_sym_db.RegisterMessage(BlockInfo)
-
-DummyMessage = _reflection.GeneratedProtocolMessageType('DummyMessage', (_message.Message,), {
-  'DESCRIPTOR' : _DUMMYMESSAGE,
-  '__module__' : 'cronus_pb2'
-  # @@protoc_insertion_point(class_scope:DummyMessage)
-  })
-_sym_db.RegisterMessage(DummyMessage)
-
-
-_HISTSOBJECTAUXINFO_METAENTRY._options = None
-_TDIGESTOBJECTAUXINFO_METAENTRY._options = None
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0c\x63ronus.proto\x1a\x1fgoogle/protobuf/timestamp.proto\"o\n\x0b\x43ronusStore\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04uuid\x18\x02 \x01(\t\x12\x13\n\x0bparent_uuid\x18\x03 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x04 \x01(\t\x12\x1e\n\x04info\x18\x05 \x01(\x0b\x32\x10.CronusStoreInfo\"\x8a\x01\n\x0f\x43ronusStoreInfo\x12+\n\x07\x63reated\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12 \n\x03\x61ux\x18\x03 \x01(\x0b\x32\x13.CronusStoreAuxInfo\x12(\n\x0c\x63hild_stores\x18\x04 \x03(\x0b\x32\x12.CronusObjectStore\")\n\x12\x43ronusStoreAuxInfo\x12\x13\n\x0b\x64\x65scription\x18\x01 \x01(\t\"{\n\x11\x43ronusObjectStore\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04uuid\x18\x02 \x01(\t\x12\x13\n\x0bparent_uuid\x18\x03 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x04 \x01(\t\x12$\n\x04info\x18\x05 \x01(\x0b\x32\x16.CronusObjectStoreInfo\"\x8c\x01\n\x15\x43ronusObjectStoreInfo\x12+\n\x07\x63reated\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12&\n\x03\x61ux\x18\x03 \x01(\x0b\x32\x19.CronusObjectStoreAuxInfo\x12\x1e\n\x07objects\x18\x05 \x03(\x0b\x32\r.CronusObject\"/\n\x18\x43ronusObjectStoreAuxInfo\x12\x13\n\x0b\x64\x65scription\x18\x01 \x01(\t\"\xb9\x03\n\x0c\x43ronusObject\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04uuid\x18\x02 \x01(\t\x12\x13\n\x0bparent_uuid\x18\x03 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\r \x01(\t\x12\x1f\n\x04menu\x18\x04 \x01(\x0b\x32\x0f.MenuObjectInfoH\x00\x12#\n\x06\x63onfig\x18\x05 \x01(\x0b\x32\x11.ConfigObjectInfoH\x00\x12%\n\x07\x64\x61taset\x18\x06 \x01(\x0b\x32\x12.DatasetObjectInfoH\x00\x12!\n\x05hists\x18\x07 \x01(\x0b\x32\x10.HistsObjectInfoH\x00\x12\x1d\n\x03job\x18\x08 \x01(\x0b\x32\x0e.JobObjectInfoH\x00\x12\x1d\n\x03log\x18\t \x01(\x0b\x32\x0e.LogObjectInfoH\x00\x12\x1f\n\x04\x66ile\x18\x0b \x01(\x0b\x32\x0f.FileObjectInfoH\x00\x12!\n\x05table\x18\x0c \x01(\x0b\x32\x10.TableObjectInfoH\x00\x12&\n\x08tdigests\x18\x0e \x01(\x0b\x32\x12.TDigestObjectInfoH\x00\x12%\n\x08sketches\x18\x0f \x01(\x0b\x32\x11.SketchObjectInfoH\x00\x42\x06\n\x04info\"\xd0\x02\n\x0f\x41rtemisArtifact\x12\x1d\n\ttransform\x18\x01 \x01(\x0b\x32\n.Transform\x12\"\n\x0binput_files\x18\x02 \x03(\x0b\x32\r.CronusObject\x12\x19\n\x11\x64\x61taset_parent_id\x18\x03 \x01(\t\x12\x18\n\x10\x64\x61taset_child_id\x18\x04 \x01(\t\x12\x15\n\rjob_parent_id\x18\x05 \x01(\t\x12\x10\n\x08\x63hild_id\x18\x06 \x01(\t\x12!\n\npartitions\x18\x07 \x03(\x0b\x32\r.CronusObject\x12\x1c\n\x05hists\x18\x08 \x01(\x0b\x32\r.CronusObject\x12\x1e\n\x07jobinfo\x18\t \x01(\x0b\x32\r.CronusObject\x12\x1a\n\x03log\x18\n \x01(\x0b\x32\r.CronusObject\x12\x1f\n\x08tdigests\x18\x0b \x01(\x0b\x32\r.CronusObject\"^\n\x0eMenuObjectInfo\x12\x1f\n\x03\x61ux\x18\x01 \x01(\x0b\x32\x12.MenuObjectAuxInfo\x12+\n\x07\x63reated\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"(\n\x11MenuObjectAuxInfo\x12\x13\n\x0b\x64\x65scription\x18\x01 \x01(\t\"b\n\x10\x43onfigObjectInfo\x12!\n\x03\x61ux\x18\x01 \x01(\x0b\x32\x14.ConfigObjectAuxInfo\x12+\n\x07\x63reated\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"*\n\x13\x43onfigObjectAuxInfo\x12\x13\n\x0b\x64\x65scription\x18\x01 \x01(\t\"A\n\x0fHistsObjectInfo\x12 \n\x03\x61ux\x18\x02 \x01(\x0b\x32\x13.HistsObjectAuxInfo\x12\x0c\n\x04keys\x18\x01 \x03(\t\"\x83\x01\n\x12HistsObjectAuxInfo\x12\x13\n\x0b\x64\x65scription\x18\x01 \x01(\t\x12+\n\x04meta\x18\x02 \x03(\x0b\x32\x1d.HistsObjectAuxInfo.MetaEntry\x1a+\n\tMetaEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"E\n\x11TDigestObjectInfo\x12\"\n\x03\x61ux\x18\x02 \x01(\x0b\x32\x15.TDigestObjectAuxInfo\x12\x0c\n\x04keys\x18\x01 \x03(\t\"\x87\x01\n\x14TDigestObjectAuxInfo\x12\x13\n\x0b\x64\x65scription\x18\x01 \x01(\t\x12-\n\x04meta\x18\x02 \x03(\x0b\x32\x1f.TDigestObjectAuxInfo.MetaEntry\x1a+\n\tMetaEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"C\n\x10SketchObjectInfo\x12!\n\x03\x61ux\x18\x02 \x01(\x0b\x32\x14.SketchObjectAuxInfo\x12\x0c\n\x04keys\x18\x01 \x03(\t\"\x85\x01\n\x13SketchObjectAuxInfo\x12\x13\n\x0b\x64\x65scription\x18\x01 \x01(\t\x12,\n\x04meta\x18\x02 \x03(\x0b\x32\x1e.SketchObjectAuxInfo.MetaEntry\x1a+\n\tMetaEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"/\n\rJobObjectInfo\x12\x1e\n\x03\x61ux\x18\x01 \x01(\x0b\x32\x11.JobObjectAuxInfo\"\'\n\x10JobObjectAuxInfo\x12\x13\n\x0b\x64\x65scription\x18\x01 \x01(\t\"/\n\rLogObjectInfo\x12\x1e\n\x03\x61ux\x18\x01 \x01(\x0b\x32\x11.LogObjectAuxInfo\"\'\n\x10LogObjectAuxInfo\x12\x13\n\x0b\x64\x65scription\x18\x01 \x01(\t\"\xc0\x03\n\x11\x44\x61tasetObjectInfo\x12\"\n\x03\x61ux\x18\x01 \x01(\x0b\x32\x15.DatasetObjectAuxInfo\x12\x1d\n\ttransform\x18\x04 \x01(\x0b\x32\n.Transform\x12\x12\n\npartitions\x18\x02 \x03(\t\x12\x0f\n\x07job_idx\x18\r \x01(\x05\x12\x1b\n\x04jobs\x18\x05 \x03(\x0b\x32\r.CronusObject\x12\x1c\n\x05hists\x18\x06 \x03(\x0b\x32\r.CronusObject\x12\x1b\n\x04logs\x18\x07 \x03(\x0b\x32\r.CronusObject\x12\x18\n\x10storage_location\x18\x08 \x01(\t\x12\x1e\n\x07parents\x18\t \x03(\x0b\x32\r.CronusObject\x12\x1f\n\x08\x63hildren\x18\n \x03(\x0b\x32\r.CronusObject\x12\x1c\n\x05\x66iles\x18\x0b \x03(\x0b\x32\r.CronusObject\x12\x1d\n\x06tables\x18\x0c \x03(\x0b\x32\r.CronusObject\x12\x1f\n\x08tdigests\x18\x0e \x03(\x0b\x32\r.CronusObject\x12\x11\n\twatermark\x18\x0f \x03(\t\x12\x1f\n\x08sketches\x18\x10 \x03(\x0b\x32\r.CronusObject\"Z\n\x14\x44\x61tasetObjectAuxInfo\x12\"\n\x0c\x64\x61ta_holding\x18\x01 \x01(\x0b\x32\x0c.DataHolding\x12\x1e\n\ndata_asset\x18\x02 \x01(\x0b\x32\n.DataAsset\"\x8d\x04\n\x0b\x44\x61taHolding\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x17\n\x0fprogram_element\x18\x03 \x01(\t\x12\"\n\x1asensitive_statistical_info\x18\x04 \x01(\x08\x12 \n\x18has_personal_identifiers\x18\x05 \x01(\x08\x12\x1b\n\x13has_data_dictionary\x18\x06 \x01(\x08\x12\x19\n\x11has_record_layout\x18\x07 \x01(\x08\x12*\n\"has_other_supporting_documentation\x18\x08 \x01(\x08\x12\x14\n\x0c\x64\x61taset_size\x18\t \x01(\x05\x12+\n\x11\x64\x61taset_size_type\x18\n \x01(\x0e\x32\x10.DatasetSizeType\x12\x17\n\x0f\x65xpected_medium\x18\x0b \x03(\t\x12/\n\x13\x64\x61ta_holding_detail\x18\x0c \x01(\x0b\x32\x12.DataHoldingDetail\x12\x30\n\x13provision_agreement\x18\r \x01(\x0b\x32\x13.ProvisionAgreement\x12\r\n\x05usage\x18\x0e \x03(\t\x12\x12\n\npermission\x18\x0f \x01(\t\x12\x10\n\x08provider\x18\x10 \x01(\t\x12$\n\rprovider_type\x18\x11 \x01(\x0e\x32\r.ProviderType\"\xa5\x03\n\tDataAsset\x12\x13\n\x0b\x64\x65scription\x18\x01 \x01(\t\x12\x18\n\x10reference_period\x18\x02 \x01(\t\x12\x18\n\x10granularity_type\x18\x03 \x01(\t\x12\r\n\x05state\x18\x05 \x01(\t\x12\x30\n\x0clast_updated\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x31\n\rcreation_time\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x1b\n\x13\x64\x61ta_asset_category\x18\x08 \x01(\t\x12&\n\x0e\x64\x61ta_retention\x18\t \x01(\x0b\x32\x0e.DataRetention\x12\x13\n\x0btable_count\x18\n \x01(\x05\x12\x12\n\nfile_count\x18\x0b \x01(\x05\x12\x17\n\x0fpartition_count\x18\x0c \x01(\x05\x12\x11\n\tjob_count\x18\r \x01(\x05\x12\x13\n\x0bhists_count\x18\x0e \x01(\x05\x12\x14\n\x0cparent_count\x18\x0f \x01(\x05\x12\x16\n\x0e\x63hildren_count\x18\x14 \x01(\x05\"}\n\rDataRetention\x12\x13\n\x0b\x64\x65scription\x18\x01 \x01(\t\x12\x0e\n\x06period\x18\x02 \x01(\t\x12\x1e\n\x16retention_trigger_date\x18\x03 \x01(\t\x12\x19\n\x11retention_trigger\x18\x04 \x01(\t\x12\x0c\n\x04type\x18\x05 \x01(\t\"\x8e\x01\n\x11\x44\x61taHoldingDetail\x12\x1a\n\x12receptionFrequency\x18\x04 \x01(\t\x12\x19\n\x11\x61\x63quisition_stage\x18\x01 \x01(\t\x12\x18\n\x10\x61\x63quisition_cost\x18\x02 \x01(\x02\x12(\n quality_evaluation_done_on_input\x18\x03 \x01(\x08\"\x92\x01\n\x12ProvisionAgreement\x12\x0f\n\x07\x63hannel\x18\x01 \x01(\t\x12\x1b\n\x13statcan_act_section\x18\x02 \x03(\t\x12\x16\n\x0e\x63hannel_detail\x18\x03 \x01(\t\x12\x17\n\x0f\x64\x61ta_usage_type\x18\x04 \x01(\t\x12\x1d\n\x15\x64\x61ta_acquisition_type\x18\x05 \x01(\t\"\xb2\x04\n\rJobCheckpoint\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x0e\n\x06\x64\x61tums\x18\x02 \x03(\t\x12\x12\n\npartitions\x18\x03 \x03(\t\x12\x1c\n\x05\x66iles\x18\x04 \x03(\x0b\x32\r.CronusObject\x12\x1d\n\x06tables\x18\x05 \x03(\x0b\x32\r.CronusObject\x12\r\n\x05hists\x18\x06 \x01(\x0c\x12\x10\n\x08tdigests\x18\x07 \x01(\x0c\x12,\n\x07schemas\x18\x08 \x03(\x0b\x32\x1b.JobCheckpoint.SchemasEntry\x12*\n\x06states\x18\t \x03(\x0b\x32\x1a.JobCheckpoint.StatesEntry\x12\x17\n\x0fprocessed_bytes\x18\n \x01(\x04\x12\x19\n\x11processed_ndatums\x18\x0b \x01(\x05\x12(\n\x05stats\x18\x0c \x03(\x0b\x32\x19.JobCheckpoint.StatsEntry\x12\x10\n\x08sketches\x18\r \x01(\x0c\x1a\"\n\x05Stats\x12\x0b\n\x03sum\x18\x01 \x01(\x01\x12\x0c\n\x04sum2\x18\x02 \x01(\x01\x1a.\n\x0cSchemasEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x0c:\x02\x38\x01\x1a-\n\x0bStatesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x0c:\x02\x38\x01\x1a\x42\n\nStatsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12#\n\x05value\x18\x02 \x01(\x0b\x32\x14.JobCheckpoint.Stats:\x02\x38\x01\"!\n\x0fTableObjectInfo\x12\x0e\n\x06\x66ields\x18\x01 \x03(\t\"G\n\tTransform\x12\x1b\n\x04menu\x18\x01 \x01(\x0b\x32\r.CronusObject\x12\x1d\n\x06\x63onfig\x18\x02 \x01(\x0b\x32\r.CronusObject\"\xb7\x02\n\x0e\x46ileObjectInfo\x12\x1f\n\x03\x61ux\x18\x01 \x01(\x0b\x32\x12.FileObjectAuxInfo\x12\x17\n\x04type\x18\x02 \x01(\x0e\x32\t.FileType\x12\x12\n\nsize_bytes\x18\x03 \x01(\x03\x12\x11\n\tsize_unit\x18\x06 \x01(\t\x12\x16\n\x06\x62locks\x18\x04 \x03(\x0b\x32\x06.Block\x12\x11\n\tpartition\x18\x05 \x01(\t\x12\x19\n\x07zonemap\x18\x07 \x01(\x0b\x32\x08.ZoneMap\x12\x19\n\x07\x62\x61tches\x18\x08 \x03(\x0b\x32\x08.ZoneMap\x12\x1c\n\x05index\x18\t \x01(\x0b\x32\r.KeyIndexInfo\x12 \n\x06\x62looms\x18\n \x03(\x0b\x32\x10.BloomFilterInfo\x12\x0e\n\x06\x62ucket\x18\x0b \x01(\x05\x12\x13\n\x0bnum_buckets\x18\x0c \x01(\x05\"t\n\x0f\x42loomFilterInfo\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x10\n\x08num_keys\x18\x02 \x01(\x03\x12\x10\n\x08num_bits\x18\x03 \x01(\x03\x12\x12\n\nnum_hashes\x18\x04 \x01(\x05\x12\x0c\n\x04\x62its\x18\x05 \x01(\x0c\x12\x0e\n\x06schema\x18\x06 \x01(\x0c\";\n\x0cKeyIndexInfo\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x0c\n\x04uuid\x18\x02 \x01(\t\x12\x10\n\x08num_keys\x18\x03 \x01(\x03\":\n\x07ZoneMap\x12\x10\n\x08num_rows\x18\x01 \x01(\x03\x12\x1d\n\x07\x63olumns\x18\x02 \x03(\x0b\x32\x0c.ColumnStats\"\xcd\x01\n\x0b\x43olumnStats\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x12\n\nnull_count\x18\x02 \x01(\x03\x12\x10\n\x08\x64istinct\x18\x03 \x01(\x03\x12\x11\n\x07min_int\x18\x04 \x01(\x03H\x00\x12\x14\n\nmin_double\x18\x05 \x01(\x01H\x00\x12\x14\n\nmin_string\x18\x06 \x01(\tH\x00\x12\x11\n\x07max_int\x18\x07 \x01(\x03H\x01\x12\x14\n\nmax_double\x18\x08 \x01(\x01H\x01\x12\x14\n\nmax_string\x18\t \x01(\tH\x01\x42\x05\n\x03minB\x05\n\x03max\"d\n\x11\x46ileObjectAuxInfo\x12\x13\n\x0b\x64\x65scription\x18\x01 \x01(\t\x12\x13\n\x0bnum_columns\x18\x02 \x01(\x05\x12\x10\n\x08num_rows\x18\x03 \x01(\x05\x12\x13\n\x0bnum_batches\x18\x04 \x01(\x05\"0\n\x05\x42lock\x12\r\n\x05index\x18\x01 \x01(\x05\x12\x18\n\x04info\x18\x02 \x01(\x0b\x32\n.BlockInfo\"?\n\tBlockInfo\x12\x12\n\nsize_bytes\x18\x01 \x01(\x03\x12\x0e\n\x06offset\x18\x02 \x01(\x03\x12\x0e\n\x06length\x18\x03 \x01(\x03\"1\n\x0c\x44ummyMessage\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t*K\n\x0f\x44\x61tasetSizeType\x12\x08\n\x04\x42YTE\x10\x00\x12\x06\n\x02KB\x10\x01\x12\x06\n\x02MB\x10\x02\x12\x06\n\x02GB\x10\x03\x12\x06\n\x02TB\x10\x04\x12\x06\n\x02PB\x10\x05\x12\x06\n\x02\x45\x42\x10\x06*K\n\x0cProviderType\x12\x15\n\x11\x45XTERNAL_PROVIDER\x10\x00\x12\x15\n\x11INTERNAL_PROVIDER\x10\x01\x12\r\n\tCUSTODIAN\x10\x02*s\n\x08\x46ileType\x12\x08\n\x04NONE\x10\x00\x12\x07\n\x03\x43SV\x10\x01\x12\x07\n\x03\x46WF\x10\x02\x12\x08\n\x04JSON\x10\x03\x12\x0b\n\x07PARQUET\x10\x04\x12\t\n\x05\x41RROW\x10\x05\x12\x10\n\x0c\x41RROW_STREAM\x10\x06\x12\x0c\n\x08SAS7BDAT\x10\x07\x12\t\n\x05INDEX\x10\x08\x62\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'cronus_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _HISTSOBJECTAUXINFO_METAENTRY._options = None
+  _HISTSOBJECTAUXINFO_METAENTRY._serialized_options = b'8\001'
+  _TDIGESTOBJECTAUXINFO_METAENTRY._options = None
+  _TDIGESTOBJECTAUXINFO_METAENTRY._serialized_options = b'8\001'
+  _SKETCHOBJECTAUXINFO_METAENTRY._options = None
+  _SKETCHOBJECTAUXINFO_METAENTRY._serialized_options = b'8\001'
+  _JOBCHECKPOINT_SCHEMASENTRY._options = None
+  _JOBCHECKPOINT_SCHEMASENTRY._serialized_options = b'8\001'
+  _JOBCHECKPOINT_STATESENTRY._options = None
+  _JOBCHECKPOINT_STATESENTRY._serialized_options = b'8\001'
+  _JOBCHECKPOINT_STATSENTRY._options = None
+  _JOBCHECKPOINT_STATSENTRY._serialized_options = b'8\001'
+  _DATASETSIZETYPE._serialized_start=6141
+  _DATASETSIZETYPE._serialized_end=6216
+  _PROVIDERTYPE._serialized_start=6218
+  _PROVIDERTYPE._serialized_end=6293
+  _FILETYPE._serialized_start=6295
+  _FILETYPE._serialized_end=6410
+  _CRONUSSTORE._serialized_start=49
+  _CRONUSSTORE._serialized_end=160
+  _CRONUSSTOREINFO._serialized_start=163
+  _CRONUSSTOREINFO._serialized_end=301
+  _CRONUSSTOREAUXINFO._serialized_start=303
+  _CRONUSSTOREAUXINFO._serialized_end=344
+  _CRONUSOBJECTSTORE._serialized_start=346
+  _CRONUSOBJECTSTORE._serialized_end=469
+  _CRONUSOBJECTSTOREINFO._serialized_start=472
+  _CRONUSOBJECTSTOREINFO._serialized_end=612
+  _CRONUSOBJECTSTOREAUXINFO._serialized_start=614
+  _CRONUSOBJECTSTOREAUXINFO._serialized_end=661
+  _CRONUSOBJECT._serialized_start=664
+  _CRONUSOBJECT._serialized_end=1105
+  _ARTEMISARTIFACT._serialized_start=1108
+  _ARTEMISARTIFACT._serialized_end=1444
+  _MENUOBJECTINFO._serialized_start=1446
+  _MENUOBJECTINFO._serialized_end=1540
+  _MENUOBJECTAUXINFO._serialized_start=1542
+  _MENUOBJECTAUXINFO._serialized_end=1582
+  _CONFIGOBJECTINFO._serialized_start=1584
+  _CONFIGOBJECTINFO._serialized_end=1682
+  _CONFIGOBJECTAUXINFO._serialized_start=1684
+  _CONFIGOBJECTAUXINFO._serialized_end=1726
+  _HISTSOBJECTINFO._serialized_start=1728
+  _HISTSOBJECTINFO._serialized_end=1793
+  _HISTSOBJECTAUXINFO._serialized_start=1796
+  _HISTSOBJECTAUXINFO._serialized_end=1927
+  _HISTSOBJECTAUXINFO_METAENTRY._serialized_start=1884
+  _HISTSOBJECTAUXINFO_METAENTRY._serialized_end=1927
+  _TDIGESTOBJECTINFO._serialized_start=1929
+  _TDIGESTOBJECTINFO._serialized_end=1998
+  _TDIGESTOBJECTAUXINFO._serialized_start=2001
+  _TDIGESTOBJECTAUXINFO._serialized_end=2136
+  _TDIGESTOBJECTAUXINFO_METAENTRY._serialized_start=1884
+  _TDIGESTOBJECTAUXINFO_METAENTRY._serialized_end=1927
+  _SKETCHOBJECTINFO._serialized_start=2138
+  _SKETCHOBJECTINFO._serialized_end=2205
+  _SKETCHOBJECTAUXINFO._serialized_start=2208
+  _SKETCHOBJECTAUXINFO._serialized_end=2341
+  _SKETCHOBJECTAUXINFO_METAENTRY._serialized_start=1884
+  _SKETCHOBJECTAUXINFO_METAENTRY._serialized_end=1927
+  _JOBOBJECTINFO._serialized_start=2343
+  _JOBOBJECTINFO._serialized_end=2390
+  _JOBOBJECTAUXINFO._serialized_start=2392
+  _JOBOBJECTAUXINFO._serialized_end=2431
+  _LOGOBJECTINFO._serialized_start=2433
+  _LOGOBJECTINFO._serialized_end=2480
+  _LOGOBJECTAUXINFO._serialized_start=2482
+  _LOGOBJECTAUXINFO._serialized_end=2521
+  _DATASETOBJECTINFO._serialized_start=2524
+  _DATASETOBJECTINFO._serialized_end=2972
+  _DATASETOBJECTAUXINFO._serialized_start=2974
+  _DATASETOBJECTAUXINFO._serialized_end=3064
+  _DATAHOLDING._serialized_start=3067
+  _DATAHOLDING._serialized_end=3592
+  _DATAASSET._serialized_start=3595
+  _DATAASSET._serialized_end=4016
+  _DATARETENTION._serialized_start=4018
+  _DATARETENTION._serialized_end=4143
+  _DATAHOLDINGDETAIL._serialized_start=4146
+  _DATAHOLDINGDETAIL._serialized_end=4288
+  _PROVISIONAGREEMENT._serialized_start=4291
+  _PROVISIONAGREEMENT._serialized_end=4437
+  _JOBCHECKPOINT._serialized_start=4440
+  _JOBCHECKPOINT._serialized_end=5002
+  _JOBCHECKPOINT_STATS._serialized_start=4805
+  _JOBCHECKPOINT_STATS._serialized_end=4839
+  _JOBCHECKPOINT_SCHEMASENTRY._serialized_start=4841
+  _JOBCHECKPOINT_SCHEMASENTRY._serialized_end=4887
+  _JOBCHECKPOINT_STATESENTRY._serialized_start=4889
+  _JOBCHECKPOINT_STATESENTRY._serialized_end=4934
+  _JOBCHECKPOINT_STATSENTRY._serialized_start=4936
+  _JOBCHECKPOINT_STATSENTRY._serialized_end=5002
+  _TABLEOBJECTINFO._serialized_start=5004
+  _TABLEOBJECTINFO._serialized_end=5037
+  _TRANSFORM._serialized_start=5039
+  _TRANSFORM._serialized_end=5110
+  _FILEOBJECTINFO._serialized_start=5113
+  _FILEOBJECTINFO._serialized_end=5424
+  _BLOOMFILTERINFO._serialized_start=5426
+  _BLOOMFILTERINFO._serialized_end=5542
+  _KEYINDEXINFO._serialized_start=5544
+  _KEYINDEXINFO._serialized_end=5603
+  _ZONEMAP._serialized_start=5605
+  _ZONEMAP._serialized_end=5663
+  _COLUMNSTATS._serialized_start=5666
+  _COLUMNSTATS._serialized_end=5871
+  _FILEOBJECTAUXINFO._serialized_start=5873
+  _FILEOBJECTAUXINFO._serialized_end=5973
+  _BLOCK._serialized_start=5975
+  _BLOCK._serialized_end=6023
+  _BLOCKINFO._serialized_start=6025
+  _BLOCKINFO._serialized_end=6088
+  _DUMMYMESSAGE._serialized_start=6090
+  _DUMMYMESSAGE._serialized_end=6139
 # @@protoc_insertion_point(module_scope)
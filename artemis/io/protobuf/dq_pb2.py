@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: dq.proto
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x08\x64q.proto\"1\n\tDQRuleSet\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x16\n\x05rules\x18\x02 \x03(\x0b\x32\x07.DQRule\"\xb0\x01\n\x06\x44QRule\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0e\n\x06\x63olumn\x18\x02 \x01(\t\x12\x1e\n\tnull_rate\x18\x03 \x01(\x0b\x32\t.NullRateH\x00\x12\x1c\n\x05range\x18\x04 \x01(\x0b\x32\x0b.ValueRangeH\x00\x12\x1a\n\x05\x63odes\x18\x05 \x01(\x0b\x32\t.CodeListH\x00\x12\x0f\n\x05regex\x18\x06 \x01(\tH\x00\x12\x14\n\nexpression\x18\x07 \x01(\tH\x00\x42\x07\n\x05\x63heck\"\x1c\n\x08NullRate\x12\x10\n\x08max_rate\x18\x01 \x01(\x01\"@\n\nValueRange\x12\x10\n\x03min\x18\x01 \x01(\x01H\x00\x88\x01\x01\x12\x10\n\x03max\x18\x02 \x01(\x01H\x01\x88\x01\x01\x42\x06\n\x04_minB\x06\n\x04_max\"\x19\n\x08\x43odeList\x12\r\n\x05\x63odes\x18\x01 \x03(\tb\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'dq_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _DQRULESET._serialized_start=12
+  _DQRULESET._serialized_end=61
+  _DQRULE._serialized_start=64
+  _DQRULE._serialized_end=240
+  _NULLRATE._serialized_start=242
+  _NULLRATE._serialized_end=270
+  _VALUERANGE._serialized_start=272
+  _VALUERANGE._serialized_end=336
+  _CODELIST._serialized_start=338
+  _CODELIST._serialized_end=363
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: sketch.proto
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0csketch.proto\"\x84\x01\n\x0cSketch_store\x12\x30\n\nsketch_map\x18\x01 \x03(\x0b\x32\x1c.Sketch_store.SketchMapEntry\x1a\x42\n\x0eSketchMapEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x1f\n\x05value\x18\x02 \x01(\x0b\x32\x10.Sketch_instance:\x02\x38\x01\"\xb1\x01\n\x0fSketch_instance\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05\x63ount\x18\x02 \x01(\x04\x12\x12\n\nnull_count\x18\x03 \x01(\x04\x12\x1a\n\x03min\x18\x04 \x01(\x0b\x32\r.Sketch_value\x12\x1a\n\x03max\x18\x05 \x01(\x0b\x32\r.Sketch_value\x12\x19\n\x03hll\x18\x06 \x01(\x0b\x32\x0c.HyperLogLog\x12\x1a\n\x04topk\x18\x07 \x01(\x0b\x32\x0c.SpaceSaving\"\\\n\x0cSketch_value\x12\x13\n\tint_value\x18\x01 \x01(\x03H\x00\x12\x16\n\x0c\x64ouble_value\x18\x02 \x01(\x01H\x00\x12\x16\n\x0cstring_value\x18\x03 \x01(\tH\x00\x42\x07\n\x05value\"3\n\x0bHyperLogLog\x12\x11\n\tprecision\x18\x01 \x01(\r\x12\x11\n\tregisters\x18\x02 \x01(\x0c\"J\n\x0bSpaceSaving\x12\x10\n\x08\x63\x61pacity\x18\x01 \x01(\r\x12\r\n\x05\x62ound\x18\x02 \x01(\x04\x12\x1a\n\x08\x63ounters\x18\x03 \x03(\x0b\x32\x08.Counter\"6\n\x07\x43ounter\x12\r\n\x05value\x18\x01 \x01(\t\x12\r\n\x05\x63ount\x18\x02 \x01(\x04\x12\r\n\x05\x65rror\x18\x03 \x01(\x04\x62\x06proto3')
+
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'sketch_pb2', globals())
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _SKETCH_STORE_SKETCHMAPENTRY._options = None
+  _SKETCH_STORE_SKETCHMAPENTRY._serialized_options = b'8\001'
+  _SKETCH_STORE._serialized_start=17
+  _SKETCH_STORE._serialized_end=149
+  _SKETCH_STORE_SKETCHMAPENTRY._serialized_start=83
+  _SKETCH_STORE_SKETCHMAPENTRY._serialized_end=149
+  _SKETCH_INSTANCE._serialized_start=152
+  _SKETCH_INSTANCE._serialized_end=329
+  _SKETCH_VALUE._serialized_start=331
+  _SKETCH_VALUE._serialized_end=423
+  _HYPERLOGLOG._serialized_start=425
+  _HYPERLOGLOG._serialized_end=476
+  _SPACESAVING._serialized_start=478
+  _SPACESAVING._serialized_end=552
+  _COUNTER._serialized_start=554
+  _COUNTER._serialized_end=608
+# @@protoc_insertion_point(module_scope)
@@ -23,11 +23,13 @@ Steering for processing.
 """
 import six
 import pyarrow as pa
-from sas7bdat import SAS7BDAT
 
 from artemis.logger import Logger
 from artemis.errors import AbstractMethodError
 from artemis.core.gate import ArtemisGateSvc
+from artemis.core.registry import lazy_import
+
+sas7bdat = lazy_import("sas7bdat")
 
 
 class BaseReader:
@@ -349,7 +351,7 @@ class Sas7bdatReader(BaseReader):
         self.nsamples = nsamples
         self.rnd = rnd
         self.schema = None
-        self.reader = SAS7BDAT(
+        self.reader = sas7bdat.SAS7BDAT(
             self.__module__,
             log_level=self.__logger.getEffectiveLevel(),
             extra_time_format_strings=None,
@@ -24,15 +24,22 @@
 Writer classes to manage output data streams to collect record batches into Arrow,
 Parquet or Csv file formats.
 """
+import time
 import urllib
 import uuid
 
+import numpy as np
 import pyarrow as pa
+import pyarrow.compute as pc
 
 from artemis.core.algo import IOAlgoBase
 from artemis.logger import Logger
 from artemis.decorators import timethis, iterable
 from artemis.core.gate import ArtemisGateSvc
+from artemis.core.sketch import ColumnSketch
+from artemis.io.keyindex import KeyIndexBuilder
+from artemis.meta.bloom import bloom_filter, key_hashes
+from artemis.meta.zonemap import zone_map
 
 from artemis.io.protobuf.cronus_pb2 import FileObjectInfo, TableObjectInfo
 from artemis.io.protobuf.table_pb2 import Table
@@ -42,6 +49,11 @@ from artemis.io.protobuf.table_pb2 import Table
 class BufferOutputOptions:
     BUFFER_MAX_SIZE = 2147483648  # 2 GB
     write_csv = True
+    max_file_age = 0  # Seconds before an open file is closed, 0 disables
+    zone_maps = False  # Record column statistics of files and batches
+    index_key = ""  # Column of the key index of the files, disabled if empty
+    bloom_keys = []  # Columns of the Bloom filters of the files
+    bloom_fpp = 0.01  # False positive rate of the Bloom filters
 
 
 @Logger.logged
@@ -49,7 +61,7 @@ class BufferOutputWriter(IOAlgoBase):
     """
     Manage output data with an in-memory buffer
     buffer is flushed to disk when a max buffer size
-    is reached
+    is reached, or when the file is older than the max file age
     Only data sink supported is Arrow::BufferOutputStream
     """
 
@@ -60,14 +72,29 @@ class BufferOutputWriter(IOAlgoBase):
 
         self.BUFFER_MAX_SIZE = self.properties.BUFFER_MAX_SIZE
         self._write_csv = self.properties.write_csv
+        self.max_file_age = self.properties.max_file_age
+        self._partition_key = name.split("_")[-1]  # partition of the files
+        self._bucket = None  # bucket of the files of a partitioned output
+        self._num_buckets = 0
+        self._zone_maps = self.properties.zone_maps
+        self._index = None  # key index of the file
+        if self.properties.index_key:
+            self._index = KeyIndexBuilder(self.properties.index_key)
+        self._bloom_keys = list(self.properties.bloom_keys)
+        self._bloom_fpp = self.properties.bloom_fpp
+        self._bloom_hashes = {}  # key hashes of the file per Bloom filter column
         self._cache = None  # cache for a pa.RecordBatch
         self._buffer = None  # in-memory buffer
         self._sink = None  # pa.BufferOutputStream
         self._writer = None  # pa.RecordBatchFileWriter
         self._schema = None  # pa.schema
+        self._dictionaries = {}  # dictionaries of encoded columns in file
+        # Appended dictionary values are written as deltas
+        self._ipc_options = pa.ipc.IpcWriteOptions(emit_dictionary_deltas=True)
 
         self._sizeof_batches = 0
         self._nbatches = 0  # batches per file
+        self._opened = None  # time of the first batch in file
         self._nrecords = 0  # records per file
         self._ncolumns = 0  # columns per file
         self._total_records = 0  # total records written
@@ -75,6 +102,8 @@ class BufferOutputWriter(IOAlgoBase):
         self._filecounter = 0  # total files
         self._fname = ""
         self._finfo = []  # Store list of metadata info objects
+        self._sketches = {}  # column sketches of the file
+        self._zonemaps = []  # zone maps of the batches in file
         self.gate = None
 
     @property
@@ -95,7 +124,9 @@ class BufferOutputWriter(IOAlgoBase):
         self.gate = ArtemisGateSvc()
         self._buffer = None
         self._sink = pa.BufferOutputStream()
-        self._writer = pa.RecordBatchFileWriter(self._sink, self._schema)
+        self._writer = pa.RecordBatchFileWriter(
+            self._sink, self._schema, options=self._ipc_options
+        )
 
     def flush(self):
         """If all else fails, clear everything
@@ -204,6 +235,11 @@ class BufferOutputWriter(IOAlgoBase):
         self._sizeof_batches = 0
         self._nbatches = 0
         self._nrecords = 0
+        self._sketches = {}
+        self._zonemaps = []
+        if self._index is not None:
+            self._index.reset()
+        self._bloom_hashes = {}
 
     def _new_sink(self):
         """
@@ -259,13 +295,41 @@ class BufferOutputWriter(IOAlgoBase):
             table, tinfo, dataset_id=ds_id, partition_key=pkey, job_id=job_id
         )
 
+    def _write_index(self, fileinfo):
+        """
+        Register the key index of the file in the partition of the file
+        """
+        ds_id = self.gate.meta.dataset_id
+        job_id = self.gate.meta.job_id
+        buf = self._index.to_buffer()
+        indexinfo = FileObjectInfo()
+        indexinfo.type = 8
+        indexinfo.partition = fileinfo.partition
+        indexinfo.aux.num_rows = self._index.num_keys
+        indexinfo.index.key = self._index.key
+        try:
+            id_ = self.register_content(
+                buf,
+                indexinfo,
+                dataset_id=ds_id,
+                job_id=job_id,
+                partition_key=fileinfo.partition,
+            ).uuid
+        except Exception:
+            self.__logger.error("Fail to register key index to store")
+            raise
+        self.gate.store.put(id_, buf)
+        fileinfo.index.key = self._index.key
+        fileinfo.index.uuid = id_
+        fileinfo.index.num_keys = self._index.num_keys
+
     def _write_file(self):
         fileinfo = FileObjectInfo()
         fileinfo.type = 5
         fileinfo.aux.num_rows = self._nrecords
         fileinfo.aux.num_columns = self._ncolumns
         fileinfo.aux.num_batches = self._nbatches
-        p_key = self.name.split("_")[-1]
+        p_key = self._partition_key
         ds_id = self.gate.meta.dataset_id
         job_id = self.gate.meta.job_id
         self.logger.info("Partitions %s", self.gate.store.list_partitions(ds_id))
@@ -273,6 +337,18 @@ class BufferOutputWriter(IOAlgoBase):
             "Writing arrow to DS %s partition %s job %s", ds_id, p_key, job_id
         )
         fileinfo.partition = p_key
+        if self._bucket is not None:
+            fileinfo.bucket = self._bucket
+            fileinfo.num_buckets = self._num_buckets
+        if self._zone_maps is True:
+            fileinfo.zonemap.CopyFrom(zone_map(self._sketches, self._nrecords))
+            fileinfo.batches.extend(self._zonemaps)
+        if self._index is not None:
+            self._write_index(fileinfo)
+        for key, hashes in self._bloom_hashes.items():
+            type_ = self._schema.field(key).type
+            bloom = bloom_filter(key, np.concatenate(hashes), self._bloom_fpp, type_)
+            fileinfo.blooms.append(bloom)
         try:
             id_ = self.register_content(
                 self._buffer,
@@ -294,7 +370,10 @@ class BufferOutputWriter(IOAlgoBase):
             fileinfo.aux.num_rows = self._nrecords
             fileinfo.aux.num_columns = self._ncolumns
             fileinfo.aux.num_batches = self._nbatches
-            partition_key = self.name.split("_")[-1]
+            if self._bucket is not None:
+                fileinfo.bucket = self._bucket
+                fileinfo.num_buckets = self._num_buckets
+            partition_key = self._partition_key
             self.__logger.info(
                 "Writing CSV DS: %s Partition: %s Job: %s", ds_id, partition_key, job_id
             )
@@ -328,11 +407,21 @@ class BufferOutputWriter(IOAlgoBase):
         except Exception:
             raise
 
-        self._writer = pa.RecordBatchFileWriter(self._sink, self._schema)
+        self._writer = pa.RecordBatchFileWriter(
+            self._sink, self._schema, options=self._ipc_options
+        )
+
+    def expired(self):
+        """
+        File holds batches for longer than the max file age
+        """
+        if self.max_file_age <= 0 or self._nbatches == 0:
+            return False
+        return time.monotonic() - self._opened >= self.max_file_age
 
     def _can_write(self, batch):
         _size = self.expected_sizeof(batch)
-        if _size > self.BUFFER_MAX_SIZE:
+        if _size > self.BUFFER_MAX_SIZE or self.expired():
             self.__logger.info("Request new writer")
             self.__logger.info(
                 "Current size %i, estimated %i", self._sizeof_batches, _size
@@ -345,6 +434,30 @@ class BufferOutputWriter(IOAlgoBase):
         else:
             self.__logger.debug("Continue filling buffer")
 
+    def _check_dictionaries(self, batch):
+        """
+        The file format does not support dictionary replacement,
+        request a new writer if the dictionary of an encoded column changed.
+        Dictionaries extended with new values are written as deltas
+        """
+        dictionaries = {}
+        for icol, field in enumerate(batch.schema):
+            if pa.types.is_dictionary(field.type):
+                dictionaries[icol] = batch.column(icol).dictionary
+        changed = False
+        for icol, dictionary in dictionaries.items():
+            current = self._dictionaries.get(icol)
+            if current is None or current is dictionary:
+                continue
+            if len(dictionary) < len(current) or not current.equals(
+                dictionary.slice(0, len(current))
+            ):
+                changed = True
+        if changed and self._nbatches > 0:
+            self.__logger.info("Dictionary replaced, request new writer")
+            self._new_writer()
+        self._dictionaries = dictionaries
+
     @timethis
     def write(self, payload):
         """
@@ -354,44 +467,17 @@ class BufferOutputWriter(IOAlgoBase):
         this should function as a consumer of batches
         RecordBatches are given as a generator to ensure
         all batches are pushed to a buffer
+        An element may carry a single batch or a list of batches
         """
         for i, element in enumerate(payload):
             self.__logger.debug("Processing Element %i", i)
-            batch = element.get_data()
-            if not isinstance(batch, pa.lib.RecordBatch):
-                self.__logger.warning("Batch is of type %s", type(batch))
-                continue
-            if batch.schema != self._schema:
-                self.__logger.error("Batch error, incorrect schema")
-                if len(batch.schema) != len(self._schema):
-                    self.__logger.error("mismatch in number of fields")
-                else:
-                    for icol, col in enumerate(self._schema):
-                        if col != batch.schema[icol]:
-                            self.__logger.error("Current field %s", batch.schema[icol])
-                            self.__logger.error("Expected field %s", col)
-                raise ValueError
-            try:
-                self._can_write(batch)
-            except Exception as e:
-                self.__logger.error("Failed sizeof check")
-                raise e
-            try:
-                self.__logger.debug("Write to sink")
-                self._ncolumns = batch.num_columns
-                self._nrecords += batch.num_rows
-                self._nbatches += 1
-                self._sizeof_batches += pa.get_record_batch_size(batch)
-                self.__logger.debug(
-                    "Records %i Batches %i size %i",
-                    self._nrecords,
-                    self._nbatches,
-                    self._sizeof_batches,
-                )
-                self._writer.write_batch(batch)
-            except Exception:
-                self.__logger.error("Cannot write a batch")
-                raise
+            data = element.get_data()
+            if isinstance(data, list):
+                batches = data
+            else:
+                batches = [data]
+            for batch in batches:
+                self._write_batch(batch)
         self.__logger.debug(
             "Records %i Batches %i size %i",
             self._nrecords,
@@ -400,6 +486,74 @@ class BufferOutputWriter(IOAlgoBase):
         )
         return True
 
+    def _write_batch(self, batch):
+        """
+        Validate the schema and write a single batch to the sink
+        """
+        if not isinstance(batch, pa.lib.RecordBatch):
+            self.__logger.warning("Batch is of type %s", type(batch))
+            return False
+        if batch.schema != self._schema:
+            self.__logger.error("Batch error, incorrect schema")
+            if len(batch.schema) != len(self._schema):
+                self.__logger.error("mismatch in number of fields")
+            else:
+                for icol, col in enumerate(self._schema):
+                    if col != batch.schema[icol]:
+                        self.__logger.error("Current field %s", batch.schema[icol])
+                        self.__logger.error("Expected field %s", col)
+            raise ValueError
+        try:
+            self._can_write(batch)
+        except Exception as e:
+            self.__logger.error("Failed sizeof check")
+            raise e
+        try:
+            self._check_dictionaries(batch)
+        except Exception:
+            self.__logger.error("Failed dictionary check")
+            raise
+        try:
+            self.__logger.debug("Write to sink")
+            self._ncolumns = batch.num_columns
+            self._nrecords += batch.num_rows
+            if self._nbatches == 0:
+                self._opened = time.monotonic()
+            self._nbatches += 1
+            self._sizeof_batches += pa.get_record_batch_size(batch)
+            self.__logger.debug(
+                "Records %i Batches %i size %i",
+                self._nrecords,
+                self._nbatches,
+                self._sizeof_batches,
+            )
+            self._writer.write_batch(batch)
+        except Exception:
+            self.__logger.error("Cannot write a batch")
+            raise
+        if self._zone_maps is True:
+            self._update_zone_maps(batch)
+        if self._index is not None:
+            self._index.update(batch, self._nbatches - 1)
+        for key in self._bloom_keys:
+            column = batch.column(batch.schema.get_field_index(key))
+            self._bloom_hashes.setdefault(key, []).append(key_hashes(column))
+        return True
+
+    def _update_zone_maps(self, batch):
+        """
+        Column statistics of the batch, summed into the statistics of the file
+        """
+        sketches = {}
+        for name, column in zip(batch.schema.names, batch.columns):
+            sketch = ColumnSketch(precision=10, capacity=0)
+            sketch.update(column)
+            sketches[name] = sketch
+            if name in self._sketches:
+                sketch = self._sketches[name] + sketch
+            self._sketches[name] = sketch
+        self._zonemaps.append(zone_map(sketches, batch.num_rows))
+
     @staticmethod
     def to_csv(
         buf,
@@ -519,3 +673,159 @@ class BufferOutputWriter(IOAlgoBase):
 
         if path_or_buf is None:
             return formatter.path_or_buf.getvalue()
+
+
+@iterable
+class PartitionedOutputOptions:
+    partition_keys = []  # Key columns of the buckets
+    partitioning = "hash"  # hash or range
+    num_buckets = 8  # Number of buckets of hash partitioning
+    range_bounds = []  # Sorted upper bounds of the first key of range partitioning
+
+
+@Logger.logged
+class PartitionedOutputWriter(BufferOutputWriter):
+    """
+    Manage output data split into buckets by key columns,
+    each bucket written by its own buffer writer
+
+    Rows are assigned to buckets by the hash of their keys modulo the
+    number of buckets, or by the range of the first key between the range
+    bounds. Null keys hash to a fixed sentinel, combined with the hashes of
+    the other keys like any value, and are below the range bounds. The files
+    record their bucket in Cronus, such that outputs partitioned on the
+    same keys can be joined bucket by bucket.
+    """
+
+    _null_hash = np.uint64(0x5BD1E9955BD1E995)  # hash of a null key
+
+    def __init__(self, name, **kwargs):
+        options = dict(PartitionedOutputOptions())
+        options.update(kwargs)
+        super().__init__(name, **options)
+
+        self._keys = list(self.properties.partition_keys)
+        self._partitioning = self.properties.partitioning
+        self._bounds = list(self.properties.range_bounds)
+        if not self._keys:
+            self.__logger.error("No partition keys")
+            raise ValueError("Partitioned output requires partition keys")
+        if self._partitioning == "hash":
+            self._num_buckets = self.properties.num_buckets
+        elif self._partitioning == "range":
+            if self._bounds != sorted(self._bounds):
+                raise ValueError(f"Range bounds {self._bounds} not sorted")
+            self._num_buckets = len(self._bounds) + 1
+        else:
+            raise ValueError(f"Unknown partitioning {self._partitioning}")
+        if self._num_buckets < 1:
+            raise ValueError(f"Number of buckets {self._num_buckets} less than 1")
+        self._writers = []  # buffer writer of each bucket
+
+    @property
+    def total_records(self):
+        return sum(writer.total_records for writer in self._writers)
+
+    @property
+    def total_batches(self):
+        return sum(writer.total_batches for writer in self._writers)
+
+    @property
+    def total_files(self):
+        return sum(writer.total_files for writer in self._writers)
+
+    def initialize(self):
+        self.__logger.info("Initialize %i buckets", self._num_buckets)
+        self.gate = ArtemisGateSvc()
+        options = self.properties.to_dict()
+        for key in dict(PartitionedOutputOptions()):
+            options.pop(key, None)
+        self._writers = []
+        for bucket in range(self._num_buckets):
+            writer = BufferOutputWriter(f"{self.name}.bucket_{bucket}", **options)
+            writer._partition_key = self._partition_key
+            writer._bucket = bucket
+            writer._num_buckets = self._num_buckets
+            writer._schema = self._schema
+            writer.initialize()
+            self._writers.append(writer)
+
+    def flush(self):
+        for writer in self._writers:
+            writer.flush()
+
+    def _update_counts(self):
+        self._nbatches = sum(writer._nbatches for writer in self._writers)
+        self._nrecords = sum(writer._nrecords for writer in self._writers)
+
+    def buckets(self, batch):
+        """
+        Bucket of each row of a batch
+
+        Returns
+        -------
+        numpy array of bucket indices
+        """
+        if self._partitioning == "range":
+            column = batch.column(batch.schema.get_field_index(self._keys[0]))
+            buckets = np.zeros(batch.num_rows, dtype=np.int64)
+            valid = column.is_valid().to_numpy(zero_copy_only=False)
+            if pa.types.is_dictionary(column.type):
+                column = column.cast(column.type.value_type)
+            values = pc.drop_null(column).to_numpy(zero_copy_only=False)
+            buckets[valid] = np.searchsorted(self._bounds, values, side="right")
+            return buckets
+        hashes = np.zeros(batch.num_rows, dtype=np.uint64)
+        for key in self._keys:
+            column = batch.column(batch.schema.get_field_index(key))
+            valid = column.is_valid().to_numpy(zero_copy_only=False)
+            keys = np.full(batch.num_rows, self._null_hash, dtype=np.uint64)
+            keys[valid] = key_hashes(column)
+            hashes *= np.uint64(0x9E3779B97F4A7C15)
+            hashes ^= keys
+        buckets = (hashes % np.uint64(self._num_buckets)).astype(np.int64)
+        return buckets
+
+    def _write_batch(self, batch):
+        """
+        Split a batch by bucket and write each part to its bucket
+        """
+        if not isinstance(batch, pa.lib.RecordBatch):
+            self.__logger.warning("Batch is of type %s", type(batch))
+            return False
+        buckets = self.buckets(batch)
+        order = np.argsort(buckets, kind="stable")
+        counts = np.bincount(buckets, minlength=self._num_buckets)
+        ordered = batch.take(pa.array(order))
+        offset = 0
+        for writer, count in zip(self._writers, counts.tolist()):
+            if count > 0:
+                writer._write_batch(ordered.slice(offset, count))
+            offset += count
+        self._update_counts()
+        return True
+
+    def expired(self):
+        return any(writer.expired() for writer in self._writers)
+
+    def _new_writer(self):
+        """
+        Close the files of the buckets holding batches
+        """
+        for writer in self._writers:
+            if writer._nbatches > 0:
+                writer._new_writer()
+        self._update_counts()
+
+    def _finalize(self):
+        for writer in self._writers:
+            writer._finalize()
+            self._finfo.extend(writer._finfo)
+        self._update_counts()
+        self.__logger.info(
+            "Buckets %i Records %i Files %i",
+            self._num_buckets,
+            self.total_records,
+            self.total_files,
+        )
+        return True
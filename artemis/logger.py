@@ -24,6 +24,8 @@
 import logging
 import urllib
 
+from artemis.core.context import current_context
+
 
 class Logger:
     """
@@ -61,7 +63,12 @@ class Logger:
         fh = logging.FileHandler(path, "w")
         fh.setFormatter(logging.Formatter(Logger.FMT))
         fh.setLevel(Logger.CONFIGURED_LEVEL)
-        logging.getLogger().addHandler(fh)
+        context = current_context()
+        if context is None:
+            logging.getLogger().addHandler(fh)
+        else:
+            # Only records of the job, removed when the job is closed
+            context.add_handler(fh)
 
     @staticmethod
     def logged(obj):
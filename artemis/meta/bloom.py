@@ -0,0 +1,176 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Bloom filters of the keys of the output files of a dataset
+
+The writer hashes the keys of chosen columns as the batches are written,
+and records a Bloom filter of the keys of each column in the FileObjectInfo
+of the file. The files which could contain a set of keys are found in the
+Cronus metadata alone, before any data file is opened. The filter records
+the type the keys of the column are hashed as, the keys of a lookup are cast
+to the type of each filter before hashing, e.g.
+
+    for file_id, mask in contains(store, dataset_id, "record_id", ids):
+        ...
+"""
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from artemis.core.sketch import BloomFilter, hash_array
+from artemis.io.protobuf.cronus_pb2 import BloomFilterInfo
+
+
+def key_type(type_):
+    """
+    Arrow type the keys of a column type are hashed as
+
+    Integers and floats are hashed as 64-bit values, and dictionaries
+    as their values, such that keys hash the same in any column type.
+    """
+    if pa.types.is_dictionary(type_):
+        type_ = type_.value_type
+    if pa.types.is_integer(type_):
+        return pa.int64()
+    if pa.types.is_floating(type_):
+        return pa.float64()
+    return type_
+
+
+def key_hashes(array):
+    """
+    Hashes of the non-null keys of an array, see key_type
+    """
+    if isinstance(array, pa.ChunkedArray):
+        array = pa.concat_arrays(array.chunks)
+    elif not isinstance(array, pa.Array):
+        array = pa.array(array)
+    if array.null_count > 0:
+        array = pc.drop_null(array)
+    if pa.types.is_dictionary(array.type):
+        array = array.dictionary.take(array.indices)
+    type_ = key_type(array.type)
+    if array.type != type_:
+        array = array.cast(type_)
+    return hash_array(array)
+
+
+def bloom_filter(key, hashes, fpp=0.01, type_=None):
+    """
+    Bloom filter of key hashes sized for a false positive rate
+
+    Parameters
+    ----------
+    key : column of the keys
+    hashes : key hashes
+    fpp : false positive rate
+    type_ : Arrow type of the key column, if known
+
+    Returns
+    -------
+    BloomFilterInfo
+    """
+    hashes = np.unique(hashes)
+    bloom = BloomFilter.optimal(len(hashes), fpp)
+    bloom.update(hashes)
+    msg = BloomFilterInfo()
+    msg.key = key
+    msg.num_keys = len(hashes)
+    msg.num_bits = bloom.num_bits
+    msg.num_hashes = bloom.num_hashes
+    msg.bits = bloom.bits.tobytes()
+    if type_ is not None:
+        schema = pa.schema([pa.field(key, key_type(type_))])
+        msg.schema = schema.serialize().to_pybytes()
+    return msg
+
+
+def filter_type(msg):
+    """
+    Arrow type the keys of a BloomFilterInfo message are hashed as,
+    None if not recorded
+    """
+    if not msg.schema:
+        return None
+    return pa.ipc.read_schema(pa.py_buffer(msg.schema)).field(0).type
+
+
+def from_protobuf(msg):
+    """
+    BloomFilter of a BloomFilterInfo message
+    """
+    bloom = BloomFilter(msg.num_bits, msg.num_hashes)
+    bloom.bits = np.frombuffer(msg.bits, dtype=np.uint8).copy()
+    return bloom
+
+
+def contains(store, dataset_id, key, values, partition=None):
+    """
+    Files of a dataset which could contain keys
+
+    Parameters
+    ----------
+    store : BaseObjectStore
+    dataset_id : uuid of the dataset
+    key : column of the keys
+    values : keys, an array or a list
+    partition : only the files of a partition if set
+
+    Returns
+    -------
+    list of (file uuid, boolean mask of the keys which could be in the file),
+    files with a filter of the key and no matching key are skipped,
+    files without a filter of the key could contain any key,
+    as could all files if the keys cannot be cast to the type of the filter
+    """
+    values = values if isinstance(values, pa.Array) else pa.array(values)
+    valid = values.is_valid().to_numpy(zero_copy_only=False)
+    hashes = {}  # key hashes per serialized filter type
+    selected = []
+    for obj in store[dataset_id].dataset.files:
+        info = obj.file
+        if info.type != 5:
+            continue
+        if partition is not None and info.partition != partition:
+            continue
+        mask = valid.copy()
+        for msg in info.blooms:
+            if msg.key == key:
+                if msg.schema not in hashes:
+                    hashes[msg.schema] = _cast_hashes(values, filter_type(msg))
+                if hashes[msg.schema] is not None:
+                    mask[valid] = from_protobuf(msg).contains(hashes[msg.schema])
+                break
+        if mask.any():
+            selected.append((obj.uuid, mask))
+    return selected
+
+
+def _cast_hashes(values, type_):
+    """
+    Hashes of keys cast to the type of a filter,
+    None if the keys cannot be cast
+    """
+    if type_ is not None and key_type(values.type) != type_:
+        try:
+            values = values.cast(type_)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            return None
+    return key_hashes(values)
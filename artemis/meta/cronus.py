@@ -49,6 +49,8 @@ from artemis.io.protobuf.cronus_pb2 import (
     FileObjectInfo,
     TableObjectInfo,
     TDigestObjectInfo,
+    SketchObjectInfo,
+    JobCheckpoint,
 )
 
 
@@ -88,6 +90,7 @@ class BaseObjectStore(BaseBook):
         Or create a new one
         """
         self._mstore = CronusObjectStore()
+        self._root = root
         self._dstore = FilesystemStore(f"{root}")
         self._alt_dstore = None
         if alt_root is not None:
@@ -134,6 +137,8 @@ class BaseObjectStore(BaseBook):
                     objects[child.uuid] = child
                 for child in item.dataset.tdigests:
                     objects[child.uuid] = child
+                for child in item.dataset.sketches:
+                    objects[child.uuid] = child
                 for child in item.dataset.logs:
                     objects[child.uuid] = child
                 for child in item.dataset.jobs:
@@ -143,6 +148,10 @@ class BaseObjectStore(BaseBook):
 
         super().__init__(objects)
 
+    @property
+    def root(self):
+        return self._root
+
     @property
     def store_name(self):
         return self._name
@@ -319,6 +328,18 @@ class BaseObjectStore(BaseBook):
             except Exception:
                 self.__logger.error("Error registering tdigest")
 
+        elif isinstance(info, SketchObjectInfo):
+            if dataset_id is None:
+                self.__logger.error("Registering sketches requires dataset id")
+                raise ValueError
+            if job_id is None:
+                self.__logger.error("Registering sketches requires job id")
+                raise ValueError
+            try:
+                metaobj = self._register_sketches(content, info, dataset_id, job_id)
+            except Exception:
+                self.__logger.error("Error registering sketches")
+
         elif isinstance(info, LogObjectInfo):
             self.__logger.error("To register a new log, use register_log")
             raise TypeError
@@ -444,6 +465,13 @@ class BaseObjectStore(BaseBook):
             objs.append(
                 MetaObject(_new.name, _new.uuid, _new.parent_uuid, _new.address)
             )
+        for obj in _update.sketches:
+            _new = self[dataset_id].dataset.sketches.add()
+            _new.CopyFrom(obj)
+            self[_new.uuid] = _new
+            objs.append(
+                MetaObject(_new.name, _new.uuid, _new.parent_uuid, _new.address)
+            )
         for obj in _update.files:
             _new = self[dataset_id].dataset.files.add()
             _new.CopyFrom(obj)
@@ -459,12 +487,80 @@ class BaseObjectStore(BaseBook):
                 MetaObject(_new.name, _new.uuid, _new.parent_uuid, _new.address)
             )
         for obj in _update.tables:
-            _new = self[dataset_id].dataset.logs.add()
+            _new = self[dataset_id].dataset.tables.add()
             _new.CopyFrom(obj)
             self[_new.uuid] = _new
             objs.append(
                 MetaObject(_new.name, _new.uuid, _new.parent_uuid, _new.address)
             )
+        self.update_watermark(dataset_id, _update.watermark)
+
+    def _checkpoint_name(self, dataset_id, job_id):
+        return f"{dataset_id}.job_{job_id}.checkpoint.pb"
+
+    def save_checkpoint(self, dataset_id, job_id, checkpoint):
+        """
+        Persist the checkpoint of a job, replaces the previous checkpoint
+
+        Parameters
+        ----------
+        dataset_id : uuid of the output dataset
+        job_id : index of the job
+        checkpoint : JobCheckpoint
+        """
+        name = self._checkpoint_name(dataset_id, job_id)
+        self.__logger.debug("Save checkpoint %s", name)
+        self._dstore.put(name, checkpoint.SerializeToString())
+
+    def load_checkpoint(self, dataset_id, job_id):
+        """
+        Checkpoint of a previous attempt of a job
+
+        Parameters
+        ----------
+        dataset_id : uuid of the output dataset
+        job_id : index of the job
+
+        Returns
+        -------
+        JobCheckpoint, None if the job has no checkpoint
+        """
+        name = self._checkpoint_name(dataset_id, job_id)
+        try:
+            buf = self._dstore.get(name)
+        except KeyError:
+            return None
+        checkpoint = JobCheckpoint()
+        checkpoint.ParseFromString(buf)
+        return checkpoint
+
+    def remove_checkpoint(self, dataset_id, job_id):
+        """
+        Remove the checkpoint of a completed job
+        """
+        self._dstore.delete(self._checkpoint_name(dataset_id, job_id))
+
+    def restore_checkpoint(self, dataset_id, checkpoint):
+        """
+        Register the partitions, files and tables of a checkpoint
+        which are not in the store, e.g. after a failed job
+
+        Parameters
+        ----------
+        dataset_id : uuid of the output dataset
+        checkpoint : JobCheckpoint
+        """
+        dataset = self[dataset_id].dataset
+        for key in checkpoint.partitions:
+            if key not in dataset.partitions:
+                self.new_partition(dataset_id, key)
+        for field in ("files", "tables"):
+            for obj in getattr(checkpoint, field):
+                if obj.uuid in self:
+                    continue
+                _new = getattr(dataset, field).add()
+                _new.CopyFrom(obj)
+                self[_new.uuid] = _new
 
     def new_job(self, dataset_id):
         """
@@ -602,14 +698,42 @@ class BaseObjectStore(BaseBook):
     def list_tdigests(self, dataset_id):
         return self[dataset_id].dataset.tdigests
 
+    def list_sketches(self, dataset_id):
+        return self[dataset_id].dataset.sketches
+
     def list_histograms(self, dataset_id):
         return self[dataset_id].dataset.hists
 
+    def list_watermark(self, dataset_id):
+        return self[dataset_id].dataset.watermark
+
+    def update_watermark(self, dataset_id, file_ids):
+        """
+        Record input files consumed by a successful job of a dataset
+
+        Parameters
+        ----------
+        dataset_id : uuid of the output dataset
+        file_ids : uuids of the input files
+        """
+        watermark = self[dataset_id].dataset.watermark
+        consumed = set(watermark)
+        for id_ in file_ids:
+            if id_ not in consumed:
+                watermark.append(id_)
+                consumed.add(id_)
+
     def _compute_hash(self, stream):
         hashobj = hashlib.new(self._algorithm)
         hashobj.update(stream.read())
         return hashobj.hexdigest()
 
+    def file_hash(self, location):
+        """
+        Content hash of a file on disk, the uuid it is registered with
+        """
+        return self._compute_hash(pa.input_stream(str(location)))
+
     def _register_menu(self, menu, menuinfo):
         self.__logger.info("Registering menu object")
 
@@ -768,6 +892,23 @@ class BaseObjectStore(BaseBook):
 
         return MetaObject(obj.name, obj.uuid, obj.parent_uuid, obj.address)
 
+    def _register_sketches(self, sketches, sketchinfo, dataset_id, job_id):
+        """
+        Register a Sketch_store of a job in the dataset
+        dataset_id.job_id.sketches_id.sketch.pb
+        """
+        self.__logger.debug("Register sketches")
+        obj = self[dataset_id].dataset.sketches.add()
+        obj.uuid = str(uuid.uuid4())
+        obj.parent_uuid = dataset_id
+        obj.name = f"{dataset_id}.job_{job_id}.{obj.uuid}.sketch.pb"
+        obj.address = self._dstore.url_for(obj.name)
+        obj.sketches.CopyFrom(sketchinfo)
+        self[obj.uuid] = obj
+        self._put_message(obj.uuid, sketches)
+
+        return MetaObject(obj.name, obj.uuid, obj.parent_uuid, obj.address)
+
     def _register_job(self, meta, jobinfo, dataset_id, job_id):
         """
         Requires
@@ -802,7 +943,7 @@ class BaseObjectStore(BaseBook):
         if path.is_absolute() is False:
             path = path.resolve()
         obj = self[dataset_id].dataset.files.add()
-        obj.uuid = self._compute_hash(pa.input_stream(str(path)))
+        obj.uuid = self.file_hash(path)
         obj.name = f"{dataset_id}.part_{partition_key}.{obj.uuid}.{path.name}"
         obj.parent_uuid = dataset_id
         # Create a Path object, ensure that location points to a file
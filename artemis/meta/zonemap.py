@@ -0,0 +1,271 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Zone maps of the output files of a dataset
+
+A writer with zone_maps enabled records the statistics of the columns of
+each file and of each record batch of a file in its FileObjectInfo: the min,
+max, null count and an estimate of the distinct values. A predicate is
+checked on the zone maps to select the files and batches which could contain
+matching rows, the other files are skipped without being opened.
+
+Predicates have the syntax of the RowFilterTool expressions, e.g.
+
+    files = prune(store, dataset_id, "age >= 65 and province in ['10', '11']")
+
+A predicate is checked conservatively, a zone map of unknown columns
+or statistics could always match.
+"""
+import ast
+import operator
+
+from artemis.io.protobuf.cronus_pb2 import ZoneMap
+
+
+def zone_map(sketches, num_rows):
+    """
+    Zone map of column sketches
+
+    Parameters
+    ----------
+    sketches : dict of column name to ColumnSketch
+    num_rows : number of rows
+
+    Returns
+    -------
+    ZoneMap
+    """
+    msg = ZoneMap()
+    msg.num_rows = num_rows
+    for name, sketch in sketches.items():
+        stats = msg.columns.add()
+        stats.name = name
+        stats.null_count = sketch.null_count
+        stats.distinct = int(round(sketch.distinct()))
+        _set_bound(stats, "min", sketch.min)
+        _set_bound(stats, "max", sketch.max)
+    return msg
+
+
+def _set_bound(stats, bound, value):
+    if value is None:
+        return
+    if isinstance(value, str):
+        setattr(stats, bound + "_string", value)
+    elif isinstance(value, int) and -(2 ** 63) <= value < 2 ** 63:
+        setattr(stats, bound + "_int", value)
+    elif isinstance(value, (int, float)):
+        setattr(stats, bound + "_double", value)
+
+
+def _get_bound(stats, bound):
+    field = stats.WhichOneof(bound)
+    if field is None:
+        return None
+    return getattr(stats, field)
+
+
+class ZoneMapFilter:
+    """
+    Predicate checked on zone maps
+    """
+
+    _compare = {
+        ast.Eq: "==",
+        ast.NotEq: "!=",
+        ast.Lt: "<",
+        ast.LtE: "<=",
+        ast.Gt: ">",
+        ast.GtE: ">=",
+        ast.In: "in",
+        ast.NotIn: "not in",
+    }
+    # Operator of the negated comparison, and with swapped operands
+    _negate = {
+        "==": "!=",
+        "!=": "==",
+        "<": ">=",
+        "<=": ">",
+        ">": "<=",
+        ">=": "<",
+        "in": "not in",
+        "not in": "in",
+    }
+    _swap = {"==": "==", "!=": "!=", "<": ">", "<=": ">=", ">": "<", ">=": "<="}
+
+    def __init__(self, expression):
+        self.expression = expression
+        try:
+            tree = ast.parse(expression, mode="eval")
+        except SyntaxError:
+            raise ValueError(f"Cannot parse predicate {expression}")
+        self._check = self._compile(tree.body, False)
+
+    def __call__(self, zonemap):
+        """
+        Whether rows of the zone map could match the predicate
+        """
+        columns = {stats.name: stats for stats in zonemap.columns}
+        return self._check(columns, zonemap.num_rows)
+
+    def _compile(self, node, negate):
+        """
+        Compile an ast node to a function of the column statistics,
+        negations are pushed down to the comparisons
+        """
+        if isinstance(node, ast.BoolOp):
+            operands = [self._compile(value, negate) for value in node.values]
+            if isinstance(node.op, ast.And) != negate:
+                return lambda cols, n: all(op(cols, n) for op in operands)
+            return lambda cols, n: any(op(cols, n) for op in operands)
+
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            return self._compile(node.operand, not negate)
+
+        if isinstance(node, ast.Compare):
+            terms = []
+            left = node.left
+            for op, right in zip(node.ops, node.comparators):
+                terms.append(self._compile_compare(left, op, right, negate))
+                left = right
+            if negate:
+                return lambda cols, n: any(term(cols, n) for term in terms)
+            return lambda cols, n: all(term(cols, n) for term in terms)
+
+        if isinstance(node, ast.Call):
+            name = getattr(node.func, "id", None)
+            if name in ("is_null", "is_valid") and len(node.args) == 1:
+                column = self._column(node.args[0])
+                if column is None:
+                    raise ValueError(f"Unsupported predicate {ast.dump(node)}")
+                if (name == "is_null") != negate:
+                    return self._stats(column, lambda s, n: s.null_count > 0)
+                return self._stats(column, lambda s, n: s.null_count < n)
+
+        # Boolean columns and other expressions could always match
+        return lambda cols, n: True
+
+    def _compile_compare(self, left, op, right, negate):
+        try:
+            op = self._compare[type(op)]
+        except KeyError:
+            raise ValueError(f"Unsupported comparison {ast.dump(op)}")
+        column = self._column(left)
+        if column is None and op in self._swap:
+            column = self._column(right)
+            op = self._swap[op]
+            right = left
+        if column is None:
+            return lambda cols, n: True
+        try:
+            value = ast.literal_eval(right)
+        except ValueError:
+            # Comparisons of columns could always match
+            return lambda cols, n: True
+        if negate:
+            op = self._negate[op]
+
+        def _test(stats, n):
+            lo, hi = _get_bound(stats, "min"), _get_bound(stats, "max")
+            if lo is None or hi is None:
+                # Null comparisons do not match, other types could match
+                return stats.null_count < n
+            return _could_match(lo, hi, op, value)
+
+        return self._stats(column, _test)
+
+    @staticmethod
+    def _stats(column, test):
+        def _check(cols, n):
+            stats = cols.get(column)
+            if stats is None:
+                return True
+            try:
+                return test(stats, n)
+            except TypeError:
+                # Value of another type than the column
+                return True
+
+        return _check
+
+    @staticmethod
+    def _column(node):
+        if isinstance(node, ast.Name):
+            return node.id
+        if (
+            isinstance(node, ast.Call)
+            and getattr(node.func, "id", None) == "col"
+            and len(node.args) == 1
+        ):
+            return ast.literal_eval(node.args[0])
+        return None
+
+
+def _could_match(lo, hi, op, value):
+    """
+    Whether a value in [lo, hi] could satisfy value op
+    """
+    if op == "in":
+        return any(lo <= v <= hi for v in value)
+    if op == "not in":
+        return not (lo == hi and lo in value)
+    if op == "==":
+        return lo <= value <= hi
+    if op == "!=":
+        return not (lo == hi == value)
+    if op in ("<", "<="):
+        return {"<": operator.lt, "<=": operator.le}[op](lo, value)
+    return {">": operator.gt, ">=": operator.ge}[op](hi, value)
+
+
+def prune(store, dataset_id, expression, partition=None):
+    """
+    Arrow files of a dataset which could contain rows matching a predicate
+
+    Parameters
+    ----------
+    store : BaseObjectStore
+    dataset_id : uuid of the dataset
+    expression : predicate on the columns
+    partition : only the files of a partition if set
+
+    Returns
+    -------
+    list of (file uuid, indices of the batches which could match),
+    the batches of a file without batch zone maps are None
+    """
+    predicate = ZoneMapFilter(expression)
+    selected = []
+    for obj in store[dataset_id].dataset.files:
+        info = obj.file
+        if info.type != 5:
+            # Only Arrow files, csv copies and key indices are skipped
+            continue
+        if partition is not None and info.partition != partition:
+            continue
+        if info.HasField("zonemap") and not predicate(info.zonemap):
+            continue
+        batches = None
+        if len(info.batches) > 0:
+            batches = [
+                i for i, zonemap in enumerate(info.batches) if predicate(zonemap)
+            ]
+        selected.append((obj.uuid, batches))
+    return selected
@@ -22,7 +22,7 @@
 
 from artemis.includes.libfiltercol cimport CFilterColumns
 from pyarrow import RecordBatch
-from pyarrow.compat import frombytes, tobytes
+from pyarrow.lib import frombytes, tobytes
 from pyarrow.lib cimport (pyarrow_wrap_batch, pyarrow_unwrap_batch)
 from libcpp cimport bool as c_bool
 from libcpp.string cimport string as c_string
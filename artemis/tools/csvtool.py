@@ -18,8 +18,14 @@
 # limitations under the License.
 
 """
-
+Tool for converting blocks of csv data to Arrow RecordBatches.
+Column types inferred from the sampled blocks are unified and locked,
+such that all subsequent blocks are converted with explicit column types.
+String columns with a low cardinality in the sampled blocks
+can be dictionary encoded with a stable dictionary.
 """
+import pyarrow as pa
+import pyarrow.compute as pc
 from pyarrow.csv import read_csv, ReadOptions, ParseOptions, ConvertOptions
 
 from artemis.decorators import iterable
@@ -30,7 +36,9 @@ from artemis.core.tool import ToolBase
 class CsvToolOptions:
 
     # Add user-defined options for Artemis.CsvTool
-    pass
+    dictionary_encode = False  # Dictionary encode low-cardinality string columns
+    dictionary_max_size = 1000  # Max distinct values of an encoded column
+    dictionary_max_ratio = 0.1  # Max ratio of distinct values to valid values
 
 
 class CsvTool(ToolBase):
@@ -50,6 +58,31 @@ class CsvTool(ToolBase):
         self._readopts = ReadOptions(**ropts)
         self._parseopts = ParseOptions(**popts)
         self._convertopts = ConvertOptions(**copts)
+        # Inference options retained for sampling
+        self._inferopts = self._convertopts
+        self._copts = copts
+        self._sampled = None
+        self._schema = None
+        # Columns projected after conversion
+        # if include_columns not supported by pyarrow
+        self._projection = None
+        self._dictionary_encode = options["dictionary_encode"]
+        self._dictionary_max_size = options["dictionary_max_size"]
+        self._dictionary_max_ratio = options["dictionary_max_ratio"]
+        # Distinct values and valid counts of sampled string columns
+        # None once a column exceeds the max dictionary size
+        self._distinct = {}
+        self._nvalid = {}
+        # Stable dictionaries of the encoded columns
+        self._dictionaries = {}
+        # Smallest index type holding the max dictionary size with headroom
+        # for values first seen after sampling
+        if self._dictionary_max_size < 2 ** 6:
+            self._index_type = pa.int8()
+        elif self._dictionary_max_size < 2 ** 14:
+            self._index_type = pa.int16()
+        else:
+            self._index_type = pa.int32()
         self.__logger.info("%s: __init__ CsvTool", self.name)
         self.__logger.info("Options %s", options)
 
@@ -57,6 +90,8 @@ class CsvTool(ToolBase):
         options = {}
         for attr in dir(cls):
             if attr[:2] != "__" and attr != "escape_char":
+                if callable(getattr(cls, attr)):
+                    continue
                 options[attr] = getattr(cls, attr)
                 if attr in kwargs:
                     options[attr] = kwargs[attr]
@@ -67,38 +102,313 @@ class CsvTool(ToolBase):
             "%s properties: %s", self.__class__.__name__, self.properties
         )
 
+    @property
+    def schema(self):
+        """
+        Schema locked from the sampled blocks
+        None if no block has been sampled
+        """
+        return self._schema
+
+    @property
+    def dictionaries(self):
+        """
+        Dictionaries of the encoded columns
+        """
+        return dict(self._dictionaries)
+
+    @staticmethod
+    def unify_types(left, right):
+        """
+        Common type of a column inferred with different types
+        in different blocks
+
+        null is promoted to any type, mixed integer and floating point
+        are promoted to double, any other conflict is promoted to string
+        """
+        if left == right:
+            return left
+        if pa.types.is_null(left):
+            return right
+        if pa.types.is_null(right):
+            return left
+        numeric = (pa.types.is_integer, pa.types.is_floating)
+        if any(f(left) for f in numeric) and any(f(right) for f in numeric):
+            return pa.float64()
+        return pa.string()
+
+    def unify_schema(self, schema):
+        """
+        Unify a schema with the schema of all previously sampled blocks
+
+        Parameters
+        ----------
+        schema : pa.Schema
+
+        Returns
+        -------
+        pa.Schema
+        """
+        if self._sampled is None:
+            return schema
+        if self._sampled.names != schema.names:
+            self.__logger.error("Sampled columns differ %s", schema.names)
+            raise ValueError
+        fields = []
+        for sampled, field in zip(self._sampled, schema):
+            fields.append(
+                pa.field(field.name, self.unify_types(sampled.type, field.type))
+            )
+        return pa.schema(fields)
+
+    def lock_schema(self, schema):
+        """
+        Convert all subsequent blocks with the column types of schema
+
+        Columns which are null in all sampled blocks are locked as string.
+        User-defined column_types take precedence over the sampled types.
+
+        Parameters
+        ----------
+        schema : pa.Schema
+        """
+        user_types = self._copts["column_types"]
+        fields = []
+        for field in schema:
+            if field.name in user_types:
+                field = pa.field(field.name, user_types[field.name])
+            elif pa.types.is_null(field.type):
+                field = pa.field(field.name, pa.string())
+            fields.append(field)
+        self._schema = pa.schema(fields)
+
+        copts = dict(self._copts)
+        copts["column_types"] = {field.name: field.type for field in self._schema}
+        self._convertopts = ConvertOptions(**copts)
+        self.__logger.debug("Locked schema %s", self._schema)
+
+    def include_columns(self, columns):
+        """
+        Convert only the given columns, all others are skipped by the parser.
+        Must be set before sampling.
+
+        Uses ConvertOptions.include_columns when supported by pyarrow,
+        otherwise the columns are projected after conversion.
+
+        Parameters
+        ----------
+        columns : list of column names
+        """
+        columns = list(columns)
+        self.__logger.info("Include columns %s", columns)
+        if "include_columns" in self._copts:
+            self._copts["include_columns"] = columns
+            self._inferopts = ConvertOptions(**self._copts)
+            self._convertopts = self._inferopts
+        else:
+            self._projection = columns
+
+    def sample(self, block):
+        """
+        Convert a sampled block with type inference
+        and lock the schema unified over all sampled blocks.
+        The block is converted again if the inferred types differ
+        from the locked types.
+
+        Parameters
+        ----------
+        block: pa.py_buffer
+
+        Returns
+        ---------
+        list of pyarrow RecordBatch
+        """
+        table = self._read(block, self._inferopts)
+        self._sampled = self.unify_schema(table.schema)
+        self.lock_schema(self._sampled)
+        if table.schema != self._schema:
+            self.__logger.debug("Sampled schema differs, convert with locked types")
+            table = self._read(block, self._convertopts)
+        if self._dictionary_encode:
+            self.measure_cardinality(table)
+            self.lock_dictionaries()
+        return self._to_batches(table)
+
+    def measure_cardinality(self, table):
+        """
+        Accumulate the distinct values of the sampled string columns
+
+        Parameters
+        ----------
+        table : pa.Table
+        """
+        for field in table.schema:
+            if not pa.types.is_string(field.type):
+                self._distinct.pop(field.name, None)
+                continue
+            if field.name in self._distinct and self._distinct[field.name] is None:
+                continue
+            column = table.column(field.name)
+            values = column.unique()
+            if self._distinct.get(field.name) is not None:
+                values = pa.concat_arrays([self._distinct[field.name], values])
+                values = values.unique()
+            values = values.drop_null()
+            nvalid = self._nvalid.get(field.name, 0)
+            self._nvalid[field.name] = nvalid + len(column) - column.null_count
+            if len(values) > self._dictionary_max_size:
+                self.__logger.debug("Column %s exceeds dictionary size", field.name)
+                values = None
+            self._distinct[field.name] = values
+
+    def lock_dictionaries(self):
+        """
+        Dictionary encode the sampled string columns with a low cardinality
+
+        The dictionary of a column holds the sorted distinct sampled values.
+        Values first seen after sampling are appended,
+        such that the index of a value never changes.
+        """
+        self._dictionaries = {}
+        for name, values in self._distinct.items():
+            if values is None or not self._nvalid[name]:
+                continue
+            if len(values) > self._dictionary_max_ratio * self._nvalid[name]:
+                continue
+            self._dictionaries[name] = values.take(pc.sort_indices(values))
+        self._encode_schema()
+        self.__logger.info("Dictionary encoded columns %s", list(self._dictionaries))
+
+    def _encode_schema(self):
+        """
+        Lock the encoded columns as dictionaries in the schema
+        """
+        fields = []
+        for field in self._schema:
+            if field.name in self._dictionaries:
+                field = pa.field(
+                    field.name, pa.dictionary(self._index_type, pa.string())
+                )
+            fields.append(field)
+        self._schema = pa.schema(fields)
+
+    def checkpoint(self):
+        """
+        Sampled schema and the dictionaries of the encoded columns,
+        serialized as an Arrow stream. Empty if not sampled
+        """
+        if self._sampled is None:
+            return b""
+        names = list(self._dictionaries)
+        values = [self._dictionaries[name].to_pylist() for name in names]
+        batch = pa.RecordBatch.from_arrays(
+            [pa.array(names, pa.string()), pa.array(values, pa.list_(pa.string()))],
+            names=["name", "values"],
+        )
+        batch = batch.replace_schema_metadata(
+            {"sampled": self._sampled.serialize().to_pybytes()}
+        )
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, batch.schema) as writer:
+            writer.write_batch(batch)
+        return sink.getvalue().to_pybytes()
+
+    def resume(self, state):
+        """
+        Lock the sampled schema and dictionaries of a checkpoint
+        """
+        if not state:
+            return
+        table = pa.ipc.open_stream(pa.py_buffer(state)).read_all()
+        sampled = table.schema.metadata[b"sampled"]
+        self._sampled = pa.ipc.read_schema(pa.py_buffer(sampled))
+        self.lock_schema(self._sampled)
+        names = table.column("name").to_pylist()
+        values = table.column("values").to_pylist()
+        self._dictionaries = {
+            name: pa.array(values_, pa.string()) for name, values_ in zip(names, values)
+        }
+        self._encode_schema()
+        self.__logger.info("Resumed schema %s", self._schema)
+
+    def _encode(self, name, array):
+        """
+        Encode a string array with the stable dictionary of the column
+        """
+        dictionary = self._dictionaries[name]
+        indices = pc.index_in(array, value_set=dictionary)
+        unseen = pc.and_(pc.is_valid(array), pc.is_null(indices))
+        if pc.any(unseen).as_py():
+            values = array.filter(unseen).unique()
+            self.__logger.warning(
+                "Column %s extend dictionary with %i values", name, len(values)
+            )
+            dictionary = pa.concat_arrays([dictionary, values])
+            if len(dictionary) >= 2 ** (self._index_type.bit_width - 1):
+                self.__logger.error("Column %s exceeds dictionary index type", name)
+                raise ValueError
+            self._dictionaries[name] = dictionary
+            indices = pc.index_in(array, value_set=dictionary)
+        return pa.DictionaryArray.from_arrays(
+            indices.cast(self._index_type), dictionary
+        )
+
     def execute(self, block):
         """
         Calls the read_csv module from pyarrow
 
+        The block is parsed in chunks of block_size bytes,
+        in parallel if use_threads is set,
+        each chunk is returned as a RecordBatch
+
         Parameters
         ----------
         block: pa.py_buffer
 
         Returns
         ---------
-        pyarrow RecordBatch
+        list of pyarrow RecordBatch
         """
+        return self._to_batches(self._read(block, self._convertopts))
+
+    def _read(self, block, convertopts):
         try:
             table = read_csv(
                 block,
                 read_options=self._readopts,
                 parse_options=self._parseopts,
-                convert_options=self._convertopts,
+                convert_options=convertopts,
             )
         except Exception:
             self.__logger.error("Problem converting csv to table")
             raise
-        # We actually want a batch
+        if self._projection is not None:
+            indices = [table.schema.get_field_index(name) for name in self._projection]
+            if -1 in indices:
+                self.__logger.error("Cannot project columns %s", self._projection)
+                raise KeyError
+            table = pa.Table.from_arrays(
+                [table.column(i) for i in indices], names=self._projection
+            )
+        return table
+
+    def _to_batches(self, table):
+        # We actually want batches
         # batch can be converted to table
-        # but not vice-verse, we get batches
-        # Should always be length 1 though (chunksize can be set however)
+        # but not vice-verse
+        # One batch per parser chunk of block_size
         batches = table.to_batches()
+        if self._dictionaries:
+            batches = [self._encode_batch(batch) for batch in batches]
         self.__logger.debug("Batches %i", len(batches))
         for batch in batches:
             self.__logger.debug("Batch records %i", batch.num_rows)
-        if len(batches) != 1:
-            self.__logger.error("Table has more than 1 RecordBatches")
-            raise Exception
+        return batches
 
-        return batches[-1]
+    def _encode_batch(self, batch):
+        columns = []
+        for field, column in zip(batch.schema, batch.columns):
+            if field.name in self._dictionaries:
+                column = self._encode(field.name, column)
+            columns.append(column)
+        return pa.RecordBatch.from_arrays(columns, schema=self._schema)
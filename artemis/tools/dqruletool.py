@@ -0,0 +1,204 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tool to check the rows of a record batch with a set of data quality rules.
+
+The rule set is a DQRuleSet protobuf message, configured as text format, e.g.
+
+    rules { name: "age" column: "age" range { min: 0 max: 120 } }
+    rules { name: "province" column: "province" codes { codes: ["10", "11"] } }
+    rules { name: "naics" column: "naics" regex: "[0-9]{6}" }
+    rules { name: "income" column: "income" null_rate { max_rate: 0.05 } }
+    rules { name: "adult" expression: "not (age < 18 and status == 'married')" }
+
+Each rule is compiled once to pyarrow.compute kernels, evaluating the mask
+of the rows of a batch passing the rule. Rules on a column pass the null
+values, which are checked by a null_rate rule. Expressions are compiled
+as for RowFilterTool, rows with a null expression fail.
+"""
+import collections
+import re
+
+import pyarrow as pa
+import pyarrow.compute as pc
+from google.protobuf import text_format
+
+from artemis.decorators import iterable
+from artemis.core.tool import ToolBase
+from artemis.io.protobuf.dq_pb2 import DQRuleSet
+from artemis.tools.rowfiltertool import RowFilterTool
+
+
+@iterable
+class DQRuleToolOptions:
+    rules = ""  # DQRuleSet in protobuf text format
+
+
+class DQRuleTool(ToolBase):
+    def __init__(self, name, **kwargs):
+        options = dict(DQRuleToolOptions())
+        options.update(kwargs)
+        if isinstance(options["rules"], DQRuleSet):
+            options["rules"] = text_format.MessageToString(options["rules"])
+
+        super().__init__(name, **options)
+        self.__logger.info("%s: __init__ DQRuleTool", self.name)
+        self.__logger.info("Options %s", options)
+
+        self.ruleset = DQRuleSet()
+        try:
+            text_format.Parse(options["rules"], self.ruleset)
+        except text_format.ParseError:
+            self.__logger.error("Cannot parse rule set %s", options["rules"])
+            raise ValueError
+        names = [rule.name for rule in self.ruleset.rules]
+        if "" in names or len(set(names)) != len(names):
+            self.__logger.error("Rules require unique names %s", names)
+            raise ValueError
+        self._masks = None
+        self._columns = None
+
+    @property
+    def rules(self):
+        return list(self.ruleset.rules)
+
+    @property
+    def columns(self):
+        """
+        Columns referenced by the rules
+        """
+        if self._columns is None:
+            self.initialize()
+        return list(self._columns)
+
+    def initialize(self):
+        """
+        Compile each rule to a function evaluating the mask of a batch
+        """
+        self.__logger.info(
+            "%s properties: %s", self.__class__.__name__, self.properties
+        )
+        self._columns = []
+        self._masks = collections.OrderedDict()
+        for rule in self.ruleset.rules:
+            try:
+                self._masks[rule.name] = self._compile(rule)
+            except (re.error, ValueError):
+                self.__logger.error("Cannot compile rule %s", rule)
+                raise ValueError
+        self.__logger.info("Compiled %i rules", len(self._masks))
+
+    def _compile(self, rule):
+        check = rule.WhichOneof("check")
+        if check is None:
+            raise ValueError
+
+        if check == "expression":
+            tool = RowFilterTool(rule.name, expression=rule.expression)
+            tool.initialize()
+            for column in tool.columns:
+                self._add_column(column)
+            return lambda batch: pc.fill_null(tool.mask(batch), False)
+
+        if not rule.column:
+            raise ValueError
+        self._add_column(rule.column)
+        name = rule.column
+
+        if check == "null_rate":
+            return lambda batch: pc.is_valid(batch.column(name))
+
+        if check == "range":
+            bounds = []
+            if rule.range.HasField("min"):
+                bounds.append((pc.greater_equal, pa.scalar(rule.range.min)))
+            if rule.range.HasField("max"):
+                bounds.append((pc.less_equal, pa.scalar(rule.range.max)))
+
+            if not bounds:
+                raise ValueError
+
+            def _range(array):
+                mask = bounds[0][0](array, bounds[0][1])
+                for kernel, bound in bounds[1:]:
+                    mask = pc.and_(mask, kernel(array, bound))
+                return mask
+
+            return self._column_check(name, _range)
+
+        if check == "codes":
+            codes = pa.array(list(rule.codes.codes), pa.string())
+
+            def _codes(array):
+                value_set = codes
+                if value_set.type != array.type:
+                    value_set = value_set.cast(array.type)
+                return pc.is_in(array, value_set=value_set)
+
+            return self._column_check(name, _codes)
+
+        if check == "regex":
+            # Validate the pattern once, matched on the full value
+            re.compile(rule.regex)
+            pattern = f"^(?:{rule.regex})$"
+            return self._column_check(
+                name, lambda array: pc.match_substring_regex(array, pattern=pattern)
+            )
+
+    def _column_check(self, name, kernel):
+        """
+        Check of the valid values of a column, dictionary arrays
+        are checked on the dictionary only
+        """
+
+        def _check(batch):
+            array = batch.column(name)
+            if pa.types.is_dictionary(array.type):
+                mask = pc.take(kernel(array.dictionary), array.indices)
+            else:
+                mask = kernel(array)
+            return pc.fill_null(mask, True)
+
+        return _check
+
+    def _add_column(self, name):
+        if name not in self._columns:
+            self._columns.append(name)
+
+    def execute(self, record_batch):
+        """
+        Evaluate the rules on a record batch
+
+        Parameters
+        ----------
+        record_batch : pa.RecordBatch
+
+        Returns
+        -------
+        OrderedDict of the rule name to the mask of the passing rows
+        """
+        masks = collections.OrderedDict()
+        for name, mask in self._masks.items():
+            try:
+                masks[name] = mask(record_batch)
+            except Exception:
+                self.__logger.error("Cannot evaluate rule %s", name)
+                raise
+        return masks
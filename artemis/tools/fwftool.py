@@ -17,6 +17,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pyarrow as pa
 import pyfwfr as pf
 
 from artemis.decorators import iterable
@@ -48,6 +49,10 @@ class FwfTool(ToolBase):
         self._readopts = pf.ReadOptions(**ropts)
         self._parseopts = pf.ParseOptions(**popts)
         self._convertopts = pf.ConvertOptions(**copts)
+        self._copts = copts
+        # Fields projected after conversion
+        # if include_columns not supported by pyfwfr
+        self._projection = None
         self.__logger.info("%s: __init__ FwfTool", self.name)
         self.__logger.info("Options %s", options)
 
@@ -55,6 +60,8 @@ class FwfTool(ToolBase):
         options = {}
         for attr in dir(cls):
             if attr[:2] != "__" and attr != "buffer_safety_factor":
+                if callable(getattr(cls, attr)):
+                    continue
                 options[attr] = getattr(cls, attr)
                 if attr in kwargs:
                     options[attr] = kwargs[attr]
@@ -65,6 +72,25 @@ class FwfTool(ToolBase):
             "%s properties: %s", self.__class__.__name__, self.properties
         )
 
+    def include_columns(self, columns):
+        """
+        Convert only the given subset of fields
+
+        Uses ConvertOptions.include_columns when supported by pyfwfr,
+        otherwise the fields are projected after conversion.
+
+        Parameters
+        ----------
+        columns : list of column names
+        """
+        columns = list(columns)
+        self.__logger.info("Include columns %s", columns)
+        if "include_columns" in self._copts:
+            self._copts["include_columns"] = columns
+            self._convertopts = pf.ConvertOptions(**self._copts)
+        else:
+            self._projection = columns
+
     def execute(self, block):
         """
         Calls the read_csv module from pyarrow
@@ -99,4 +125,13 @@ class FwfTool(ToolBase):
             self.__logger.error("Table has more than 1 RecordBatches")
             raise Exception
 
-        return batches[-1]
+        batch = batches[-1]
+        if self._projection is not None:
+            indices = [batch.schema.get_field_index(name) for name in self._projection]
+            if -1 in indices:
+                self.__logger.error("Cannot project columns %s", self._projection)
+                raise KeyError
+            batch = pa.RecordBatch.from_arrays(
+                [batch.column(i) for i in indices], self._projection
+            )
+        return batch
@@ -101,6 +101,9 @@ class MfTool(ToolBase):
 
         self.codec = self.properties.codec
 
+        # Indices of the decoded fields, all fields by default
+        self._selected = list(range(self.nfields))
+
         self._nbatches = 0
 
     def initialize(self):
@@ -115,6 +118,21 @@ class MfTool(ToolBase):
     def columns(self):
         return self.col_names
 
+    def include_columns(self, columns):
+        """
+        Decode only the given fields, all other fields are skipped
+
+        Parameters
+        ----------
+        columns : list of column names
+        """
+        try:
+            self._selected = [self.col_names.index(name) for name in columns]
+        except ValueError:
+            self.__logger.error("Unknown columns %s", columns)
+            raise
+        self.__logger.info("Include columns %s", columns)
+
     def execute(self, block):
         """
         Reads a block of data with the initialized MfTool object.
@@ -132,6 +150,8 @@ class MfTool(ToolBase):
         for field in self.ds_schema:
             odata.append([])
 
+        skipped = set(range(self.nfields)) - set(self._selected)
+
         ccounter = 0
         ncounter = 0
         fcounter = 0
@@ -140,6 +160,11 @@ class MfTool(ToolBase):
             # Extract record.
             rdata = block[ccounter : (ccounter + self.rsize)]
             while ncounter < self.nfields:
+                if ncounter in skipped:
+                    # Field is not decoded
+                    fcounter = fcounter + self.ds_schema[ncounter]["length"]
+                    ncounter = ncounter + 1
+                    continue
                 # Extract field.
                 field = rdata[
                     fcounter : (fcounter + self.ds_schema[ncounter]["length"])
@@ -261,7 +286,8 @@ class MfTool(ToolBase):
 
         # Creates apache arrow dataset.
 
-        for my_list in odata:
+        for i in self._selected:
+            my_list = odata[i]
             arr = pa.array(my_list)
             if arr.type == pa.null():
                 self.__logger.warning("Null array recast as float")
@@ -275,7 +301,9 @@ class MfTool(ToolBase):
         self.__logger.debug(arrowodata)
 
         try:
-            rbatch = pa.RecordBatch.from_arrays(arrowodata, self.col_names)
+            rbatch = pa.RecordBatch.from_arrays(
+                arrowodata, [self.col_names[i] for i in self._selected]
+            )
         except Exception:
             self.__logger.error("Cannot convert arrays to batch")
             raise
@@ -0,0 +1,247 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tool to select rows of a record batch with a boolean expression.
+
+The expression is a small subset of python syntax,
+compiled once to pyarrow.compute kernels, e.g.
+
+    (age >= 18) and province in ["10", "11"] and not is_null(income)
+
+Supported
+    column names, or col("column name") for any other name
+    literals: numbers, strings, True, False, lists for in / not in
+    comparisons: ==, !=, <, <=, >, >=, in, not in
+    null checks: is_null(column), is_valid(column)
+    boolean combinators: and, or, not
+
+Comparisons with null evaluate to null, and rows with a null mask are dropped.
+"""
+import ast
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from artemis.decorators import iterable
+from artemis.core.tool import ToolBase
+
+
+@iterable
+class RowFilterToolOptions:
+    expression = None  # Boolean expression selecting the rows to keep
+
+
+class RowFilterTool(ToolBase):
+
+    _compare = {
+        ast.Eq: pc.equal,
+        ast.NotEq: pc.not_equal,
+        ast.Lt: pc.less,
+        ast.LtE: pc.less_equal,
+        ast.Gt: pc.greater,
+        ast.GtE: pc.greater_equal,
+    }
+
+    _checks = {"is_null": pc.is_null, "is_valid": pc.is_valid}
+
+    def __init__(self, name, **kwargs):
+        options = dict(RowFilterToolOptions())
+        options.update(kwargs)
+
+        super().__init__(name, **options)
+        self.__logger.info("%s: __init__ RowFilterTool", self.name)
+        self.__logger.info("Options %s", options)
+
+        if options["expression"] is None:
+            self.__logger.error("Row filter requires an expression")
+            raise ValueError
+        self.expression = options["expression"]
+        self._mask = None
+        self._columns = None
+
+    @property
+    def columns(self):
+        """
+        Columns referenced by the expression
+        """
+        if self._columns is None:
+            self.initialize()
+        return list(self._columns)
+
+    def initialize(self):
+        """
+        Compile the expression to a function evaluating the mask of a batch
+        """
+        self.__logger.info(
+            "%s properties: %s", self.__class__.__name__, self.properties
+        )
+        self._columns = []
+        try:
+            tree = ast.parse(self.expression, mode="eval")
+            self._mask = self._compile(tree.body)
+        except (SyntaxError, ValueError):
+            self.__logger.error("Cannot compile expression %s", self.expression)
+            raise ValueError
+        self.__logger.info("Compiled %s", self.expression)
+
+    def _compile(self, node):
+        """
+        Recursively compile an ast node to a function of a record batch
+        """
+        if isinstance(node, ast.BoolOp):
+            operands = [self._compile(value) for value in node.values]
+            if isinstance(node.op, ast.And):
+                kernel = pc.and_kleene
+            else:
+                kernel = pc.or_kleene
+
+            def _boolop(batch):
+                result = operands[0](batch)
+                for operand in operands[1:]:
+                    result = kernel(result, operand(batch))
+                return result
+
+            return _boolop
+
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            operand = self._compile(node.operand)
+            return lambda batch: pc.invert(operand(batch))
+
+        if isinstance(node, ast.Compare):
+            # Comparison chains a < b < c are a < b and b < c
+            terms = []
+            left = node.left
+            for op, right in zip(node.ops, node.comparators):
+                terms.append(self._compile_compare(left, op, right))
+                left = right
+            if len(terms) == 1:
+                return terms[0]
+
+            def _chain(batch):
+                result = terms[0](batch)
+                for term in terms[1:]:
+                    result = pc.and_kleene(result, term(batch))
+                return result
+
+            return _chain
+
+        if isinstance(node, ast.Call):
+            name = getattr(node.func, "id", None)
+            if name in self._checks and len(node.args) == 1:
+                kernel = self._checks[name]
+                operand = self._compile_operand(node.args[0])
+                return lambda batch: kernel(operand(batch))
+
+        if isinstance(node, ast.Name) or isinstance(node, ast.Call):
+            # Boolean column
+            return self._compile_operand(node)
+
+        self.__logger.error("Unsupported expression %s", ast.dump(node))
+        raise ValueError
+
+    def _compile_compare(self, left, op, right):
+        lhs = self._compile_operand(left)
+        if isinstance(op, (ast.In, ast.NotIn)):
+            try:
+                values = pa.array(ast.literal_eval(right))
+            except (ValueError, TypeError, pa.ArrowException):
+                self.__logger.error("in requires a list of literals")
+                raise ValueError
+
+            def _isin(batch):
+                array = lhs(batch)
+                value_set = values
+                if value_set.type != array.type:
+                    value_set = value_set.cast(array.type)
+                # Null values evaluate to null, as for comparisons
+                return pc.if_else(
+                    pc.is_valid(array),
+                    pc.is_in(array, value_set=value_set),
+                    pa.scalar(None, pa.bool_()),
+                )
+
+            if isinstance(op, ast.NotIn):
+                return lambda batch: pc.invert(_isin(batch))
+            return _isin
+
+        try:
+            kernel = self._compare[type(op)]
+        except KeyError:
+            self.__logger.error("Unsupported comparison %s", ast.dump(op))
+            raise ValueError
+        rhs = self._compile_operand(right)
+        return lambda batch: kernel(lhs(batch), rhs(batch))
+
+    def _compile_operand(self, node):
+        """
+        Column reference or literal scalar
+        """
+        if isinstance(node, ast.Name):
+            return self._column(node.id)
+        if (
+            isinstance(node, ast.Call)
+            and getattr(node.func, "id", None) == "col"
+            and len(node.args) == 1
+        ):
+            return self._column(ast.literal_eval(node.args[0]))
+        try:
+            scalar = pa.scalar(ast.literal_eval(node))
+        except (ValueError, TypeError, pa.ArrowException):
+            self.__logger.error("Unsupported operand %s", ast.dump(node))
+            raise ValueError
+        return lambda batch: scalar
+
+    def _column(self, name):
+        if name not in self._columns:
+            self._columns.append(name)
+        return lambda batch: batch.column(name)
+
+    def mask(self, record_batch):
+        """
+        Evaluate the expression on a record batch
+
+        Parameters
+        ----------
+        record_batch : pa.RecordBatch
+
+        Returns
+        -------
+        pa.BooleanArray
+        """
+        return self._mask(record_batch)
+
+    def execute(self, record_batch):
+        """
+        Select rows of a record batch
+
+        Parameters
+        ----------
+        record_batch : pa.RecordBatch
+
+        Returns
+        -------
+        pa.RecordBatch
+        """
+        try:
+            mask = self._mask(record_batch)
+        except Exception:
+            self.__logger.error("Cannot evaluate expression %s", self.expression)
+            raise
+        return record_batch.filter(mask)
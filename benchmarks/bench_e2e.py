@@ -0,0 +1,242 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+End-to-end benchmarks of Artemis jobs
+
+Each sample runs Artemis.control() on a new dataset of the same store,
+the menu and configuration are registered once in setup.
+Input files are generated in setup, the legacy job generates its input.
+"""
+import tempfile
+import uuid
+
+from artemis.generators.parallelgen import ParallelGenerator
+from artemis.generators.simutablegen import SimuTableGen
+from artemis.meta.cronus import BaseObjectStore
+from artemis.io.protobuf.artemis_pb2 import JobInfo as JobInfo_pb
+from artemis.io.protobuf.cronus_pb2 import MenuObjectInfo, ConfigObjectInfo
+from artemis.io.protobuf.cronus_pb2 import TableObjectInfo
+from artemis.io.protobuf.table_pb2 import Table
+
+from benchmarks.common import MF_SCHEMA, SEED, reset_gate
+
+SIZES = [[10000, 100000], [1, 4]]
+SIZE_NAMES = ["num_rows", "nbatches"]
+
+
+def import_artemis():
+    """
+    Menus are built with pygraphviz, skip if not installed
+    """
+    try:
+        import pygraphviz  # noqa: F401
+    except ImportError:
+        raise NotImplementedError("pygraphviz is not installed")
+    from artemis.artemis import Artemis
+    from artemis.configurables.factories import MenuFactory, JobConfigFactory
+
+    return Artemis, MenuFactory, JobConfigFactory
+
+
+class ArtemisJobMixin:
+    """
+    Registers a menu and configuration, runs jobs on new datasets
+    """
+
+    number = 1
+    repeat = 3
+
+    def setup_store(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.store = BaseObjectStore(self.tmpdir.name, "artemis")
+        self.parentset_id = ""
+
+    def register_job(self, msgmenu, config):
+        menuinfo = MenuObjectInfo()
+        menuinfo.created.GetCurrentTime()
+        configinfo = ConfigObjectInfo()
+        configinfo.created.GetCurrentTime()
+        self.menu_id = self.store.register_content(msgmenu, menuinfo).uuid
+        self.config_id = self.store.register_content(config._msg, configinfo).uuid
+
+    def generate_inputs(self, file_type, num_rows, nbatches):
+        """
+        Generate nbatches files of num_rows from a model in the store
+        """
+        dataset = self.store.register_dataset()
+        self.store.new_partition(dataset.uuid, "generator")
+        job_id = self.store.new_job(dataset.uuid)
+
+        table = Table()
+        table.name = "BenchModel"
+        table.uuid = str(uuid.uuid4())
+        for name, model in [("a", "normal"), ("b", "normal"), ("c", "lognormal")]:
+            field = table.info.schema.info.fields.add()
+            field.name = name
+            field.info.type = "Float"
+            field.info.aux.generator.name = model
+        self.store.register_content(
+            table,
+            TableObjectInfo(),
+            dataset_id=dataset.uuid,
+            job_id=job_id,
+            partition_key="generator",
+        )
+
+        generator = SimuTableGen(
+            "generator",
+            num_rows=num_rows,
+            file_type=file_type,
+            columnar=True,
+            table_id=table.uuid,
+        )
+        ParallelGenerator(generator, nchunks=nbatches, seed=SEED).run(
+            self.store, dataset.uuid, job_id
+        )
+        self.parentset_id = dataset.uuid
+
+    def run_job(self):
+        dataset = self.store.register_dataset(self.menu_id, self.config_id)
+        job_id = self.store.new_job(dataset.uuid)
+        self.store.save_store()
+
+        job = JobInfo_pb()
+        job.name = "bench"
+        job.store_path = self.tmpdir.name
+        job.store_id = self.store.store_uuid
+        job.store_name = self.store.store_name
+        job.menu_id = self.menu_id
+        job.config_id = self.config_id
+        job.dataset_id = dataset.uuid
+        job.parentset_id = self.parentset_id
+        job.job_id = str(job_id)
+        try:
+            # control returns False when the job aborts
+            if self.Artemis(job, loglevel="WARNING").control() is False:
+                raise RuntimeError("Artemis job failed")
+        finally:
+            reset_gate()
+
+    def teardown(self, *params):
+        reset_gate()
+        self.tmpdir.cleanup()
+
+
+class CsvJobSuite(ArtemisJobMixin):
+    params = SIZES
+    param_names = SIZE_NAMES
+
+    def setup(self, num_rows, nbatches):
+        self.Artemis, MenuFactory, JobConfigFactory = import_artemis()
+        self.setup_store()
+        self.generate_inputs(1, num_rows, nbatches)
+
+        menu = MenuFactory("csvgen")
+        msgmenu = menu.build()
+        config = JobConfigFactory(
+            "csvio",
+            msgmenu,
+            jobname="bench",
+            generator_type="file",
+            filehandler_type="csv",
+            nbatches=nbatches,
+            max_file_size=1073741824,
+            write_csv=False,
+            input_glob=".csv",
+        )
+        config.configure()
+        config.add_algos(menu.algos)
+        self.register_job(msgmenu, config)
+
+    def time_control(self, num_rows, nbatches):
+        self.run_job()
+
+
+class IpcJobSuite(ArtemisJobMixin):
+    params = SIZES
+    param_names = SIZE_NAMES
+
+    def setup(self, num_rows, nbatches):
+        self.Artemis, _, JobConfigFactory = import_artemis()
+        from benchmarks.menus import ProfilerMenu
+
+        self.setup_store()
+        self.generate_inputs(5, num_rows, nbatches)
+
+        menu = ProfilerMenu("profiler")
+        msgmenu = menu.build()
+        config = JobConfigFactory(
+            "csvio",
+            msgmenu,
+            jobname="bench",
+            generator_type="file",
+            filehandler_type="ipc",
+            nbatches=nbatches,
+            max_file_size=1073741824,
+            write_csv=False,
+            input_glob=".arrow",
+        )
+        config.configure()
+        config.add_algos(menu.algos)
+        self.register_job(msgmenu, config)
+
+    def time_control(self, num_rows, nbatches):
+        self.run_job()
+
+
+class LegacyJobSuite(ArtemisJobMixin):
+    params = SIZES
+    param_names = SIZE_NAMES
+
+    def setup(self, num_rows, nbatches):
+        self.Artemis, MenuFactory, JobConfigFactory = import_artemis()
+        try:
+            import pyfwfr  # noqa: F401
+        except ImportError:
+            raise NotImplementedError("pyfwfr is not installed")
+
+        self.setup_store()
+        columns = {f"column_{i}": field for i, field in enumerate(MF_SCHEMA)}
+        menu = MenuFactory("legacygen")
+        msgmenu = menu.build()
+        config = JobConfigFactory(
+            "legacygen",
+            msgmenu,
+            generator_type="legacy",
+            nbatches=nbatches,
+            num_rows=num_rows,
+            header="header",
+            header_offset=20,
+            footer="footer",
+            footer_size=20,
+            delimiter="\r\n",
+            nrecords_per_block=4095,
+            max_file_size=1073741824,
+            write_csv=False,
+            skip_rows=0,
+            column_names=list(columns),
+            field_widths=[field["length"] for field in MF_SCHEMA],
+        )
+        config.configure(**columns)
+        config.add_algos(menu.algos)
+        self.register_job(msgmenu, config)
+
+    def time_control(self, num_rows, nbatches):
+        self.run_job()
@@ -0,0 +1,135 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Micro-benchmarks of the file handler, output writer and Cronus store
+"""
+import tempfile
+
+from artemis.core.gate import ArtemisGateSvc
+from artemis.core.tree import Element
+from artemis.io.filehandler import FileHandlerTool
+from artemis.io.writer import BufferOutputWriter
+from artemis.meta.cronus import BaseObjectStore
+from artemis.io.protobuf.cronus_pb2 import FileObjectInfo
+
+from benchmarks.common import csv_block, record_batch, reset_gate
+
+
+class StoreMixin:
+    """
+    Temporary store with an empty dataset and partition
+    """
+
+    def setup_store(self, partition_key="generator"):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.store = BaseObjectStore(self.tmpdir.name, "artemis")
+        self.dataset_id = self.store.register_dataset().uuid
+        self.store.new_partition(self.dataset_id, partition_key)
+        self.job_id = self.store.new_job(self.dataset_id)
+
+    def register_file(self, content=b"", filetype=1, partition_key="generator"):
+        fileinfo = FileObjectInfo()
+        fileinfo.type = filetype
+        fileinfo.partition = partition_key
+        return self.store.register_content(
+            content,
+            fileinfo,
+            dataset_id=self.dataset_id,
+            job_id=self.job_id,
+            partition_key=partition_key,
+        )
+
+    def teardown(self, *params):
+        reset_gate()
+        self.tmpdir.cleanup()
+
+
+class FileHandlerSuite(StoreMixin):
+    params = [[100000, 1000000], [2 ** 16, 2 ** 20]]
+    param_names = ["num_rows", "blocksize"]
+
+    def setup(self, num_rows, blocksize):
+        self.setup_store()
+        block = csv_block(num_rows)
+        self.file_id = self.register_file(block).uuid
+        self.store.put(self.file_id, block)
+        ArtemisGateSvc().store = self.store
+        self.handler = FileHandlerTool(
+            "filehandler", filetype="csv", linesep="\n", blocksize=blocksize
+        )
+        self.handler.initialize()
+
+    def time_execute(self, num_rows, blocksize):
+        self.handler.execute(self.file_id)
+
+
+class BufferOutputWriterSuite(StoreMixin):
+    params = [[10, 50], [2 ** 31, 2 ** 22], [False, True]]
+    param_names = ["nbatches", "max_buffer_size", "zone_maps"]
+    number = 1
+
+    def setup(self, nbatches, max_buffer_size, zone_maps):
+        self.setup_store("bench")
+        gate = ArtemisGateSvc()
+        gate.store = self.store
+        gate.meta.dataset_id = self.dataset_id
+        gate.meta.job_id = str(self.job_id)
+        batch = record_batch(10000)
+        self.elements = []
+        for i in range(nbatches):
+            element = Element(str(i))
+            element.add_data(batch)
+            self.elements.append(element)
+        self.schema = batch.schema
+
+    def time_write(self, nbatches, max_buffer_size, zone_maps):
+        writer = BufferOutputWriter(
+            "bufferwriter_bench",
+            BUFFER_MAX_SIZE=max_buffer_size,
+            write_csv=False,
+            zone_maps=zone_maps,
+        )
+        # Schema is set by the collector from the sampled payload
+        writer._schema = self.schema
+        writer.initialize()
+        writer.write(self.elements)
+        writer._finalize()
+
+
+class CronusSuite(StoreMixin):
+    params = [[100, 1000]]
+    param_names = ["nfiles"]
+
+    def setup(self, nfiles):
+        self.setup_store()
+        for _ in range(nfiles):
+            self.register_file()
+
+    def time_register_file(self, nfiles):
+        self.register_file()
+
+    def time_list(self, nfiles):
+        self.store.list(prefix=self.dataset_id, suffix="csv")
+
+    def time_list_partitions(self, nfiles):
+        self.store.list_partitions(self.dataset_id)
+
+    def time_save_store(self, nfiles):
+        self.store.save_store()
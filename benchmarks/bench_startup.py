@@ -0,0 +1,59 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Startup time of a fresh interpreter, paid by every sub-job process
+"""
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules loaded by a job reading csv files
+CSV_JOB = [
+    "artemis.artemis",
+    "artemis.generators.filegen",
+    "artemis.io.filehandler",
+    "artemis.io.writer",
+    "artemis.tools.csvtool",
+    "artemis.tools.tdigesttool",
+    "artemis.algorithms.csvparseralgo",
+    "artemis.algorithms.profileralgo",
+]
+
+
+class StartupSuite:
+    number = 1
+    repeat = 10
+
+    def python(self, code):
+        subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
+
+    def time_interpreter(self):
+        self.python("pass")
+
+    def time_import_pyarrow(self):
+        self.python("import pyarrow")
+
+    def time_import_artemis(self):
+        self.python("import artemis.artemis")
+
+    def time_import_csv_job(self):
+        self.python("import " + ", ".join(CSV_JOB))
@@ -0,0 +1,149 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Micro-benchmarks of the parser and profiling tools
+"""
+import numpy as np
+
+from artemis.core.book import ArtemisBook
+from artemis.externals.tdigest.tdigest import TDigest
+from artemis.generators.legacygen import GenMF
+from artemis.tools.csvtool import CsvTool
+from artemis.tools.mftool import MfTool
+from artemis.tools.tdigesttool import TDigestTool
+
+from benchmarks.common import MF_SCHEMA, SEED, csv_block, record_batch, reset_gate
+
+
+class CsvToolSuite:
+    params = [[10000, 100000], [False, True]]
+    param_names = ["num_rows", "dictionary_encode"]
+
+    def setup(self, num_rows, dictionary_encode):
+        self.block = csv_block(num_rows)
+        self.tool = CsvTool(
+            "csvtool",
+            block_size=2 * self.block.size,
+            dictionary_encode=dictionary_encode,
+        )
+        self.tool.initialize()
+        self.tool.sample(self.block)
+
+    def teardown(self, num_rows, dictionary_encode):
+        reset_gate()
+
+    def time_execute(self, num_rows, dictionary_encode):
+        self.tool.execute(self.block)
+
+
+class MfToolSuite:
+    params = [[1000, 10000]]
+    param_names = ["num_rows"]
+
+    def setup(self, num_rows):
+        generator = GenMF(
+            "generator", ds_schema=MF_SCHEMA, num_rows=num_rows, seed=SEED
+        )
+        self.chunk = generator.gen_chunk()
+        self.tool = MfTool("legacytool", ds_schema=MF_SCHEMA)
+
+    def teardown(self, num_rows):
+        reset_gate()
+
+    def time_execute(self, num_rows):
+        self.tool.execute(self.chunk)
+
+
+class FwfToolSuite:
+    params = [[10000, 100000]]
+    param_names = ["num_rows"]
+
+    def setup(self, num_rows):
+        try:
+            from artemis.tools.fwftool import FwfTool
+        except ImportError:
+            raise NotImplementedError("pyfwfr is not installed")
+        generator = GenMF(
+            "generator", ds_schema=MF_SCHEMA, num_rows=num_rows, seed=SEED
+        )
+        self.chunk = generator.gen_chunk()
+        widths = [field["length"] for field in MF_SCHEMA]
+        self.tool = FwfTool(
+            "fwftool",
+            block_size=2 * len(self.chunk),
+            is_cobol=True,
+            skip_rows=0,
+            column_names=[f"column_{i}" for i in range(len(widths))],
+            field_widths=widths,
+            encoding="cp500,swaplfnl",
+        )
+        self.tool.initialize()
+
+    def teardown(self, num_rows):
+        reset_gate()
+
+    def time_execute(self, num_rows):
+        self.tool.execute(self.chunk)
+
+
+class TDigestSuite:
+    params = [[1000, 10000]]
+    param_names = ["num_rows"]
+
+    def setup(self, num_rows):
+        self.batch = record_batch(num_rows)
+        self.values = np.random.RandomState(SEED).normal(size=num_rows)
+        self.tool = TDigestTool("tdigesttool")
+
+    def teardown(self, num_rows):
+        reset_gate()
+
+    def time_batch_update(self, num_rows):
+        TDigest().batch_update(self.values)
+
+    def time_tool_execute(self, num_rows):
+        self.tool.execute(self.batch)
+
+
+class ArtemisBookSuite:
+    params = [[1, 1000, 100000]]
+    param_names = ["size"]
+
+    def setup(self, size):
+        self.book = ArtemisBook()
+        self.book.book("bench", "hist", range(101))
+        values = np.random.RandomState(SEED).uniform(0, 100, size)
+        self.data = values[0] if size == 1 else values
+
+    def time_fill(self, size):
+        self.book.fill("bench", "hist", self.data)
+
+
+class ArtemisBookTimerSuite(ArtemisBookSuite):
+    # Timers keep all values before rebook, bound the number of calls
+    params = [[1, 1000]]
+    number = 100
+
+    def setup(self, size):
+        super().setup(size)
+        self.book.book("bench", "timer", range(101), timer=True)
+
+    def time_fill(self, size):
+        self.book.fill("bench", "timer", self.data)
@@ -0,0 +1,71 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Fixed, seeded input data shared by the benchmarks
+"""
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv
+
+from artemis.core.singleton import Singleton
+from artemis.core.gate import ArtemisGateSvc
+from artemis.core.datastore import ArrowSets
+
+SEED = 42
+
+MF_SCHEMA = [
+    {"utype": "int", "length": 10, "min_val": -1000, "max_val": 1000},
+    {"utype": "uint", "length": 6, "min_val": 0, "max_val": 10},
+    {"utype": "str", "length": 4},
+]
+
+
+def record_batch(nrows, seed=SEED):
+    """
+    Record batch of numeric and low-cardinality string columns
+    """
+    rng = np.random.RandomState(seed)
+    provinces = np.array(["ON", "QC", "BC", "AB", "MB", "NS"])
+    return pa.RecordBatch.from_arrays(
+        [
+            pa.array(np.arange(nrows)),
+            pa.array(rng.normal(size=nrows)),
+            pa.array(rng.lognormal(size=nrows)),
+            pa.array(rng.randint(0, 100, nrows)),
+            pa.array(provinces[rng.randint(0, len(provinces), nrows)]),
+        ],
+        ["id", "normal", "lognormal", "age", "province"],
+    )
+
+
+def csv_block(nrows, seed=SEED):
+    """
+    record_batch as a csv buffer with a header, lines end with \\n
+    """
+    sink = pa.BufferOutputStream()
+    table = pa.Table.from_batches([record_batch(nrows, seed)])
+    pyarrow.csv.write_csv(table, sink)
+    return sink.getvalue()
+
+
+def reset_gate():
+    for service in (ArtemisGateSvc, ArrowSets):
+        if Singleton.exists(service):
+            Singleton.reset(service)
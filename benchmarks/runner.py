@@ -0,0 +1,301 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Runs the benchmark suite and tracks regressions in a JSON history
+
+Benchmarks follow the asv conventions. Each class in a benchmarks.bench_*
+module with time_* methods is a benchmark suite, with optional attributes
+    params : list of lists of parameter values
+    param_names : name of each parameter
+    number : calls per sample, scaled to sample_time if 0
+    repeat : number of samples
+and methods setup(*params) and teardown(*params) called around the samples.
+setup raising NotImplementedError skips the benchmark,
+e.g. for an optional dependency.
+
+    python -m benchmarks.runner run [-b pattern] [--label name]
+    python -m benchmarks.runner compare [--base -2] [--head -1] [--threshold 1.1]
+
+Each run is appended to the history with the commit and environment.
+compare exits with status 1 if any benchmark regressed by more than threshold.
+"""
+import argparse
+import datetime
+import importlib
+import inspect
+import itertools
+import json
+import logging
+import os
+import pkgutil
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import timeit
+import warnings
+
+HISTORY = os.path.join(os.path.dirname(__file__), "results", "history.json")
+
+
+def discover(pattern=None):
+    """
+    Benchmark classes of all benchmarks.bench_* modules
+
+    Parameters
+    ----------
+    pattern : regular expression on the benchmark name
+
+    Returns
+    -------
+    list of (name, class, method name, params)
+    """
+    package = os.path.dirname(__file__)
+    benchmarks = []
+    for info in sorted(pkgutil.iter_modules([package]), key=lambda m: m.name):
+        if not info.name.startswith("bench_"):
+            continue
+        module = importlib.import_module(f"benchmarks.{info.name}")
+        for cname, class_ in inspect.getmembers(module, inspect.isclass):
+            if class_.__module__ != module.__name__:
+                continue
+            methods = [m for m in dir(class_) if m.startswith("time_")]
+            params = getattr(class_, "params", [])
+            names = getattr(class_, "param_names", [])
+            for method, values in itertools.product(
+                methods, itertools.product(*params)
+            ):
+                name = f"{info.name}.{cname}.{method}"
+                if values:
+                    args = ", ".join(f"{k}={v!r}" for k, v in zip(names, values))
+                    name = f"{name}({args})"
+                if pattern is None or re.search(pattern, name):
+                    benchmarks.append((name, class_, method, values))
+    return benchmarks
+
+
+def measure(class_, method, params, sample_time=0.2, repeat=None):
+    """
+    Time a benchmark method
+
+    Returns
+    -------
+    dict of min, median and max seconds per call, number and repeat,
+    or None if the benchmark is skipped
+    """
+    suite = class_()
+    try:
+        if hasattr(suite, "setup"):
+            suite.setup(*params)
+    except NotImplementedError:
+        return None
+    try:
+        func = getattr(suite, method)
+        timer = timeit.Timer(lambda: func(*params))
+        number = getattr(suite, "number", 0)
+        if not number:
+            # Scale the calls per sample, as timeit.autorange
+            number = 1
+            while True:
+                elapsed = timer.timeit(number)
+                if elapsed >= sample_time or number >= 10 ** 6:
+                    break
+                number = max(number * 2, int(number * sample_time / max(elapsed, 1e-9)))
+        repeat = repeat or getattr(suite, "repeat", 5)
+        samples = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    finally:
+        if hasattr(suite, "teardown"):
+            suite.teardown(*params)
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "max": max(samples),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def environment():
+    """
+    Commit and versions of the run
+    """
+    import numpy
+    import pyarrow
+
+    try:
+        commit = subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(__file__),
+            stderr=subprocess.DEVNULL,
+        )
+        commit = commit.decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = ""
+    return {
+        "commit": commit,
+        "machine": platform.node(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "numpy": numpy.__version__,
+        "pyarrow": pyarrow.__version__,
+    }
+
+
+def load_history(path):
+    if not os.path.exists(path):
+        return {"runs": []}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_history(history, path):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(history, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def format_time(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g}{unit}"
+    return f"{seconds / 1e-9:.3g}ns"
+
+
+def run(args):
+    benchmarks = discover(args.bench)
+    if not benchmarks:
+        print(f"No benchmarks match {args.bench}")
+        return 1
+
+    results = {}
+    for name, class_, method, params in benchmarks:
+        try:
+            result = measure(class_, method, params, args.sample_time, args.repeat)
+        except Exception as error:
+            print(f"{'failed':>10}  {name}: {error!r}")
+            continue
+        if result is None:
+            print(f"{'skipped':>10}  {name}")
+            continue
+        results[name] = result
+        print(f"{format_time(result['median']):>10}  {name}")
+
+    entry = environment()
+    entry["label"] = args.label or entry["commit"]
+    entry["timestamp"] = datetime.datetime.now().isoformat(timespec="seconds")
+    entry["results"] = results
+    if not args.dry_run:
+        history = load_history(args.history)
+        history["runs"].append(entry)
+        save_history(history, args.history)
+        print(f"Run {entry['label']} saved to {args.history}")
+    return 0
+
+
+def compare_runs(base, head, threshold=1.1, stat="median"):
+    """
+    Ratio head / base of the benchmarks in both runs
+
+    Returns
+    -------
+    list of (name, base seconds, head seconds, ratio, flag)
+    flag is "+" for a regression, "-" for an improvement
+    """
+    rows = []
+    for name in sorted(set(base["results"]) & set(head["results"])):
+        before = base["results"][name][stat]
+        after = head["results"][name][stat]
+        ratio = after / before if before > 0 else float("inf")
+        if ratio > threshold:
+            flag = "+"
+        elif ratio < 1 / threshold:
+            flag = "-"
+        else:
+            flag = ""
+        rows.append((name, before, after, ratio, flag))
+    return rows
+
+
+def compare(args):
+    runs = load_history(args.history)["runs"]
+    try:
+        base = runs[args.base]
+        head = runs[args.head]
+    except IndexError:
+        print(f"History {args.history} has {len(runs)} runs")
+        return 1
+
+    print(f"base {base['label']} ({base['timestamp']})")
+    print(f"head {head['label']} ({head['timestamp']})")
+    rows = compare_runs(base, head, args.threshold, args.stat)
+    for name, before, after, ratio, flag in rows:
+        print(
+            f"{flag:1} {format_time(before):>10} {format_time(after):>10} "
+            f"{ratio:6.2f}  {name}"
+        )
+    regressions = [row for row in rows if row[-1] == "+"]
+    if regressions:
+        print(f"{len(regressions)} benchmarks regressed by more than {args.threshold}")
+        return 1
+    print("No regressions")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.runner")
+    parser.add_argument("--history", default=HISTORY, help="JSON history file")
+    commands = parser.add_subparsers(dest="command")
+    commands.required = True
+
+    run_parser = commands.add_parser("run", help="Run benchmarks")
+    run_parser.add_argument("-b", "--bench", help="Regex on benchmark names")
+    run_parser.add_argument("--label", help="Name of the run, default commit")
+    run_parser.add_argument("--repeat", type=int, help="Samples per benchmark")
+    run_parser.add_argument(
+        "--sample-time", type=float, default=0.2, help="Seconds per sample"
+    )
+    run_parser.add_argument(
+        "--dry-run", action="store_true", help="Do not save to the history"
+    )
+    run_parser.add_argument("--loglevel", default="WARNING")
+    run_parser.set_defaults(func=run)
+
+    compare_parser = commands.add_parser("compare", help="Compare two runs")
+    compare_parser.add_argument("--base", type=int, default=-2, help="Run index")
+    compare_parser.add_argument("--head", type=int, default=-1, help="Run index")
+    compare_parser.add_argument(
+        "--threshold", type=float, default=1.1, help="Ratio flagged as regression"
+    )
+    compare_parser.add_argument("--stat", default="median", choices=["min", "median"])
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        logging.getLogger().setLevel(args.loglevel)
+        warnings.simplefilter("ignore", FutureWarning)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -30,7 +30,7 @@ def main():
         version='0.6.0',
         author='Ryan White',
         author_email='ryan.white4@canada.ca',
-        packages=find_packages(),
+        packages=find_packages(exclude=['benchmarks', 'benchmarks.*']),
         ext_modules=cythonize(ext_modules),
         cmdclass={'build_ext': build_ext_},
         package_data={
@@ -47,6 +47,13 @@ def link_arrow(ext):
     ext.include_dirs.append(pa.get_include())
     ext.library_dirs.extend(pa.get_library_dirs())
     ext.libraries.extend(pa.get_libraries())
+    # pip wheels bundle versioned libraries (libarrow.so.700) in the package,
+    # built with the pre-C++11 ABI, conda links against the shared prefix
+    pa_dir = os.path.dirname(pa.__file__)
+    if os.name == 'posix' and any(f.startswith('libarrow.so.') for f in os.listdir(pa_dir)):
+        pa.create_library_symlinks()
+        ext.define_macros.append(('_GLIBCXX_USE_CXX11_ABI', '0'))
+        ext.runtime_library_dirs.append(pa_dir)
 
 def make_ext(name, sources, include_arrow=True, quiet=True):
     """
@@ -0,0 +1,139 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import tempfile
+
+import numpy as np
+import pyarrow as pa
+
+from artemis.core.gate import ArtemisGateSvc
+from artemis.core.singleton import Singleton
+from artemis.core.sketch import BloomFilter
+from artemis.core.tree import Element
+from artemis.io.writer import BufferOutputWriter
+from artemis.meta.bloom import bloom_filter, contains, filter_type, from_protobuf
+from artemis.meta.bloom import key_hashes
+from artemis.meta.cronus import BaseObjectStore
+
+
+class BloomFilterTestCase(unittest.TestCase):
+    def test_filter(self):
+        bloom = BloomFilter.optimal(10000, 0.01)
+        assert bloom.num_hashes == 7
+        keys = key_hashes(pa.array(np.arange(10000)))
+        bloom.update(keys)
+        assert bloom.contains(keys).all()
+        others = key_hashes(pa.array(np.arange(10000, 110000)))
+        assert bloom.contains(others).mean() < 0.02
+
+        # Keys hash the same in any integer, dictionary or chunked column
+        ints = key_hashes(pa.array([1, None, 2], pa.int16()))
+        assert ints.tolist() == key_hashes([1, 2]).tolist()
+        words = pa.array(["a", "b", None, "a"])
+        assert key_hashes(words.dictionary_encode()).tolist() == (
+            key_hashes(pa.chunked_array([words[:2], words[2:]])).tolist()
+        )
+
+        msg = bloom_filter("id", np.concatenate([keys, keys]), fpp=0.01)
+        assert msg.num_keys == 10000
+        assert filter_type(msg) is None
+        restored = from_protobuf(msg)
+        assert (restored.bits == bloom.bits).all()
+        msg = bloom_filter("id", keys, type_=pa.dictionary(pa.int8(), pa.int32()))
+        assert filter_type(msg) == pa.int64()
+
+        with self.assertRaises(ValueError):
+            BloomFilter(0, 1)
+
+    def test_contains(self):
+        self.addCleanup(Singleton.reset, ArtemisGateSvc)
+        with tempfile.TemporaryDirectory() as dirpath:
+            store = BaseObjectStore(dirpath, "artemis")
+            dataset_id = store.register_dataset().uuid
+            gate = ArtemisGateSvc()
+            gate.store = store
+            gate.meta.dataset_id = dataset_id
+            gate.meta.job_id = str(store.new_job(dataset_id))
+            store.new_partition(dataset_id, "test")
+
+            batches = [
+                pa.RecordBatch.from_arrays(
+                    [pa.array(np.arange(i * 1000, (i + 1) * 1000) * 7)], ["id"]
+                )
+                for i in range(4)
+            ]
+            writer = BufferOutputWriter(
+                "writer_test",
+                write_csv=True,
+                bloom_keys=["id"],
+                BUFFER_MAX_SIZE=2 * pa.get_record_batch_size(batches[0]),
+            )
+            writer._schema = batches[0].schema
+            writer.initialize()
+            elements = []
+            for i, batch in enumerate(batches):
+                el = Element(str(i))
+                el.add_data(batch)
+                elements.append(el)
+            writer.write(elements)
+            writer._finalize()
+
+            first, second = [
+                f for f in store[dataset_id].dataset.files if f.file.type == 5
+            ]
+            assert [b.key for b in first.file.blooms] == ["id"]
+            assert first.file.blooms[0].num_keys == 2000
+
+            keys = [7, 14007, 14000 * 7, None]
+            selected = contains(store, dataset_id, "id", keys)
+            assert [s[0] for s in selected] == [first.uuid, second.uuid]
+            assert selected[0][1].tolist() == [True, False, False, False]
+            assert selected[1][1].tolist() == [False, True, False, False]
+            assert contains(store, dataset_id, "id", [-1, 3]) == []
+            # Files without a filter of the key could contain any key
+            selected = contains(store, dataset_id, "other", [1])
+            assert len(selected) == 2
+
+            # Keys are cast to the type of the key column of each file
+            selected = contains(store, dataset_id, "id", pa.array([7.0, 14007.0]))
+            assert [s[0] for s in selected] == [first.uuid, second.uuid]
+            store.new_partition(dataset_id, "floats")
+            batch = pa.RecordBatch.from_arrays(
+                [pa.array(np.arange(100, dtype="float64"))], ["id"]
+            )
+            writer = BufferOutputWriter(
+                "writer_floats", write_csv=False, bloom_keys=["id"]
+            )
+            writer._schema = batch.schema
+            writer.initialize()
+            el = Element("floats")
+            el.add_data(batch)
+            writer.write([el])
+            writer._finalize()
+            selected = contains(store, dataset_id, "id", [3, 200], partition="floats")
+            assert len(selected) == 1
+            assert selected[0][1].tolist() == [True, False]
+            # Keys which cannot be cast could be in any file
+            selected = contains(store, dataset_id, "id", ["x"], partition="floats")
+            assert len(selected) == 1
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,221 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import tempfile
+import urllib.parse
+import uuid
+
+import pyarrow as pa
+
+from artemis.artemis import Artemis
+from artemis.algorithms.csvparseralgo import CsvParserAlgo
+from artemis.core.context import JobContext
+from artemis.generators.filegen import FileGenerator
+from artemis.io.filehandler import FileHandlerTool
+from artemis.io.writer import BufferOutputWriter
+from artemis.meta.cronus import BaseObjectStore
+from artemis.tools.csvtool import CsvTool
+from artemis.io.protobuf.artemis_pb2 import JobInfo as JobInfo_pb
+from artemis.io.protobuf.configuration_pb2 import Configuration
+from artemis.io.protobuf.cronus_pb2 import ConfigObjectInfo, MenuObjectInfo
+from artemis.io.protobuf.cronus_pb2 import FileObjectInfo, JobCheckpoint
+from artemis.io.protobuf.menu_pb2 import Menu
+
+
+class Crash(Exception):
+    pass
+
+
+class CheckpointTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        store = BaseObjectStore(self.tmpdir.name, "artemis")
+
+        # Input dataset of csv files
+        parentset = store.register_dataset()
+        store.new_partition(parentset.uuid, "generator")
+        self.ids = []
+        for i in range(4):
+            rows = "".join(f"{50 * i + j},{['ON', 'QC'][j % 2]}\r\n" for j in range(50))
+            content = ("a,b\r\n" + rows).encode()
+            fileinfo = FileObjectInfo()
+            fileinfo.type = 1
+            fileinfo.partition = "generator"
+            obj = store.register_content(
+                content,
+                fileinfo,
+                dataset_id=parentset.uuid,
+                partition_key="generator",
+                job_id=0,
+            )
+            with open(urllib.parse.urlparse(obj.address).path, "wb") as f:
+                f.write(content)
+            self.ids.append(obj.uuid)
+
+        menu = Menu()
+        menu.uuid = str(uuid.uuid4())
+        menu.name = f"{menu.uuid}.menu.pb"
+        graph = menu.graphs.add()
+        graph.name = "chain"
+        node = graph.nodes.add()
+        node.name = "initial"
+        node.algos.append("iorequest")
+        node = graph.nodes.add()
+        node.name = "seqA"
+        node.parents.append("initial")
+        node.algos.append("csvparser")
+
+        config = Configuration()
+        config.uuid = str(uuid.uuid4())
+        config.name = f"{config.uuid}.config.pb"
+        config.max_malloc_size_bytes = 2147483648
+        config.checkpoint_ndatums = 1
+        generator = FileGenerator("generator", glob="csv", nsamples=1, seed=42)
+        config.input.generator.config.CopyFrom(generator.to_msg())
+        tools = [
+            FileHandlerTool("filehandler", filetype="csv", blocksize=2 ** 16),
+            CsvTool("csvtool", block_size=2 ** 17, dictionary_encode=True),
+            BufferOutputWriter("bufferwriter", write_csv=False),
+        ]
+        for tool in tools:
+            config.tools[tool.name].CopyFrom(tool.to_msg())
+        config.algos.add().CopyFrom(CsvParserAlgo("csvparser").to_msg())
+
+        menu_id = store.register_content(menu, MenuObjectInfo()).uuid
+        config_id = store.register_content(config, ConfigObjectInfo()).uuid
+        dataset = store.register_dataset(menu_id, config_id)
+
+        self.job = JobInfo_pb()
+        self.job.name = "checkpoint"
+        self.job.store_path = self.tmpdir.name
+        self.job.store_id = store.store_uuid
+        self.job.store_name = store.store_name
+        self.job.menu_id = menu_id
+        self.job.config_id = config_id
+        self.job.dataset_id = dataset.uuid
+        self.job.parentset_id = parentset.uuid
+        self.job.job_id = str(store.new_job(dataset.uuid))
+        store.save_store()
+
+    def run_job(self, crash_after=None):
+        """
+        Run the job with the store as persisted before the job,
+        optionally failing after a number of processed datums
+        """
+        store = BaseObjectStore(
+            self.tmpdir.name, self.job.store_name, store_uuid=self.job.store_id
+        )
+        context = JobContext("checkpoint")
+        datums = []
+
+        def heartbeat(summary):
+            if not datums or datums[-1] != context.gate.current_file:
+                datums.append(context.gate.current_file)
+            if crash_after is not None and len(datums) > crash_after:
+                raise Crash
+
+        context.heartbeat = heartbeat
+        status = Artemis(
+            self.job, loglevel="WARNING", context=context, store=store
+        ).control()
+        return status, store, context, datums
+
+    def read_outputs(self, store):
+        rows = []
+        for obj in store[self.job.dataset_id].dataset.files:
+            reader = pa.ipc.open_file(store.get(obj.uuid))
+            rows.extend(reader.read_all().column("a").to_pylist())
+        return sorted(rows)
+
+    def test_resume(self):
+        status, store, context, datums = self.run_job(crash_after=2)
+        assert status is False
+        assert datums == self.ids[:3]
+        checkpoint = store.load_checkpoint(self.job.dataset_id, self.job.job_id)
+        assert list(checkpoint.datums) == self.ids[:2]
+        assert checkpoint.processed_ndatums == 2
+        assert list(checkpoint.schemas) == ["seqA"]
+        assert list(checkpoint.states) == ["csvtool"]
+        assert len(checkpoint.files) == 2
+
+        # Restart, the completed datums are skipped
+        status, store, context, datums = self.run_job()
+        assert status is None
+        assert datums == self.ids[2:]
+        assert context.meta.summary.processed_ndatums == 4
+        assert context.hbook["artemis.counts"].total == 4
+        assert self.read_outputs(store) == list(range(200))
+        schema = context.tools.get("writer_seqA")._schema
+        assert schema.field_by_name("b").type == pa.dictionary(pa.int16(), pa.string())
+        assert store.load_checkpoint(self.job.dataset_id, self.job.job_id) is None
+        assert list(store.list_watermark(self.job.dataset_id)) == self.ids
+
+    def test_disabled(self):
+        config = Configuration()
+        store = BaseObjectStore(
+            self.tmpdir.name, self.job.store_name, store_uuid=self.job.store_id
+        )
+        store.get(self.job.config_id, config)
+        config.checkpoint_ndatums = 0
+        config.uuid = str(uuid.uuid4())
+        config.name = f"{config.uuid}.config.pb"
+        self.job.config_id = store.register_content(config, ConfigObjectInfo()).uuid
+        store.save_store()
+
+        status, store, context, datums = self.run_job(crash_after=2)
+        assert status is False
+        assert store.load_checkpoint(self.job.dataset_id, self.job.job_id) is None
+        status, store, context, datums = self.run_job()
+        assert status is None
+        assert datums == self.ids
+        assert self.read_outputs(store) == list(range(200))
+        assert list(store.list_watermark(self.job.dataset_id)) == self.ids
+
+    def test_store(self):
+        store = BaseObjectStore(
+            self.tmpdir.name, self.job.store_name, store_uuid=self.job.store_id
+        )
+        dataset_id = self.job.dataset_id
+        assert store.load_checkpoint(dataset_id, "1") is None
+
+        checkpoint = JobCheckpoint()
+        checkpoint.job_id = "1"
+        checkpoint.datums.append("datum")
+        checkpoint.partitions.append("seqA")
+        obj = checkpoint.files.add()
+        obj.uuid = str(uuid.uuid4())
+        obj.name = f"{dataset_id}.job_1.part_seqA.{obj.uuid}.arrow"
+        obj.parent_uuid = dataset_id
+        store.save_checkpoint(dataset_id, "1", checkpoint)
+        assert store.load_checkpoint(dataset_id, "1") == checkpoint
+
+        store.restore_checkpoint(dataset_id, checkpoint)
+        store.restore_checkpoint(dataset_id, checkpoint)
+        assert list(store.list_partitions(dataset_id)) == ["seqA"]
+        assert [f.uuid for f in store[dataset_id].dataset.files] == [obj.uuid]
+        assert obj.uuid in store
+
+        store.remove_checkpoint(dataset_id, "1")
+        assert store.load_checkpoint(dataset_id, "1") is None
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import logging
+import os
+import tempfile
+import threading
+
+from artemis.logger import Logger
+from artemis.core.context import JobContext, current_context
+from artemis.core.singleton import Singleton
+from artemis.core.gate import ArtemisGateSvc
+from artemis.core.datastore import ArrowSets
+
+
+class JobContextTestCase(unittest.TestCase):
+    def tearDown(self):
+        for service in (ArtemisGateSvc, ArrowSets):
+            if Singleton.exists(service):
+                Singleton.reset(service)
+
+    def test_isolation(self):
+        first = JobContext("first")
+        second = JobContext("second")
+        with first:
+            gate = ArtemisGateSvc()
+            assert ArtemisGateSvc() is gate
+            assert current_context() is first
+            ArrowSets().add_to_dict("data", 1)
+        with second:
+            assert ArtemisGateSvc() is not gate
+            assert not ArrowSets().contains("data")
+        assert current_context() is None
+        assert first.gate is gate
+        assert first.hbook is gate.hbook
+        assert first.arrowsets.get_data("data") == 1
+        assert not Singleton.exists(ArtemisGateSvc)
+        assert not Singleton.exists(ArrowSets)
+
+        # Process-wide instance outside of any context
+        gate = ArtemisGateSvc()
+        with first:
+            assert ArtemisGateSvc() is not gate
+        assert ArtemisGateSvc() is gate
+
+    def test_reentrant(self):
+        context = JobContext("job")
+        with context:
+            gate = ArtemisGateSvc()
+            with context:
+                assert ArtemisGateSvc() is gate
+                with JobContext("nested"):
+                    assert ArtemisGateSvc() is not gate
+                assert current_context() is context
+            assert current_context() is context
+            Singleton.reset(ArtemisGateSvc)
+            assert not Singleton.exists(ArtemisGateSvc)
+        assert context.run(current_context) is context
+        assert ArtemisGateSvc not in context.services
+
+    def test_concurrent(self):
+        njobs = 4
+        contexts = [JobContext(f"job{i}") for i in range(njobs)]
+        barrier = threading.Barrier(njobs)
+
+        def job(i):
+            hbook = ArtemisGateSvc().hbook
+            hbook.book("job", "counts", range(10))
+            barrier.wait()
+            for _ in range(100):
+                hbook.fill("job", "counts", i)
+                ArrowSets().add_to_dict(f"job{i}", i)
+
+        threads = [
+            threading.Thread(target=contexts[i].run, args=(job, i))
+            for i in range(njobs)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for i, context in enumerate(contexts):
+            assert list(context.hbook.keys()) == ["job.counts"]
+            assert context.hbook["job.counts"].total == 100
+            assert context.hbook["job.counts"].mean() == i
+            assert context.arrowsets.get_data(f"job{i}") == i
+            assert not context.arrowsets.contains(f"job{(i + 1) % njobs}")
+
+    def test_log_handler(self):
+        # Jobs of other tests may have configured a higher level
+        Logger.loglevel(loglevel="INFO")
+        logger = logging.getLogger("artemis.test_context")
+        logger.setLevel(logging.INFO)
+        with tempfile.TemporaryDirectory() as dirpath:
+            first = JobContext("first")
+            second = JobContext("second")
+            for context in (first, second):
+                with context:
+                    path = os.path.join(dirpath, context.name + ".log")
+                    Logger.logfilehandler(path=path)
+                    logger.info("Message from %s", context.name)
+            logger.info("Message outside of any job")
+            for context in (first, second):
+                assert len(context.handlers) == 1
+                context.close()
+                assert context.handlers == []
+                with open(os.path.join(dirpath, context.name + ".log")) as f:
+                    lines = f.readlines()
+                assert len(lines) == 1
+                assert lines[0].endswith(f"Message from {context.name}\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -97,7 +97,9 @@ class CsvToolTestCase(unittest.TestCase):
             
             length = len(data)
             buf = pa.py_buffer(data) 
-            tbatch = tool.execute(buf)
+            tbatches = tool.execute(buf)
+            assert len(tbatches) == 1
+            tbatch = tbatches[0]
             print(batch.schema, batch.num_rows, batch.num_columns)
             print(tbatch.schema, tbatch.num_rows, tbatch.num_columns)
             print(tbatch.to_pydict())
@@ -107,5 +109,92 @@ class CsvToolTestCase(unittest.TestCase):
             assert batch.to_pydict() == tbatch.to_pydict()
             assert batch.equals(tbatch)
 
+    def test_lock_schema(self):
+        tool = CsvTool("tool", block_size=2**16)
+        block1 = pa.py_buffer(b"a,b,c\n,1,x\n,2,y\n")
+        block2 = pa.py_buffer(b"a,b,c\n3,1.5,z\n4,2.5,w\n")
+        block3 = pa.py_buffer(b"a,b,c\n5,7,\n,8,v\n")
+
+        batch1 = tool.sample(block1)[0]
+        assert batch1.schema.field_by_name("a").type == pa.string()
+        assert tool.schema.field_by_name("b").type == pa.int64()
+
+        batch2 = tool.sample(block2)[0]
+        assert batch2.schema == tool.schema
+        assert tool.schema.field_by_name("a").type == pa.int64()
+        assert tool.schema.field_by_name("b").type == pa.float64()
+        assert tool.schema.field_by_name("c").type == pa.string()
+
+        # Blocks converted with the locked types, no inference
+        batch3 = tool.execute(block3)[0]
+        assert batch3.schema == tool.schema
+        assert batch3.column(1).to_pylist() == [7.0, 8.0]
+
+    def test_lock_schema_user_types(self):
+        tool = CsvTool("tool", block_size=2**16, column_types={"b": pa.string()})
+        tool.sample(pa.py_buffer(b"a,b\n1,2\n"))
+        batch = tool.execute(pa.py_buffer(b"a,b\n3,4\n"))[0]
+        assert batch.schema.field_by_name("a").type == pa.int64()
+        assert batch.schema.field_by_name("b").type == pa.string()
+
+    def test_multibatch(self):
+        tool = CsvTool("tool", block_size=2**10, use_threads=True)
+        rows = "\n".join(["%i,%i.5,abc%i" % (i, i, i) for i in range(1000)])
+        block = pa.py_buffer(("a,b,c\n" + rows + "\n").encode())
+        batches = tool.sample(block)
+        assert len(batches) > 1
+        for batch in batches:
+            assert batch.schema == tool.schema
+        table = pa.Table.from_batches(tool.execute(block))
+        assert table.num_rows == 1000
+        assert table.column(0).to_pylist() == list(range(1000))
+
+    def test_dictionary_encode(self):
+        tool = CsvTool("tool", block_size=2**16, dictionary_encode=True,
+                       dictionary_max_ratio=0.5)
+        rows = [b"%i,%s,x%i" % (i, [b"ON", b"QC", b"BC"][i % 3], i)
+                for i in range(12)]
+        block1 = pa.py_buffer(b"a,b,c\n" + b"\n".join(rows[:6]) + b"\n")
+        block2 = pa.py_buffer(b"a,b,c\n" + b"\n".join(rows[6:]) + b"\n")
+
+        batch = tool.sample(block1)[0]
+        assert list(tool.dictionaries) == ["b"]
+        assert tool.schema.field_by_name("b").type == \
+            pa.dictionary(pa.int16(), pa.string())
+        assert tool.schema.field_by_name("c").type == pa.string()
+        assert batch.schema == tool.schema
+        assert batch.column(1).dictionary.to_pylist() == ["BC", "ON", "QC"]
+        assert batch.column(1).to_pylist() == ["ON", "QC", "BC"] * 2
+
+        # Unseen values are appended, existing indices are stable
+        block3 = pa.py_buffer(b"a,b,c\n1,NB,x\n2,,y\n3,ON,z\n")
+        batch = tool.execute(block2)[0]
+        assert batch.column(1).dictionary.to_pylist() == ["BC", "ON", "QC"]
+        batch = tool.execute(block3)[0]
+        assert batch.schema == tool.schema
+        assert batch.column(1).dictionary.to_pylist() == ["BC", "ON", "QC", "NB", ""]
+        assert batch.column(1).indices.to_pylist() == [3, 4, 1]
+        assert batch.column(1).to_pylist() == ["NB", "", "ON"]
+
+    def test_dictionary_max_size(self):
+        tool = CsvTool("tool", block_size=2**16, dictionary_encode=True,
+                       dictionary_max_size=2)
+        rows = [b"%i,%s" % (i, [b"ON", b"QC", b"BC"][i % 3]) for i in range(60)]
+        block = pa.py_buffer(b"a,b\n" + b"\n".join(rows) + b"\n")
+        batch = tool.sample(block)[0]
+        assert tool.dictionaries == {}
+        assert batch.schema.field_by_name("b").type == pa.string()
+
+    def test_include_columns(self):
+        tool = CsvTool("tool", block_size=2**16)
+        tool.include_columns(["c", "a"])
+        block = pa.py_buffer(b"a,b,c\n1,x,2.5\n3,y,4.5\n")
+        batch = tool.sample(block)[0]
+        assert batch.schema.names == ["c", "a"]
+        assert tool.schema.names == ["c", "a"]
+        batch = tool.execute(block)[0]
+        assert batch.column(0).to_pylist() == [2.5, 4.5]
+        assert batch.column(1).to_pylist() == [1, 3]
+
 if __name__ == "__main__":
     unittest.main()
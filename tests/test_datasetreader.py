@@ -0,0 +1,116 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import tempfile
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from artemis.core.gate import ArtemisGateSvc
+from artemis.core.singleton import Singleton
+from artemis.core.tree import Element
+from artemis.io.datasetreader import DatasetReader
+from artemis.io.writer import BufferOutputWriter
+from artemis.meta.cronus import BaseObjectStore
+
+
+class DatasetReaderTestCase(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(Singleton.reset, ArtemisGateSvc)
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.store = BaseObjectStore(self.tmpdir.name, "artemis")
+        self.dataset_id = self.store.register_dataset().uuid
+        self.gate = ArtemisGateSvc()
+        self.gate.store = self.store
+        self.gate.meta.dataset_id = self.dataset_id
+        for key in ("seqX", "seqY"):
+            self.store.new_partition(self.dataset_id, key)
+        # Two jobs writing one file per partition
+        for job in range(2):
+            self.gate.meta.job_id = str(self.store.new_job(self.dataset_id))
+            for key in ("seqX", "seqY"):
+                start = 100 * job + (50 if key == "seqY" else 0)
+                columns = [pa.array(range(start, start + 50))]
+                names = ["a"]
+                if key == "seqY":
+                    columns.append(pa.array(["ON", "QC"] * 25).dictionary_encode())
+                    names.append("b")
+                self.write(key, pa.RecordBatch.from_arrays(columns, names))
+
+    def write(self, key, batch):
+        writer = BufferOutputWriter(f"writer_{key}", write_csv=True, zone_maps=True)
+        writer._schema = batch.schema
+        writer.initialize()
+        el = Element(key)
+        el.add_data(batch)
+        writer.write([el])
+        writer._finalize()
+
+    def test_read(self):
+        reader = DatasetReader(self.store, self.dataset_id)
+        assert len(reader.files()) == 4
+        table = reader.to_table()
+        assert sorted(table.column("a").to_pylist()) == list(range(200))
+        assert table.schema.names == ["a", "b"]
+        assert table.column("b").null_count == 100
+
+        # Partition and job pruning from the metadata
+        reader = DatasetReader(
+            self.store, self.dataset_id, partitions=["seqY"], jobs=[1], columns=["b"]
+        )
+        assert len(reader.files()) == 1
+        table = reader.to_table()
+        assert table.schema.names == ["b"]
+        assert table.num_rows == 50
+
+        reader = DatasetReader(
+            self.store, self.dataset_id, partitions=["seqX"], batch_size=20
+        )
+        batches = list(reader)
+        assert max(batch.num_rows for batch in batches) == 20
+        assert sum(batch.num_rows for batch in batches) == 100
+        assert reader.count_rows() == 100
+
+    def test_filter(self):
+        reader = DatasetReader(
+            self.store, self.dataset_id, filter=ds.field("a") >= 190, columns=["a"]
+        )
+        assert sorted(reader.to_table().column("a").to_pylist()) == list(
+            range(190, 200)
+        )
+
+        # Files pruned with the zone maps, rows selected with the row filter
+        reader = DatasetReader(
+            self.store, self.dataset_id, filter="a < 60 and b == 'QC'", columns=["a"]
+        )
+        assert len(reader.files()) == 2
+        table = reader.to_table()
+        assert table.schema.names == ["a"]
+        assert table.column("a").to_pylist() == [51, 53, 55, 57, 59]
+        assert reader.count_rows() == 5
+
+        reader = DatasetReader(self.store, self.dataset_id, filter="a > 500")
+        assert reader.files() == []
+        assert reader.to_table().num_rows == 0
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import unittest
+import logging
+
+import pyarrow as pa
+
+from artemis.core.tool import ToolBase
+from artemis.core.gate import ArtemisGateSvc
+from artemis.core.singleton import Singleton
+from artemis.core.tree import Element
+from artemis.core.datastore import ArrowSets
+from artemis.tools.dqruletool import DQRuleTool
+from artemis.algorithms.dqrulealgo import DQRuleAlgo
+from artemis.io.protobuf.dq_pb2 import DQRuleSet
+
+RULES = """
+rules { name: "age" column: "age" range { min: 0 max: 99 } }
+rules { name: "province" column: "province" codes { codes: ["10", "11"] } }
+rules { name: "code" column: "code" regex: "[A-Z][0-9]{2}" }
+rules { name: "income" column: "income" null_rate { max_rate: 0.1 } }
+rules { name: "adult" expression: "not (age < 18 and income > 0)" }
+"""
+
+
+class DQRuleTestCase(unittest.TestCase):
+    def setUp(self):
+        self.batch = pa.RecordBatch.from_arrays(
+            [
+                pa.array([10, 20, 130, None, 50]),
+                pa.array(["10", "11", "24", "10", None]).dictionary_encode(),
+                pa.array(["A10", "B2", "C30", None, "D40"]),
+                pa.array([1.5, None, 3.5, 4.5, 5.5]),
+            ],
+            ["age", "province", "code", "income"],
+        )
+
+    def tearDown(self):
+        Singleton.reset(ArtemisGateSvc)
+        Singleton.reset(ArrowSets)
+
+    def test_rules(self):
+        tool = DQRuleTool("tool", rules=RULES)
+        assert tool.columns == ["age", "province", "code", "income"]
+        masks = tool.execute(self.batch)
+        result = {name: mask.to_pylist() for name, mask in masks.items()}
+        assert result == {
+            "age": [True, True, False, True, True],
+            "province": [True, True, False, True, True],
+            "code": [True, False, True, True, True],
+            "income": [True, False, True, True, True],
+            "adult": [False, True, True, False, True],
+        }
+
+    def test_invalid(self):
+        for rules in [
+            'rules { name: "a" column: "age" }',
+            'rules { name: "a" range { min: 0 } }',
+            'rules { name: "a" column: "age" range { } }',
+            'rules { name: "a" column: "code" regex: "[A-" }',
+            'rules { name: "a" expression: "age +" }',
+        ]:
+            tool = DQRuleTool("tool", rules=rules)
+            with self.assertRaises(ValueError):
+                tool.initialize()
+        for rules in [
+            "rules { name: ",
+            'rules { column: "age" null_rate { } }',
+            'rules { name: "a" column: "age" null_rate { } } '
+            'rules { name: "a" column: "income" null_rate { } }',
+        ]:
+            with self.assertRaises(ValueError):
+                DQRuleTool("tool", rules=rules)
+
+    def test_to_msg(self):
+        ruleset = DQRuleSet()
+        rule = ruleset.rules.add()
+        rule.name = "age"
+        rule.column = "age"
+        rule.range.max = 99
+        tool = DQRuleTool("tool", rules=ruleset)
+        newtool = ToolBase.from_msg(logging.getLogger(), tool.to_msg())
+        assert newtool.ruleset == ruleset
+        assert newtool.columns == ["age"]
+
+    def test_algo(self):
+        gate = ArtemisGateSvc()
+        gate.current_file = "file"
+        tool = DQRuleTool("dqruletool", rules=RULES)
+        gate.tools.add(logging.getLogger(), tool.to_msg())
+        gate.tools.get("dqruletool").initialize()
+
+        algo = DQRuleAlgo("dq")
+        algo.initialize()
+        algo.book()
+        assert algo.required_columns == ["age", "province", "code", "income"]
+        element = Element("dq_0")
+        element.add_data([self.batch, self.batch])
+        algo.execute(element)
+        assert element.get_data() == [self.batch, self.batch]
+        assert list(gate.hbook["dq.rule.age"].frequencies) == [2, 8]
+        assert list(gate.hbook["dq.rule.income"].frequencies) == [2, 8]
+        algo.finalize()
+
+        # Side output of the failing rows, indexed in the file
+        algo = DQRuleAlgo("side", side_output=True)
+        algo.initialize()
+        algo.book()
+        element = Element("side_0")
+        element.add_data([self.batch, self.batch])
+        algo.execute(element)
+        failures = pa.Table.from_batches(element.get_data()).to_pydict()
+        assert failures["file"] == ["file"] * 8
+        assert failures["row"] == [0, 1, 2, 3, 5, 6, 7, 8]
+        assert failures["age"] == [False, False, True, False] * 2
+        assert failures["province"] == [False, False, True, False] * 2
+        assert failures["code"] == [False, True, False, False] * 2
+        assert failures["adult"] == [True, False, False, True] * 2
+        assert "income" not in failures
+
+        gate.current_file = "other"
+        element = Element("side_1")
+        element.add_data(self.batch.slice(2))
+        algo.execute(element)
+        assert element.get_data().to_pydict()["row"] == [0, 1]
+        assert element.get_data().to_pydict()["file"] == ["other"] * 2
+
+
+if __name__ == "__main__":
+    unittest.main()
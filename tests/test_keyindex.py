@@ -0,0 +1,119 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import tempfile
+
+import pyarrow as pa
+
+from artemis.core.gate import ArtemisGateSvc
+from artemis.core.singleton import Singleton
+from artemis.core.tree import Element
+from artemis.io.datasetreader import DatasetReader
+from artemis.io.keyindex import KeyIndexBuilder, lookup
+from artemis.io.writer import BufferOutputWriter
+from artemis.meta.cronus import BaseObjectStore
+
+
+class KeyIndexTestCase(unittest.TestCase):
+    def test_builder(self):
+        builder = KeyIndexBuilder("id")
+        ids = pa.array(["b", None, "a"])
+        builder.update(pa.RecordBatch.from_arrays([ids], ["id"]), 0)
+        builder.update(
+            pa.RecordBatch.from_arrays(
+                [pa.array(["a", "c"]).dictionary_encode()], ["id"]
+            ),
+            1,
+        )
+        assert builder.num_keys == 4
+        index = pa.ipc.open_file(builder.to_buffer()).read_all()
+        assert index.schema.metadata == {b"key": b"id"}
+        hashes = index.column("hash").to_pylist()
+        assert hashes == sorted(hashes)
+        locations = list(
+            zip(index.column("batch").to_pylist(), index.column("row").to_pylist())
+        )
+        assert sorted(locations) == [(0, 0), (0, 2), (1, 0), (1, 1)]
+        # Equal keys have equal hashes, also dictionary encoded
+        positions = dict(zip(locations, hashes))
+        assert positions[(0, 2)] == positions[(1, 0)]
+
+        builder.reset()
+        assert pa.ipc.open_file(builder.to_buffer()).read_all().num_rows == 0
+
+    def test_lookup(self):
+        self.addCleanup(Singleton.reset, ArtemisGateSvc)
+        with tempfile.TemporaryDirectory() as dirpath:
+            store = BaseObjectStore(dirpath, "artemis")
+            dataset_id = store.register_dataset().uuid
+            gate = ArtemisGateSvc()
+            gate.store = store
+            gate.meta.dataset_id = dataset_id
+            gate.meta.job_id = str(store.new_job(dataset_id))
+            store.new_partition(dataset_id, "test")
+
+            batches = [
+                pa.RecordBatch.from_arrays(
+                    [
+                        pa.array(range(i * 100, (i + 1) * 100)),
+                        pa.array([f"r{j:04d}" for j in range(i * 100, (i + 1) * 100)]),
+                    ],
+                    ["id", "name"],
+                )
+                for i in range(4)
+            ]
+            writer = BufferOutputWriter(
+                "writer_test",
+                write_csv=False,
+                index_key="id",
+                BUFFER_MAX_SIZE=2 * pa.get_record_batch_size(batches[0]),
+            )
+            writer._schema = batches[0].schema
+            writer.initialize()
+            elements = []
+            for i, batch in enumerate(batches):
+                el = Element(str(i))
+                el.add_data(batch)
+                elements.append(el)
+            writer.write(elements)
+            writer._finalize()
+            assert writer.total_files == 2
+
+            files = [f for f in store[dataset_id].dataset.files if f.file.type == 5]
+            assert len(files) == 2
+            for f in files:
+                assert f.file.index.key == "id"
+                assert f.file.index.num_keys == 200
+                assert store[f.file.index.uuid].file.type == 8
+            # Indices are not read as data
+            assert len(DatasetReader(store, dataset_id).files()) == 2
+
+            table = lookup(store, dataset_id, "id", 321)
+            assert table.to_pydict() == {"id": [321], "name": ["r0321"]}
+            table = lookup(store, dataset_id, "id", 42, columns=["name"])
+            assert table.to_pydict() == {"name": ["r0042"]}
+            table = lookup(store, dataset_id, "id", 1000)
+            assert table.num_rows == 0 and table.schema.names == ["id", "name"]
+            assert lookup(store, dataset_id, "name", "r1") is None
+            assert lookup(store, dataset_id, "id", 1, partition="other") is None
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -21,7 +21,14 @@ import unittest
 import logging
 import tempfile
 
-from artemis.generators.legacygen import GenMF
+from artemis.generators.legacygen import GenMF, GenMFOptions
+from artemis.generators.fwfencoder import (
+    encode_int,
+    encode_records,
+    encode_str,
+    overpunch_table,
+)
+from artemis.tools.mftool import MfTool
 from artemis.core.algo import AlgoBase
 from artemis.meta.cronus import BaseObjectStore
 
@@ -149,5 +156,46 @@ class Test_MF_Gen(unittest.TestCase):
             chunk = next(test_gen)
             #assert len(chunk) == 120
 
+    def test_overpunch(self):
+        pos = overpunch_table(GenMFOptions.pos_char)
+        neg = overpunch_table(GenMFOptions.neg_char)
+        matrix = encode_int([123, -120, 0, -7, 123456], 5, pos, neg)
+        records = [bytes(row).decode() for row in matrix]
+        self.assertEqual(records, ['0012C', '0012}', '0000{', '0000P', '2345F'])
+        matrix = encode_int([11, 7], 4)
+        self.assertEqual(matrix.tobytes(), b'00110007')
+        matrix = encode_str(['ab', 'abcdef', ''], 4)
+        self.assertEqual(matrix.tobytes(), b'ab  abcd    ')
+
+    def test_encode_records(self):
+        pos = overpunch_table(GenMFOptions.pos_char)
+        neg = overpunch_table(GenMFOptions.neg_char)
+        cols = [encode_int([-1, 22], 3, pos, neg), encode_str(['x', 'yz'], 2)]
+        data = encode_records(cols, 'cp500', header='h', footer='f')
+        self.assertEqual(data, 'h00Jx 02Byzf'.encode('cp500'))
+        data = encode_records(cols, 'utf8')
+        self.assertEqual(data, b'00Jx 02Byz')
+
+    def test_gen_read(self):
+        intconf = {'utype': 'int', 'length': 6, 'min_val': -500, 'max_val': 500}
+        uintconf = {'utype': 'uint', 'length': 4, 'min_val': 0, 'max_val': 100}
+        strconf = {'utype': 'str', 'length': 3}
+        schema = [intconf, uintconf, strconf]
+        test_gen = GenMF('test', ds_schema=schema, num_rows=1000, seed=42)
+        chunk = test_gen.gen_chunk()
+        self.assertEqual(len(chunk), 1000 * 13)
+
+        batch = MfTool('reader', ds_schema=schema).execute(chunk)
+        self.assertEqual(batch.num_rows, 1000)
+        ints = batch.column(0).to_pylist()
+        self.assertTrue(all(-500 <= x < 500 for x in ints))
+        self.assertTrue(any(x < 0 for x in ints))
+        self.assertTrue(all(0 <= x < 100 for x in batch.column(1).to_pylist()))
+        self.assertTrue(all(len(x) == 3 for x in batch.column(2).to_pylist()))
+
+        # Reproducible with the seed
+        test_gen = GenMF('test', ds_schema=schema, num_rows=1000, seed=42)
+        self.assertEqual(test_gen.gen_chunk(), chunk)
+
 if __name__ == "__main__":
     unittest.main()
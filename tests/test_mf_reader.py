@@ -222,6 +222,26 @@ class Test_MF_Reader(unittest.TestCase):
         print("Batch columns %i, rows %i" % (batch.num_columns, batch.num_rows))
         print(batch.schema)
 
+    def test_mf_include_columns(self):
+        """
+        Only the included fields are decoded
+        """
+        intconf0 = {"utype": "int", "length": 10, "min_val": 0, "max_val": 10}
+        intuconf0 = {"utype": "uint", "length": 6, "min_val": 0, "max_val": 10}
+        strconf0 = {"utype": "str", "length": 4}
+        schema = [intconf0, intuconf0, strconf0]
+        my_gen = GenMF("test", ds_schema=schema, num_rows=10, loglevel="INFO")
+        chunk = my_gen.gen_chunk()
+
+        batch = MfTool("reader", ds_schema=schema).execute(chunk)
+        my_read = MfTool("reader", ds_schema=schema)
+        my_read.include_columns(["column_2", "column_0"])
+        pbatch = my_read.execute(chunk)
+        self.assertEqual(pbatch.schema.names, ["column_2", "column_0"])
+        self.assertEqual(pbatch.num_rows, batch.num_rows)
+        self.assertEqual(pbatch.column(0).to_pylist(), batch.column(2).to_pylist())
+        self.assertEqual(pbatch.column(1).to_pylist(), batch.column(0).to_pylist())
+
     @unittest.skipUnless(
         module_exists("artemis.tools.fwftool", "FwfTool"), "mftool not installed"
     )
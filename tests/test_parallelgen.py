@@ -0,0 +1,121 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import logging
+import tempfile
+import uuid
+
+from artemis.core.singleton import Singleton
+from artemis.core.gate import ArtemisGateSvc
+from artemis.meta.cronus import BaseObjectStore
+from artemis.generators.legacygen import GenMF
+from artemis.generators.simutablegen import SimuTableGen
+from artemis.generators.filegen import FileGenerator
+from artemis.generators.parallelgen import ParallelGenerator
+from artemis.io.protobuf.table_pb2 import Table
+from artemis.io.protobuf.cronus_pb2 import TableObjectInfo
+
+logging.getLogger().setLevel(logging.INFO)
+
+
+class ParallelGenTestCase(unittest.TestCase):
+    def tearDown(self):
+        Singleton.reset(ArtemisGateSvc)
+
+    def generate(self, generator, nworkers):
+        with tempfile.TemporaryDirectory() as dirpath:
+            store = BaseObjectStore(dirpath, "artemis")
+            dataset = store.register_dataset()
+            job_id = store.new_job(dataset.uuid)
+            pgen = ParallelGenerator(generator, nchunks=4, nworkers=nworkers, seed=7)
+            objs = pgen.run(store, dataset.uuid, job_id)
+            assert len(objs) == 4
+            assert store.list_partitions(dataset.uuid) == ["generator"]
+            return [store.get(obj.uuid) for obj in objs]
+
+    def test_chunk_seeds(self):
+        seeds = ParallelGenerator.chunk_seeds(7, 4)
+        assert len(set(seeds)) == 4
+        assert ParallelGenerator.chunk_seeds(7, 6)[:4] == seeds
+
+    def test_genmf(self):
+        intconf = {"utype": "int", "length": 10, "min_val": -10, "max_val": 10}
+        strconf = {"utype": "str", "length": 6}
+        generator = GenMF("generator", column_a=intconf, column_b=strconf, num_rows=50)
+        serial = self.generate(generator, 1)
+        parallel = self.generate(generator, 2)
+        assert serial == parallel
+        assert len(set(serial)) == 4
+        assert all(len(data) == 50 * 16 for data in serial)
+
+    def test_simutable(self):
+        with tempfile.TemporaryDirectory() as dirpath:
+            store = BaseObjectStore(dirpath, "artemis")
+            g_dataset = store.register_dataset()
+            store.new_partition(g_dataset.uuid, "generator")
+            job_id = store.new_job(g_dataset.uuid)
+
+            g_table = Table()
+            g_table.name = "EvolveModel"
+            g_table.uuid = str(uuid.uuid4())
+            field = g_table.info.schema.info.fields.add()
+            field.name = "record_id"
+            field.info.type = "String"
+            field = g_table.info.schema.info.fields.add()
+            field.name = "Value"
+            field.info.type = "Float"
+            field.info.aux.generator.name = "normal"
+            store.register_content(
+                g_table,
+                TableObjectInfo(),
+                dataset_id=g_dataset.uuid,
+                job_id=job_id,
+                partition_key="generator",
+            )
+
+            generator = SimuTableGen(
+                "generator",
+                num_rows=20,
+                file_type=1,
+                columnar=True,
+                table_id=g_table.uuid,
+            )
+            pgen = ParallelGenerator(generator, nchunks=3, nworkers=2)
+            objs = pgen.run(store, g_dataset.uuid, job_id)
+            ids = []
+            for obj in objs:
+                lines = store.get(obj.uuid).decode().split("\r\n")
+                assert lines[0] == "record_id,Value"
+                assert len(lines) == 22
+                ids.extend(line.split(",")[0] for line in lines[1:-1])
+            # Record ids are unique across chunks
+            assert len(ids) == 60
+            assert len(set(ids)) == 60
+
+            # Generated files are consumed by a file generator
+            reader = FileGenerator("reader", glob="csv", nbatches=1)
+            reader.gate.store = store
+            reader.gate.meta.parentset_id = g_dataset.uuid
+            reader.initialize()
+            assert list(reader) == [obj.uuid for obj in objs]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import tempfile
+
+import pyarrow as pa
+
+from artemis.core.gate import ArtemisGateSvc
+from artemis.core.singleton import Singleton
+from artemis.core.tree import Element
+from artemis.io.datasetreader import DatasetReader
+from artemis.io.writer import PartitionedOutputWriter
+from artemis.meta.cronus import BaseObjectStore
+
+
+class PartitionedWriterTestCase(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(Singleton.reset, ArtemisGateSvc)
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.store = BaseObjectStore(self.tmpdir.name, "artemis")
+        self.dataset_id = self.store.register_dataset().uuid
+        gate = ArtemisGateSvc()
+        gate.store = self.store
+        gate.meta.dataset_id = self.dataset_id
+        gate.meta.job_id = str(self.store.new_job(self.dataset_id))
+        self.store.new_partition(self.dataset_id, "seqA")
+        self.batches = [
+            pa.RecordBatch.from_arrays(
+                [
+                    pa.array([i % 10 if i % 7 else None for i in range(j, j + 50)]),
+                    pa.array([f"k{i % 4}" for i in range(j, j + 50)]),
+                    pa.array(range(j, j + 50)),
+                ],
+                ["id", "region", "row"],
+            )
+            for j in range(0, 200, 50)
+        ]
+
+    def write(self, **kwargs):
+        writer = PartitionedOutputWriter("writer_seqA", write_csv=False, **kwargs)
+        writer._schema = self.batches[0].schema
+        writer.initialize()
+        elements = []
+        for i, batch in enumerate(self.batches):
+            el = Element(str(i))
+            el.add_data(batch)
+            elements.append(el)
+        writer.write(elements)
+        assert writer._nrecords == 200
+        writer._finalize()
+        return writer
+
+    def test_hash(self):
+        writer = self.write(partition_keys=["id", "region"], num_buckets=4)
+        assert writer.total_records == 200
+        files = self.store[self.dataset_id].dataset.files
+        assert {f.file.partition for f in files} == {"seqA"}
+        assert {f.file.num_buckets for f in files} == {4}
+        assert len({f.file.bucket for f in files}) == len(files) > 1
+
+        # Rows with equal keys are in the same bucket
+        placement = {}
+        for f in files:
+            reader = DatasetReader(self.store, self.dataset_id, buckets=[f.file.bucket])
+            table = reader.to_table()
+            for key in zip(*table.to_pydict().values()):
+                placement.setdefault(key[:2], set()).add(f.file.bucket)
+        assert all(len(buckets) == 1 for buckets in placement.values())
+        table = DatasetReader(self.store, self.dataset_id).to_table()
+        assert sorted(table.column("row").to_pylist()) == list(range(200))
+
+    def test_null_keys(self):
+        writer = PartitionedOutputWriter(
+            "writer_seqA", partition_keys=["region", "id"], num_buckets=64
+        )
+        batch = pa.RecordBatch.from_arrays(
+            [
+                pa.array([f"k{i}" for i in range(20)] * 2),
+                pa.array([None] * 40, pa.int64()),
+            ],
+            ["region", "id"],
+        )
+        buckets = writer.buckets(batch)
+        # A null key keeps the hash of the other keys
+        assert len(set(buckets.tolist())) > 1
+        assert buckets[:20].tolist() == buckets[20:].tolist()
+
+    def test_range(self):
+        writer = self.write(
+            partition_keys=["region"], partitioning="range", range_bounds=["k0", "k2"]
+        )
+        assert writer._num_buckets == 3
+        regions = {}
+        for bucket in range(3):
+            reader = DatasetReader(
+                self.store, self.dataset_id, buckets=[bucket], columns=["region"]
+            )
+            regions[bucket] = set(reader.to_table().column("region").to_pylist())
+        assert regions == {0: set(), 1: {"k0", "k1"}, 2: {"k2", "k3"}}
+
+    def test_options(self):
+        with self.assertRaises(ValueError):
+            PartitionedOutputWriter("writer_seqA")
+        with self.assertRaises(ValueError):
+            PartitionedOutputWriter("writer_seqA", partition_keys=["id"], num_buckets=0)
+        with self.assertRaises(ValueError):
+            PartitionedOutputWriter(
+                "writer_seqA",
+                partition_keys=["id"],
+                partitioning="range",
+                range_bounds=[5, 1],
+            )
+        with self.assertRaises(ValueError):
+            PartitionedOutputWriter(
+                "writer_seqA", partition_keys=["id"], partitioning="list"
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import tempfile
+
+import numpy as np
+import pyarrow as pa
+
+from artemis.core.book import ArtemisBook, TDigestBook, SketchBook
+from artemis.distributed.reduction import reduce_books, tree_reduce
+from artemis.externals.tdigest.tdigest import TDigest
+from artemis.meta.cronus import BaseObjectStore
+from artemis.io.protobuf.cronus_pb2 import HistsObjectInfo, TDigestObjectInfo
+from artemis.io.protobuf.cronus_pb2 import SketchObjectInfo
+from artemis.io.protobuf.tdigest_pb2 import TDigest_store
+from artemis.io.protobuf.sketch_pb2 import Sketch_store
+
+
+class ReductionTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.store = BaseObjectStore(self.tmpdir.name, "artemis")
+        self.random_state = np.random.RandomState(42)
+
+    def test_tdigest_merge(self):
+        data = self.random_state.normal(0, 1, 20000)
+        digests = []
+        for part in np.array_split(data, 5):
+            digest = TDigest()
+            digest.batch_update(part)
+            digests.append(digest)
+        merged = digests[0].merge(*digests[1:])
+        assert merged.n == 20000
+        assert len(merged) <= sum(len(d) for d in digests)
+        assert list(merged.C.keys()) == sorted(merged.C.keys())
+        for p in (1, 10, 50, 90, 99):
+            assert abs(merged.percentile(p) - np.percentile(data, p)) < 0.05
+        assert (digests[0] + digests[1]).n == 8000
+        assert TDigest().merge(TDigest()).n == 0
+
+        # Serialized digests are loaded without re-inserting the centroids
+        tbook = TDigestBook()
+        tbook["job.values"] = merged
+        msg = TDigest_store()
+        msg.ParseFromString(tbook._to_message().SerializeToString())
+        loaded = TDigestBook()._from_message(msg)["job.values"]
+        assert loaded.n == merged.n
+        assert len(loaded) == len(merged)
+        means = [c["m"] for c in merged.centroids_to_list()]
+        assert np.allclose([c["m"] for c in loaded.centroids_to_list()], means)
+
+    def test_reduce(self):
+        dataset = self.store.register_dataset()
+        njobs = 5
+        for job_id in range(njobs):
+            values = self.random_state.uniform(0, 100, 1000)
+            hbook = ArtemisBook()
+            hbook.book("job", "values", range(101))
+            hbook.fill("job", "values", values)
+            tbook = TDigestBook()
+            tbook.book("job", "values")
+            tbook["job.values"].batch_update(values)
+            sbook = SketchBook()
+            sbook.fill("job", "values", pa.array(values))
+            for book, info in (
+                (hbook, HistsObjectInfo()),
+                (tbook, TDigestObjectInfo()),
+                (sbook, SketchObjectInfo()),
+            ):
+                self.store.register_content(
+                    book._to_message(), info, dataset_id=dataset.uuid, job_id=job_id
+                )
+
+        hbook, tbook, sbook = reduce_books(self.store, dataset.uuid, nworkers=2)
+        assert hbook["job.values"].total == 1000 * njobs
+        assert tbook["job.values"].n == 1000 * njobs
+        assert sbook["job.values"].count == 1000 * njobs
+        for objs in (
+            self.store.list_histograms(dataset.uuid),
+            self.store.list_tdigests(dataset.uuid),
+            self.store.list_sketches(dataset.uuid),
+        ):
+            assert len(objs) == njobs + 1
+            assert ".job_merged." in objs[-1].name
+
+        # Merged books are not summed again
+        hbook, tbook, sbook = reduce_books(self.store, dataset.uuid, fanin=3)
+        assert hbook["job.values"].total == 1000 * njobs
+        assert tbook["job.values"].n == 1000 * njobs
+        assert sbook["job.values"].count == 1000 * njobs
+
+    def test_tree_reduce(self):
+        empty = tree_reduce("sketches", [])
+        assert len(SketchBook()._from_message(Sketch_store.FromString(empty))) == 0
+        with self.assertRaises(ValueError):
+            tree_reduce("hists", [], fanin=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import logging
+import subprocess
+import sys
+
+from artemis.core import registry
+from artemis.core.tool import ToolBase
+from artemis.core.algo import AlgoBase
+from artemis.tools.csvtool import CsvTool
+from artemis.algorithms.profileralgo import ProfilerAlgo
+
+# Dependencies which are not imported on startup
+HEAVY = ["pandas", "pkg_resources", "sas7bdat", "faker", "matplotlib", "dask"]
+
+
+class RegistryTestCase(unittest.TestCase):
+    def test_resolve(self):
+        assert registry.resolve("CsvTool") is CsvTool
+        assert registry.resolve("CsvTool", "artemis.tools.csvtool") is CsvTool
+        with self.assertRaises(ImportError):
+            registry.resolve("NoSuchTool")
+        with self.assertRaises(ImportError):
+            registry.resolve("CsvTool", "artemis.tools.nosuchmodule")
+        with self.assertRaises(AttributeError):
+            registry.resolve("NoSuchTool", "artemis.tools.csvtool")
+
+    def test_register(self):
+        self.addCleanup(registry._registered.clear)
+        registry.register("Thing", "artemis.tools.csvtool")
+        with self.assertRaises(AttributeError):
+            registry.resolve("Thing")
+        registry.register("CsvToolAlias", "artemis.tools.csvtool")
+        assert registry.plugins()["CsvToolAlias"] == "artemis.tools.csvtool"
+
+    def test_from_msg(self):
+        msg = CsvTool("csvtool", block_size=2 ** 16).to_msg()
+        msg.module = ""
+        tool = ToolBase.from_msg(logging.getLogger(), msg)
+        assert isinstance(tool, CsvTool)
+        assert tool.properties.block_size == 2 ** 16
+
+        msg = ProfilerAlgo("profiler").to_msg()
+        msg.module = ""
+        assert isinstance(AlgoBase.from_msg(logging.getLogger(), msg), ProfilerAlgo)
+
+    def test_lazy_import(self):
+        assert registry.lazy_import("logging") is logging
+        missing = registry.lazy_import("artemis_no_such_module")
+        with self.assertRaises(ImportError):
+            missing.anything
+
+        code = (
+            "import sys, types\n"
+            "from artemis.core.registry import lazy_import\n"
+            "wave = lazy_import('wave')\n"
+            "print(type(sys.modules['wave']) is types.ModuleType)\n"
+            "wave.Error\n"
+            "print(type(sys.modules['wave']) is types.ModuleType)\n"
+        )
+        output = subprocess.check_output([sys.executable, "-c", code])
+        assert output.split() == [b"False", b"True"]
+
+    def test_startup_imports(self):
+        code = (
+            "import sys, types\n"
+            "import artemis.artemis, artemis.io.filehandler, artemis.io.writer\n"
+            "import artemis.tools.csvtool, artemis.algorithms.csvparseralgo\n"
+            f"for name in {HEAVY!r}:\n"
+            "    if type(sys.modules.get(name)) is types.ModuleType:\n"
+            "        print(name)\n"
+        )
+        output = subprocess.check_output([sys.executable, "-c", code])
+        assert output.decode().split() == []
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import logging
+
+import pyarrow as pa
+
+from artemis.core.tool import ToolBase
+from artemis.core.gate import ArtemisGateSvc
+from artemis.core.singleton import Singleton
+from artemis.core.tree import Element
+from artemis.core.datastore import ArrowSets
+from artemis.tools.rowfiltertool import RowFilterTool
+from artemis.algorithms.rowfilteralgo import RowFilterAlgo
+
+
+class RowFilterTestCase(unittest.TestCase):
+    def setUp(self):
+        self.batch = pa.RecordBatch.from_arrays(
+            [
+                pa.array([10, 20, 30, None, 50]),
+                pa.array(["10", "11", "24", "10", None]),
+                pa.array([1.5, None, 3.5, 4.5, 5.5]),
+            ],
+            ["age", "province", "income"],
+        )
+
+    def tearDown(self):
+        Singleton.reset(ArtemisGateSvc)
+        Singleton.reset(ArrowSets)
+
+    def select(self, expression):
+        tool = RowFilterTool("tool", expression=expression)
+        tool.initialize()
+        return tool.execute(self.batch).to_pydict()
+
+    def test_compare(self):
+        assert self.select("age >= 20")["age"] == [20, 30, 50]
+        assert self.select("age != 20")["age"] == [10, 30, 50]
+        assert self.select("25 < age")["age"] == [30, 50]
+        assert self.select("10 < age < 50")["age"] == [20, 30]
+        assert self.select("income > age")["age"] == []
+
+    def test_isin(self):
+        assert self.select("province in ['10', '11']")["age"] == [10, 20, None]
+        assert self.select("province not in ('10', '11')")["age"] == [30]
+        assert self.select("age in [10, 30]")["age"] == [10, 30]
+
+    def test_nulls(self):
+        assert self.select("is_null(age)")["province"] == ["10"]
+        assert self.select("is_valid(income) and is_valid(province)")["age"] == [
+            10,
+            30,
+            None,
+        ]
+
+    def test_combinators(self):
+        result = self.select("(age > 10 and province == '24') or income < 2")
+        assert result["age"] == [10, 30]
+        assert self.select("not age > 20")["age"] == [10, 20]
+        assert self.select("col('age') == 50")["income"] == [5.5]
+
+    def test_columns(self):
+        tool = RowFilterTool("tool", expression="age > 1 and col('x y') == 'a'")
+        assert tool.columns == ["age", "x y"]
+
+    def test_invalid(self):
+        for expression in ["age +", "age + 1", "age in other", "foo(age)"]:
+            tool = RowFilterTool("tool", expression=expression)
+            with self.assertRaises(ValueError):
+                tool.initialize()
+        with self.assertRaises(ValueError):
+            RowFilterTool("tool")
+
+    def test_to_msg(self):
+        tool = RowFilterTool("tool", expression="age > 1")
+        newtool = ToolBase.from_msg(logging.getLogger(), tool.to_msg())
+        assert newtool.expression == "age > 1"
+
+    def test_algo(self):
+        gate = ArtemisGateSvc()
+        tool = RowFilterTool("rowfiltertool", expression="age >= 30")
+        gate.tools.add(logging.getLogger(), tool.to_msg())
+        gate.tools.get("rowfiltertool").initialize()
+
+        algo = RowFilterAlgo("rowfilter")
+        algo.initialize()
+        algo.book()
+        assert algo.required_columns == ["age"]
+
+        element = Element("rowfilter_0")
+        element.add_data([self.batch, self.batch])
+        algo.execute(element)
+        batches = element.get_data()
+        assert [b.num_rows for b in batches] == [2, 2]
+        rows = gate.hbook["rowfilter.rows"]
+        assert list(rows.frequencies) == [6, 4]
@@ -0,0 +1,317 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import logging
+import tempfile
+import threading
+import time
+import urllib.parse
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pyarrow as pa
+
+from artemis.core.book import ArtemisBook, TDigestBook, SketchBook
+from artemis.core.singleton import Singleton
+from artemis.core.gate import ArtemisGateSvc
+from artemis.distributed.scheduler import DatasetScheduler, StragglerDetector, pack
+from artemis.errors import JobCancelledError
+from artemis.generators.filegen import FileGenerator
+from artemis.meta.cronus import BaseObjectStore
+from artemis.io.protobuf.artemis_pb2 import JobInfo as JobInfo_pb
+from artemis.io.protobuf.configuration_pb2 import Configuration
+from artemis.io.protobuf.cronus_pb2 import ConfigObjectInfo, FileObjectInfo
+from artemis.io.protobuf.cronus_pb2 import DatasetObjectInfo
+from artemis.io.protobuf.cronus_pb2 import HistsObjectInfo, TDigestObjectInfo
+from artemis.io.protobuf.cronus_pb2 import SketchObjectInfo, TableObjectInfo
+from artemis.io.protobuf.histogram_pb2 import HistogramCollection
+from artemis.io.protobuf.tdigest_pb2 import TDigest_store
+from artemis.io.protobuf.sketch_pb2 import Sketch_store
+from artemis.io.protobuf.table_pb2 import Table
+
+
+class ThreadPool:
+    """
+    Runs simulated sub-jobs on threads with the interface of WorkerPool,
+    the first attempt of the slow units processes 100 times slower
+    """
+
+    def __init__(self, nworkers, slow):
+        self.executor = ThreadPoolExecutor(nworkers)
+        self.slow = slow
+        self.beats = []
+        self.cancelled = set()
+        self.lock = threading.Lock()
+
+    def subjob(self, jobinfo, key):
+        delay = 0.5 if key[1] == 0 and key[0] in self.slow else 0.005
+        for i in range(10):
+            with self.lock:
+                self.beats.append((key, 100 * i, i, time.time()))
+            if key in self.cancelled:
+                raise JobCancelledError
+            time.sleep(delay)
+        update = DatasetObjectInfo()
+        job = update.jobs.add()
+        job.name = f"unit_{key[0]}.attempt_{key[1]}.job_{jobinfo.job_id}"
+        return update.SerializeToString()
+
+    def submit(self, jobinfo, key=None):
+        return self.executor.submit(self.subjob, jobinfo, key)
+
+    def heartbeats(self):
+        with self.lock:
+            beats, self.beats = self.beats, []
+        return beats
+
+    def cancel(self, key):
+        self.cancelled.add(key)
+
+
+class SchedulerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.store = BaseObjectStore(self.tmpdir.name, "artemis")
+
+        self.parentset = self.store.register_dataset()
+        self.store.new_partition(self.parentset.uuid, "generator")
+        self.sizes = [100, 10, 60, 30, 50, 40, 20, 5]
+        self.ids = []
+        for i, size in enumerate(self.sizes):
+            fileinfo = FileObjectInfo()
+            fileinfo.type = 1
+            if i % 2 == 0:
+                fileinfo.size_bytes = size
+            obj = self.store.register_content(
+                b"x" * size,
+                fileinfo,
+                dataset_id=self.parentset.uuid,
+                partition_key="generator",
+                job_id=f"0_chunk_{i}",
+            )
+            with open(urllib.parse.urlparse(obj.address).path, "wb") as f:
+                f.write(b"x" * size)
+            self.ids.append(obj.uuid)
+
+        generator = FileGenerator("generator", glob="csv", nsamples=1)
+        config = Configuration()
+        config.uuid = str(uuid.uuid4())
+        config.name = f"{config.uuid}.config.pb"
+        config.input.generator.config.CopyFrom(generator.to_msg())
+        configinfo = ConfigObjectInfo()
+        self.config_id = self.store.register_content(config, configinfo).uuid
+
+    def test_pack(self):
+        units = pack(self.sizes, 3)
+        assert sorted(i for unit in units for i in unit) == list(range(8))
+        totals = [sum(self.sizes[i] for i in unit) for unit in units]
+        assert totals == sorted(totals, reverse=True)
+        assert max(totals) - min(totals) <= max(self.sizes)
+        assert pack([1, 2], 4) == [[1], [0]]
+        assert pack([], 4) == []
+
+    def test_list_inputs(self):
+        scheduler = DatasetScheduler(self.store, "", self.config_id, nworkers=2)
+        assert scheduler.nunits == 8
+        ids, sizes = scheduler.list_inputs(self.parentset.uuid)
+        assert sorted(zip(ids, sizes)) == sorted(zip(self.ids, self.sizes))
+
+    def test_unit_config(self):
+        scheduler = DatasetScheduler(self.store, "", self.config_id)
+        config_id = scheduler._unit_config(self.ids[:2])
+        config_id = scheduler._unit_config(self.ids[2:4])
+
+        config = Configuration()
+        self.store.get(config_id, config)
+        msg = config.input.generator.config
+        names = [p.name for p in msg.properties.property]
+        assert names.count("file_ids") == 1
+
+        self.addCleanup(Singleton.reset, ArtemisGateSvc)
+        generator = FileGenerator.from_msg(logging.getLogger(), msg)
+        generator.gate.meta.parentset_id = self.parentset.uuid
+        generator.gate.store = self.store
+        generator.initialize()
+        assert list(generator) == self.ids[2:4]
+
+    def test_incremental(self):
+        dataset = self.store.register_dataset()
+        self.store.update_watermark(dataset.uuid, self.ids[:3])
+        self.store.update_watermark(dataset.uuid, self.ids[2:5])
+        assert list(self.store.list_watermark(dataset.uuid)) == self.ids[:5]
+
+        scheduler = DatasetScheduler(self.store, "", self.config_id)
+        ids, _ = scheduler.list_inputs(self.parentset.uuid, dataset.uuid)
+        assert len(ids) == 8
+        scheduler.incremental = True
+        ids, _ = scheduler.list_inputs(self.parentset.uuid, dataset.uuid)
+        assert sorted(ids) == sorted(self.ids[5:])
+
+        self.addCleanup(Singleton.reset, ArtemisGateSvc)
+        generator = FileGenerator("generator", glob="csv", incremental=True)
+        generator.gate.meta.parentset_id = self.parentset.uuid
+        generator.gate.meta.dataset_id = dataset.uuid
+        generator.gate.store = self.store
+        generator.initialize()
+        assert sorted(generator) == sorted(self.ids[5:])
+
+        # Sub-jobs report their consumed files in the dataset update
+        update = DatasetObjectInfo()
+        update.watermark.extend(self.ids[4:])
+        self.store.update_dataset(dataset.uuid, update.SerializeToString())
+        assert list(self.store.list_watermark(dataset.uuid)) == self.ids
+
+    def test_stragglers(self):
+        detector = StragglerDetector(factor=2.0, min_elapsed=1.0)
+        detector.beat("a", 0, 0, 0.0)
+        detector.beat("b", 0, 0, 0.0)
+        detector.beat("c", 0, 0, 1.0)
+        assert detector.stragglers(10.0) == []
+        detector.complete("a", 1000, 10.0)
+        detector.beat("b", 600, 1, 10.0)
+        assert detector.stragglers(10.0) == ["c"]
+        detector.beat("b", 600, 1, 13.0)
+        detector.beat("d", 0, 0, 12.5)
+        assert detector.stragglers(13.0) == ["c", "b"]
+        detector.discard("c")
+        assert detector.stragglers(13.0) == ["b"]
+
+    def test_speculate(self):
+        dataset = self.store.register_dataset()
+        jobs = []
+        for _ in range(4):
+            job = JobInfo_pb()
+            job.dataset_id = dataset.uuid
+            job.job_id = str(self.store.new_job(dataset.uuid))
+            jobs.append(job)
+
+        scheduler = DatasetScheduler(
+            self.store,
+            "",
+            self.config_id,
+            nworkers=2,
+            min_elapsed=0.05,
+            heartbeat_interval=0.01,
+        )
+        pool = ThreadPool(2, slow=[0])
+        self.addCleanup(pool.executor.shutdown)
+        start = time.time()
+        updates = scheduler._execute(pool, jobs, [1000] * 4)
+        assert time.time() - start < 4
+        names = []
+        for buf in updates:
+            update = DatasetObjectInfo()
+            update.ParseFromString(buf)
+            names.append(update.jobs[0].name)
+        assert names == [
+            "unit_0.attempt_1.job_4",
+            "unit_1.attempt_0.job_1",
+            "unit_2.attempt_0.job_2",
+            "unit_3.attempt_0.job_3",
+        ]
+        assert pool.cancelled == {(0, 0)}
+
+        # Without speculation the slow unit is waited for
+        scheduler.speculate = False
+        pool = ThreadPool(2, slow=[])
+        self.addCleanup(pool.executor.shutdown)
+        updates = scheduler._execute(pool, jobs, [1000] * 4)
+        assert len(updates) == 4
+        assert pool.cancelled == set()
+
+    def test_merge(self):
+        dataset = self.store.register_dataset()
+        self.store.save_store()
+
+        # Each sub-job registers its books
+        updates = []
+        values = np.arange(100, dtype="float")
+        for job_id in range(2):
+            store = BaseObjectStore(
+                self.tmpdir.name,
+                self.store.store_name,
+                store_uuid=self.store.store_uuid,
+            )
+            store.new_partition(dataset.uuid, "seqA")
+            hbook = ArtemisBook()
+            hbook.book("job", "values", range(101))
+            hbook.fill("job", "values", values)
+            hinfo = HistsObjectInfo()
+            store.register_content(
+                hbook._to_message(), hinfo, dataset_id=dataset.uuid, job_id=job_id
+            )
+            tbook = TDigestBook()
+            tbook.book("job", "values")
+            tbook["job.values"].batch_update(values)
+            tinfo = TDigestObjectInfo()
+            store.register_content(
+                tbook._to_message(), tinfo, dataset_id=dataset.uuid, job_id=job_id
+            )
+            sbook = SketchBook()
+            sbook.fill("job", "values", pa.array(values + 100 * job_id))
+            sinfo = SketchObjectInfo()
+            store.register_content(
+                sbook._to_message(), sinfo, dataset_id=dataset.uuid, job_id=job_id
+            )
+            table = Table()
+            table.name = f"seqA.job_{job_id}"
+            table.uuid = str(uuid.uuid4())
+            store.register_content(
+                table,
+                TableObjectInfo(),
+                dataset_id=dataset.uuid,
+                job_id=job_id,
+                partition_key="seqA",
+            )
+            updates.append(store[dataset.uuid].dataset.SerializeToString())
+
+        scheduler = DatasetScheduler(self.store, "", self.config_id)
+        scheduler.merge(dataset.uuid, updates)
+        assert list(self.store.list_partitions(dataset.uuid)) == ["seqA"]
+        tables = self.store[dataset.uuid].dataset.tables
+        assert [obj.name for obj in tables] == ["seqA.job_0", "seqA.job_1"]
+        assert len(self.store[dataset.uuid].dataset.logs) == 0
+        hists = self.store.list_histograms(dataset.uuid)
+        tdigests = self.store.list_tdigests(dataset.uuid)
+        assert len(hists) == 3
+        assert len(tdigests) == 3
+        assert ".job_merged." in hists[-1].name
+
+        msg = HistogramCollection()
+        self.store.get(hists[-1].uuid, msg)
+        merged = ArtemisBook()._from_message(msg)
+        assert merged["job.values"].total == 200
+        msg = TDigest_store()
+        self.store.get(tdigests[-1].uuid, msg)
+        merged = TDigestBook()._from_message(msg)
+        assert merged["job.values"].n == 200
+        sketches = self.store.list_sketches(dataset.uuid)
+        assert len(sketches) == 3
+        msg = Sketch_store()
+        self.store.get(sketches[-1].uuid, msg)
+        merged = SketchBook()._from_message(msg)
+        assert merged["job.values"].count == 200
+        assert (merged["job.values"].min, merged["job.values"].max) == (0, 199)
+
+
+if __name__ == "__main__":
+    unittest.main()
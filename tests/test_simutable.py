@@ -26,6 +26,9 @@ import tempfile
 import os
 import uuid
 import logging
+
+import numpy as np
+import pyarrow as pa
 # from collections import OrderedDict
 from artemis.artemis import Artemis, ArtemisFactory
 from artemis.meta.cronus import BaseObjectStore
@@ -301,6 +304,125 @@ class SimuTableTestCase(unittest.TestCase):
         s2 = Synthesizer(model, 'en_CA')
         print(s2.generate())
     
+    def test_generate_columns(self):
+        model = Table()
+        schema = model.info.schema.info
+        field = schema.fields.add()
+        field.name = 'record_id'
+        field.info.type = 'String'
+
+        field = schema.fields.add()
+        field.name = 'Name'
+        field.info.type = 'String'
+        field.info.aux.generator.name = 'name'
+
+        field = schema.fields.add()
+        field.name = 'Income'
+        field.info.type = 'Float'
+        field.info.aux.generator.name = 'lognormal'
+
+        field1 = schema.fields.add()
+        field1.name = 'Value1'
+        field1.info.type = 'Float'
+        field1.info.aux.generator.name = 'normal'
+        field1.info.aux.dependent = 'Prediction'
+
+        field2 = schema.fields.add()
+        field2.name = 'Value2'
+        field2.info.type = 'Float'
+        field2.info.aux.generator.name = 'random_int'
+        field2.info.aux.dependent = 'Prediction'
+
+        field3 = schema.fields.add()
+        field3.name = 'Prediction'
+        field3.info.type = 'Float'
+        field3.info.aux.generator.name = 'glm'
+        for name, value in [('beta1', 10), ('beta2', 0.1),
+                            ('beta3', 100), ('sigma', 1)]:
+            parm = field3.info.aux.generator.parameters.add()
+            parm.name = name
+            parm.value = value
+            parm.type = 'float'
+        for var in [field1, field2]:
+            parm = field3.info.aux.generator.parameters.add()
+            parm.name = var.name
+            parm.type = 'Field'
+            parm.variable.CopyFrom(var)
+
+        s1 = Synthesizer(model, 'en_CA', idx=0, seed=4053)
+        assert s1.batch_fcns['Name'] is None
+        assert s1.batch_fcns['Prediction'] is not None
+        columns = s1.generate_columns(1000)
+        assert len(columns) == 6
+        assert all(len(column) == 1000 for column in columns)
+        assert columns[0][0] == 'rec-0-id'
+        assert isinstance(columns[2], np.ndarray)
+        assert s1.record_count == 1000
+        assert s1.generate_columns(10)[0][0] == 'rec-1000-id'
+
+        # Predictor follows the model within the noise
+        residual = columns[5] - (10 * columns[3] + 0.1 * columns[4] + 100)
+        assert abs(residual.mean()) < 0.2
+        assert abs(residual.std() - 1) < 0.2
+
+        # Reproducible with the seed
+        s2 = Synthesizer(model, 'en_CA', idx=0, seed=4053)
+        assert np.array_equal(s2.generate_columns(1000)[5], columns[5])
+
+    def test_simutablegen_columnar(self):
+        with tempfile.TemporaryDirectory() as dirpath:
+            store = BaseObjectStore(dirpath, 'artemis')
+            g_dataset = store.register_dataset()
+            store.new_partition(g_dataset.uuid, 'generator')
+            job_id = store.new_job(g_dataset.uuid)
+
+            g_table = Table()
+            g_table.name = 'EvolveModel'
+            g_table.uuid = str(uuid.uuid4())
+            schema = g_table.info.schema.info
+            field = schema.fields.add()
+            field.name = 'Name'
+            field.info.type = 'String'
+            field.info.length = 12
+            field.info.aux.generator.name = 'name'
+            field = schema.fields.add()
+            field.name = 'Value'
+            field.info.type = 'Float'
+            field.info.length = 8
+            field.info.aux.generator.name = 'normal'
+
+            tinfo = TableObjectInfo()
+            store.register_content(g_table,
+                                   tinfo,
+                                   dataset_id=g_dataset.uuid,
+                                   job_id=job_id,
+                                   partition_key='generator')
+
+            for file_type in [1, 2, 5]:
+                generator = SimuTableGen('generator',
+                                         nbatches=2,
+                                         num_rows=100,
+                                         file_type=file_type,
+                                         columnar=True,
+                                         seed=42,
+                                         table_id=g_table.uuid)
+                generator.gate.meta.parentset_id = g_dataset.uuid
+                generator.gate.meta.job_id = str(job_id)
+                generator.gate.store = store
+                generator.initialize()
+                data = generator.write_batch()
+                if file_type == 5:
+                    assert data.num_rows == 100
+                    assert data.schema.names == ['Name', 'Value']
+                    assert data.schema.field_by_name('Value').type == pa.float64()
+                    assert generator.write_batch().schema == data.schema
+                elif file_type == 2:
+                    assert data.size == 100 * 20
+                else:
+                    lines = data.to_pybytes().decode().split('\r\n')
+                    assert lines[0] == 'Name,Value'
+                    assert len(lines) == 102
+
     def test_xduplicates(self):
 
         model = Table()
@@ -0,0 +1,162 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import tempfile
+
+import numpy as np
+import pyarrow as pa
+
+from artemis.core.book import SketchBook
+from artemis.core.sketch import ColumnSketch, HyperLogLog, SpaceSaving, hash_array
+from artemis.meta.cronus import BaseObjectStore
+from artemis.io.protobuf.cronus_pb2 import SketchObjectInfo
+from artemis.io.protobuf.sketch_pb2 import Sketch_store
+
+
+class SketchTestCase(unittest.TestCase):
+    def setUp(self):
+        self.random_state = np.random.RandomState(42)
+
+    def test_hyperloglog(self):
+        values = self.random_state.randint(0, 50000, 200000)
+        hll = HyperLogLog(12)
+        hll.update(hash_array(pa.array(values)))
+        exact = len(np.unique(values))
+        assert abs(hll.estimate() - exact) < 0.05 * exact
+
+        small = HyperLogLog(12)
+        small.update(hash_array(pa.array(["a", "b", "c", "a"])))
+        assert round(small.estimate()) == 3
+
+        # Strings hash the same with and without dictionary encoding
+        words = pa.array(["x", "y", "x"])
+        assert hash_array(words).tolist() == (
+            hash_array(words.dictionary_encode()).tolist()
+        )
+        with self.assertRaises(ValueError):
+            hll + HyperLogLog(10)
+
+    def test_spacesaving(self):
+        words = [f"w{i}" for i in self.random_state.zipf(1.5, 20000)]
+        exact = dict(zip(*np.unique(words, return_counts=True)))
+        topk = SpaceSaving(16)
+        for i in range(0, len(words), 5000):
+            topk.update(pa.array(words[i : i + 5000]))
+        assert len(topk.counts) == 16
+        for value, count, error in topk.top():
+            assert count - error <= exact[value] <= count
+        assert [x[0] for x in topk.top(3)] == ["w1", "w2", "w3"]
+        assert max(n for v, n in exact.items() if v not in topk.counts) <= topk.bound
+
+        # Exact below capacity
+        topk = SpaceSaving(16)
+        topk.update(pa.array(["a", "b", "a"]))
+        assert topk.top() == [("a", 2, 0), ("b", 1, 0)]
+        assert topk.bound == 0
+
+    def test_column(self):
+        data = pa.chunked_array(
+            [pa.array([3, None, 1]), pa.array([7, 7, None]), pa.array([], pa.int64())]
+        )
+        sketch = ColumnSketch()
+        sketch.update(data)
+        assert (sketch.count, sketch.null_count) == (6, 2)
+        assert (sketch.min, sketch.max) == (1, 7)
+        assert round(sketch.distinct()) == 3
+        assert sketch.top() == []
+
+        # Sum of the sketches of parts is the sketch of the whole
+        words = pa.array(["ON", "QC", None, "ON", "BC", "ON"])
+        whole = ColumnSketch()
+        whole.update(words.dictionary_encode())
+        first, second = ColumnSketch(), ColumnSketch()
+        first.update(words[:3])
+        second.update(words[3:].dictionary_encode())
+        merged = first + second
+        assert (merged.count, merged.null_count) == (6, 1)
+        assert (merged.min, merged.max) == ("BC", "QC")
+        assert merged.top() == whole.top()
+        assert merged.top(1) == [("ON", 3, 0)]
+        assert (merged.hll.registers == whole.hll.registers).all()
+
+        restored = ColumnSketch.from_protobuf(merged.to_protobuf("words"))
+        assert (restored.count, restored.null_count) == (6, 1)
+        assert (restored.min, restored.max) == ("BC", "QC")
+        assert restored.top() == merged.top()
+        assert restored.distinct() == merged.distinct()
+
+        empty = ColumnSketch.from_protobuf(ColumnSketch().to_protobuf("empty"))
+        assert empty.min is None and empty.topk is None
+
+    def test_book(self):
+        batches = [
+            pa.RecordBatch.from_arrays(
+                [
+                    pa.array(np.arange(i * 100, (i + 1) * 100)),
+                    pa.array(["a", "b"] * 50),
+                ],
+                ["x", "y"],
+            )
+            for i in range(2)
+        ]
+        books = []
+        for batch in batches:
+            sbook = SketchBook()
+            for name, column in zip(batch.schema.names, batch.columns):
+                sbook.fill("profiler", name, column, capacity=4)
+            books.append(sbook)
+        sbook = books[0] + books[1]
+        assert list(sbook.keys()) == ["profiler.x", "profiler.y"]
+        assert sbook["profiler.x"].count == 200
+        assert sbook["profiler.x"].max == 199
+        assert sbook["profiler.y"].top() == [("a", 100, 0), ("b", 100, 0)]
+        assert sbook["profiler.y"].capacity == 4
+
+        msg = Sketch_store()
+        msg.ParseFromString(sbook._to_message().SerializeToString())
+        restored = SketchBook()._from_message(msg)
+        assert restored["profiler.x"].count == 200
+        assert restored["profiler.y"].top() == sbook["profiler.y"].top()
+
+        sbook.rebook()
+        assert sbook["profiler.x"].count == 0
+        assert sbook["profiler.y"].capacity == 4
+
+        with tempfile.TemporaryDirectory() as dirpath:
+            store = BaseObjectStore(dirpath, "artemis")
+            dataset = store.register_dataset()
+            sinfo = SketchObjectInfo()
+            sinfo.keys.extend(restored.keys())
+            obj = store.register_content(
+                restored._to_message(), sinfo, dataset_id=dataset.uuid, job_id=0
+            )
+            assert obj.name.endswith(".sketch.pb")
+            assert [o.uuid for o in store.list_sketches(dataset.uuid)] == [obj.uuid]
+            store.save_store()
+            reloaded = BaseObjectStore(
+                dirpath, store.store_name, store_uuid=store.store_uuid
+            )
+            msg = Sketch_store()
+            reloaded.get(obj.uuid, msg)
+            assert SketchBook()._from_message(msg)["profiler.x"].min == 0
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -16,12 +16,17 @@
 import unittest
 from collections import OrderedDict
 from pprint import pformat
+import pyarrow as pa
 import logging
 
 from artemis.core.gate import ArtemisGateSvc 
 from artemis.core.steering import Steering
 from artemis.core.singleton import Singleton
 from artemis.algorithms.dummyalgo import DummyAlgo1
+from artemis.algorithms.csvparseralgo import CsvParserAlgo
+from artemis.algorithms.filteralgo import FilterAlgo
+from artemis.tools.csvtool import CsvTool
+from artemis.tools.filtercoltool import FilterColTool
 from artemis.meta.Directed_Graph import Directed_Graph, GraphMenu
 from artemis.meta.Directed_Graph import Node as Node_pb2
 from artemis.core.tree import Tree
@@ -78,5 +83,47 @@ class SteeringTestCase(unittest.TestCase):
         #del jobops.data['menu']
 
 
+    def test_projection_pushdown(self):
+        '''
+        Columns required by the filter are pushed into the csv parser
+        '''
+        csvalgo = CsvParserAlgo('csvparser', loglevel='INFO')
+        filteralgo = FilterAlgo('filter', loglevel='INFO')
+        dummy = DummyAlgo1('dummy', myproperty='ptest', loglevel='INFO')
+
+        seq1 = Node_pb2(["initial"], ('csvparser',), "seq1")
+        seq2 = Node_pb2(["seq1"], ('filter', 'dummy'), "seq2")
+
+        chain = Directed_Graph("chain")
+        chain.add(seq1)
+        chain.add(seq2)
+        chain.build()
+        testmenu = GraphMenu("test")
+        testmenu.add(chain)
+        testmenu.build()
+
+        config = Configuration()
+        for algo in [csvalgo, filteralgo, dummy]:
+            config.algos.add().CopyFrom(algo.to_msg())
+
+        jobops = ArtemisGateSvc()
+        jobops.menu.CopyFrom(testmenu.to_msg())
+        jobops.config.CopyFrom(config)
+        jobops.tree = Tree('projection')
+        logger = logging.getLogger()
+        jobops.tools.add(logger, CsvTool('csvtool').to_msg())
+        jobops.tools.add(
+            logger, FilterColTool('filtercoltool', columns=['c', 'a']).to_msg()
+        )
+
+        a_steer = Steering('a_steer', loglevel="INFO")
+        a_steer.initialize()
+        self.assertEqual(a_steer.leaf_columns(), ['c', 'a'])
+
+        a_steer.book()
+        a_steer.execute(pa.py_buffer(b"a,b,c\n1,x,2.5\n"))
+        batches = jobops.tree.nodes['seq1'].payload[-1].get_data()
+        self.assertEqual(batches[0].schema.names, ['c', 'a'])
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,198 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import os
+import tempfile
+import uuid
+
+import pyarrow as pa
+
+from artemis.artemis import Artemis
+from artemis.algorithms.csvparseralgo import CsvParserAlgo
+from artemis.core.context import JobContext
+from artemis.core.singleton import Singleton
+from artemis.core.gate import ArtemisGateSvc
+from artemis.generators.streamgen import StreamGenerator
+from artemis.io.filehandler import FileHandlerTool
+from artemis.io.writer import BufferOutputWriter
+from artemis.meta.cronus import BaseObjectStore
+from artemis.tools.csvtool import CsvTool
+from artemis.io.protobuf.artemis_pb2 import JobInfo as JobInfo_pb
+from artemis.io.protobuf.configuration_pb2 import Configuration
+from artemis.io.protobuf.cronus_pb2 import ConfigObjectInfo, MenuObjectInfo
+from artemis.io.protobuf.menu_pb2 import Menu
+
+
+class StreamGeneratorTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.landing = os.path.join(self.tmpdir.name, "landing")
+        os.mkdir(self.landing)
+        self.store = BaseObjectStore(self.tmpdir.name, "artemis")
+        self.parentset = self.store.register_dataset()
+
+    def land(self, i, nrows=10):
+        rows = "".join(f"{nrows * i + j},{j % 2}\r\n" for j in range(nrows))
+        path = os.path.join(self.landing, f"file_{i}.csv")
+        with open(path, "w") as f:
+            f.write("a,b\r\n" + rows)
+        return path
+
+    def test_generator(self):
+        dataset = self.store.register_dataset()
+        self.addCleanup(Singleton.reset, ArtemisGateSvc)
+        generator = StreamGenerator(
+            "generator",
+            glob=".csv",
+            path=self.landing,
+            poll_interval=0.01,
+            settle_time=0,
+        )
+        generator.gate.meta.parentset_id = self.parentset.uuid
+        generator.gate.meta.dataset_id = dataset.uuid
+        generator.gate.store = self.store
+        generator.initialize()
+
+        assert next(generator) is None
+        self.land(0)
+        self.land(1)
+        first = next(generator)
+        second = next(generator)
+        assert next(generator) is None
+        files = self.store[self.parentset.uuid].dataset.files
+        assert [f.uuid for f in files] == [first, second]
+        assert files[0].file.partition == "generator"
+        assert list(self.store.list_partitions(self.parentset.uuid)) == ["generator"]
+
+        # A restarted stream skips the files of the watermark
+        self.store.update_watermark(dataset.uuid, [first])
+        generator.reset()
+        assert next(generator) == second
+        generator.stop()
+        with self.assertRaises(StopIteration):
+            next(generator)
+
+        generator = StreamGenerator(
+            "generator", glob=".csv", poll_interval=0.01, idle_timeout=0.05
+        )
+        generator.initialize()
+        assert [id_ for id_ in generator if id_ is not None] == [second]
+
+        # A restarted stream does not register the landed files again
+        generator = StreamGenerator(
+            "generator",
+            glob=".csv",
+            path=self.landing,
+            poll_interval=0.01,
+            settle_time=0,
+            idle_timeout=0.05,
+        )
+        generator.initialize()
+        assert [id_ for id_ in generator if id_ is not None] == [second]
+        assert len(self.store[self.parentset.uuid].dataset.files) == 2
+
+    def test_stream(self):
+        menu = Menu()
+        menu.uuid = str(uuid.uuid4())
+        menu.name = f"{menu.uuid}.menu.pb"
+        graph = menu.graphs.add()
+        graph.name = "chain"
+        node = graph.nodes.add()
+        node.name = "initial"
+        node.algos.append("iorequest")
+        node = graph.nodes.add()
+        node.name = "seqA"
+        node.parents.append("initial")
+        node.algos.append("csvparser")
+
+        config = Configuration()
+        config.uuid = str(uuid.uuid4())
+        config.name = f"{config.uuid}.config.pb"
+        config.max_malloc_size_bytes = 2147483648
+        config.checkpoint_ndatums = 1
+        generator = StreamGenerator(
+            "generator",
+            glob=".csv",
+            path=self.landing,
+            poll_interval=0.01,
+            settle_time=0.1,
+        )
+        config.input.generator.config.CopyFrom(generator.to_msg())
+        tools = [
+            FileHandlerTool("filehandler", filetype="csv", blocksize=2 ** 16),
+            CsvTool("csvtool", block_size=2 ** 17),
+            BufferOutputWriter("bufferwriter", write_csv=False, max_file_age=0.001),
+        ]
+        for tool in tools:
+            config.tools[tool.name].CopyFrom(tool.to_msg())
+        config.algos.add().CopyFrom(CsvParserAlgo("csvparser").to_msg())
+
+        store = self.store
+        menu_id = store.register_content(menu, MenuObjectInfo()).uuid
+        config_id = store.register_content(config, ConfigObjectInfo()).uuid
+        dataset = store.register_dataset(menu_id, config_id)
+        job = JobInfo_pb()
+        job.name = "stream"
+        job.store_path = self.tmpdir.name
+        job.store_id = store.store_uuid
+        job.store_name = store.store_name
+        job.menu_id = menu_id
+        job.config_id = config_id
+        job.dataset_id = dataset.uuid
+        job.parentset_id = self.parentset.uuid
+        job.job_id = str(store.new_job(dataset.uuid))
+
+        # Files land while the job runs, the job stops after the last file
+        self.land(0)
+        context = JobContext("stream")
+        datums = []
+        marks = []
+
+        def heartbeat(summary):
+            if datums and datums[-1] == context.gate.current_file:
+                return
+            datums.append(context.gate.current_file)
+            marks.append(len(store.list_watermark(dataset.uuid)))
+            if len(datums) < 3:
+                self.land(len(datums))
+            else:
+                bow.stop()
+
+        context.heartbeat = heartbeat
+        bow = Artemis(job, loglevel="WARNING", context=context, store=store)
+        assert bow.control() is None
+
+        assert len(datums) == 3
+        files = store[dataset.uuid].dataset.files
+        assert len(files) == 3
+        rows = []
+        for obj in files:
+            reader = pa.ipc.open_file(store.get(obj.uuid))
+            rows.extend(reader.read_all().column("a").to_pylist())
+        assert sorted(rows) == list(range(30))
+        # The watermark advances at each checkpoint of the stream
+        assert marks == [0, 1, 2]
+        assert list(store.list_watermark(dataset.uuid)) == datums
+        assert context.hbook["artemis.counts"].total == 3
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,250 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import importlib.util
+import itertools
+import queue
+import tempfile
+import uuid
+
+from artemis.core.singleton import Singleton
+from artemis.core.gate import ArtemisGateSvc
+from artemis.distributed import workerpool
+from artemis.distributed.workerpool import WorkerPool, Heartbeat
+from artemis.errors import JobCancelledError
+from artemis.generators.csvgen import GenCsvLikeArrow
+from artemis.meta.cronus import BaseObjectStore
+from artemis.io.protobuf.artemis_pb2 import JobInfo as JobInfo_pb
+from artemis.io.protobuf.cronus_pb2 import MenuObjectInfo, ConfigObjectInfo
+from artemis.io.protobuf.cronus_pb2 import FileObjectInfo, TableObjectInfo
+from artemis.io.protobuf.cronus_pb2 import DatasetObjectInfo
+from artemis.io.protobuf.table_pb2 import Table
+
+
+class WorkerPoolTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.addCleanup(workerpool._worker["stores"].clear)
+        self.store = BaseObjectStore(self.tmpdir.name, "artemis")
+
+    def jobinfo(self, dataset_id, **kwargs):
+        job = JobInfo_pb()
+        job.name = "arrowproto"
+        job.store_path = self.tmpdir.name
+        job.store_id = self.store.store_uuid
+        job.store_name = self.store.store_name
+        job.dataset_id = dataset_id
+        for key, value in kwargs.items():
+            setattr(job, key, value)
+        return job
+
+    def test_open_store(self):
+        dataset = self.store.register_dataset()
+        self.store.save_store()
+        job = self.jobinfo(dataset.uuid)
+
+        store = workerpool._open_store(job)
+        assert dataset.uuid in store
+        assert workerpool._open_store(job) is store
+
+        other = self.store.register_dataset()
+        self.store.save_store()
+        reloaded = workerpool._open_store(job)
+        assert reloaded is not store
+        assert other.uuid in reloaded
+
+    def test_update_restore(self):
+        dataset = self.store.register_dataset()
+        self.store.new_partition(dataset.uuid, "seqA")
+        before = self.store.register_content(
+            b"before",
+            FileObjectInfo(),
+            dataset_id=dataset.uuid,
+            partition_key="seqA",
+            job_id=0,
+        )
+        lengths = workerpool._checkpoint(self.store, dataset.uuid)
+
+        # Objects registered by a sub-job
+        self.store.new_partition(dataset.uuid, "seqB")
+        obj = self.store.register_content(
+            b"data",
+            FileObjectInfo(),
+            dataset_id=dataset.uuid,
+            partition_key="seqB",
+            job_id=1,
+        )
+        log = self.store.register_log(dataset.uuid, 1)
+        other = self.store.register_dataset()
+        self.store.update_watermark(dataset.uuid, [before.uuid])
+
+        update = workerpool._update(self.store, dataset.uuid, lengths)
+        assert list(update.partitions) == ["seqA", "seqB"]
+        assert [f.uuid for f in update.files] == [obj.uuid]
+        assert [f.uuid for f in update.logs] == [log.uuid]
+        assert list(update.watermark) == [before.uuid]
+
+        workerpool._restore(self.store, dataset.uuid, lengths)
+        assert list(self.store.list_partitions(dataset.uuid)) == ["seqA"]
+        assert list(self.store.list_watermark(dataset.uuid)) == []
+        assert [f.uuid for f in self.store[dataset.uuid].dataset.files] == [before.uuid]
+        for uuid_ in (obj.uuid, log.uuid, other.uuid):
+            assert uuid_ not in self.store
+        assert before.uuid in self.store
+
+        # Update is merged in a store as the dataset of a sub-job
+        msg = DatasetObjectInfo()
+        msg.ParseFromString(update.SerializeToString())
+        self.store.new_partition(dataset.uuid, "seqB")
+        self.store.update_dataset(dataset.uuid, msg.SerializeToString())
+        assert obj.uuid in self.store
+        assert len(self.store[dataset.uuid].dataset.files) == 2
+
+    def test_submit_error(self):
+        dataset = self.store.register_dataset()
+        job = self.jobinfo(dataset.uuid, store_name="missing.cronus.pb")
+        with WorkerPool(nworkers=1) as pool:
+            error = pool.submit(job).exception()
+        assert isinstance(error, FileNotFoundError)
+
+    def test_heartbeat(self):
+        beats = queue.Queue()
+        cancelled = {}
+        heartbeat = Heartbeat("job", beats, cancelled, interval=60)
+        summary = JobInfo_pb().summary
+        summary.processed_bytes = 100
+        summary.processed_ndatums = 1
+        heartbeat(summary)
+        heartbeat(summary)
+        assert beats.qsize() == 1
+        assert beats.get()[:3] == ("job", 100, 1)
+        heartbeat.send(200, 2)
+        assert beats.get()[:3] == ("job", 200, 2)
+        cancelled["job"] = True
+        with self.assertRaises(JobCancelledError):
+            heartbeat.send(300, 3)
+
+    def test_cancel(self):
+        dataset = self.store.register_dataset()
+        job = self.jobinfo(dataset.uuid, store_name="missing.cronus.pb")
+        with WorkerPool(nworkers=1, heartbeat_interval=0.1) as pool:
+            error = pool.submit(job, key="first").exception()
+            assert isinstance(error, FileNotFoundError)
+            assert [beat[:3] for beat in pool.heartbeats()] == [("first", 0, 0)]
+            pool.cancel("second")
+            error = pool.submit(job, key="second").exception()
+            assert isinstance(error, JobCancelledError)
+            assert pool.submit(job).exception() is not None
+        with WorkerPool(nworkers=1) as pool:
+            assert pool.heartbeats() == []
+            with self.assertRaises(ValueError):
+                pool.cancel("first")
+
+    @unittest.skipUnless(
+        importlib.util.find_spec("pygraphviz"), "pygraphviz not installed"
+    )
+    def test_pool(self):
+        from artemis.configurables.factories import MenuFactory, JobConfigFactory
+
+        dirpath = self.tmpdir.name
+        store = self.store
+        mb = MenuFactory("csvgen")
+        msgmenu = mb.build()
+        config = JobConfigFactory(
+            "csvio",
+            msgmenu,
+            jobname="arrowproto",
+            generator_type="file",
+            filehandler_type="csv",
+            nbatches=1,
+            num_rows=1000,
+            max_file_size=1073741824,
+            write_csv=False,
+            input_glob=".csv",
+        )
+        config.configure()
+        config.add_algos(mb.algos)
+        menuinfo = MenuObjectInfo()
+        menuinfo.created.GetCurrentTime()
+        configinfo = ConfigObjectInfo()
+        configinfo.created.GetCurrentTime()
+        menu_uuid = store.register_content(msgmenu, menuinfo).uuid
+        config_uuid = store.register_content(config._msg, configinfo).uuid
+
+        g_dataset = store.register_dataset()
+        store.new_partition(g_dataset.uuid, "generator")
+        job_id = store.new_job(g_dataset.uuid)
+        g_table = Table()
+        g_table.name = "generator"
+        g_table.uuid = str(uuid.uuid4())
+        fields = list(itertools.islice(GenCsvLikeArrow.generate_col_names(), 20))
+        for f in fields:
+            field = g_table.info.schema.info.fields.add()
+            field.name = f
+        tinfo = TableObjectInfo()
+        tinfo.fields.extend(fields)
+        store.register_content(
+            g_table,
+            tinfo,
+            dataset_id=g_dataset.uuid,
+            job_id=job_id,
+            partition_key="generator",
+        )
+        generator = GenCsvLikeArrow(
+            "generator",
+            nbatches=1,
+            num_cols=20,
+            num_rows=1000,
+            suffix=".csv",
+            prefix="testio",
+            path=dirpath,
+            table_id=g_table.uuid,
+        )
+        self.addCleanup(Singleton.reset, ArtemisGateSvc)
+        generator.gate.meta.parentset_id = g_dataset.uuid
+        generator.gate.meta.job_id = str(job_id)
+        generator.gate.store = store
+        generator.initialize()
+        generator.write()
+
+        dataset = store.register_dataset(menu_uuid, config_uuid)
+        jobs = [
+            self.jobinfo(
+                dataset.uuid,
+                menu_id=menu_uuid,
+                config_id=config_uuid,
+                parentset_id=g_dataset.uuid,
+                job_id=str(store.new_job(dataset.uuid)),
+            )
+            for _ in range(3)
+        ]
+        store.save_store()
+
+        with WorkerPool(nworkers=1, loglevel="WARNING") as pool:
+            results = list(pool.map(jobs))
+        for buf in results:
+            store.update_dataset(dataset.uuid, buf)
+        assert len(store[dataset.uuid].dataset.jobs) == 3
+        assert len(store[dataset.uuid].dataset.logs) == 3
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -30,6 +30,7 @@ import numpy as np
 import pyarrow as pa
 
 from artemis.io.writer import BufferOutputWriter 
+from artemis.tools.csvtool import CsvTool
 from artemis.core.tree import Element
 from artemis.core.gate import ArtemisGateSvc
 from artemis.meta.cronus import BaseObjectStore
@@ -147,5 +148,80 @@ class WriterTestCase(unittest.TestCase):
                 writer._finalize()
 
 
+    def test_dictionary_replacement(self):
+        '''
+        Test writer requests a new file if the dictionary of a column changes
+        '''
+        with tempfile.TemporaryDirectory() as dirpath:
+            store, ds_id, job_id = self.setupStore(dirpath)
+            jp = ArtemisGateSvc()
+            jp.store = store
+            jp.meta.dataset_id = ds_id
+            jp.meta.job_id = str(job_id)
+
+            small = pa.array(["10", "11"])
+            other = pa.array(["10", "24"])
+            elements = []
+            for i, dictionary in enumerate([small, small, other, other]):
+                codes = pa.DictionaryArray.from_arrays(
+                    pa.array([0, 1, None], pa.int32()), dictionary)
+                batch = pa.RecordBatch.from_arrays([codes], ['code'])
+                el = Element(str(i))
+                el.add_data(batch)
+                elements.append(el)
+
+            writer = BufferOutputWriter('test', write_csv=False)
+            writer._fbasename = 'test'
+            writer._path = dirpath
+            writer._schema = batch.schema
+            writer.initialize()
+            jp.store.new_partition(jp.meta.dataset_id, 'test')
+            writer.write(elements)
+            writer._finalize()
+            assert writer.total_files == 2
+
+    def test_dictionary_delta(self):
+        '''
+        Test new codes extend the dictionary within a file
+        '''
+        with tempfile.TemporaryDirectory() as dirpath:
+            store, ds_id, job_id = self.setupStore(dirpath)
+            jp = ArtemisGateSvc()
+            jp.store = store
+            jp.meta.dataset_id = ds_id
+            jp.meta.job_id = str(job_id)
+
+            tool = CsvTool("tool", block_size=2**16, dictionary_encode=True,
+                           dictionary_max_ratio=0.5)
+            rows = [b"%i,%s" % (i, [b"ON", b"QC"][i % 2]) for i in range(6)]
+            tool.sample(pa.py_buffer(b"a,code\n" + b"\n".join(rows) + b"\n"))
+            elements = []
+            expected = []
+            for i in range(4):
+                block = b"a,code\n%i,ON\n%i,X%i\n" % (i, i, i)
+                batch = tool.execute(pa.py_buffer(block))[0]
+                expected.extend(["ON", "X%i" % i])
+                el = Element(str(i))
+                el.add_data(batch)
+                elements.append(el)
+
+            writer = BufferOutputWriter('test', write_csv=False)
+            writer._fbasename = 'test'
+            writer._path = dirpath
+            writer._schema = tool.schema
+            writer.initialize()
+            jp.store.new_partition(jp.meta.dataset_id, 'test')
+            writer.write(elements)
+            writer._finalize()
+            assert len(tool.dictionaries["code"]) == 6
+            assert writer.total_files == 1
+
+            ids_ = store.list(prefix=ds_id, suffix='arrow')
+            assert len(ids_) == 1
+            table = store.open(ids_[0].uuid).read_all()
+            assert table.num_rows == 8
+            assert table.column('code').to_pylist() == expected
+
+
 if __name__ == "__main__":
     unittest.main()
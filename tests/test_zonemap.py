@@ -0,0 +1,137 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+# vim:fenc=utf-8
+#
+# Copyright © Her Majesty the Queen in Right of Canada, as represented
+# by the Minister of Statistics Canada, 2019.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import tempfile
+
+import pyarrow as pa
+
+from artemis.core.gate import ArtemisGateSvc
+from artemis.core.singleton import Singleton
+from artemis.core.sketch import ColumnSketch
+from artemis.core.tree import Element
+from artemis.io.writer import BufferOutputWriter
+from artemis.meta.cronus import BaseObjectStore
+from artemis.meta.zonemap import ZoneMapFilter, prune, zone_map
+
+
+class ZoneMapTestCase(unittest.TestCase):
+    def zonemap(self, batch):
+        sketches = {}
+        for name, column in zip(batch.schema.names, batch.columns):
+            sketches[name] = ColumnSketch(precision=10, capacity=0)
+            sketches[name].update(column)
+        return zone_map(sketches, batch.num_rows)
+
+    def test_zone_map(self):
+        batch = pa.RecordBatch.from_arrays(
+            [
+                pa.array([20, 35, None, 64]),
+                pa.array([1.5, 2.5, 0.5, None]),
+                pa.array(["ON", "QC", "ON", "BC"]).dictionary_encode(),
+                pa.array([None, None, None, None], pa.int64()),
+            ],
+            ["age", "income", "province", "empty"],
+        )
+        zonemap = self.zonemap(batch)
+        assert zonemap.num_rows == 4
+        age, income, province, empty = zonemap.columns
+        assert (age.min_int, age.max_int, age.null_count) == (20, 64, 1)
+        assert (income.min_double, income.max_double) == (0.5, 2.5)
+        assert (province.min_string, province.max_string) == ("BC", "QC")
+        assert province.distinct == 3
+        assert empty.WhichOneof("min") is None and empty.null_count == 4
+
+        def match(expression):
+            return ZoneMapFilter(expression)(zonemap)
+
+        assert match("age > 60") and not match("age > 64")
+        assert match("age >= 64") and not match("age < 20")
+        assert match("18 < age") and not match("70 <= age")
+        assert match("age == 35") and not match("age == 80")
+        assert not match("not age <= 64")
+        assert match("20 <= age <= 25") and not match("65 <= age <= 70")
+        assert match("province in ['NS', 'ON']") and not match("province in ['YT']")
+        assert match("province not in ['QC']")
+        assert match("age > 60 and income < 1") and not match("age > 70 and income < 1")
+        assert match("age > 70 or province == 'QC'")
+        assert not match("not (age <= 64 or income > 0)")
+        assert match("is_null(age)") and not match("is_null(province)")
+        assert not match("is_valid(empty)") and not match("empty > 0")
+        assert match("not is_valid(age)") and not match("not is_null(empty)")
+        # Unknown columns, types and column comparisons could match
+        assert match("missing > 0") and match("age > 'a'") and match("age > income")
+        assert not match("col('age') > 64")
+
+        with self.assertRaises(ValueError):
+            ZoneMapFilter("age >")
+        with self.assertRaises(ValueError):
+            ZoneMapFilter("age is None")
+
+    def test_prune(self):
+        self.addCleanup(Singleton.reset, ArtemisGateSvc)
+        with tempfile.TemporaryDirectory() as dirpath:
+            store = BaseObjectStore(dirpath, "artemis")
+            dataset = store.register_dataset()
+            gate = ArtemisGateSvc()
+            gate.store = store
+            gate.meta.dataset_id = dataset.uuid
+            gate.meta.job_id = str(store.new_job(dataset.uuid))
+            store.new_partition(dataset.uuid, "test")
+
+            batches = [
+                pa.RecordBatch.from_arrays(
+                    [pa.array(list(range(i * 10, (i + 1) * 10)))], ["x"]
+                )
+                for i in range(4)
+            ]
+            writer = BufferOutputWriter(
+                "writer_test",
+                write_csv=False,
+                zone_maps=True,
+                BUFFER_MAX_SIZE=2 * pa.get_record_batch_size(batches[0]),
+            )
+            writer._schema = batches[0].schema
+            writer.initialize()
+            elements = []
+            for i, batch in enumerate(batches):
+                el = Element(str(i))
+                el.add_data(batch)
+                elements.append(el)
+            writer.write(elements)
+            writer._finalize()
+            assert writer.total_files == 2
+
+            first, second = store[dataset.uuid].dataset.files
+            zonemap = first.file.zonemap
+            assert zonemap.num_rows == 20
+            assert (zonemap.columns[0].min_int, zonemap.columns[0].max_int) == (0, 19)
+            assert [z.columns[0].max_int for z in second.file.batches] == [29, 39]
+
+            assert prune(store, dataset.uuid, "x >= 25") == [(second.uuid, [0, 1])]
+            assert prune(store, dataset.uuid, "x < 5 or x == 35") == [
+                (first.uuid, [0]),
+                (second.uuid, [1]),
+            ]
+            assert prune(store, dataset.uuid, "x > 100") == []
+            assert prune(store, dataset.uuid, "x > 0", partition="other") == []
+
+
+if __name__ == "__main__":
+    unittest.main()